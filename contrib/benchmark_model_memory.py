@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory benchmark for the base model classes (Node, NodeImage, NodeSize,
+StorageVolume, Object, Container, Zone and Record).
+
+It measures number of bytes allocated per object (including the extra
+dictionary and the attribute values) for:
+
+* dict - class with the same constructor which stores attributes in an
+  instance dictionary (how the model classes looked before they started to
+  use __slots__)
+* slots - current model class
+* slots + intern - current model class where the repeated string values in
+  the extra dictionary are interned using intern_str (as done by the EC2 and
+  S3 drivers)
+
+String values are created for each object the same way they are created when
+parsing an API response so repeated values aren't shared unless they are
+interned.
+
+Use it as following:
+    $ python contrib/benchmark_model_memory.py
+    $ python contrib/benchmark_model_memory.py --count 500000
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                '../')))
+
+from libcloud.compute.base import Node, NodeImage, NodeSize, StorageVolume
+from libcloud.compute.types import NodeState, StorageVolumeState
+from libcloud.storage.base import Object, Container
+from libcloud.dns.base import Zone, Record
+from libcloud.dns.types import RecordType
+from libcloud.utils.misc import intern_str
+
+DEFAULT_COUNT = 100000
+
+
+class FakeDriver(object):
+    name = 'fake'
+    type = 'fake'
+
+
+def parsed(value):
+    """
+    Return a new copy of the provided string (same as a value which has been
+    parsed from an API response).
+    """
+    return ''.join(list(value))
+
+
+def get_dict_backed_class(klass):
+    """
+    Return class with the same constructor as the provided model class which
+    stores attributes in an instance dictionary.
+    """
+    return type('Dict' + klass.__name__, (object, ),
+                {'__init__': klass.__init__})
+
+
+def get_factories(driver):
+    container = Container(name='container', extra={}, driver=driver)
+    zone = Zone(id='1', domain='example.com', type='master', ttl=3600,
+                driver=driver)
+
+    def node(klass, i, intern):
+        extra = {'availability': intern(parsed('us-east-1a')),
+                 'instance_type': intern(parsed('t2.micro')),
+                 'status': intern(parsed('running'))}
+        return klass(id='i-%08d' % (i), name='node-%d' % (i),
+                     state=NodeState.RUNNING,
+                     public_ips=['10.0.%d.%d' % (i // 256 % 256, i % 256)],
+                     private_ips=[], driver=driver, extra=extra)
+
+    def image(klass, i, intern):
+        extra = {'state': intern(parsed('available')),
+                 'architecture': intern(parsed('x86_64')),
+                 'owner_alias': intern(parsed('amazon')),
+                 'root_device_type': intern(parsed('ebs'))}
+        return klass(id='ami-%08d' % (i), name='image-%d' % (i),
+                     driver=driver, extra=extra)
+
+    def size(klass, i, intern):
+        extra = {'cpu': 2}
+        return klass(id='size-%d' % (i), name='size-%d' % (i), ram=2048,
+                     disk=20, bandwidth=None, price=0.1, driver=driver,
+                     extra=extra)
+
+    def volume(klass, i, intern):
+        extra = {'zone': intern(parsed('us-east-1a')),
+                 'volume_type': intern(parsed('gp2'))}
+        return klass(id='vol-%08d' % (i), name='volume-%d' % (i), size=10,
+                     driver=driver, state=StorageVolumeState.AVAILABLE,
+                     extra=extra)
+
+    def obj(klass, i, intern):
+        extra = {'last_modified': '2020-01-01T00:00:%02d.000Z' % (i % 60),
+                 'storage_class': intern(parsed('STANDARD'))}
+        meta_data = {'owner': {'id': intern(parsed('75aa57f09aa0c8caeab4')),
+                               'display_name': intern(parsed('owner'))}}
+        return klass(name='path/to/object-%d' % (i), size=i,
+                     hash='%032x' % (i), extra=extra, meta_data=meta_data,
+                     container=container, driver=driver)
+
+    def container_(klass, i, intern):
+        extra = {'creation_date': intern(parsed('2020-01-01'))}
+        return klass(name='container-%d' % (i), extra=extra, driver=driver)
+
+    def zone_(klass, i, intern):
+        return klass(id=str(i), domain='example-%d.com' % (i),
+                     type=intern(parsed('master')), ttl=3600, driver=driver)
+
+    def record(klass, i, intern):
+        return klass(id=str(i), name='www-%d' % (i), type=RecordType.A,
+                     data='10.0.%d.%d' % (i // 256 % 256, i % 256),
+                     zone=zone, driver=driver, ttl=300)
+
+    return [
+        (Node, node),
+        (NodeImage, image),
+        (NodeSize, size),
+        (StorageVolume, volume),
+        (Object, obj),
+        (Container, container_),
+        (Zone, zone_),
+        (Record, record),
+    ]
+
+
+def measure(factory, klass, count, intern):
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    objects = [factory(klass, i, intern) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    # Exclude the list which holds the objects
+    used -= sys.getsizeof(objects)
+    del objects
+    return float(used) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measure memory used by the base model classes.')
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT,
+                        help='Number of objects to create for each class')
+    args = parser.parse_args()
+
+    driver = FakeDriver()
+
+    def no_intern(value):
+        return value
+
+    print('Bytes per object (%d objects):' % (args.count))
+    print('')
+    print('%-15s %12s %12s %16s' % ('class', 'dict', 'slots',
+                                    'slots + intern'))
+
+    for klass, factory in get_factories(driver):
+        before = measure(factory, get_dict_backed_class(klass), args.count,
+                         no_intern)
+        slots = measure(factory, klass, args.count, no_intern)
+        interned = measure(factory, klass, args.count, intern_str)
+        print('%-15s %12.1f %12.1f %16.1f' % (klass.__name__, before, slots,
+                                              interned))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro benchmark for libcloud.utils.files.read_in_chunks.
+
+It measures throughput of read_in_chunks(..., fill_size=True) for different
+chunk sizes and compares it with the previous implementation which built
+chunks using bytes concatenation and slicing.
+
+The following sources are used:
+
+* file - buffered file like object (io.BytesIO)
+* raw file - unbuffered file object (io.FileIO)
+* raw stream - non-seekable raw stream which returns short reads (similar to
+  a pipe or a socket) and implements readinto
+* iterator - generator which yields small pieces of data (similar to the
+  iterators which are passed to upload_object_via_stream)
+
+Use it as following:
+    $ python contrib/benchmark_read_in_chunks.py
+    $ python contrib/benchmark_read_in_chunks.py --chunk-sizes 8192 5242880
+"""
+
+from __future__ import print_function
+
+import io
+import os
+import sys
+import time
+import argparse
+import tempfile
+from io import BytesIO
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                '../')))
+
+from libcloud.utils.py3 import b
+from libcloud.utils.files import read_in_chunks
+
+KB = 1024
+MB = 1024 * KB
+
+DEFAULT_CHUNK_SIZES = [8 * KB, 5 * MB, 100 * MB]
+DEFAULT_PIECE_SIZE = 64 * KB
+DEFAULT_MIN_DATA_SIZE = 64 * MB
+
+
+def legacy_read_in_chunks(iterator, chunk_size, fill_size=False,
+                          yield_empty=False):
+    """
+    Implementation of read_in_chunks from before buffers were used.
+    """
+    try:
+        get_data = iterator.read
+        args = (chunk_size, )
+    except AttributeError:
+        get_data = next
+        args = (iterator, )
+
+    data = b('')
+    empty = False
+
+    while not empty or len(data) > 0:
+        if not empty:
+            try:
+                chunk = b(get_data(*args))
+                if len(chunk) > 0:
+                    data += chunk
+                else:
+                    empty = True
+            except StopIteration:
+                empty = True
+
+        if len(data) == 0:
+            if empty and yield_empty:
+                yield b('')
+
+            return
+
+        if fill_size:
+            if empty or len(data) >= chunk_size:
+                yield data[:chunk_size]
+                data = data[chunk_size:]
+        else:
+            yield data
+            data = b('')
+
+
+def get_file_source(data, piece_size):
+    return BytesIO(data)
+
+
+def get_raw_file_source(data, piece_size):
+    fd, path = tempfile.mkstemp()
+
+    with os.fdopen(fd, 'wb') as fp:
+        fp.write(data)
+
+    fp = open(path, 'rb', buffering=0)
+    os.unlink(path)
+    return fp
+
+
+class ShortReadStream(io.RawIOBase):
+    """
+    Non-seekable raw stream which returns at most piece_size bytes on each
+    read.
+    """
+
+    def __init__(self, data, piece_size):
+        self._view = memoryview(data)
+        self._position = 0
+        self._piece_size = piece_size
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        count = min(len(buf), self._piece_size,
+                    len(self._view) - self._position)
+        buf[:count] = self._view[self._position:self._position + count]
+        self._position += count
+        return count
+
+
+def get_raw_stream_source(data, piece_size):
+    return ShortReadStream(data, piece_size)
+
+
+def get_iterator_source(data, piece_size):
+    view = memoryview(data)
+
+    def iterator():
+        for index in range(0, len(data), piece_size):
+            yield view[index:index + piece_size].tobytes()
+
+    return iterator()
+
+
+SOURCES = [
+    ('file', get_file_source),
+    ('raw file', get_raw_file_source),
+    ('raw stream', get_raw_stream_source),
+    ('iterator', get_iterator_source)
+]
+
+IMPLEMENTATIONS = [
+    ('read_in_chunks', read_in_chunks),
+    ('legacy', legacy_read_in_chunks)
+]
+
+
+def run_benchmark(func, source, chunk_size):
+    start = time.time()
+    total = 0
+
+    for chunk in func(source, chunk_size=chunk_size, fill_size=True):
+        total += len(chunk)
+
+    return total, time.time() - start
+
+
+def main(chunk_sizes, piece_size, min_data_size, legacy_max_copy, repeat):
+    row_format = '%-10s %-12s %-16s %12s %12s'
+    print(row_format % ('chunk', 'source', 'implementation', 'time (s)',
+                        'MB/s'))
+
+    for chunk_size in chunk_sizes:
+        # Make sure we produce at least couple of full chunks
+        data_size = max(min_data_size, chunk_size * 2)
+        data = os.urandom(data_size)
+
+        for source_name, get_source in SOURCES:
+            for name, func in IMPLEMENTATIONS:
+                if name == 'legacy' and \
+                        source_name in ['iterator', 'raw stream'] and \
+                        legacy_max_copy is not None:
+                    # Legacy implementation is quadratic when the source
+                    # returns pieces which are not of the chunk size.
+                    # Estimate amount of bytes copied and skip the run if it
+                    # would take too long.
+                    if source_name == 'raw stream':
+                        # read() never returns more than chunk_size bytes
+                        size = min(piece_size, chunk_size)
+                    else:
+                        size = piece_size
+
+                    if size > chunk_size:
+                        # Only a single chunk is yielded for each piece so
+                        # the buffer grows until the iterator is exhausted
+                        copied = (data_size // chunk_size) * data_size // 2
+                    else:
+                        appends = chunk_size // size
+                        copied = (appends * appends // 2) * size * \
+                            (data_size // chunk_size)
+
+                    if copied > legacy_max_copy * 1024 * MB:
+                        print(row_format % (format_size(chunk_size),
+                                            source_name, name, 'skipped',
+                                            '-'))
+                        continue
+
+                elapsed = None
+
+                for _ in range(repeat):
+                    source = get_source(data, piece_size)
+                    total, duration = run_benchmark(func, source, chunk_size)
+                    assert total == data_size
+
+                    if hasattr(source, 'close'):
+                        source.close()
+
+                    if elapsed is None or duration < elapsed:
+                        elapsed = duration
+
+                throughput = (total / MB) / elapsed if elapsed else 0
+                print(row_format % (format_size(chunk_size), source_name,
+                                    name, '%.3f' % (elapsed),
+                                    '%.1f' % (throughput)))
+
+
+def format_size(size):
+    if size >= MB:
+        return '%d MB' % (size // MB)
+
+    return '%d KB' % (size // KB)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark read_in_chunks '
+                                                 'function')
+    parser.add_argument('--chunk-sizes', action='store', nargs='+',
+                        type=int, default=DEFAULT_CHUNK_SIZES,
+                        help='Chunk sizes (in bytes) to benchmark')
+    parser.add_argument('--piece-size', action='store', type=int,
+                        default=DEFAULT_PIECE_SIZE,
+                        help='Size of the pieces returned by the iterator '
+                             'source')
+    parser.add_argument('--min-data-size', action='store', type=int,
+                        default=DEFAULT_MIN_DATA_SIZE,
+                        help='Minimum amount of data which is read for each '
+                             'chunk size')
+    parser.add_argument('--legacy-max-copy', action='store', type=int,
+                        default=64,
+                        help='Skip legacy implementation runs which would '
+                             'copy more than this many GB of data (use 0 '
+                             'to never skip)')
+    parser.add_argument('--repeat', action='store', type=int, default=3,
+                        help='Number of times each run is repeated (best '
+                             'time is reported)')
+    args = parser.parse_args()
+
+    main(chunk_sizes=args.chunk_sizes, piece_size=args.piece_size,
+         min_data_size=args.min_data_size,
+         legacy_max_copy=args.legacy_max_copy or None, repeat=args.repeat)
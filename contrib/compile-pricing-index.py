@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+#
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""
+This script compiles a pricing file into an index which is memory-mapped by
+libcloud.pricing so price lookups don't need to load the whole pricing file.
+
+Use it as following:
+    $ python contrib/compile-pricing-index.py [pricing file path]
+
+If pricing file path is not provided, the custom (~/.libcloud/pricing.json)
+or the default pricing file is used.
+"""
+
+import os
+import sys
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BASE_DIR)
+
+from libcloud.pricing import compile_pricing_index  # NOQA
+
+
+def main():
+    pricing_file_path = sys.argv[1] if len(sys.argv) > 1 else None
+    index_file_path = compile_pricing_index(
+        pricing_file_path=pricing_file_path)
+    print('Pricing index written to %s' % (index_file_path))
+
+
+if __name__ == '__main__':
+    main()
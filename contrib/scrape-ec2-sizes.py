@@ -19,10 +19,14 @@
 
 """
 This script downloads and parses AWS EC2 from https://pricing.us-east-1.amazonaws.com/offers/v1.0/aws/AmazonEC2/current/index.json.
-It writes a Python module with constants about EC2's sizes and regions.
+It writes a Python module with constants about EC2's regions
+(libcloud/compute/constants.py) and a JSON catalog with EC2's sizes and
+sizes which are available in each region
+(libcloud/data/ec2_instance_types.json). The catalog is only loaded by the
+driver when it's needed.
 
 Use it as following:
-    $ python contrib/scrap-ec2-sizes.py > libcloud/compute/constants.py
+    $ python contrib/scrape-ec2-sizes.py
 """
 
 import re
@@ -33,6 +37,10 @@ import requests
 import ijson  # pylint: disable=import-error
 
 FILEPATH = os.environ.get('TMP_JSON', '/tmp/ec.json')
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CONSTANTS_FILE_PATH = os.path.join(BASE_DIR, 'libcloud/compute/constants.py')
+INSTANCE_TYPES_FILE_PATH = os.path.join(BASE_DIR,
+                                        'libcloud/data/ec2_instance_types.json')
 URL = "https://pricing.us-east-1.amazonaws.com/offers/v1.0/aws/AmazonEC2/current/index.json"
 IGNORED_FIELDS = ['locationType', 'operatingSystem']
 REG1_STORAGE = re.compile(r'(\d+) x ([0-9,]+)')
@@ -187,6 +195,24 @@ REGION_DETAILS = {
 }
 
 
+HEADER = """# File generated by script - DO NOT EDIT manually
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+
+
 def download_json():
     response = requests.get(URL, stream=True)
     try:
@@ -281,28 +307,26 @@ def parse():
 
 def dump():
     sizes, regions = parse()
-    print("# File generated by script - DO NOT EDIT manually")
-    print("# Licensed to the Apache Software Foundation (ASF) under one or more")
-    print("# contributor license agreements.  See the NOTICE file distributed with")
-    print("# this work for additional information regarding copyright ownership.")
-    print("# The ASF licenses this file to You under the Apache License, Version 2.0")
-    print("# (the \"License\"); you may not use this file except in compliance with")
-    print("# the License.  You may obtain a copy of the License at")
-    print("#")
-    print("#     http://www.apache.org/licenses/LICENSE-2.0")
-    print("#")
-    print("# Unless required by applicable law or agreed to in writing, software")
-    print("# distributed under the License is distributed on an \"AS IS\" BASIS,")
-    print("# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.")
-    print("# See the License for the specific language governing permissions and")
-    print("# limitations under the License.")
+
+    region_instance_types = {}
+
+    for region_id, details in regions.items():
+        region_instance_types[region_id] = details.pop('instance_types')
+
+    catalog = {'instance_types': sizes, 'regions': region_instance_types}
+
+    with open(INSTANCE_TYPES_FILE_PATH, 'w') as fp:
+        json.dump(catalog, fp, sort_keys=True, separators=(',', ':'))
+        fp.write('\n')
 
     separators = (',', ': ')
 
-    print("INSTANCE_TYPES = " + json.dumps(sizes, indent=4, sort_keys=True,
-                                           separators=separators)).replace('null', 'None')
-    print("REGION_DETAILS = " + json.dumps(regions, indent=4, sort_keys=True,
-                                           separators=separators))
+    with open(CONSTANTS_FILE_PATH, 'w') as fp:
+        fp.write(HEADER)
+        region_details = json.dumps(regions, indent=4, sort_keys=True,
+                                    separators=separators)
+        fp.write("REGION_DETAILS = " + region_details)
+        fp.write('\n')
 
 
 if __name__ == '__main__':
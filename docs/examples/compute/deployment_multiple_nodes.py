@@ -0,0 +1,38 @@
+import os
+
+from libcloud.compute.types import Provider
+from libcloud.compute.providers import get_driver
+from libcloud.compute.deployment import MultiStepDeployment
+from libcloud.compute.deployment import ScriptDeployment, SSHKeyDeployment
+
+# Path to the private SSH key file used to authenticate
+PRIVATE_SSH_KEY_PATH = os.path.expanduser('~/.ssh/id_rsa')
+
+# Path to the public key you would like to install
+KEY_PATH = os.path.expanduser('~/.ssh/id_rsa.pub')
+
+RACKSPACE_USER = 'your username'
+RACKSPACE_KEY = 'your key'
+
+Driver = get_driver(Provider.RACKSPACE)
+conn = Driver(RACKSPACE_USER, RACKSPACE_KEY)
+
+with open(KEY_PATH) as fp:
+    content = fp.read()
+
+msd = MultiStepDeployment([SSHKeyDeployment(content),
+                           ScriptDeployment('apt-get -y install nginx')])
+
+images = conn.list_images()
+sizes = conn.list_sizes()
+
+# Create 20 nodes (web-1, web-2, ...) and deploy at most 5 of them at once
+results = conn.deploy_nodes(name='web', image=images[0], size=sizes[0],
+                            deploy=msd, count=20, max_workers=5,
+                            ssh_key=PRIVATE_SSH_KEY_PATH)
+
+for node, deployment, error in results:
+    if error:
+        print('Deployment failed: %s' % (error))
+    else:
+        print('%s: %s' % (node.name, deployment.steps[1].stdout))
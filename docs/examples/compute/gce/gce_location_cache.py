@@ -0,0 +1,14 @@
+from libcloud.compute.types import Provider
+from libcloud.compute.providers import get_driver
+from libcloud.compute.drivers.gce import GCELocationCache
+
+# Zone and region metadata is stored in ~/.libcloud/gce_locations and re-used
+# by all the drivers (and processes) for a day
+location_cache = GCELocationCache(path='~/.libcloud/gce_locations',
+                                  ttl=24 * 60 * 60)
+
+ComputeEngine = get_driver(Provider.GCE)
+driver = ComputeEngine('your_service_account_email', 'path_to_pem_file',
+                       datacenter='us-central1-a',
+                       project='your_project_id',
+                       location_cache=location_cache)
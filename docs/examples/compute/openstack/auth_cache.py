@@ -0,0 +1,15 @@
+from libcloud.compute.types import Provider
+from libcloud.compute.providers import get_driver
+from libcloud.common.openstack_identity import OpenStackFileAuthCache
+
+# Token and service catalog are stored in ~/.libcloud/openstack_auth_cache
+# and re-used by all the driver instances and processes which use the same
+# credentials
+auth_cache = OpenStackFileAuthCache()
+
+OpenStack = get_driver(Provider.OPENSTACK)
+driver = OpenStack('your_auth_username', 'your_auth_password',
+                   ex_tenant_name='mytenant',
+                   ex_force_auth_url='http://192.168.1.101:5000',
+                   ex_force_auth_version='2.0_password',
+                   ex_auth_cache=auth_cache)
@@ -0,0 +1,16 @@
+from libcloud.storage.types import Provider
+from libcloud.storage.providers import get_driver
+
+Driver = get_driver(Provider.S3)
+driver = Driver('api key', 'api secret key')
+
+obj = driver.get_object(container_name='my-backups-12345',
+                        object_name='backup.tar.gz')
+
+# Download the object using up to 8 concurrent range requests, each 16 MB in
+# size
+driver.download_object_parallel(obj=obj,
+                                destination_path='/home/user/backup.tar.gz',
+                                part_size=16 * 1024 * 1024,
+                                concurrency=8,
+                                overwrite_existing=True)
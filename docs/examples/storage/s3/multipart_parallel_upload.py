@@ -0,0 +1,24 @@
+from libcloud.storage.types import Provider
+from libcloud.storage.providers import get_driver
+
+# Path to a very large file you want to upload
+FILE_PATH = '/home/user/myfile.tar.gz'
+
+cls = get_driver(Provider.S3)
+driver = cls('api key', 'api secret key')
+
+# Upload up to 8 parts of 16 MB in parallel. Memory usage is bound to
+# roughly (8 + 1) * 16 MB.
+driver.multipart_part_size = 16 * 1024 * 1024
+driver.multipart_concurrency = 8
+
+container = driver.get_container(container_name='my-backups-12345')
+
+# This method blocks until all the parts have been uploaded.
+extra = {'content_type': 'application/octet-stream'}
+
+with open(FILE_PATH, 'rb') as iterator:
+    obj = driver.upload_object_via_stream(iterator=iterator,
+                                          container=container,
+                                          object_name='backup.tar.gz',
+                                          extra=extra)
@@ -16,14 +16,26 @@
 from typing import Union
 from typing import Type
 from typing import Optional
+from typing import List
+from typing import Dict
 
 import json
 import os
 import ssl
 import socket
 import copy
+import hashlib
 import binascii
 import time
+import random
+import asyncio
+import heapq
+import itertools
+import threading
+import concurrent.futures
+from collections import OrderedDict
+
+from email.utils import parsedate_tz, mktime_tz
 
 from libcloud.utils.py3 import ET
 
@@ -32,19 +44,33 @@ import libcloud
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import urlparse
 from libcloud.utils.py3 import urlencode
+from libcloud.utils.py3 import b
 
 from libcloud.utils.misc import lowercase_keys, retry
+from libcloud.utils.xml import fixxpath
+from libcloud.utils.ratelimit import RateLimit, RATE_LIMITER
+from libcloud.utils.retry import RetryPolicy
 from libcloud.common.exceptions import exception_from_message
 from libcloud.common.types import LibcloudError, MalformedResponseError
 from libcloud.http import LibcloudConnection, HttpLibResponseProxy
+from libcloud.http import AsyncLibcloudConnection
 
 __all__ = [
     'RETRY_FAILED_HTTP_REQUESTS',
+    'USE_SHARED_CONNECTION_POOL',
+    'ENABLE_RATE_LIMITING',
 
     'BaseDriver',
 
     'Connection',
+    'AsyncConnection',
+    'AsyncPageIterator',
     'PollingConnection',
+    'PollSchedule',
+    'ExponentialBackoffPollSchedule',
+    'PollStats',
+    'PollingJob',
+    'JobWaiter',
     'ConnectionKey',
     'ConnectionUserAndKey',
     'CertificateConnection',
@@ -59,6 +85,14 @@ __all__ = [
 # Module level variable indicates if the failed HTTP requests should be retried
 RETRY_FAILED_HTTP_REQUESTS = False
 
+# Module level variable indicates if connections should use the process wide
+# shared HTTP connection pool (libcloud.http.CONNECTION_POOL_REGISTRY)
+USE_SHARED_CONNECTION_POOL = False
+
+# Module level variable indicates if connections should use client side rate
+# limiting (see Connection.rate_limits)
+ENABLE_RATE_LIMITING = False
+
 
 class LazyObject(object):
     """An object that doesn't get initialized until accessed."""
@@ -242,6 +276,153 @@ class XmlResponse(Response):
         return body
     parse_error = parse_body
 
+    def iterparse(self, xpath, namespace=None):
+        """
+        Return a generator of elements which match the provided path.
+
+        :param xpath: Path of the elements relative to the root element
+                      (e.g. ``reservationSet/item``).
+        :type xpath: ``str``
+
+        :param namespace: Namespace of the elements in the path.
+        :type namespace: ``str``
+
+        :rtype: ``generator`` of :class:`Element`
+        """
+        if self.object is None or not hasattr(self.object, 'findall'):
+            return
+
+        for element in self.object.findall(fixxpath(xpath=xpath,
+                                                    namespace=namespace)):
+            yield element
+
+
+class StreamingXmlResponse(XmlResponse):
+    """
+    XML Response class which parses the response body incrementally.
+
+    Unlike :class:`XmlResponse`, the body of a successful response is not
+    read in the constructor. :meth:`iterparse` parses the body while it is
+    being downloaded, yields the matching elements and frees each of them
+    after it has been processed. This way memory usage is bound by the size
+    of a single element instead of the size of the whole document.
+
+    Elements which don't match the path (e.g. pagination markers) are kept
+    and once the body has been consumed, the remaining document is available
+    in the ``object`` attribute. If the body is empty, ``object`` is None.
+
+    Error responses are read and parsed in full.
+
+    This class is used by :meth:`Connection.request` when ``stream=True`` is
+    passed and the connection defines ``streamResponseCls``.
+    """
+
+    # Size of the chunks (in bytes) in which the body is fed to the parser
+    chunk_size = 64 * 1024
+
+    def __init__(self, response, connection):
+        """
+        :param response: HTTP response object. (optional)
+        :type response: :class:`requests.Response`
+
+        :param connection: Parent connection object.
+        :type connection: :class:`.Connection`
+        """
+        self.connection = connection
+
+        self.headers = lowercase_keys(dict(response.headers))
+        self.error = response.reason
+        self.status = response.status_code
+        self.request = response.request
+        self.iter_content = response.iter_content
+        self.body = ''
+        self.object = None
+        self._response = response
+
+        if not self.success():
+            self.body = response.text.strip() \
+                if response.text is not None and \
+                hasattr(response.text, 'strip') else ''
+            raise exception_from_message(code=self.status,
+                                         message=self.parse_error(),
+                                         headers=self.headers)
+
+    def iterparse(self, xpath, namespace=None):
+        """
+        Parse the response body and yield elements which match the provided
+        path.
+
+        Each element is cleared and removed from the document as soon as
+        the caller advances the generator so all the needed data needs to be
+        extracted from it before that. The body can only be iterated once.
+
+        :param xpath: Path of the elements relative to the root element
+                      (e.g. ``reservationSet/item``).
+        :type xpath: ``str``
+
+        :param namespace: Namespace of the elements in the path.
+        :type namespace: ``str``
+
+        :rtype: ``generator`` of :class:`Element`
+        """
+        if self._response is None:
+            raise ValueError('Response body has already been consumed')
+
+        path = [fixxpath(xpath=tag, namespace=namespace)
+                for tag in xpath.split('/')]
+        response, self._response = self._response, None
+
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        # Stack of the currently open elements, starting with the root
+        stack = []
+        empty = True
+
+        try:
+            try:
+                for chunk in response.iter_content(self.chunk_size):
+                    if not chunk:
+                        continue
+
+                    empty = False
+                    parser.feed(chunk)
+
+                    for element in self._read_events(parser, stack, path):
+                        yield element
+
+                if empty:
+                    return
+
+                parser.close()
+
+                for element in self._read_events(parser, stack, path):
+                    yield element
+            except ET.ParseError:
+                raise MalformedResponseError('Failed to parse XML',
+                                             body=self.body,
+                                             driver=self.connection.driver)
+        finally:
+            response.close()
+
+    def _read_events(self, parser, stack, path):
+        for event, element in parser.read_events():
+            if event == 'start':
+                if not stack:
+                    self.object = element
+
+                stack.append(element)
+                continue
+
+            stack.pop()
+
+            if len(stack) != len(path) or \
+                    [e.tag for e in stack[1:]] + [element.tag] != path:
+                continue
+
+            yield element
+
+            element.clear()
+            stack[-1].remove(element)
+
 
 class RawResponse(Response):
     def __init__(self, connection, response=None):
@@ -307,6 +488,9 @@ class Connection(object):
 
     responseCls = Response
     rawResponseCls = RawResponse
+    # Response class which is used with non-raw "stream=True" requests. If
+    # not set, responseCls is used and the whole body is read at once.
+    streamResponseCls = None  # type: Optional[Type[Response]]
     connection = None
     host = '127.0.0.1'  # type: str
     port = 443
@@ -318,6 +502,24 @@ class Connection(object):
     backoff = None
     retry_delay = None
 
+    # True to use the process wide shared HTTP connection pool for this
+    # connection, None to use the module level default
+    # (USE_SHARED_CONNECTION_POOL)
+    shared_pool = None  # type: Optional[bool]
+
+    # Client side rate limits for requests performed by this connection.
+    # Buckets are shared by all the connections in a process.
+    rate_limits = None  # type: Optional[List[RateLimit]]
+
+    # True to use client side rate limiting for this connection, None to use
+    # the module level default (ENABLE_RATE_LIMITING)
+    rate_limiting = None  # type: Optional[bool]
+
+    # Policy which is used to retry failed requests. If set, it takes
+    # precedence over RETRY_FAILED_HTTP_REQUESTS and the retry_delay,
+    # backoff and timeout based retries.
+    retry_policy = None  # type: Optional[RetryPolicy]
+
     allow_insecure = True
 
     def __init__(self, secure=True, host=None, port=None, url=None,
@@ -458,6 +660,9 @@ class Connection(object):
         if self.proxy_url:
             kwargs.update({'proxy_url': self.proxy_url})
 
+        if self._use_shared_pool():
+            kwargs.update({'shared_pool': True})
+
         connection = self.conn_class(**kwargs)
         # You can uncoment this line, if you setup a reverse proxy server
         # which proxies to your endpoint, and lets you easily capture
@@ -467,6 +672,84 @@ class Connection(object):
 
         self.connection = connection
 
+    def _use_shared_pool(self):
+        if self.shared_pool is not None:
+            return self.shared_pool
+
+        return bool(os.environ.get('LIBCLOUD_SHARED_CONNECTION_POOL',
+                                   False) or USE_SHARED_CONNECTION_POOL)
+
+    def _use_rate_limiting(self):
+        if not self.rate_limits:
+            return False
+
+        if self.rate_limiting is not None:
+            return self.rate_limiting
+
+        return bool(os.environ.get('LIBCLOUD_RATE_LIMITING',
+                                   False) or ENABLE_RATE_LIMITING)
+
+    def get_rate_limit_account(self):
+        """
+        Return value which identifies the account for the ``account`` and
+        ``action`` scoped rate limits.
+
+        By default a hash of the ``user_id`` or ``key`` attribute is used.
+
+        :rtype: ``str``
+        """
+        account = getattr(self, 'user_id', None) or getattr(self, 'key', None)
+
+        if account is None:
+            return None
+
+        # Credentials are hashed so they are not kept in the bucket registry
+        return hashlib.sha256(b(str(account))).hexdigest()
+
+    def get_rate_limit_action(self, action, params=None, method='GET'):
+        """
+        Return name of the API action for the ``action`` scoped rate limits.
+
+        :rtype: ``str``
+        """
+        return '%s %s' % (method, action)
+
+    def get_rate_limit_buckets(self, action, params=None, method='GET'):
+        """
+        Return token buckets which apply to the provided request.
+
+        :rtype: ``list`` of :class:`libcloud.utils.ratelimit.TokenBucket`
+        """
+        buckets = []
+
+        for rate_limit in self.rate_limits or []:
+            key = (rate_limit.scope, self.host)
+
+            if rate_limit.scope in ['account', 'action']:
+                key += (self.get_rate_limit_account(),)
+
+            if rate_limit.scope == 'action':
+                key += (self.get_rate_limit_action(action=action,
+                                                   params=params,
+                                                   method=method),)
+
+            buckets.append(RATE_LIMITER.get_bucket(key, rate_limit))
+
+        return buckets
+
+    def _reserve_rate_limit(self, action, params=None, method='GET'):
+        """
+        Reserve a token in each of the rate limit buckets which apply to the
+        provided request and return number of seconds to wait before the
+        request can be performed.
+        """
+        if not self._use_rate_limiting():
+            return 0
+
+        buckets = self.get_rate_limit_buckets(action=action, params=params,
+                                              method=method)
+        return RATE_LIMITER.reserve(buckets=buckets)
+
     def _user_agent(self):
         user_agent_suffix = ' '.join(['(%s)' % x for x in self.ua])
 
@@ -526,11 +809,129 @@ class Connection(object):
         :type stream: ``bool``
         :param stream: True to return an iterator in Response.iter_content
                     and allow streaming of the response data
-                    (for downloading large files)
+                    (for downloading large files). For non-raw requests
+                    ``streamResponseCls`` is used if the connection
+                    defines it.
 
         :return: An :class:`Response` instance.
         :rtype: :class:`Response` instance
 
+        """
+        retry_enabled = os.environ.get('LIBCLOUD_RETRY_FAILED_HTTP_REQUESTS',
+                                       False) or RETRY_FAILED_HTTP_REQUESTS
+
+        url, data, headers = self._prepare_request(action=action,
+                                                   params=params, data=data,
+                                                   headers=headers,
+                                                   method=method)
+
+        # IF connection has not yet been established
+        if self.connection is None:
+            self.connect()
+
+        if self.retry_policy is not None:
+            idempotent = self.is_idempotent_request(method=method,
+                                                    params=params,
+                                                    headers=headers)
+
+            def send_request():
+                self._wait_for_rate_limit(action=action, params=params,
+                                          method=method)
+                self._send_request(url=url, data=data, headers=headers,
+                                   method=method, raw=raw, stream=stream)
+                response = self.connection.getresponse()
+                return self._create_response(response=response, raw=raw,
+                                             stream=stream)
+
+            return self.retry_policy.call(send_request, method=method,
+                                          body=data, idempotent=idempotent)
+
+        self._wait_for_rate_limit(action=action, params=params, method=method)
+        self._send_request(url=url, data=data, headers=headers, method=method,
+                           raw=raw, stream=stream,
+                           retry_enabled=retry_enabled)
+
+        return self._create_response(response=self.connection.getresponse(),
+                                     raw=raw, stream=stream)
+
+    def _send_request(self, url, data, headers, method, raw=False,
+                      stream=False, retry_enabled=False):
+        try:
+            # @TODO: Should we just pass File object as body to request method
+            # instead of dealing with splitting and sending the file ourselves?
+            if raw:
+                self.connection.prepared_request(
+                    method=method,
+                    url=url,
+                    body=data,
+                    headers=headers,
+                    raw=raw,
+                    stream=stream)
+            else:
+                if retry_enabled:
+                    retry_request = retry(timeout=self.timeout,
+                                          retry_delay=self.retry_delay,
+                                          backoff=self.backoff)
+                    retry_request(self.connection.request)(method=method,
+                                                           url=url,
+                                                           body=data,
+                                                           headers=headers,
+                                                           stream=stream)
+                else:
+                    self.connection.request(method=method, url=url, body=data,
+                                            headers=headers, stream=stream)
+        except socket.gaierror as e:
+            message = str(e)
+            errno = getattr(e, 'errno', None)
+
+            if errno == -5:
+                # Throw a more-friendly exception on "no address associated
+                # with hostname" error. This error could simpli indicate that
+                # "host" Connection class attribute is set to an incorrect
+                # value
+                class_name = self.__class__.__name__
+                msg = ('%s. Perhaps "host" Connection class attribute '
+                       '(%s.connection) is set to an invalid, non-hostname '
+                       'value (%s)?' %
+                       (message, class_name, self.host))
+                raise socket.gaierror(msg)
+            self.reset_context()
+            raise e
+        except ssl.SSLError as e:
+            self.reset_context()
+            raise ssl.SSLError(str(e))
+
+    def _wait_for_rate_limit(self, action, params=None, method='GET'):
+        delay = self._reserve_rate_limit(action=action, params=params,
+                                         method=method)
+
+        if delay > 0:
+            time.sleep(delay)
+
+    def is_idempotent_request(self, method, params=None, headers=None):
+        """
+        Return True if the request can be safely retried.
+
+        By default this is determined by the HTTP method (see
+        :meth:`libcloud.utils.retry.RetryPolicy.is_idempotent`). Connection
+        classes for APIs which support idempotency tokens can override it.
+
+        :rtype: ``bool``
+        """
+        return self.retry_policy.is_idempotent(method)
+
+    def _prepare_request(self, action, params=None, data=None, headers=None,
+                         method='GET'):
+        """
+        Run all the request pre-processing hooks (default params and
+        headers, cache busting, data encoding, request signing) and return
+        the final request URL, body and headers.
+
+        This is shared between :meth:`request` and
+        :meth:`AsyncConnection.request` so both transports send exactly the
+        same request.
+
+        :rtype: ``tuple`` (``str``, ``object``, ``dict``)
         """
         if params is None:
             params = {}
@@ -542,9 +943,6 @@ class Connection(object):
         else:
             headers = copy.copy(headers)
 
-        retry_enabled = os.environ.get('LIBCLOUD_RETRY_FAILED_HTTP_REQUESTS',
-                                       False) or RETRY_FAILED_HTTP_REQUESTS
-
         action = self.morph_action_hook(action)
         self.action = action
         self.method = method
@@ -586,66 +984,32 @@ class Connection(object):
         else:
             url = action
 
-        # IF connection has not yet been established
-        if self.connection is None:
-            self.connect()
+        return url, data, headers
 
-        try:
-            # @TODO: Should we just pass File object as body to request method
-            # instead of dealing with splitting and sending the file ourselves?
-            if raw:
-                self.connection.prepared_request(
-                    method=method,
-                    url=url,
-                    body=data,
-                    headers=headers,
-                    raw=raw,
-                    stream=stream)
-            else:
-                if retry_enabled:
-                    retry_request = retry(timeout=self.timeout,
-                                          retry_delay=self.retry_delay,
-                                          backoff=self.backoff)
-                    retry_request(self.connection.request)(method=method,
-                                                           url=url,
-                                                           body=data,
-                                                           headers=headers,
-                                                           stream=stream)
-                else:
-                    self.connection.request(method=method, url=url, body=data,
-                                            headers=headers, stream=stream)
-        except socket.gaierror as e:
-            message = str(e)
-            errno = getattr(e, 'errno', None)
+    def _create_response(self, response, raw=False, stream=False):
+        """
+        Wrap the transport level response in the connection response class.
 
-            if errno == -5:
-                # Throw a more-friendly exception on "no address associated
-                # with hostname" error. This error could simpli indicate that
-                # "host" Connection class attribute is set to an incorrect
-                # value
-                class_name = self.__class__.__name__
-                msg = ('%s. Perhaps "host" Connection class attribute '
-                       '(%s.connection) is set to an invalid, non-hostname '
-                       'value (%s)?' %
-                       (message, class_name, self.host))
-                raise socket.gaierror(msg)
-            self.reset_context()
-            raise e
-        except ssl.SSLError as e:
-            self.reset_context()
-            raise ssl.SSLError(str(e))
+        :param response: Response object returned by the transport.
+        :type response: :class:`requests.Response`
+
+        :param raw: True to use ``rawResponseCls``.
+        :type raw: ``bool``
+
+        :param stream: True to use ``streamResponseCls`` (if defined).
+        :type stream: ``bool``
 
+        :rtype: :class:`Response`
+        """
         if raw:
             responseCls = self.rawResponseCls
-            kwargs = {'connection': self,
-                      'response': self.connection.getresponse()}
+        elif stream and self.streamResponseCls is not None:
+            responseCls = self.streamResponseCls
         else:
             responseCls = self.responseCls
-            kwargs = {'connection': self,
-                      'response': self.connection.getresponse()}
 
         try:
-            response = responseCls(**kwargs)
+            response = responseCls(connection=self, response=response)
         finally:
             # Always reset the context after the request has completed
             self.reset_context()
@@ -720,6 +1084,111 @@ class Connection(object):
         return params
 
 
+class PollSchedule(object):
+    """
+    Schedule which determines how long to wait between job status polls.
+
+    Default schedule uses a fixed interval. If the provider suggested an
+    interval (e.g. using ``Retry-After`` header), it's used instead.
+    """
+
+    def __init__(self, interval=0.5):
+        """
+        :param interval: Number of seconds to wait between polls.
+        :type interval: ``float``
+        """
+        self.interval = interval
+
+    def get_delay(self, poll_count, hint=None):
+        """
+        Return number of seconds to wait before the next poll.
+
+        :param poll_count: Number of status polls which have been performed
+                           so far.
+        :type poll_count: ``int``
+
+        :param hint: Interval suggested by the provider (if any).
+        :type hint: ``float``
+
+        :rtype: ``float``
+        """
+        if hint is not None:
+            return hint
+
+        return self.interval
+
+
+class ExponentialBackoffPollSchedule(PollSchedule):
+    """
+    Schedule where the interval between polls grows exponentially up to the
+    maximum interval.
+
+    Random jitter is applied to each interval so jobs which have been started
+    at the same time don't poll in lockstep.
+    """
+
+    def __init__(self, interval=0.5, multiplier=2, max_interval=30,
+                 jitter=0.1):
+        """
+        :param interval: Number of seconds to wait before the first poll.
+        :type interval: ``float``
+
+        :param multiplier: Multiplier which is applied to the interval after
+                           each poll.
+        :type multiplier: ``float``
+
+        :param max_interval: Maximum number of seconds between polls.
+        :type max_interval: ``float``
+
+        :param jitter: Fraction of the interval by which it's randomly
+                       shortened (0 disables jitter).
+        :type jitter: ``float``
+        """
+        super(ExponentialBackoffPollSchedule, self).__init__(
+            interval=interval)
+        self.multiplier = multiplier
+        self.max_interval = max_interval
+        self.jitter = jitter
+
+    def get_delay(self, poll_count, hint=None):
+        if hint is not None:
+            return hint
+
+        delay = self.interval * (self.multiplier ** max(poll_count - 1, 0))
+
+        if self.max_interval is not None:
+            delay = min(delay, self.max_interval)
+
+        if self.jitter:
+            delay -= delay * self.jitter * random.random()
+
+        return delay
+
+
+class PollStats(object):
+    """
+    Timing statistics for a single job which has been waited for using
+    :meth:`PollingConnection.async_request`.
+    """
+
+    def __init__(self):
+        self.start_time = time.time()
+        self.end_time = None  # type: Optional[float]
+        self.poll_count = 0
+        self.sleep_time = 0.0
+        self.completed = False
+
+    @property
+    def duration(self):
+        end_time = self.end_time or time.time()
+        return end_time - self.start_time
+
+    def __repr__(self):
+        return ('<PollStats completed=%s, poll_count=%s, duration=%.2f, '
+                'sleep_time=%.2f>' % (self.completed, self.poll_count,
+                                      self.duration, self.sleep_time))
+
+
 class PollingConnection(Connection):
     """
     Connection class which can also work with the async APIs.
@@ -727,11 +1196,24 @@ class PollingConnection(Connection):
     After initial requests, this class periodically polls for jobs status and
     waits until the job has finished.
     If job doesn't finish in timeout seconds, an Exception thrown.
+
+    By default jobs are polled every ``poll_interval`` seconds. Interval grows
+    by ``poll_backoff`` multiplier (up to ``poll_max_interval`` seconds) after
+    each poll and a custom :class:`PollSchedule` can be used by setting
+    ``poll_schedule`` attribute.
     """
     poll_interval = 0.5
+    poll_backoff = 1  # type: float
+    poll_max_interval = None  # type: Optional[float]
+    poll_jitter = 0  # type: float
+    poll_schedule = None  # type: Optional[PollSchedule]
+    max_polls = None  # type: Optional[int]
     timeout = 200
     request_method = 'request'
 
+    # Timing statistics for the last job which has been waited for
+    last_poll_stats = None  # type: Optional[PollStats]
+
     def async_request(self, action, params=None, data=None, headers=None,
                       method='GET', context=None):
         """
@@ -747,8 +1229,9 @@ class PollingConnection(Connection):
 
         - Returned 'job_id' is then used to construct a URL which is used for
           retrieving job status. Constructed URL is then periodically polled
-          until the response indicates that the job has completed or the
-          timeout of 'self.timeout' seconds has been reached.
+          (see :meth:`get_poll_schedule`) until the response indicates that
+          the job has completed, the timeout of 'self.timeout' seconds has
+          been reached or the job has been polled 'self.max_polls' times.
 
         :type action: ``str``
         :param action: A path
@@ -775,30 +1258,147 @@ class PollingConnection(Connection):
         :rtype: :class:`Response` instance
         """
 
+        job = self.start_async_request(action=action, params=params,
+                                       data=data, headers=headers,
+                                       method=method, context=context)
+
         request = getattr(self, self.request_method)
-        kwargs = self.get_request_kwargs(action=action, params=params,
-                                         data=data, headers=headers,
-                                         method=method,
-                                         context=context)
-        response = request(**kwargs)
-        kwargs = self.get_poll_request_kwargs(response=response,
-                                              context=context,
-                                              request_kwargs=kwargs)
+        kwargs = job.poll_kwargs
+        schedule = job.schedule
+        stats = job.stats
+        self.last_poll_stats = stats
 
-        end = time.time() + self.timeout
+        end = job.deadline
         completed = False
         while time.time() < end and not completed:
+            if self.max_polls is not None and \
+                    stats.poll_count >= self.max_polls:
+                break
+
             response = request(**kwargs)
+            stats.poll_count += 1
             completed = self.has_completed(response=response)
             if not completed:
-                time.sleep(self.poll_interval)
+                hint = self.get_poll_interval_hint(response=response)
+                delay = schedule.get_delay(poll_count=stats.poll_count,
+                                           hint=hint)
+                delay = max(min(delay, end - time.time()), 0)
+                stats.sleep_time += delay
+                time.sleep(delay)
+
+        stats.end_time = time.time()
+        stats.completed = completed
 
         if not completed:
+            if self.max_polls is not None and \
+                    stats.poll_count >= self.max_polls:
+                raise LibcloudError('Job did not complete after %s polls' %
+                                    (stats.poll_count))
+
             raise LibcloudError('Job did not complete in %s seconds' %
                                 (self.timeout))
 
         return response
 
+    def start_async_request(self, action, params=None, data=None,
+                            headers=None, method='GET', context=None):
+        """
+        Perform the initial 'async' request and return a handle for the
+        started job without waiting for it to complete.
+
+        Returned job can be waited for using :class:`JobWaiter`. Arguments
+        are the same as for :meth:`async_request`.
+
+        :rtype: :class:`PollingJob`
+        """
+        request = getattr(self, self.request_method)
+        kwargs = self.get_request_kwargs(action=action, params=params,
+                                         data=data, headers=headers,
+                                         method=method,
+                                         context=context)
+        response = request(**kwargs)
+        kwargs = self.get_poll_request_kwargs(response=response,
+                                              context=context,
+                                              request_kwargs=kwargs)
+        return PollingJob(connection=self, poll_kwargs=kwargs,
+                          response=response, context=context)
+
+    def poll_jobs(self, jobs):
+        """
+        Retrieve status of the provided jobs.
+
+        Default implementation polls each job separately. Connection classes
+        for providers which offer a batched status API can override it so
+        many jobs can be checked using a single request.
+
+        :param jobs: Jobs to retrieve the status for.
+        :type jobs: ``list`` of :class:`PollingJob`
+
+        :return: Poll responses in the same order as the provided jobs.
+        :rtype: ``list``
+        """
+        request = getattr(self, self.request_method)
+        return [request(**job.poll_kwargs) for job in jobs]
+
+    def get_poll_connection(self):
+        """
+        Return a copy of this connection which is used by :class:`JobWaiter`
+        to poll the jobs from its scheduler thread (connection instances are
+        not thread safe).
+
+        :rtype: :class:`PollingConnection`
+        """
+        connection = copy.copy(self)
+        connection.context = {}
+        connection.connect()
+        return connection
+
+    def get_poll_schedule(self):
+        """
+        Return schedule which is used when polling for the job status.
+
+        :rtype: :class:`PollSchedule`
+        """
+        if self.poll_schedule is not None:
+            return self.poll_schedule
+
+        if self.poll_backoff == 1 and not self.poll_jitter:
+            return PollSchedule(interval=self.poll_interval)
+
+        return ExponentialBackoffPollSchedule(
+            interval=self.poll_interval, multiplier=self.poll_backoff,
+            max_interval=self.poll_max_interval, jitter=self.poll_jitter)
+
+    def get_poll_interval_hint(self, response):
+        """
+        Return poll interval suggested by the provider in the job status
+        response or None if the response contains no such suggestion.
+
+        By default, ``Retry-After`` response header is used.
+
+        :param response: Response object returned by poll request.
+        :type response: :class:`HTTPResponse`
+
+        :rtype: ``float``
+        """
+        headers = getattr(response, 'headers', None) or {}
+        value = headers.get('retry-after', None)
+
+        if not value:
+            return None
+
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+
+        http_date = parsedate_tz(value)
+
+        if http_date is None:
+            return None
+
+        return max(mktime_tz(http_date) - time.time(), 0)
+
     def get_request_kwargs(self, action, params=None, data=None, headers=None,
                            method='GET', context=None):
         """
@@ -837,6 +1437,463 @@ class PollingConnection(Connection):
         raise NotImplementedError('has_completed not implemented')
 
 
+class PollingJob(object):
+    """
+    Handle for a job which has been started using
+    :meth:`PollingConnection.start_async_request`.
+    """
+
+    def __init__(self, connection, poll_kwargs, response=None, context=None,
+                 timeout=None):
+        """
+        :param connection: Connection which has started the job.
+        :type connection: :class:`PollingConnection`
+
+        :param poll_kwargs: Keyword arguments which are passed to the
+                            request method when polling for the job status.
+        :type poll_kwargs: ``dict``
+
+        :param response: Response to the request which has started the job.
+
+        :param context: Context dictionary which has been passed to the
+                        request.
+        :type context: ``dict``
+
+        :param timeout: Number of seconds to wait for the job to complete
+                        (defaults to connection timeout).
+        :type timeout: ``int``
+        """
+        self.connection = connection
+        self.poll_kwargs = poll_kwargs
+        self.response = response
+        self.context = context
+        self.schedule = connection.get_poll_schedule()
+        self.stats = PollStats()
+
+        timeout = timeout if timeout is not None else connection.timeout
+        self.timeout = timeout
+        self.deadline = self.stats.start_time + timeout
+
+    def __repr__(self):
+        return ('<PollingJob poll_kwargs=%s, stats=%s>' %
+                (self.poll_kwargs, self.stats))
+
+
+class JobWaiter(object):
+    """
+    Waits for many jobs started using
+    :meth:`PollingConnection.start_async_request` concurrently.
+
+    All the jobs are polled from a single scheduler thread according to their
+    poll schedules. Jobs which belong to the same connection and are due at
+    the same time are polled together using
+    :meth:`PollingConnection.poll_jobs` so providers with a batched status API
+    only need a single request for all of them.
+
+    Jobs are polled using a copy of their connection (see
+    :meth:`PollingConnection.get_poll_connection`) so the original connection
+    can still be used by the caller while the jobs are being waited for.
+
+    Usage::
+
+        waiter = JobWaiter()
+        futures = [waiter.submit(connection.start_async_request(...))
+                   for _ in range(100)]
+
+        for future in concurrent.futures.as_completed(futures):
+            response = future.result()
+
+        waiter.shutdown()
+    """
+
+    # Jobs which are due within this many seconds are polled together
+    batch_window = 0.05
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._jobs = []  # type: List[tuple]
+        self._counter = itertools.count()
+        self._thread = None  # type: Optional[threading.Thread]
+        self._shutdown = False
+
+        # Connections used by the scheduler thread keyed by the id of the
+        # job connection. Only accessed from the scheduler thread.
+        self._connections = {}  # type: Dict[int, tuple]
+
+    def submit(self, job):
+        """
+        Start waiting for the provided job.
+
+        :param job: Job to wait for.
+        :type job: :class:`PollingJob`
+
+        :return: Future which resolves to the last poll response once the
+                 job has completed.
+        :rtype: :class:`concurrent.futures.Future`
+        """
+        return self._submit([job])[0]
+
+    def wait(self, jobs, timeout=None):
+        """
+        Wait for the provided jobs to complete and return their results.
+
+        :param jobs: Jobs to wait for.
+        :type jobs: ``list`` of :class:`PollingJob`
+
+        :param timeout: Maximum number of seconds to wait.
+        :type timeout: ``float``
+
+        :return: Last poll response for each job (in the same order).
+        :rtype: ``list``
+
+        :raises: ``concurrent.futures.TimeoutError`` if some of the jobs
+                 haven't completed within ``timeout`` seconds. Those jobs
+                 are not polled anymore.
+        """
+        futures = self._submit(jobs)
+        _, not_done = concurrent.futures.wait(futures, timeout=timeout)
+
+        if not_done:
+            for future in not_done:
+                future.cancel()
+
+            raise concurrent.futures.TimeoutError(
+                '%s (of %s) jobs did not complete in %s seconds' %
+                (len(not_done), len(futures), timeout))
+
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait=True):
+        """
+        Stop the scheduler thread. Jobs which haven't completed yet are
+        cancelled.
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify()
+            thread = self._thread
+
+        if wait and thread is not None:
+            thread.join()
+
+    def _submit(self, jobs):
+        futures = [concurrent.futures.Future() for _ in jobs]
+        now = time.time()
+
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('Cannot submit jobs after shutdown')
+
+            for job, future in zip(jobs, futures):
+                self._schedule(job, future, now)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name='libcloud-job-waiter')
+                self._thread.daemon = True
+                self._thread.start()
+
+            self._condition.notify()
+
+        return futures
+
+    def _schedule(self, job, future, poll_time):
+        heapq.heappush(self._jobs, (poll_time, next(self._counter), job,
+                                    future))
+
+    def _get_due_jobs(self):
+        with self._condition:
+            while True:
+                if self._shutdown:
+                    return None
+
+                now = time.time()
+
+                if self._jobs and self._jobs[0][0] <= now:
+                    break
+
+                timeout = self._jobs[0][0] - now if self._jobs else None
+                self._condition.wait(timeout)
+
+            due_jobs = []
+
+            while self._jobs and self._jobs[0][0] <= now + self.batch_window:
+                _, _, job, future = heapq.heappop(self._jobs)
+
+                if not future.cancelled():
+                    due_jobs.append((job, future))
+
+            return due_jobs
+
+    def _run(self):
+        while True:
+            due_jobs = self._get_due_jobs()
+
+            if due_jobs is None:
+                break
+
+            # Group jobs by connection so they can be polled together
+            batches = OrderedDict()  # type: OrderedDict
+
+            for job, future in due_jobs:
+                batches.setdefault(id(job.connection), []).append(
+                    (job, future))
+
+            for batch in batches.values():
+                self._poll_batch(batch)
+
+        with self._condition:
+            jobs = self._jobs
+            self._jobs = []
+
+        for _, _, _, future in jobs:
+            future.cancel()
+
+        for _, connection in self._connections.values():
+            self._close_connection(connection)
+
+        self._connections = {}
+
+    def _get_poll_connection(self, connection):
+        key = id(connection)
+
+        if key not in self._connections:
+            # Reference to the job connection is kept so its id isn't reused
+            self._connections[key] = (connection,
+                                      connection.get_poll_connection())
+
+        return self._connections[key][1]
+
+    def _close_connection(self, connection):
+        session = getattr(connection.connection, 'session', None)
+
+        if session is not None:
+            session.close()
+
+    def _poll_batch(self, batch):
+        jobs = [job for job, _ in batch]
+
+        try:
+            connection = self._get_poll_connection(jobs[0].connection)
+            responses = connection.poll_jobs(jobs)
+        except Exception as e:
+            if len(batch) == 1:
+                self._set_exception(batch[0][1], e)
+                return
+
+            # Poll jobs separately so an error only affects the job which
+            # caused it
+            for item in batch:
+                self._poll_batch([item])
+
+            return
+
+        for (job, future), response in zip(batch, responses):
+            self._handle_response(job, future, response)
+
+    def _handle_response(self, job, future, response):
+        connection = job.connection
+        stats = job.stats
+        stats.poll_count += 1
+
+        if future.cancelled():
+            # Caller is not waiting for the job anymore
+            stats.end_time = time.time()
+            return
+
+        try:
+            completed = connection.has_completed(response=response)
+        except Exception as e:
+            stats.end_time = time.time()
+            self._set_exception(future, e)
+            return
+
+        now = time.time()
+
+        if completed:
+            stats.end_time = now
+            stats.completed = True
+
+            if not future.done():
+                future.set_result(response)
+
+            return
+
+        if connection.max_polls is not None and \
+                stats.poll_count >= connection.max_polls:
+            stats.end_time = now
+            self._set_exception(future, LibcloudError(
+                'Job did not complete after %s polls' % (stats.poll_count)))
+            return
+
+        if now >= job.deadline:
+            stats.end_time = now
+            self._set_exception(future, LibcloudError(
+                'Job did not complete in %s seconds' % (job.timeout)))
+            return
+
+        hint = connection.get_poll_interval_hint(response=response)
+        delay = job.schedule.get_delay(poll_count=stats.poll_count, hint=hint)
+        delay = max(min(delay, job.deadline - now), 0)
+        stats.sleep_time += delay
+
+        with self._condition:
+            self._schedule(job, future, now + delay)
+
+    def _set_exception(self, future, exception):
+        # Future might have been cancelled while the job was being polled
+        if not future.done():
+            future.set_exception(exception)
+
+
+class AsyncConnection(object):
+    """
+    Asyncio counterpart of :class:`Connection`.
+
+    It wraps an existing (synchronous) connection instance and reuses all of
+    its request hooks (default params and headers, request signing, etc.) and
+    its ``responseCls``. Only the transport differs - requests are performed
+    using a non-blocking :class:`AsyncLibcloudConnection` so a single process
+    can have many requests in flight without using a thread per request.
+
+    Note: Only regular (non-raw) requests are supported.
+    """
+    conn_class = AsyncLibcloudConnection
+
+    def __init__(self, connection):
+        """
+        :param connection: Synchronous connection instance to wrap.
+        :type connection: :class:`Connection`
+        """
+        self.sync_connection = connection
+        self.connection = None
+
+    @property
+    def driver(self):
+        return self.sync_connection.driver
+
+    def connect(self):
+        """
+        Establish a connection with the API server.
+        """
+        conn = self.sync_connection
+        base_url = getattr(conn, 'base_url', None)
+
+        if base_url:
+            host, port, secure, _ = conn._tuple_from_url(base_url)
+        else:
+            host, port, secure = conn.host, conn.port, conn.secure
+
+        kwargs = {'host': host, 'port': int(port), 'secure': secure}
+
+        if conn.timeout:
+            kwargs['timeout'] = conn.timeout
+
+        if conn.proxy_url:
+            kwargs['proxy_url'] = conn.proxy_url
+
+        self.connection = self.conn_class(**kwargs)
+
+    async def request(self, action, params=None, data=None, headers=None,
+                      method='GET'):
+        """
+        Request a given `action`.
+
+        Takes the same arguments as :meth:`Connection.request` (except
+        ``raw`` and ``stream``) and returns an instance of the wrapped
+        connection ``responseCls``.
+
+        :rtype: :class:`Response` instance
+        """
+        if self.connection is None:
+            self.connect()
+
+        # NOTE: Request preparation is synchronous so there is no chance for
+        # a different coroutine to modify connection state (action, method,
+        # data, context) before the request hooks have been called.
+        conn = self.sync_connection
+        url, data, headers = conn._prepare_request(action=action,
+                                                   params=params, data=data,
+                                                   headers=headers,
+                                                   method=method)
+        context = conn.context
+        conn.reset_context()
+
+        delay = conn._reserve_rate_limit(action=action, params=params,
+                                         method=method)
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        response = await self.connection.request(method=method, url=url,
+                                                 body=data, headers=headers)
+
+        conn.context = context
+        return conn._create_response(response=response)
+
+    async def close(self):
+        """
+        Close the underlying transport and release pooled connections.
+        """
+        if self.connection is not None:
+            await self.connection.close()
+
+
+class AsyncPageIterator(object):
+    """
+    Asynchronous iterator over a paginated API listing.
+
+    ``fetch_page`` is a coroutine function which receives the marker returned
+    by the previous call (``None`` for the first page) and returns a tuple of
+    ``(items, next_marker)``. Iteration stops once ``next_marker`` is
+    ``None``.
+    """
+
+    def __init__(self, fetch_page):
+        self._fetch_page = fetch_page
+        self._items = []
+        self._marker = None
+        self._exhausted = False
+
+    @classmethod
+    def from_iterator(cls, func, page_size=100):
+        """
+        Create an asynchronous iterator from a blocking iterator factory.
+
+        This is a fallback for drivers without native asyncio support - the
+        blocking iterator is advanced in the default executor, ``page_size``
+        items at a time.
+        """
+        state = {}
+
+        async def fetch_page(marker):
+            loop = asyncio.get_event_loop()
+
+            if 'iterator' not in state:
+                state['iterator'] = await loop.run_in_executor(None, func)
+
+            items = await loop.run_in_executor(
+                None, lambda: list(itertools.islice(state['iterator'],
+                                                    page_size)))
+            return items, (True if len(items) == page_size else None)
+
+        return cls(fetch_page)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._items:
+            if self._exhausted:
+                raise StopAsyncIteration
+
+            items, self._marker = await self._fetch_page(self._marker)
+            self._items = list(reversed(items))
+            self._exhausted = self._marker is None
+
+        return self._items.pop()
+
+
 class ConnectionKey(Connection):
     """
     Base connection class which accepts a single ``key`` argument.
@@ -988,6 +2045,31 @@ class BaseDriver(object):
         self.connection.driver = self
         self.connection.connect()
 
+        self._async_connection = None
+
+    @property
+    def async_connection(self):
+        """
+        :class:`AsyncConnection` which wraps this driver's connection and is
+        used by the asyncio variants of the driver methods.
+
+        It's created lazily on first access.
+
+        :rtype: :class:`AsyncConnection`
+        """
+        if getattr(self, '_async_connection', None) is None:
+            self._async_connection = AsyncConnection(self.connection)
+
+        return self._async_connection
+
+    async def close_async(self):
+        """
+        Close asyncio transport (if it has been used) and release all the
+        pooled connections.
+        """
+        if getattr(self, '_async_connection', None) is not None:
+            await self._async_connection.close()
+
     def _ex_connection_class_kwargs(self):
         """
         Return extra connection keyword arguments which are passed to the
@@ -17,6 +17,7 @@ import base64
 import hashlib
 import copy
 import hmac
+import time
 
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import urlencode
@@ -29,6 +30,9 @@ from libcloud.common.base import JsonResponse
 from libcloud.common.types import MalformedResponseError
 from libcloud.compute.types import InvalidCredsError
 
+# Prefixes of the commands which only retrieve data and can be safely retried
+IDEMPOTENT_COMMAND_PREFIXES = ('list', 'query', 'get')
+
 
 class CloudStackResponse(JsonResponse):
     def parse_error(self):
@@ -55,6 +59,9 @@ class CloudStackResponse(JsonResponse):
 class CloudStackConnection(ConnectionUserAndKey, PollingConnection):
     responseCls = CloudStackResponse
     poll_interval = 1
+    poll_backoff = 1.5
+    poll_max_interval = 10.0
+    poll_jitter = 0.1
     request_method = '_sync_request'
     timeout = 600
 
@@ -62,6 +69,15 @@ class CloudStackConnection(ConnectionUserAndKey, PollingConnection):
     ASYNC_SUCCESS = 1
     ASYNC_FAILURE = 2
 
+    # Number of jobs which are retrieved using a single listAsyncJobs call
+    # when polling many jobs at once
+    poll_jobs_page_size = 500
+
+    # Jobs are listed starting this many seconds before the oldest polled job
+    # has been started to account for the clock difference between the
+    # client and the server
+    poll_jobs_start_date_margin = 300
+
     def encode_data(self, data):
         """
         Must of the data is sent as part of query params (eeww),
@@ -116,6 +132,92 @@ class CloudStackConnection(ConnectionUserAndKey, PollingConnection):
             method=method, context=context)
         return result['jobresult']
 
+    def _start_async_request(self, command, action=None, params=None,
+                             data=None, headers=None, method='GET',
+                             context=None):
+        """
+        Start an async job and return a handle for it without waiting for
+        the job to complete.
+
+        Returned job can be waited for using
+        :class:`libcloud.common.base.JobWaiter`. Job result is available in
+        the 'jobresult' key of the resolved value.
+
+        :rtype: :class:`libcloud.common.base.PollingJob`
+        """
+        if params:
+            context = copy.deepcopy(params)
+        else:
+            context = {}
+
+        context['command'] = command
+        return self.start_async_request(action=action, params=params,
+                                        data=data, headers=headers,
+                                        method=method, context=context)
+
+    def poll_jobs(self, jobs):
+        """
+        Retrieve status of many jobs using listAsyncJobs calls.
+
+        Only jobs which have been submitted after the oldest of the provided
+        jobs has been started are listed (page by page) so the whole job
+        history of the account isn't retrieved on each poll. Jobs which are
+        not included in the listAsyncJobs response are polled separately.
+        """
+        if len(jobs) < 2:
+            return super(CloudStackConnection, self).poll_jobs(jobs)
+
+        job_ids = set(job.poll_kwargs['params']['jobid'] for job in jobs)
+        start_time = min(job.stats.start_time for job in jobs)
+        start_time -= self.poll_jobs_start_date_margin
+        start_date = time.strftime('%Y-%m-%dT%H:%M:%S+0000',
+                                   time.gmtime(start_time))
+
+        params = {'listall': 'true', 'startdate': start_date,
+                  'pagesize': self.poll_jobs_page_size}
+        async_jobs = {}
+        page = 1
+
+        while True:
+            params['page'] = page
+            result = self._sync_request(command='listAsyncJobs',
+                                        params=params, method='GET')
+            items = result.get('asyncjobs', [])
+
+            for job in items:
+                if job['jobid'] in job_ids:
+                    async_jobs[job['jobid']] = job
+
+            if len(items) < self.poll_jobs_page_size or \
+                    len(async_jobs) == len(job_ids):
+                break
+
+            page += 1
+
+        responses = []
+
+        for job in jobs:
+            response = async_jobs.get(job.poll_kwargs['params']['jobid'])
+
+            if response is None:
+                response = self._sync_request(**job.poll_kwargs)
+
+            responses.append(response)
+
+        return responses
+
+    def is_idempotent_request(self, method, params=None, headers=None):
+        params = params or {}
+        command = params.get('command', None)
+
+        if command is None:
+            return super(CloudStackConnection, self).is_idempotent_request(
+                method=method, params=params, headers=headers)
+
+        # All the commands are sent using GET so the HTTP method can't be
+        # used. Only commands which retrieve data can be safely retried.
+        return command.lower().startswith(IDEMPOTENT_COMMAND_PREFIXES)
+
     def get_request_kwargs(self, action, params=None, data='', headers=None,
                            method='GET', context=None):
         command = context['command']
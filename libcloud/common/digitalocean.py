@@ -18,6 +18,7 @@ Common settings and connection objects for DigitalOcean Cloud
 """
 
 from libcloud.utils.py3 import httplib, parse_qs, urlparse
+from libcloud.utils.ratelimit import RateLimit
 
 from libcloud.common.base import BaseDriver
 from libcloud.common.base import ConnectionKey
@@ -75,6 +76,10 @@ class DigitalOcean_v2_Connection(ConnectionKey):
     host = 'api.digitalocean.com'
     responseCls = DigitalOcean_v2_Response
 
+    # DigitalOcean API allows 5000 requests per hour and 250 requests per
+    # minute per token
+    rate_limits = [RateLimit(rate=5000 / 3600.0, burst=250, scope='account')]
+
     def add_default_headers(self, headers):
         """
         Add headers that are necessary for every request
@@ -67,6 +67,8 @@ Please remember to secure your keys and access tokens.
 
 from __future__ import with_statement
 
+from typing import Optional
+
 try:
     import simplejson as json
 except ImportError:
@@ -80,6 +82,7 @@ import datetime
 import os
 import socket
 import sys
+import threading
 
 from libcloud.utils.connection import get_response_object
 from libcloud.utils.py3 import b, httplib, urlencode, urlparse, PY3
@@ -100,6 +103,21 @@ except ImportError:
 
 UTC_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 
+# How many seconds before the access token expires a new token is requested
+# in the background
+TOKEN_REFRESH_AHEAD_SECONDS = 300
+
+# Minimum number of seconds between two background token refresh attempts
+TOKEN_REFRESH_MIN_INTERVAL_SECONDS = 30
+
+# Lifetime of the signed JWT assertion which is used by Service Account
+# authentication (maximum allowed by Google is 1 hour)
+JWT_ASSERTION_LIFETIME_SECONDS = 3600
+
+# Signed JWT assertion is re-used until it's about to expire in less than
+# this number of seconds
+JWT_ASSERTION_REFRESH_AHEAD_SECONDS = 300
+
 LOG = logging.getLogger(__name__)
 
 
@@ -502,6 +520,11 @@ class GoogleServiceAcctAuthConnection(GoogleBaseAuthConnection):
         super(GoogleServiceAcctAuthConnection, self).__init__(
             user_id, key, *args, **kwargs)
 
+        self._private_key = None
+        self._assertion = None
+        self._assertion_expire_time = 0
+        self._assertion_lock = threading.Lock()
+
     def get_new_token(self):
         """
         Get a new token using the email address and RSA Key.
@@ -509,6 +532,34 @@ class GoogleServiceAcctAuthConnection(GoogleBaseAuthConnection):
         :return:  Dictionary containing token information
         :rtype:   ``dict``
         """
+        request = {'grant_type': 'urn:ietf:params:oauth:grant-type:jwt-bearer',
+                   'assertion': self._get_assertion()}
+
+        return self._token_request(request)
+
+    def _get_assertion(self):
+        """
+        Return signed JWT assertion.
+
+        Signing the assertion is relatively expensive so the assertion is
+        re-used for subsequent token requests until it's about to expire.
+
+        :rtype: ``bytes``
+        """
+        with self._assertion_lock:
+            now = int(time.time())
+            expire_time = (self._assertion_expire_time -
+                           JWT_ASSERTION_REFRESH_AHEAD_SECONDS)
+
+            if self._assertion is None or now >= expire_time:
+                self._assertion_expire_time = \
+                    now + JWT_ASSERTION_LIFETIME_SECONDS
+                self._assertion = self._sign_assertion(
+                    issued_at=now, expire_time=self._assertion_expire_time)
+
+            return self._assertion
+
+    def _sign_assertion(self, issued_at, expire_time):
         # The header is always the same
         header = {'alg': 'RS256', 'typ': 'JWT'}
         header_enc = base64.urlsafe_b64encode(b(json.dumps(header)))
@@ -517,19 +568,14 @@ class GoogleServiceAcctAuthConnection(GoogleBaseAuthConnection):
         claim_set = {'iss': self.user_id,
                      'scope': self.scopes,
                      'aud': 'https://accounts.google.com/o/oauth2/token',
-                     'exp': int(time.time()) + 3600,
-                     'iat': int(time.time())}
+                     'exp': expire_time,
+                     'iat': issued_at}
         claim_set_enc = base64.urlsafe_b64encode(b(json.dumps(claim_set)))
 
         # The message contains both the header and claim set
         message = b'.'.join((header_enc, claim_set_enc))
         # Then the message is signed using the key supplied
-        key = serialization.load_pem_private_key(
-            b(self.key),
-            password=None,
-            backend=default_backend()
-        )
-        signature = key.sign(
+        signature = self._get_private_key().sign(
             data=b(message),
             padding=PKCS1v15(),
             algorithm=SHA256()
@@ -537,11 +583,18 @@ class GoogleServiceAcctAuthConnection(GoogleBaseAuthConnection):
         signature = base64.urlsafe_b64encode(signature)
 
         # Finally the message and signature are sent to get a token
-        jwt = b'.'.join((message, signature))
-        request = {'grant_type': 'urn:ietf:params:oauth:grant-type:jwt-bearer',
-                   'assertion': jwt}
+        return b'.'.join((message, signature))
 
-        return self._token_request(request)
+    def _get_private_key(self):
+        # Key is only parsed once
+        if self._private_key is None:
+            self._private_key = serialization.load_pem_private_key(
+                b(self.key),
+                password=None,
+                backend=default_backend()
+            )
+
+        return self._private_key
 
 
 class GoogleGCEServiceAcctAuthConnection(GoogleBaseAuthConnection):
@@ -625,8 +678,23 @@ class GoogleAuthType(object):
 
 
 class GoogleOAuth2Credential(object):
+    """
+    OAuth2 credential which caches the access token in a credential file.
+
+    Access token is refreshed in a background thread when it's about to
+    expire in less than ``refresh_ahead`` seconds so requests don't need to
+    wait for a token round trip. If the token has already expired, all the
+    threads wait for a single (shared) refresh.
+    """
     default_credential_file = '~/.google_libcloud_auth'
 
+    # Number of seconds before the token expiration time at which a new token
+    # is requested
+    refresh_ahead = TOKEN_REFRESH_AHEAD_SECONDS
+
+    # True to refresh the token in a background thread ahead of expiration
+    background_refresh = True
+
     def __init__(self, user_id, key, auth_type=None, credential_file=None,
                  scopes=None, **kwargs):
         self.auth_type = auth_type or GoogleAuthType.guess_type(user_id)
@@ -648,6 +716,10 @@ class GoogleOAuth2Credential(object):
             'https://www.googleapis.com/auth/ndev.clouddns.readwrite',
         ]
 
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread = None  # type: Optional[threading.Thread]
+        self._last_background_refresh = None  # type: Optional[float]
+
         self.token = self._get_token_from_file()
 
         if self.auth_type == GoogleAuthType.GCE:
@@ -669,8 +741,17 @@ class GoogleOAuth2Credential(object):
 
     @property
     def access_token(self):
-        if self.token_expire_utc_datetime < _utcnow():
-            self._refresh_token()
+        now = _utcnow()
+
+        if self.token_expire_utc_datetime < now:
+            # Token has expired. Only a single thread refreshes it, other
+            # threads wait for the refresh to finish and use the new token.
+            with self._refresh_lock:
+                if self.token_expire_utc_datetime < _utcnow():
+                    self._refresh_token()
+        elif self._should_refresh_ahead(now):
+            self._start_background_refresh()
+
         return self.token['access_token']
 
     @property
@@ -681,6 +762,59 @@ class GoogleOAuth2Credential(object):
         self.token = self.oauth2_conn.refresh_token(self.token)
         self._write_token_to_file()
 
+    def _should_refresh_ahead(self, now):
+        refresh_time = self.token_expire_utc_datetime - \
+            datetime.timedelta(seconds=self.refresh_ahead)
+        return refresh_time < now
+
+    def _can_refresh_in_background(self):
+        # Installed Application tokens without a refresh token can only be
+        # refreshed interactively
+        if self.auth_type == GoogleAuthType.IA:
+            return 'refresh_token' in self.token
+
+        return True
+
+    def _start_background_refresh(self):
+        if not self.background_refresh or \
+                not self._can_refresh_in_background():
+            return
+
+        with self._refresh_lock:
+            if self._refresh_thread is not None and \
+                    self._refresh_thread.is_alive():
+                # Refresh is already in progress
+                return
+
+            now = time.time()
+
+            if self._last_background_refresh is not None and \
+                    now - self._last_background_refresh < \
+                    TOKEN_REFRESH_MIN_INTERVAL_SECONDS:
+                return
+
+            self._last_background_refresh = now
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh,
+                name='libcloud-google-token-refresh')
+            self._refresh_thread.daemon = True
+            self._refresh_thread.start()
+
+    def _background_refresh(self):
+        with self._refresh_lock:
+            # Token could have already been refreshed by a request which has
+            # found the token expired
+            if not self._should_refresh_ahead(_utcnow()):
+                return
+
+            try:
+                self._refresh_token()
+            except Exception as e:
+                # Not fatal, token will be refreshed on the next attempt or
+                # when it expires
+                LOG.warning('Failed to refresh auth token in the '
+                            'background: %s', str(e))
+
     def _get_token_from_file(self):
         """
         Read credential file and return token information.
@@ -712,12 +846,18 @@ class GoogleOAuth2Credential(object):
         filename = os.path.expanduser(self.credential_file)
         filename = os.path.realpath(filename)
 
+        # Token is written to a temporary file which is then renamed so other
+        # threads and processes never read a partially written file
+        tmp_filename = '%s.%s.%s.tmp' % (filename, os.getpid(),
+                                         threading.current_thread().ident)
+
         try:
             data = json.dumps(self.token)
             write_flags = os.O_CREAT | os.O_WRONLY | os.O_TRUNC
-            with os.fdopen(os.open(filename, write_flags,
+            with os.fdopen(os.open(tmp_filename, write_flags,
                                    int('600', 8)), 'w') as f:
                 f.write(data)
+            os.replace(tmp_filename, filename)
         except Exception as e:
             # Note: Failure to write (cache) token in a file is not fatal. It
             # simply means degraded performance since we will need to acquire a
@@ -725,6 +865,11 @@ class GoogleOAuth2Credential(object):
             LOG.info('Failed to write auth token to file "%s": %s',
                      filename, str(e))
 
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+
 
 class GoogleBaseConnection(ConnectionUserAndKey, PollingConnection):
     """Base connection class for interacting with Google APIs."""
@@ -733,6 +878,9 @@ class GoogleBaseConnection(ConnectionUserAndKey, PollingConnection):
     responseCls = GoogleResponse
     host = 'www.googleapis.com'
     poll_interval = 2.0
+    poll_backoff = 1.5
+    poll_max_interval = 10.0
+    poll_jitter = 0.1
     timeout = 180
 
     def __init__(self, user_id, key=None, auth_type=None,
@@ -17,14 +17,19 @@
 Common utilities for OpenStack
 """
 
+from typing import Optional
+
 from libcloud.utils.py3 import ET
 from libcloud.utils.py3 import httplib
 
 from libcloud.common.base import ConnectionUserAndKey, Response
-from libcloud.common.types import ProviderError
+from libcloud.common.exceptions import BaseHTTPError
+from libcloud.common.types import ProviderError, InvalidCredsError
 from libcloud.compute.types import (LibcloudError, MalformedResponseError)
 from libcloud.compute.types import KeyPairDoesNotExistError
 from libcloud.common.openstack_identity import get_class_for_auth_version
+from libcloud.common.openstack_identity import (OpenStackAuthCache,
+                                                OpenStackAuthCacheEntry)
 
 # Imports for backward compatibility reasons
 from libcloud.common.openstack_identity import (OpenStackServiceCatalog,
@@ -132,6 +137,12 @@ class OpenStackBaseConnection(ConnectionUserAndKey):
                                     If not specified, a provider specific
                                     default will be used.
     :type ex_force_service_region: ``str``
+
+    :param ex_auth_cache: Cache which is used to share auth tokens and
+                          service catalogs between connections (and
+                          processes when a file based cache is used). If not
+                          specified, ``auth_cache`` class attribute is used.
+    :type ex_auth_cache: :class:`OpenStackAuthCache`
     """
 
     auth_url = None  # type: str
@@ -145,6 +156,10 @@ class OpenStackBaseConnection(ConnectionUserAndKey):
     accept_format = None
     _auth_version = None  # type: str
 
+    # Auth cache which is used by all the instances of this class. Auth cache
+    # is disabled by default.
+    auth_cache = None  # type: Optional[OpenStackAuthCache]
+
     def __init__(self, user_id, key, secure=True,
                  host=None, port=None, timeout=None, proxy_url=None,
                  ex_force_base_url=None,
@@ -158,6 +173,7 @@ class OpenStackBaseConnection(ConnectionUserAndKey):
                  ex_force_service_type=None,
                  ex_force_service_name=None,
                  ex_force_service_region=None,
+                 ex_auth_cache=None,
                  retry_delay=None, backoff=None):
         super(OpenStackBaseConnection, self).__init__(
             user_id, key, secure=secure, timeout=timeout,
@@ -179,6 +195,9 @@ class OpenStackBaseConnection(ConnectionUserAndKey):
         self._ex_force_service_region = ex_force_service_region
         self._osa = None
 
+        if ex_auth_cache is not None:
+            self.auth_cache = ex_auth_cache
+
         if ex_force_auth_token and not ex_force_base_url:
             raise LibcloudError(
                 'Must also provide ex_force_base_url when specifying '
@@ -229,12 +248,20 @@ class OpenStackBaseConnection(ConnectionUserAndKey):
         if method.upper() in ['POST', 'PUT'] and default_content_type:
             headers = {'Content-Type': default_content_type}
 
-        return super(OpenStackBaseConnection, self).request(action=action,
-                                                            params=params,
-                                                            data=data,
-                                                            method=method,
-                                                            headers=headers,
-                                                            raw=raw)
+        kwargs = {'action': action, 'params': params, 'data': data,
+                  'method': method, 'headers': headers, 'raw': raw}
+
+        try:
+            return super(OpenStackBaseConnection, self).request(**kwargs)
+        except (InvalidCredsError, BaseHTTPError) as e:
+            # Token which has been retrieved from the auth cache could have
+            # been revoked. Remove it from the cache so other connections
+            # don't use it anymore and retry the request once with a new token
+            if not self._is_unauthorized_error(e) or \
+                    not self._evict_cached_token():
+                raise
+
+        return super(OpenStackBaseConnection, self).request(**kwargs)
 
     def _get_auth_url(self):
         """
@@ -325,30 +352,113 @@ class OpenStackBaseConnection(ConnectionUserAndKey):
             self._set_up_connection_info(url=self._ex_force_base_url)
             return
 
-        if not osa.is_token_valid():
+        if not self._is_token_valid(osa):
             # Token is not available or it has expired. Need to retrieve a
             # new one.
-            if self._auth_version == '2.0_apikey':
-                kwargs = {'auth_type': 'api_key'}
-            elif self._auth_version == '2.0_password':
-                kwargs = {'auth_type': 'password'}
+            if self.auth_cache is not None:
+                osc = self._authenticate_with_auth_cache(osa)
             else:
-                kwargs = {}
+                osa = self._authenticate(osa)  # may throw InvalidCreds
 
-            osa = osa.authenticate(**kwargs)  # may throw InvalidCreds
+                # Pull out and parse the service catalog
+                osc = OpenStackServiceCatalog(service_catalog=osa.urls,
+                                              auth_version=self._auth_version)
 
             self.auth_token = osa.auth_token
             self.auth_token_expires = osa.auth_token_expires
             self.auth_user_info = osa.auth_user_info
-
-            # Pull out and parse the service catalog
-            osc = OpenStackServiceCatalog(service_catalog=osa.urls,
-                                          auth_version=self._auth_version)
             self.service_catalog = osc
 
         url = self._ex_force_base_url or self.get_endpoint()
         self._set_up_connection_info(url=url)
 
+    def _is_token_valid(self, osa):
+        if not osa.is_token_valid():
+            return False
+
+        if self.auth_cache is None:
+            return True
+
+        # Also refresh the token ahead of expiration when using the cache so
+        # the token is renewed the same way as the cached one
+        entry = OpenStackAuthCacheEntry.from_connection(osa)
+        return entry.is_valid(refresh_ahead=self.auth_cache.refresh_ahead)
+
+    def _authenticate(self, osa):
+        if self._auth_version == '2.0_apikey':
+            kwargs = {'auth_type': 'api_key'}
+        elif self._auth_version == '2.0_password':
+            kwargs = {'auth_type': 'password'}
+        else:
+            kwargs = {}
+
+        return osa.authenticate(force=True, **kwargs)
+
+    def _authenticate_with_auth_cache(self, osa):
+        """
+        Use token and service catalog from the auth cache or authenticate and
+        store the new token in the cache if there is no valid cached token.
+
+        :return: Parsed service catalog.
+        :rtype: :class:`OpenStackServiceCatalog`
+        """
+        cache = self.auth_cache
+        key = osa.get_auth_cache_key()
+
+        with cache.lock(key):
+            # Another connection (or process) could have stored a new token
+            # while we were waiting for the lock
+            entry = cache.get(key)
+
+            if entry is not None and \
+                    entry.is_valid(refresh_ahead=cache.refresh_ahead):
+                entry.apply(osa)
+            else:
+                self._authenticate(osa)  # may throw InvalidCreds
+                entry = OpenStackAuthCacheEntry.from_connection(osa)
+
+                # Tokens without expiration time (auth v1.0) are not cached
+                if osa.auth_token_expires:
+                    cache.put(key, entry)
+
+        return entry.get_service_catalog(auth_version=self._auth_version)
+
+    def _is_unauthorized_error(self, error):
+        if isinstance(error, InvalidCredsError):
+            return True
+
+        return isinstance(error, BaseHTTPError) and \
+            error.code == httplib.UNAUTHORIZED
+
+    def _evict_cached_token(self):
+        """
+        Remove token which is used by this connection from the auth cache and
+        reset it so a new token is requested on the next request.
+
+        :return: True if the token has been retrieved using the auth cache.
+        :rtype: ``bool``
+        """
+        if self.auth_cache is None or self._ex_force_auth_token or \
+                not self.auth_token:
+            return False
+
+        cache = self.auth_cache
+        osa = self.get_auth_class()
+        key = osa.get_auth_cache_key()
+
+        with cache.lock(key):
+            entry = cache.get(key)
+
+            # Another connection could have already stored a new token
+            if entry is not None and entry.auth_token == self.auth_token:
+                cache.delete(key)
+
+        osa.auth_token = None
+        osa.auth_token_expires = None
+        self.auth_token = None
+        self.auth_token_expires = None
+        return True
+
 
 class OpenStackException(ProviderError):
     pass
@@ -435,7 +545,8 @@ class OpenStackDriverMixin(object):
                  ex_tenant_domain_id='default',
                  ex_force_service_type=None,
                  ex_force_service_name=None,
-                 ex_force_service_region=None, *args, **kwargs):
+                 ex_force_service_region=None,
+                 ex_auth_cache=None, *args, **kwargs):
         self._ex_force_base_url = ex_force_base_url
         self._ex_force_auth_url = ex_force_auth_url
         self._ex_force_auth_version = ex_force_auth_version
@@ -447,6 +558,7 @@ class OpenStackDriverMixin(object):
         self._ex_force_service_type = ex_force_service_type
         self._ex_force_service_name = ex_force_service_name
         self._ex_force_service_region = ex_force_service_region
+        self._ex_auth_cache = ex_auth_cache
 
     def openstack_connection_kwargs(self):
         """
@@ -477,4 +589,6 @@ class OpenStackDriverMixin(object):
             rv['ex_force_service_name'] = self._ex_force_service_name
         if self._ex_force_service_region:
             rv['ex_force_service_region'] = self._ex_force_service_region
+        if self._ex_auth_cache is not None:
+            rv['ex_auth_cache'] = self._ex_auth_cache
         return rv
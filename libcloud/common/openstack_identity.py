@@ -18,7 +18,13 @@ Common / shared code for handling authentication against OpenStack identity
 service (Keystone).
 """
 
+from typing import Dict
+
+import os
+import errno
+import hashlib
 import datetime
+import threading
 
 from libcloud.utils.py3 import httplib
 from libcloud.utils.iso8601 import parse_date
@@ -33,6 +39,11 @@ try:
 except ImportError:
     import json  # type: ignore
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore
+
 AUTH_API_VERSION = '1.1'
 
 # Auth versions which contain token expiration information.
@@ -53,6 +64,15 @@ AUTH_VERSIONS_WITH_EXPIRES = [
 # user from getting "InvalidCredsError" if token is about to expire.
 AUTH_TOKEN_EXPIRES_GRACE_SECONDS = 5
 
+# How many seconds before the auth token expiration time a token which is
+# stored in the auth cache is considered stale and a new one is requested.
+# This way processes which share the cache don't all end up re-authenticating
+# at the same time when the token expires.
+AUTH_CACHE_REFRESH_AHEAD_SECONDS = 300
+
+# Default directory which is used by the file based auth cache
+DEFAULT_AUTH_CACHE_PATH = '~/.libcloud/openstack_auth_cache'
+
 
 __all__ = [
     'OpenStackIdentityVersion',
@@ -66,6 +86,11 @@ __all__ = [
     'OpenStackServiceCatalogEntryEndpoint',
     'OpenStackIdentityEndpointType',
 
+    'OpenStackAuthCacheEntry',
+    'OpenStackAuthCache',
+    'OpenStackMemoryAuthCache',
+    'OpenStackFileAuthCache',
+
     'OpenStackIdentityConnection',
     'OpenStackIdentity_1_0_Connection',
     'OpenStackIdentity_1_1_Connection',
@@ -525,6 +550,369 @@ class OpenStackServiceCatalogEntryEndpoint(object):
                  'type=%s' % (self.region, self.url, self.endpoint_type)))
 
 
+def _is_expires_in_future(expires, grace_seconds):
+    if not expires:
+        return False
+
+    expires = expires - datetime.timedelta(seconds=grace_seconds)
+
+    time_tuple_expires = expires.utctimetuple()
+    time_tuple_now = datetime.datetime.utcnow().utctimetuple()
+
+    return time_tuple_now < time_tuple_expires
+
+
+class OpenStackAuthCacheEntry(object):
+    """
+    Auth token which is stored in the auth cache together with the service
+    catalog which was returned with it.
+    """
+
+    def __init__(self, auth_token, expires, urls=None, user_info=None):
+        """
+        :param auth_token: Auth token.
+        :type auth_token: ``str``
+
+        :param expires: Token expiration time.
+        :type expires: ``datetime.datetime``
+
+        :param urls: Raw service catalog returned by the identity service.
+
+        :param user_info: User information returned by the identity service.
+        :type user_info: ``dict``
+        """
+        self.auth_token = auth_token
+        self.expires = expires
+        self.urls = urls
+        self.user_info = user_info
+
+        # Parsed service catalogs (by auth version) are shared by all the
+        # connections which use this entry
+        self._service_catalogs = {}  # type: Dict[str, object]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_connection(cls, connection):
+        """
+        Create an entry from an authenticated identity connection.
+
+        :type connection: :class:`OpenStackIdentityConnection`
+        :rtype: :class:`OpenStackAuthCacheEntry`
+        """
+        return cls(auth_token=connection.auth_token,
+                   expires=connection.auth_token_expires,
+                   urls=connection.urls,
+                   user_info=connection.auth_user_info)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(auth_token=data['auth_token'],
+                   expires=parse_date(data['expires']),
+                   urls=data.get('urls', None),
+                   user_info=data.get('user_info', None))
+
+    def to_dict(self):
+        return {
+            'auth_token': self.auth_token,
+            'expires': self.expires.isoformat(),
+            'urls': self.urls,
+            'user_info': self.user_info
+        }
+
+    def is_valid(self, refresh_ahead=AUTH_CACHE_REFRESH_AHEAD_SECONDS):
+        """
+        Return True if the token won't expire in the next ``refresh_ahead``
+        seconds.
+
+        :rtype: ``bool``
+        """
+        if not self.auth_token:
+            return False
+
+        return _is_expires_in_future(expires=self.expires,
+                                     grace_seconds=refresh_ahead)
+
+    def apply(self, connection):
+        """
+        Set token and service catalog of this entry on the provided identity
+        connection.
+
+        :type connection: :class:`OpenStackIdentityConnection`
+        """
+        connection.auth_token = self.auth_token
+        connection.auth_token_expires = self.expires
+        connection.urls = self.urls
+        connection.auth_user_info = self.user_info
+
+    def get_service_catalog(self, auth_version=AUTH_API_VERSION):
+        """
+        Return parsed service catalog. The catalog is only parsed once per
+        entry.
+
+        :rtype: :class:`OpenStackServiceCatalog`
+        """
+        with self._lock:
+            service_catalog = self._service_catalogs.get(auth_version, None)
+
+            if service_catalog is None:
+                service_catalog = OpenStackServiceCatalog(
+                    service_catalog=self.urls, auth_version=auth_version)
+                self._service_catalogs[auth_version] = service_catalog
+
+            return service_catalog
+
+    def __repr__(self):
+        return ('<OpenStackAuthCacheEntry expires=%s>' % (self.expires))
+
+
+class OpenStackAuthCache(object):
+    """
+    Base class for caches which allow auth tokens and service catalogs to be
+    shared between connection (driver) instances.
+
+    Entries are keyed by a tuple which contains the auth url, the user, the
+    project, the domain and the token scope (see
+    :meth:`OpenStackIdentityConnection.get_auth_cache_key`).
+    """
+
+    def __init__(self, refresh_ahead=AUTH_CACHE_REFRESH_AHEAD_SECONDS):
+        """
+        :param refresh_ahead: Number of seconds before the token expiration
+                              time at which a new token is requested.
+        :type refresh_ahead: ``int``
+        """
+        self.refresh_ahead = refresh_ahead
+
+        self._locks = {}  # type: Dict[str, threading.Lock]
+        self._locks_lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return cached entry for the provided key or None if there is no entry.
+
+        :rtype: :class:`OpenStackAuthCacheEntry`
+        """
+        raise NotImplementedError('get not implemented for this cache')
+
+    def put(self, key, entry):
+        """
+        Store entry for the provided key.
+
+        :type entry: :class:`OpenStackAuthCacheEntry`
+        """
+        raise NotImplementedError('put not implemented for this cache')
+
+    def delete(self, key):
+        """
+        Remove entry for the provided key (if it exists).
+        """
+        raise NotImplementedError('delete not implemented for this cache')
+
+    def clear(self):
+        """
+        Remove all the entries.
+        """
+        raise NotImplementedError('clear not implemented for this cache')
+
+    def lock(self, key):
+        """
+        Return lock which is held while a new token for the provided key is
+        being requested so only a single connection authenticates at a time.
+        """
+        cache_key = self.get_cache_key(key)
+
+        with self._locks_lock:
+            lock = self._locks.get(cache_key, None)
+
+            if lock is None:
+                lock = threading.Lock()
+                self._locks[cache_key] = lock
+
+            return lock
+
+    def get_cache_key(self, key):
+        """
+        Return string representation of the provided key. Key includes the
+        credentials so it's hashed.
+
+        :rtype: ``str``
+        """
+        value = json.dumps(list(key))
+        return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+
+class OpenStackMemoryAuthCache(OpenStackAuthCache):
+    """
+    Auth cache which is shared by all the connections in a process.
+    """
+
+    def __init__(self, refresh_ahead=AUTH_CACHE_REFRESH_AHEAD_SECONDS):
+        super(OpenStackMemoryAuthCache, self).__init__(
+            refresh_ahead=refresh_ahead)
+        self._entries = {}  # type: Dict[str, OpenStackAuthCacheEntry]
+
+    def get(self, key):
+        return self._entries.get(self.get_cache_key(key), None)
+
+    def put(self, key, entry):
+        self._entries[self.get_cache_key(key)] = entry
+
+    def delete(self, key):
+        self._entries.pop(self.get_cache_key(key), None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class OpenStackFileAuthCache(OpenStackAuthCache):
+    """
+    Auth cache which stores entries in a directory so they can be shared by
+    multiple processes (e.g. short lived worker processes).
+
+    Each entry is stored in a separate file which is only readable by the
+    current user. Files are written to a temporary file first and then
+    renamed so readers never see a partially written entry. On platforms
+    which support it, an exclusive file lock is held while a new token is
+    requested so processes don't authenticate at the same time.
+    """
+
+    def __init__(self, path=DEFAULT_AUTH_CACHE_PATH,
+                 refresh_ahead=AUTH_CACHE_REFRESH_AHEAD_SECONDS):
+        """
+        :param path: Path to the directory where the entries are stored.
+        :type path: ``str``
+        """
+        super(OpenStackFileAuthCache, self).__init__(
+            refresh_ahead=refresh_ahead)
+        self.path = os.path.expanduser(path)
+
+        # Entries which have already been read by this process. This way the
+        # service catalog is only parsed again when the file has changed.
+        self._entries = {}  # type: Dict[str, tuple]
+
+    def get(self, key):
+        cache_key = self.get_cache_key(key)
+        file_path = self._get_file_path(cache_key)
+
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+
+        item = self._entries.get(cache_key, None)
+
+        if item and item[0] == mtime:
+            return item[1]
+
+        try:
+            with open(file_path, 'r') as fp:
+                entry = OpenStackAuthCacheEntry.from_dict(json.load(fp))
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            # Missing or corrupted entry
+            return None
+
+        self._entries[cache_key] = (mtime, entry)
+        return entry
+
+    def put(self, key, entry):
+        cache_key = self.get_cache_key(key)
+        file_path = self._get_file_path(cache_key)
+        tmp_file_path = '%s.%s.tmp' % (file_path, os.getpid())
+
+        self._create_directory()
+
+        fd = os.open(tmp_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                     0o600)
+
+        with os.fdopen(fd, 'w') as fp:
+            json.dump(entry.to_dict(), fp)
+
+        os.replace(tmp_file_path, file_path)
+
+        self._entries[cache_key] = (os.stat(file_path).st_mtime_ns, entry)
+
+    def delete(self, key):
+        cache_key = self.get_cache_key(key)
+        self._entries.pop(cache_key, None)
+        self._remove_file(self._get_file_path(cache_key))
+
+    def clear(self):
+        self._entries.clear()
+
+        if not os.path.isdir(self.path):
+            return
+
+        for name in os.listdir(self.path):
+            if name.endswith(('.json', '.lock')):
+                self._remove_file(os.path.join(self.path, name))
+
+    def lock(self, key):
+        lock = super(OpenStackFileAuthCache, self).lock(key=key)
+        lock_file_path = '%s.lock' % (self._get_file_path(
+            self.get_cache_key(key)))
+        return _FileAuthCacheLock(file_path=lock_file_path, lock=lock,
+                                  cache=self)
+
+    def _get_file_path(self, cache_key):
+        return os.path.join(self.path, '%s.json' % (cache_key))
+
+    def _create_directory(self):
+        try:
+            os.makedirs(self.path, 0o700)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    def _remove_file(self, file_path):
+        try:
+            os.remove(file_path)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+
+
+class _FileAuthCacheLock(object):
+    """
+    Lock which is held by a single thread and (where supported) by a single
+    process at a time.
+    """
+
+    def __init__(self, file_path, lock, cache):
+        self.file_path = file_path
+        self.lock = lock
+        self.cache = cache
+        self._fp = None
+
+    def __enter__(self):
+        self.lock.acquire()
+
+        if fcntl is None:
+            return self
+
+        try:
+            self.cache._create_directory()
+            self._fp = open(self.file_path, 'a')
+            fcntl.flock(self._fp.fileno(), fcntl.LOCK_EX)
+        except (IOError, OSError):
+            # Locking is an optimization, cache still works without it
+            self._close()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if self._fp is not None:
+                fcntl.flock(self._fp.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._close()
+            self.lock.release()
+
+    def _close(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+
 class OpenStackAuthResponse(Response):
     def success(self):
         return self.status in [httplib.OK, httplib.CREATED,
@@ -645,19 +1033,20 @@ class OpenStackIdentityConnection(ConnectionUserAndKey):
         if not self.auth_token:
             return False
 
-        if not self.auth_token_expires:
-            return False
-
-        expires = self.auth_token_expires - \
-            datetime.timedelta(seconds=AUTH_TOKEN_EXPIRES_GRACE_SECONDS)
-
-        time_tuple_expires = expires.utctimetuple()
-        time_tuple_now = datetime.datetime.utcnow().utctimetuple()
+        return _is_expires_in_future(
+            expires=self.auth_token_expires,
+            grace_seconds=AUTH_TOKEN_EXPIRES_GRACE_SECONDS)
 
-        if time_tuple_now < time_tuple_expires:
-            return True
+    def get_auth_cache_key(self):
+        """
+        Return key which identifies tokens of this connection in the auth
+        cache.
 
-        return False
+        :rtype: ``tuple``
+        """
+        return (self.auth_version, self.auth_url, self.user_id, self.key,
+                self.tenant_name, self.domain_name,
+                getattr(self, 'tenant_domain_id', None), self.token_scope)
 
     def authenticate(self, force=False):
         """
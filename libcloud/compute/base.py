@@ -27,9 +27,11 @@ from typing import Optional
 from typing import Any
 from typing import Union
 from typing import Callable
+from typing import Iterator
 from typing import TYPE_CHECKING
 
 import time
+import copy
 import hashlib
 import os
 import re
@@ -38,6 +40,9 @@ import random
 import binascii
 import datetime
 import atexit
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
 
 from libcloud.utils.py3 import b
 
@@ -51,6 +56,7 @@ from libcloud.compute.types import Provider
 from libcloud.compute.types import NodeImageMemberState
 from libcloud.compute.ssh import SSHClient
 from libcloud.compute.ssh import BaseSSHClient
+from libcloud.compute.ssh import SSHClientPool
 from libcloud.common.base import Connection
 from libcloud.common.base import ConnectionKey
 from libcloud.common.base import BaseDriver
@@ -58,6 +64,7 @@ from libcloud.common.types import LibcloudError
 from libcloud.compute.ssh import have_paramiko
 from libcloud.compute.ssh import SSHCommandTimeoutError
 
+from libcloud.utils.misc import SlotsStateMixin
 from libcloud.utils.networking import is_private_subnet
 from libcloud.utils.networking import is_valid_ip_address
 
@@ -125,6 +132,10 @@ class UuidMixin(object):
     Mixin class for get_uuid function.
     """
 
+    # Classes which use this mixin and define __slots__ need to include
+    # "_uuid" slot
+    __slots__ = ()  # type: Tuple[str, ...]
+
     def __init__(self):
         self._uuid = None  # type: str
 
@@ -163,7 +174,7 @@ class UuidMixin(object):
         return self.get_uuid()
 
 
-class Node(UuidMixin):
+class Node(UuidMixin, SlotsStateMixin):
     """
     Provide a common interface for handling nodes of all types.
 
@@ -206,8 +217,15 @@ class Node(UuidMixin):
 
     >>> node.extra
     {'foo': 'bar'}
+
+    Attributes are stored in slots so a large number of nodes can be kept in
+    memory. Subclasses which don't define ``__slots__`` can still use
+    arbitrary attributes.
     """
 
+    __slots__ = ('id', 'name', 'state', 'public_ips', 'private_ips', 'driver',
+                 'size', 'created_at', 'image', 'extra', '_uuid')
+
     def __init__(self,
                  id,  # type: str
                  name,  # type: str
@@ -339,7 +357,7 @@ class Node(UuidMixin):
                    self.private_ips, self.driver.name))
 
 
-class NodeSize(UuidMixin):
+class NodeSize(UuidMixin, SlotsStateMixin):
     """
     A Base NodeSize class to derive from.
 
@@ -363,6 +381,9 @@ class NodeSize(UuidMixin):
     4
     """
 
+    __slots__ = ('id', 'name', 'ram', 'disk', 'bandwidth', 'price', 'driver',
+                 'extra', '_uuid')
+
     def __init__(self,
                  id,  # type: str
                  name,  # type: str
@@ -416,7 +437,7 @@ class NodeSize(UuidMixin):
                    self.price, self.driver.name))
 
 
-class NodeImage(UuidMixin):
+class NodeImage(UuidMixin, SlotsStateMixin):
     """
     An operating system image.
 
@@ -438,6 +459,8 @@ class NodeImage(UuidMixin):
     >>> node = driver.create_node(image=image)
     """
 
+    __slots__ = ('id', 'name', 'driver', 'extra', '_uuid')
+
     def __init__(self,
                  id,  # type: str
                  name,  # type: str
@@ -619,11 +642,13 @@ class NodeAuthPassword(object):
         return '<NodeAuthPassword>'
 
 
-class StorageVolume(UuidMixin):
+class StorageVolume(UuidMixin, SlotsStateMixin):
     """
     A base StorageVolume class to derive from.
     """
 
+    __slots__ = ('id', 'name', 'size', 'driver', 'extra', 'state', '_uuid')
+
     def __init__(self,
                  id,  # type: str
                  name,  # type: str
@@ -871,6 +896,35 @@ class NodeDriver(BaseDriver):
         raise NotImplementedError(
             'list_nodes not implemented for this driver')
 
+    def iterate_nodes(self, *args, **kwargs):
+        # type: (Any, Any) -> Iterator[Node]
+        """
+        Return a generator of nodes.
+
+        Drivers for APIs which support pagination override this method and
+        request the next page only once the previous one has been consumed.
+        The default implementation iterates over :meth:`list_nodes`.
+
+        :return:  A generator of node objects
+        :rtype: ``generator`` of :class:`.Node`
+        """
+        return iter(self.list_nodes(*args, **kwargs))
+
+    async def list_nodes_async(self, *args, **kwargs):
+        """
+        Asyncio variant of :meth:`list_nodes`.
+
+        Drivers with native asyncio support override this method and use
+        ``self.async_connection``. The default implementation runs the
+        blocking :meth:`list_nodes` in the default executor.
+
+        :return:  list of node objects
+        :rtype: ``list`` of :class:`.Node`
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, lambda: self.list_nodes(*args, **kwargs))
+
     def list_sizes(self, location=None):
         # type: (Optional[NodeLocation]) -> List[NodeSize]
         """
@@ -999,6 +1053,7 @@ class NodeDriver(BaseDriver):
                     max_tries=3,  # type: int
                     ssh_interface='public_ips',  # type: str
                     at_exit_func=None,  # type: Callable
+                    ssh_client_pool=None,  # type: Optional[SSHClientPool]
                     **create_node_kwargs):
         # type: (...) -> Node
         """
@@ -1105,27 +1160,16 @@ class NodeDriver(BaseDriver):
                              finishes (this includes throwing an exception),
                              at exit handler function won't be called.
         :type at_exit_func: ``func``
-        """
-        if not libcloud.compute.ssh.have_paramiko:
-            raise RuntimeError('paramiko is not installed. You can install ' +
-                               'it using pip: pip install paramiko')
 
-        if auth:
-            if not isinstance(auth, (NodeAuthSSHKey, NodeAuthPassword)):
-                raise NotImplementedError(
-                    'If providing auth, only NodeAuthSSHKey or'
-                    'NodeAuthPassword is supported')
-        elif ssh_key:
-            # If an ssh_key is provided we can try deploy_node
-            pass
-        elif 'create_node' in self.features:
-            f = self.features['create_node']
-            if 'generates_password' not in f and "password" not in f:
-                raise NotImplementedError(
-                    'deploy_node not implemented for this driver')
-        else:
-            raise NotImplementedError(
-                'deploy_node not implemented for this driver')
+        :param ssh_client_pool: Optional pool of SSH connections. If provided,
+                                the connection which is used for the
+                                deployment is kept open in the pool and
+                                re-used by the subsequent deployments to the
+                                same node. Caller is responsible for closing
+                                the pool.
+        :type ssh_client_pool: :class:`libcloud.compute.ssh.SSHClientPool`
+        """
+        self._check_deploy_auth(auth=auth, ssh_key=ssh_key)
 
         # NOTE 1: This is a workaround for legacy code. Sadly a lot of legacy
         # code uses **kwargs in "create_node()" method and simply ignores
@@ -1194,26 +1238,13 @@ class NodeDriver(BaseDriver):
         ssh_alternate_usernames = ssh_alternate_usernames or []
         deploy_timeout = timeout or SSH_CONNECT_TIMEOUT
 
-        deploy_error = None
-
-        for username in ([ssh_username] + ssh_alternate_usernames):
-            try:
-                self._connect_and_run_deployment_script(
-                    task=deploy, node=node,
-                    ssh_hostname=ip_addresses[0], ssh_port=ssh_port,
-                    ssh_username=username, ssh_password=password,
-                    ssh_key_file=ssh_key, ssh_key_password=ssh_key_password,
-                    ssh_timeout=ssh_timeout,
-                    timeout=deploy_timeout, max_tries=max_tries)
-            except Exception as e:
-                # Try alternate username
-                # Todo: Need to fix paramiko so we can catch a more specific
-                # exception
-                deploy_error = e
-            else:
-                # Script successfully executed, don't try alternate username
-                deploy_error = None
-                break
+        deploy_error = self._deploy_running_node(
+            task=deploy, node=node, ip_addresses=ip_addresses,
+            ssh_usernames=[ssh_username] + ssh_alternate_usernames,
+            ssh_password=password, ssh_port=ssh_port, ssh_key=ssh_key,
+            ssh_key_password=ssh_key_password, ssh_timeout=ssh_timeout,
+            timeout=deploy_timeout, max_tries=max_tries,
+            ssh_client_pool=ssh_client_pool)
 
         if deploy_error is not None:
             if at_exit_func:
@@ -1227,6 +1258,142 @@ class NodeDriver(BaseDriver):
 
         return node
 
+    def deploy_nodes(self,
+                     deploy,  # type: Deployment
+                     count,  # type: int
+                     ssh_username='root',  # type: str
+                     ssh_alternate_usernames=None,  # type: Optional[List[str]]
+                     ssh_port=22,  # type: int
+                     ssh_timeout=10,  # type: int
+                     ssh_key=None,  # type: Optional[T_Ssh_key]
+                     ssh_key_password=None,  # type: Optional[str]
+                     auth=None,  # type: T_Auth
+                     timeout=SSH_CONNECT_TIMEOUT,  # type: int
+                     max_tries=3,  # type: int
+                     ssh_interface='public_ips',  # type: str
+                     max_workers=10,  # type: int
+                     ssh_client_pool=None,  # type: Optional[SSHClientPool]
+                     **create_node_kwargs):
+        # type: (...) -> List[Tuple[Optional[Node], Deployment, Optional[Exception]]]  # noqa: E501
+        """
+        Create multiple nodes and run the deployment on all of them.
+
+        All the nodes are created first and then waited for together. As soon
+        as a node is running, the deployment is run on it using a pool of
+        ``max_workers`` threads which limits the number of concurrent SSH
+        connections.
+
+        Failures are isolated - a node which fails to be created, to start or
+        to be deployed doesn't affect the other nodes.
+
+        If ``name`` argument is provided and ``count`` is greater than 1, an
+        index is appended to the name of each node (e.g. ``web-1``,
+        ``web-2``, ...).
+
+        Each node is deployed using its own copy of ``deploy`` so output of
+        the deployment steps (e.g. ``ScriptDeployment.stdout``) is available
+        per node.
+
+        See :meth:`deploy_node` for description of the other arguments.
+
+        :param deploy: Deployment to run once the nodes are online and
+                       available to SSH.
+        :type deploy: :class:`Deployment`
+
+        :param count: Number of nodes to create.
+        :type count: ``int``
+
+        :param max_workers: Maximum number of nodes which are deployed in
+                            parallel (default is 10).
+        :type max_workers: ``int``
+
+        :return: List with a (node, deployment, error) tuple for each node.
+                 ``node`` is ``None`` if the node couldn't be created and
+                 ``error`` is ``None`` if the node has been successfully
+                 deployed. Otherwise it's an exception instance
+                 (:class:`DeploymentError` if the node has been created).
+        :rtype: ``list`` of ``tuple``
+        """
+        self._check_deploy_auth(auth=auth, ssh_key=ssh_key)
+
+        ssh_usernames = [ssh_username] + (ssh_alternate_usernames or [])
+        wait_timeout = timeout or NODE_ONLINE_WAIT_TIMEOUT
+        deploy_timeout = timeout or SSH_CONNECT_TIMEOUT
+        name = create_node_kwargs.pop('name', None)
+
+        # [node, deployment, error] for each node
+        results = []  # type: List[List[Any]]
+
+        for index in range(count):
+            kwargs = dict(create_node_kwargs)
+
+            if name is not None:
+                kwargs['name'] = name if count == 1 else \
+                    '%s-%s' % (name, index + 1)
+
+            if auth:
+                kwargs['auth'] = auth
+
+            deployment = copy.deepcopy(deploy)
+
+            try:
+                node = self.create_node(**kwargs)
+            except Exception as e:
+                results.append([None, deployment, e])
+            else:
+                results.append([node, deployment, None])
+
+        created = dict([(result[0].uuid, result) for result in results
+                        if result[0] is not None])
+        passwords = {}
+
+        for uuid, result in created.items():
+            if isinstance(auth, NodeAuthPassword):
+                passwords[uuid] = auth.password
+            else:
+                passwords[uuid] = result[0].extra.get('password', None)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = {}
+
+        def deploy_running_node(node, ip_addresses):
+            created[node.uuid][0] = node
+            futures[node.uuid] = executor.submit(
+                self._deploy_running_node, task=created[node.uuid][1],
+                node=node, ip_addresses=ip_addresses,
+                ssh_usernames=ssh_usernames, ssh_password=passwords[node.uuid],
+                ssh_port=ssh_port, ssh_key=ssh_key,
+                ssh_key_password=ssh_key_password, ssh_timeout=ssh_timeout,
+                timeout=deploy_timeout, max_tries=max_tries,
+                ssh_client_pool=ssh_client_pool)
+
+        try:
+            if created:
+                try:
+                    self.wait_until_running(
+                        nodes=[result[0] for result in created.values()],
+                        wait_period=3, timeout=wait_timeout,
+                        ssh_interface=ssh_interface,
+                        ex_progress_callback=deploy_running_node)
+                except Exception as e:
+                    for uuid, result in created.items():
+                        if uuid not in futures:
+                            result[2] = DeploymentError(
+                                node=result[0], original_exception=e,
+                                driver=self)
+
+            for uuid, future in futures.items():
+                deploy_error = future.result()
+
+                if deploy_error is not None:
+                    created[uuid][2] = DeploymentError(
+                        node=created[uuid][0], original_exception=deploy_error,
+                        driver=self)
+        finally:
+            executor.shutdown(wait=True)
+
+        return [tuple(result) for result in results]
+
     def reboot_node(self, node):
         # type: (Node) -> bool
         """
@@ -1300,6 +1467,17 @@ class NodeDriver(BaseDriver):
         raise NotImplementedError(
             'list_volumes not implemented for this driver')
 
+    def iterate_volumes(self, *args, **kwargs):
+        # type: (Any, Any) -> Iterator[StorageVolume]
+        """
+        Return a generator of storage volumes.
+
+        The default implementation iterates over :meth:`list_volumes`.
+
+        :rtype: ``generator`` of :class:`.StorageVolume`
+        """
+        return iter(self.list_volumes(*args, **kwargs))
+
     def list_volume_snapshots(self, volume):
         # type: (StorageVolume) -> List[VolumeSnapshot]
         """
@@ -1433,6 +1611,18 @@ class NodeDriver(BaseDriver):
         raise NotImplementedError(
             'list_images not implemented for this driver')
 
+    def iterate_images(self, *args, **kwargs):
+        # type: (Any, Any) -> Iterator[NodeImage]
+        """
+        Return a generator of images.
+
+        The default implementation iterates over :meth:`list_images`.
+
+        :return: A generator of node image objects.
+        :rtype: ``generator`` of :class:`.NodeImage`
+        """
+        return iter(self.list_images(*args, **kwargs))
+
     def create_image(self, node, name, description=None):
         # type: (Node, str, Optional[str]) -> List[NodeImage]
         """
@@ -1602,7 +1792,9 @@ class NodeDriver(BaseDriver):
                            timeout=600,  # type: int
                            ssh_interface='public_ips',  # type: str
                            force_ipv4=True,  # type: bool
-                           ex_list_nodes_kwargs=None  # type: Optional[Dict]
+                           ex_list_nodes_kwargs=None,  # type: Optional[Dict]
+                           ex_progress_callback=None,  # type: Callable
+                           ex_max_wait_period=None  # type: Optional[float]
                            ):
         # type: (...) -> List[Tuple[Node, List[str]]]
         """
@@ -1611,6 +1803,13 @@ class NodeDriver(BaseDriver):
         Node is considered running when it's state is "running" and when it has
         at least one IP address assigned.
 
+        Only the nodes which are not running yet are looked up on each
+        iteration. Drivers which support retrieving specific nodes do that
+        using targeted requests, other drivers (and all the drivers when
+        ``ex_list_nodes_kwargs`` is provided) list all the nodes. Delay
+        between the iterations is increased while none of the nodes become
+        running.
+
         :param nodes: List of nodes to wait for.
         :type nodes: ``list`` of :class:`.Node`
 
@@ -1635,12 +1834,25 @@ class NodeDriver(BaseDriver):
                                      method.
         :type ex_list_nodes_kwargs: ``dict``
 
+        :param ex_progress_callback: Optional function which is called with
+                                     the node and its IP addresses as soon
+                                     as each node is running.
+        :type ex_progress_callback: ``callable``
+
+        :param ex_max_wait_period: Maximum number of seconds to wait between
+                                   the loop iterations. (default is ten times
+                                   ``wait_period``)
+        :type ex_max_wait_period: ``float``
+
         :return: ``[(Node, ip_addresses)]`` list of tuple of Node instance and
                  list of ip_address on success.
         :rtype: ``list`` of ``tuple``
         """
         ex_list_nodes_kwargs = ex_list_nodes_kwargs or {}
 
+        if ex_max_wait_period is None:
+            ex_max_wait_period = wait_period * 10
+
         def is_supported(address):
             # type: (str) -> bool
             """
@@ -1665,37 +1877,89 @@ class NodeDriver(BaseDriver):
         start = time.time()
         end = start + timeout
 
-        uuids = set([node.uuid for node in nodes])
+        uuids = [node.uuid for node in nodes]
+        pending = dict([(node.uuid, node) for node in nodes])
+        running = {}  # type: Dict[str, Tuple[Node, List[str]]]
+        delay = wait_period
 
         while time.time() < end:
-            all_nodes = self.list_nodes(**ex_list_nodes_kwargs)
-            matching_nodes = list([node for node in all_nodes
-                                   if node.uuid in uuids])
+            matching_nodes = self._get_nodes_for_wait(
+                nodes=list(pending.values()),
+                list_nodes_kwargs=ex_list_nodes_kwargs)
 
-            if len(matching_nodes) > len(uuids):
+            if len(matching_nodes) > len(pending):
                 found_uuids = [node.uuid for node in matching_nodes]
                 msg = ('Unable to match specified uuids ' +
-                       '(%s) with existing nodes. Found ' % (uuids) +
+                       '(%s) with existing nodes. Found ' % (set(pending)) +
                        'multiple nodes with same uuid: (%s)' % (found_uuids))
                 raise LibcloudError(value=msg, driver=self)
 
-            running_nodes = [node for node in matching_nodes
-                             if node.state == NodeState.RUNNING]
-            addresses = []
-            for node in running_nodes:
+            progress = False
+
+            for node in matching_nodes:
+                if node.state != NodeState.RUNNING:
+                    continue
+
                 node_addresses = filter_addresses(getattr(node, ssh_interface))
+
                 if len(node_addresses) >= 1:
-                    addresses.append(node_addresses)
+                    running[node.uuid] = (node, node_addresses)
+                    del pending[node.uuid]
+                    progress = True
 
-            if len(running_nodes) == len(uuids) == len(addresses):
-                return list(zip(running_nodes, addresses))
-            else:
-                time.sleep(wait_period)
-                continue
+                    if ex_progress_callback:
+                        ex_progress_callback(node, node_addresses)
+
+            if not pending:
+                return [running[uuid] for uuid in uuids]
+
+            if progress:
+                # Nodes are becoming running, keep polling at the initial rate
+                delay = wait_period
+
+            time.sleep(max(min(delay, end - time.time()), 0))
+            delay = min(delay * 1.5, max(ex_max_wait_period, wait_period))
 
         raise LibcloudError(value='Timed out after %s seconds' % (timeout),
                             driver=self)
 
+    def _get_nodes_for_wait(self, nodes, list_nodes_kwargs=None):
+        # type: (List[Node], Optional[Dict]) -> List[Node]
+        """
+        Return up to date versions of the provided nodes which are used by
+        ``wait_until_running``.
+
+        Nodes are retrieved using ``_get_nodes``. All the nodes are listed if
+        the driver doesn't support it or if ``list_nodes`` keyword arguments
+        are provided (``_get_nodes`` doesn't take them into account).
+        """
+        if not list_nodes_kwargs:
+            try:
+                return self._get_nodes(nodes=nodes)
+            except NotImplementedError:
+                pass
+
+        uuids = set([node.uuid for node in nodes])
+        all_nodes = self.list_nodes(**(list_nodes_kwargs or {}))
+        return [node for node in all_nodes if node.uuid in uuids]
+
+    def _get_nodes(self, nodes):
+        # type: (List[Node]) -> List[Node]
+        """
+        Return up to date versions of the provided nodes using requests
+        which only retrieve those nodes.
+
+        Nodes which can't be found are omitted. Drivers which support
+        retrieving specific nodes should override this method.
+
+        :param nodes: List of nodes to retrieve.
+        :type nodes: ``list`` of :class:`.Node`
+
+        :rtype: ``list`` of :class:`.Node`
+        """
+        raise NotImplementedError(
+            '_get_nodes not implemented for this driver')
+
     def _get_and_check_auth(self, auth):
         # type: (T_Auth) -> T_Auth
         """
@@ -1811,32 +2075,124 @@ class NodeDriver(BaseDriver):
         ssh_key_password,  # type: Optional[str]
         ssh_timeout,  # type: int
         timeout,  # type: int
-        max_tries  # type: int
+        max_tries,  # type: int
+        ssh_client_pool=None  # type: Optional[SSHClientPool]
     ):
         """
         Establish an SSH connection to the node and run the provided deployment
         task.
 
+        If a pool is provided, an open connection from the pool is re-used
+        and a new connection is added to the pool instead of being closed.
+
         :rtype: :class:`.Node`:
         :return: Node instance on success.
         """
-        ssh_client = SSHClient(hostname=ssh_hostname,
-                               port=ssh_port, username=ssh_username,
-                               password=ssh_key_password or ssh_password,
-                               key_files=ssh_key_file,
-                               timeout=ssh_timeout)
+        password = ssh_key_password or ssh_password
+        ssh_client = None
+
+        if ssh_client_pool is not None:
+            ssh_client = ssh_client_pool.get(hostname=ssh_hostname,
+                                             port=ssh_port,
+                                             username=ssh_username,
+                                             password=password,
+                                             key_files=ssh_key_file)
+
+        if ssh_client is None:
+            ssh_client = SSHClient(hostname=ssh_hostname,
+                                   port=ssh_port, username=ssh_username,
+                                   password=password,
+                                   key_files=ssh_key_file,
+                                   timeout=ssh_timeout)
 
-        ssh_client = self._ssh_client_connect(ssh_client=ssh_client,
-                                              timeout=timeout)
+            ssh_client = self._ssh_client_connect(ssh_client=ssh_client,
+                                                  timeout=timeout)
+
+            if ssh_client_pool is not None:
+                ssh_client_pool.add(ssh_client)
 
         # Execute the deployment task
-        node = self._run_deployment_script(task=task, node=node,
-                                           ssh_client=ssh_client,
-                                           max_tries=max_tries)
+        node = self._run_deployment_script(
+            task=task, node=node, ssh_client=ssh_client, max_tries=max_tries,
+            close_client=ssh_client_pool is None)
         return node
 
-    def _run_deployment_script(self, task, node, ssh_client, max_tries=3):
-        # type: (Deployment, Node, BaseSSHClient, int) -> Node
+    def _check_deploy_auth(self, auth, ssh_key):
+        # type: (T_Auth, Optional[T_Ssh_key]) -> None
+        """
+        Verify that paramiko is available and that the nodes created by this
+        driver can be accessed using the provided credentials.
+        """
+        if not libcloud.compute.ssh.have_paramiko:
+            raise RuntimeError('paramiko is not installed. You can install ' +
+                               'it using pip: pip install paramiko')
+
+        if auth:
+            if not isinstance(auth, (NodeAuthSSHKey, NodeAuthPassword)):
+                raise NotImplementedError(
+                    'If providing auth, only NodeAuthSSHKey or'
+                    'NodeAuthPassword is supported')
+        elif ssh_key:
+            # If an ssh_key is provided we can try deploy_node
+            pass
+        elif 'create_node' in self.features:
+            f = self.features['create_node']
+            if 'generates_password' not in f and "password" not in f:
+                raise NotImplementedError(
+                    'deploy_node not implemented for this driver')
+        else:
+            raise NotImplementedError(
+                'deploy_node not implemented for this driver')
+
+    def _deploy_running_node(
+        self,
+        task,  # type: Deployment
+        node,  # type: Node
+        ip_addresses,  # type: List[str]
+        ssh_usernames,  # type: List[str]
+        ssh_password,  # type: Optional[str]
+        ssh_port,  # type: int
+        ssh_key,  # type: Optional[T_Ssh_key]
+        ssh_key_password,  # type: Optional[str]
+        ssh_timeout,  # type: int
+        timeout,  # type: int
+        max_tries,  # type: int
+        ssh_client_pool=None  # type: Optional[SSHClientPool]
+    ):
+        # type: (...) -> Optional[Exception]
+        """
+        Run the deployment task on a running node trying the provided
+        usernames in order.
+
+        :return: ``None`` on success, otherwise the last exception.
+        :rtype: ``Exception``
+        """
+        deploy_error = None
+
+        for username in ssh_usernames:
+            try:
+                self._connect_and_run_deployment_script(
+                    task=task, node=node,
+                    ssh_hostname=ip_addresses[0], ssh_port=ssh_port,
+                    ssh_username=username, ssh_password=ssh_password,
+                    ssh_key_file=ssh_key, ssh_key_password=ssh_key_password,
+                    ssh_timeout=ssh_timeout,
+                    timeout=timeout, max_tries=max_tries,
+                    ssh_client_pool=ssh_client_pool)
+            except Exception as e:
+                # Try alternate username
+                # Todo: Need to fix paramiko so we can catch a more specific
+                # exception
+                deploy_error = e
+            else:
+                # Script successfully executed, don't try alternate username
+                return None
+
+        return deploy_error
+
+    def _run_deployment_script(self, task, node, ssh_client, max_tries=3,
+                               close_client=True):
+        # type: (Deployment, Node, BaseSSHClient, int, bool) -> Node
         """
         Run the deployment script on the provided node. At this point it is
         assumed that SSH connection has already been established.
@@ -1854,6 +2210,10 @@ class NodeDriver(BaseDriver):
                           before giving up. (default is 3)
         :type max_tries: ``int``
 
+        :param close_client: Close the SSH connection once the deployment
+                             succeeds (default is True).
+        :type close_client: ``bool``
+
         :rtype: :class:`.Node`
         :return: ``Node`` Node instance on success.
         """
@@ -1873,7 +2233,9 @@ class NodeDriver(BaseDriver):
                                         % (max_tries, str(e)), driver=self)
             else:
                 # Deployment succeeded
-                ssh_client.close()
+                if close_client:
+                    ssh_client.close()
+
                 return node
 
         return node
@@ -13,7799 +13,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-INSTANCE_TYPES = {
-    "a1.2xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "a1.2xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "AWS Graviton Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "a1.2xlarge",
-        "name": "a1.2xlarge",
-        "ram": 16384
-    },
-    "a1.4xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "a1.4xlarge",
-            "instancesku": "JQK5AH3Y44CQ57AA",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "AWS Graviton Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "a1.4xlarge",
-        "name": "a1.4xlarge",
-        "ram": 32768
-    },
-    "a1.large": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "a1.large",
-            "instancesku": "FV7PUC9Y973899CS",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "4 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "AWS Graviton Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "a1.large",
-        "name": "a1.large",
-        "ram": 4096
-    },
-    "a1.medium": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "a1.medium",
-            "instancesku": "Q494P4JCZC9KDPCA",
-            "memory": "2 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "2",
-            "physicalProcessor": "AWS Graviton Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "1"
-        },
-        "id": "a1.medium",
-        "name": "a1.medium",
-        "ram": 2048
-    },
-    "a1.xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "a1.xlarge",
-            "instancesku": "943GQ4TSWGS354CV",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "8 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "AWS Graviton Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "a1.xlarge",
-        "name": "a1.xlarge",
-        "ram": 8192
-    },
-    "c1.medium": {
-        "bandwidth": None,
-        "disk": 350,
-        "extra": {
-            "currentGeneration": "No",
-            "ecu": "5",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c1.medium",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "1.7 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "2",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "32-bit or 64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 350 SSD",
-            "vcpu": "2"
-        },
-        "id": "c1.medium",
-        "name": "c1.medium",
-        "ram": 1740
-    },
-    "c1.xlarge": {
-        "bandwidth": None,
-        "disk": 1680,
-        "extra": {
-            "currentGeneration": "No",
-            "ecu": "20",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c1.xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "7 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 420 SSD",
-            "vcpu": "8"
-        },
-        "id": "c1.xlarge",
-        "name": "c1.xlarge",
-        "ram": 7168
-    },
-    "c3.2xlarge": {
-        "bandwidth": None,
-        "disk": 160,
-        "extra": {
-            "clockSpeed": "2.8 GHz",
-            "currentGeneration": "No",
-            "ecu": "28",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c3.2xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "15 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2680 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 80 SSD",
-            "vcpu": "8"
-        },
-        "id": "c3.2xlarge",
-        "name": "c3.2xlarge",
-        "ram": 15360
-    },
-    "c3.4xlarge": {
-        "bandwidth": None,
-        "disk": 320,
-        "extra": {
-            "clockSpeed": "2.8 GHz",
-            "currentGeneration": "No",
-            "ecu": "55",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c3.4xlarge",
-            "instancesku": "BPC44EBCFMK4UP3U",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "30 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon E5-2680 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 160 SSD",
-            "vcpu": "16"
-        },
-        "id": "c3.4xlarge",
-        "name": "c3.4xlarge",
-        "ram": 30720
-    },
-    "c3.8xlarge": {
-        "bandwidth": 10,
-        "disk": 640,
-        "extra": {
-            "clockSpeed": "2.8 GHz",
-            "currentGeneration": "No",
-            "ecu": "108",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c3.8xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "60 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2680 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 320 SSD",
-            "vcpu": "36"
-        },
-        "id": "c3.8xlarge",
-        "name": "c3.8xlarge",
-        "ram": 61440
-    },
-    "c3.large": {
-        "bandwidth": None,
-        "disk": 32,
-        "extra": {
-            "clockSpeed": "2.8 GHz",
-            "currentGeneration": "No",
-            "ecu": "7",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c3.large",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "3.75 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon E5-2680 v2 (Ivy Bridge)",
-            "processorArchitecture": "32-bit or 64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 16 SSD",
-            "vcpu": "2"
-        },
-        "id": "c3.large",
-        "name": "c3.large",
-        "ram": 3840
-    },
-    "c3.xlarge": {
-        "bandwidth": None,
-        "disk": 80,
-        "extra": {
-            "clockSpeed": "2.8 GHz",
-            "currentGeneration": "No",
-            "ecu": "14",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c3.xlarge",
-            "instancesku": "37H9CQX49KK8KQ2D",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "7.5 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon E5-2680 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 40 SSD",
-            "vcpu": "4"
-        },
-        "id": "c3.xlarge",
-        "name": "c3.xlarge",
-        "ram": 7680
-    },
-    "c4.2xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.9 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "1000 Mbps",
-            "ecu": "31",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c4.2xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "15 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2666 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "c4.2xlarge",
-        "name": "c4.2xlarge",
-        "ram": 15360
-    },
-    "c4.4xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.9 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "2000 Mbps",
-            "ecu": "62",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c4.4xlarge",
-            "instancesku": "DKZ8SVQYPP9QWN2F",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "30 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon E5-2666 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "c4.4xlarge",
-        "name": "c4.4xlarge",
-        "ram": 30720
-    },
-    "c4.8xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.9 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "4000 Mbps",
-            "ecu": "132",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c4.8xlarge",
-            "instancesku": "AKHXNUBZUVXUQVS4",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "60 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2666 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "36"
-        },
-        "id": "c4.8xlarge",
-        "name": "c4.8xlarge",
-        "ram": 61440
-    },
-    "c4.large": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.9 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "500 Mbps",
-            "ecu": "8",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c4.large",
-            "instancesku": "NJYJAMFEMWY3BC2Y",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "3.75 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon E5-2666 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "c4.large",
-        "name": "c4.large",
-        "ram": 3840
-    },
-    "c4.xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.9 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "750 Mbps",
-            "ecu": "16",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c4.xlarge",
-            "instancesku": "KT5H34MYNAZWD4VM",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "7.5 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon E5-2666 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "c4.xlarge",
-        "name": "c4.xlarge",
-        "ram": 7680
-    },
-    "c5.12xlarge": {
-        "bandwidth": 12,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "188",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5.12xlarge",
-            "instancesku": "G88BQ9JNT44CJU5A",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "96 GiB",
-            "networkPerformance": "12 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "Intel Xeon Platinum 8275L",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Deep Learning Boost; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "48"
-        },
-        "id": "c5.12xlarge",
-        "name": "c5.12xlarge",
-        "ram": 98304
-    },
-    "c5.18xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "9000 Mbps",
-            "ecu": "281",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5.18xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "144 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "144",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "72"
-        },
-        "id": "c5.18xlarge",
-        "name": "c5.18xlarge",
-        "ram": 147456
-    },
-    "c5.24xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "375",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5.24xlarge",
-            "instancesku": "DFU3RR7RPDU5NHP6",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "192 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8275L",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Deep Learning Boost; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "96"
-        },
-        "id": "c5.24xlarge",
-        "name": "c5.24xlarge",
-        "ram": 196608
-    },
-    "c5.2xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2250 Mbps",
-            "ecu": "39",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5.2xlarge",
-            "instancesku": "DFH4W5NFFA5EGBVU",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "c5.2xlarge",
-        "name": "c5.2xlarge",
-        "ram": 16384
-    },
-    "c5.4xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2250 Mbps",
-            "ecu": "73",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5.4xlarge",
-            "instancesku": "ZJCH42UY78N76ZSX",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "c5.4xlarge",
-        "name": "c5.4xlarge",
-        "ram": 32768
-    },
-    "c5.9xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "4500 Mbps",
-            "ecu": "139",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5.9xlarge",
-            "instancesku": "8UXUVRFUWYET2CA4",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "72 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "72",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "36"
-        },
-        "id": "c5.9xlarge",
-        "name": "c5.9xlarge",
-        "ram": 73728
-    },
-    "c5.large": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2250 Mbps",
-            "ecu": "10",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5.large",
-            "instancesku": "ZGCJFX4FNDKBY4B4",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "4 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "c5.large",
-        "name": "c5.large",
-        "ram": 4096
-    },
-    "c5.xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2250 Mbps",
-            "ecu": "20",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5.xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "8 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "c5.xlarge",
-        "name": "c5.xlarge",
-        "ram": 8192
-    },
-    "c5d.12xlarge": {
-        "bandwidth": 12,
-        "disk": 1800,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "188",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5d.12xlarge",
-            "instancesku": "65HKXNPPQZVPW4JB",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "96 GiB",
-            "networkPerformance": "12 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "Intel Xeon Platinum 8275L",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Deep Learning Boost; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 900 NVMe SSD",
-            "vcpu": "48"
-        },
-        "id": "c5d.12xlarge",
-        "name": "c5d.12xlarge",
-        "ram": 98304
-    },
-    "c5d.18xlarge": {
-        "bandwidth": 25,
-        "disk": 1800,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "9000 Mbps",
-            "ecu": "281",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5d.18xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "144 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "144",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 900 NVMe SSD",
-            "vcpu": "72"
-        },
-        "id": "c5d.18xlarge",
-        "name": "c5d.18xlarge",
-        "ram": 147456
-    },
-    "c5d.24xlarge": {
-        "bandwidth": 25,
-        "disk": 3600,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "375",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5d.24xlarge",
-            "instancesku": "PC4G8JDRGDDX5R8B",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "192 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8275L",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Deep Learning Boost; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 900 NVMe SSD",
-            "vcpu": "96"
-        },
-        "id": "c5d.24xlarge",
-        "name": "c5d.24xlarge",
-        "ram": 196608
-    },
-    "c5d.2xlarge": {
-        "bandwidth": 10,
-        "disk": 200,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2250 Mbps",
-            "ecu": "39",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5d.2xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 200 NVMe SSD",
-            "vcpu": "8"
-        },
-        "id": "c5d.2xlarge",
-        "name": "c5d.2xlarge",
-        "ram": 16384
-    },
-    "c5d.4xlarge": {
-        "bandwidth": 10,
-        "disk": 400,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2250 Mbps",
-            "ecu": "73",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5d.4xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 400 NVMe SSD",
-            "vcpu": "16"
-        },
-        "id": "c5d.4xlarge",
-        "name": "c5d.4xlarge",
-        "ram": 32768
-    },
-    "c5d.9xlarge": {
-        "bandwidth": 10,
-        "disk": 900,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "4500 Mbps",
-            "ecu": "139",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5d.9xlarge",
-            "instancesku": "6PPHHXHGC4KS4FD2",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "72 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "72",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 900 NVMe SSD",
-            "vcpu": "36"
-        },
-        "id": "c5d.9xlarge",
-        "name": "c5d.9xlarge",
-        "ram": 73728
-    },
-    "c5d.large": {
-        "bandwidth": 10,
-        "disk": 50,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2250 Mbps",
-            "ecu": "10",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5d.large",
-            "instancesku": "DZ66HJ5ZUN3XZX8X",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "4 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 50 NVMe SSD",
-            "vcpu": "2"
-        },
-        "id": "c5d.large",
-        "name": "c5d.large",
-        "ram": 4096
-    },
-    "c5d.xlarge": {
-        "bandwidth": 10,
-        "disk": 100,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2250 Mbps",
-            "ecu": "20",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5d.xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "8 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 100 NVMe SSD",
-            "vcpu": "4"
-        },
-        "id": "c5d.xlarge",
-        "name": "c5d.xlarge",
-        "ram": 8192
-    },
-    "c5n.18xlarge": {
-        "bandwidth": 100,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "281",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5n.18xlarge",
-            "instancesku": "GP9J882PRJR3HFWT",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "192 GiB",
-            "networkPerformance": "100 Gigabit",
-            "normalizationSizeFactor": "144",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "72"
-        },
-        "id": "c5n.18xlarge",
-        "name": "c5n.18xlarge",
-        "ram": 196608
-    },
-    "c5n.2xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "39",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5n.2xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "21 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "c5n.2xlarge",
-        "name": "c5n.2xlarge",
-        "ram": 21504
-    },
-    "c5n.4xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "73",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5n.4xlarge",
-            "instancesku": "RXTSEWTUD8EWJENN",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "42 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "c5n.4xlarge",
-        "name": "c5n.4xlarge",
-        "ram": 43008
-    },
-    "c5n.9xlarge": {
-        "bandwidth": 50,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "139",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5n.9xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "96 GiB",
-            "networkPerformance": "50 Gigabit",
-            "normalizationSizeFactor": "72",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "36"
-        },
-        "id": "c5n.9xlarge",
-        "name": "c5n.9xlarge",
-        "ram": 98304
-    },
-    "c5n.large": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "10",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5n.large",
-            "instancesku": "RGPG564XSTMQEEGT",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "5.25 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "c5n.large",
-        "name": "c5n.large",
-        "ram": 5376
-    },
-    "c5n.xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.0 Ghz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "20",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "c5n.xlarge",
-            "instancesku": "XPUQY5QHXK4NZNKG",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "10.5 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8124M",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "c5n.xlarge",
-        "name": "c5n.xlarge",
-        "ram": 10752
-    },
-    "cc2.8xlarge": {
-        "bandwidth": 10,
-        "disk": 3360,
-        "extra": {
-            "clockSpeed": "2.6 GHz",
-            "currentGeneration": "No",
-            "ecu": "88",
-            "instanceFamily": "Compute optimized",
-            "instanceType": "cc2.8xlarge",
-            "memory": "60.5 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2670",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 840",
-            "vcpu": "32"
-        },
-        "id": "cc2.8xlarge",
-        "name": "cc2.8xlarge",
-        "ram": 61952
-    },
-    "cr1.8xlarge": {
-        "bandwidth": 10,
-        "disk": 240,
-        "extra": {
-            "currentGeneration": "No",
-            "ecu": "88",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "cr1.8xlarge",
-            "memory": "244 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2670",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 120 SSD",
-            "vcpu": "32"
-        },
-        "id": "cr1.8xlarge",
-        "name": "cr1.8xlarge",
-        "ram": 249856
-    },
-    "d2.2xlarge": {
-        "bandwidth": None,
-        "disk": 12000,
-        "extra": {
-            "clockSpeed": "2.4 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "1000 Mbps",
-            "ecu": "28",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "d2.2xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "61 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2676 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "6 x 2000 HDD",
-            "vcpu": "8"
-        },
-        "id": "d2.2xlarge",
-        "name": "d2.2xlarge",
-        "ram": 62464
-    },
-    "d2.4xlarge": {
-        "bandwidth": None,
-        "disk": 24000,
-        "extra": {
-            "clockSpeed": "2.4 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "2000 Mbps",
-            "ecu": "56",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "d2.4xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "122 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon E5-2676 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "12 x 2000 HDD",
-            "vcpu": "16"
-        },
-        "id": "d2.4xlarge",
-        "name": "d2.4xlarge",
-        "ram": 124928
-    },
-    "d2.8xlarge": {
-        "bandwidth": 10,
-        "disk": 48000,
-        "extra": {
-            "clockSpeed": "2.4 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "4000 Mbps",
-            "ecu": "116",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "d2.8xlarge",
-            "instancesku": "XP5P8NMSB2W7KP3U",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "244 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2676 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "24 x 2000 HDD",
-            "vcpu": "36"
-        },
-        "id": "d2.8xlarge",
-        "name": "d2.8xlarge",
-        "ram": 249856
-    },
-    "d2.xlarge": {
-        "bandwidth": None,
-        "disk": 6000,
-        "extra": {
-            "clockSpeed": "2.4 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "750 Mbps",
-            "ecu": "14",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "d2.xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "30.5 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon E5-2676 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "3 x 2000 HDD",
-            "vcpu": "4"
-        },
-        "id": "d2.xlarge",
-        "name": "d2.xlarge",
-        "ram": 31232
-    },
-    "f1.16xlarge": {
-        "bandwidth": 20,
-        "disk": 3760,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "201",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "FPGA Instances",
-            "instanceType": "f1.16xlarge",
-            "instancesku": "P4PZ87XYY47FTQT9",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "976 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 940 NVMe SSD",
-            "vcpu": "64"
-        },
-        "id": "f1.16xlarge",
-        "name": "f1.16xlarge",
-        "ram": 999424
-    },
-    "f1.2xlarge": {
-        "bandwidth": 10,
-        "disk": 470,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "1700 Mbps",
-            "ecu": "31",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "FPGA Instances",
-            "instanceType": "f1.2xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "122 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 470 NVMe SSD",
-            "vcpu": "8"
-        },
-        "id": "f1.2xlarge",
-        "name": "f1.2xlarge",
-        "ram": 124928
-    },
-    "f1.4xlarge": {
-        "bandwidth": 10,
-        "disk": 940,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "58",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "FPGA Instances",
-            "instanceType": "f1.4xlarge",
-            "instancesku": "3294757KFZTHDXMC",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "244 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 940 NVMe SSD",
-            "vcpu": "16"
-        },
-        "id": "f1.4xlarge",
-        "name": "f1.4xlarge",
-        "ram": 249856
-    },
-    "g2.2xlarge": {
-        "bandwidth": None,
-        "disk": 60,
-        "extra": {
-            "clockSpeed": "2.6 GHz",
-            "currentGeneration": "No",
-            "ecu": "26",
-            "enhancedNetworkingSupported": "No",
-            "gpu": "1",
-            "instanceFamily": "GPU instance",
-            "instanceType": "g2.2xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "15 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2670 (Sandy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 60 SSD",
-            "vcpu": "8"
-        },
-        "id": "g2.2xlarge",
-        "name": "g2.2xlarge",
-        "ram": 15360
-    },
-    "g2.8xlarge": {
-        "bandwidth": None,
-        "disk": 240,
-        "extra": {
-            "clockSpeed": "2.6 GHz",
-            "currentGeneration": "No",
-            "ecu": "104",
-            "enhancedNetworkingSupported": "No",
-            "gpu": "4",
-            "instanceFamily": "GPU instance",
-            "instanceType": "g2.8xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "60 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2670 (Sandy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 120 SSD",
-            "vcpu": "32"
-        },
-        "id": "g2.8xlarge",
-        "name": "g2.8xlarge",
-        "ram": 61440
-    },
-    "g3.16xlarge": {
-        "bandwidth": 20,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "201",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "4",
-            "instanceFamily": "GPU instance",
-            "instanceType": "g3.16xlarge",
-            "instancesku": "9JX6W8YKTGAXCFNB",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "488 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "64"
-        },
-        "id": "g3.16xlarge",
-        "name": "g3.16xlarge",
-        "ram": 499712
-    },
-    "g3.4xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "58",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "1",
-            "instanceFamily": "GPU instance",
-            "instanceType": "g3.4xlarge",
-            "instancesku": "XQVRFGT3HCZ63BJ5",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "122 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "g3.4xlarge",
-        "name": "g3.4xlarge",
-        "ram": 124928
-    },
-    "g3.8xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "97",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "2",
-            "instanceFamily": "GPU instance",
-            "instanceType": "g3.8xlarge",
-            "instancesku": "8DQCJ3V7VZPTQK24",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "244 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "32"
-        },
-        "id": "g3.8xlarge",
-        "name": "g3.8xlarge",
-        "ram": 249856
-    },
-    "g3s.xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "100 Mbps",
-            "ecu": "13",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "1",
-            "instanceFamily": "GPU instance",
-            "instanceType": "g3s.xlarge",
-            "instancesku": "CH4D8VQYKHAT566Q",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "30.5 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "g3s.xlarge",
-        "name": "g3s.xlarge",
-        "ram": 31232
-    },
-    "g4dn.12xlarge": {
-        "bandwidth": 50,
-        "disk": 900,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "4",
-            "instanceFamily": "GPU instance",
-            "instanceType": "g4dn.12xlarge",
-            "instancesku": "KYG4GJZXW67JH275",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "192 GiB",
-            "networkPerformance": "50 Gigabit",
-            "normalizationSizeFactor": "NA",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "900 GB NVMe SSD",
-            "vcpu": "48"
-        },
-        "id": "g4dn.12xlarge",
-        "name": "g4dn.12xlarge",
-        "ram": 196608
-    },
-    "g4dn.16xlarge": {
-        "bandwidth": 50,
-        "disk": 900,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "1",
-            "instanceFamily": "GPU instance",
-            "instanceType": "g4dn.16xlarge",
-            "instancesku": "EV7U94XE5G2K8RWP",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "256 GiB",
-            "networkPerformance": "50 Gigabit",
-            "normalizationSizeFactor": "NA",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "900 GB NVMe SSD",
-            "vcpu": "64"
-        },
-        "id": "g4dn.16xlarge",
-        "name": "g4dn.16xlarge",
-        "ram": 262144
-    },
-    "g4dn.2xlarge": {
-        "bandwidth": 25,
-        "disk": 225,
-        "extra": {
-            "currentGeneration": "Yes",
-            "ecu": "NA",
-            "gpu": "1",
-            "instanceFamily": "GPU instance",
-            "instanceType": "g4dn.2xlarge",
-            "instancesku": "3W5TQY9NMW3Z6HKV",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "NA",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "225 GB NVMe SSD",
-            "vcpu": "8"
-        },
-        "id": "g4dn.2xlarge",
-        "name": "g4dn.2xlarge",
-        "ram": 32768
-    },
-    "g4dn.4xlarge": {
-        "bandwidth": 25,
-        "disk": 225,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "1",
-            "instanceFamily": "GPU instance",
-            "instanceType": "g4dn.4xlarge",
-            "instancesku": "P2PYJRR8WRUQQ83N",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "NA",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "225 GB NVMe SSD",
-            "vcpu": "16"
-        },
-        "id": "g4dn.4xlarge",
-        "name": "g4dn.4xlarge",
-        "ram": 65536
-    },
-    "g4dn.8xlarge": {
-        "bandwidth": 50,
-        "disk": 900,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "1",
-            "instanceFamily": "GPU instance",
-            "instanceType": "g4dn.8xlarge",
-            "instancesku": "E4ENVUU4X4C9CA2A",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "128 GiB",
-            "networkPerformance": "50 Gigabit",
-            "normalizationSizeFactor": "NA",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "900 GB NVMe SSD",
-            "vcpu": "32"
-        },
-        "id": "g4dn.8xlarge",
-        "name": "g4dn.8xlarge",
-        "ram": 131072
-    },
-    "g4dn.xlarge": {
-        "bandwidth": 25,
-        "disk": 125,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "1",
-            "instanceFamily": "GPU instance",
-            "instanceType": "g4dn.xlarge",
-            "instancesku": "CBN4GYUGRUCDMWNY",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "NA",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "125 GB NVMe SSD",
-            "vcpu": "4"
-        },
-        "id": "g4dn.xlarge",
-        "name": "g4dn.xlarge",
-        "ram": 16384
-    },
-    "h1.16xlarge": {
-        "bandwidth": 25,
-        "disk": 16000,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "201",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "h1.16xlarge",
-            "instancesku": "95Z3VYWMT3AARF75",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "256 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "8 x 2000 HDD",
-            "vcpu": "64"
-        },
-        "id": "h1.16xlarge",
-        "name": "h1.16xlarge",
-        "ram": 262144
-    },
-    "h1.2xlarge": {
-        "bandwidth": 10,
-        "disk": 2000,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "1750 Mbps",
-            "ecu": "31",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "h1.2xlarge",
-            "instancesku": "EDHN83CZXXV35NWH",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 2000 HDD",
-            "vcpu": "8"
-        },
-        "id": "h1.2xlarge",
-        "name": "h1.2xlarge",
-        "ram": 32768
-    },
-    "h1.4xlarge": {
-        "bandwidth": 10,
-        "disk": 4000,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "58",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "h1.4xlarge",
-            "instancesku": "E3W8QW3X5FF55BPW",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 2000 HDD",
-            "vcpu": "16"
-        },
-        "id": "h1.4xlarge",
-        "name": "h1.4xlarge",
-        "ram": 65536
-    },
-    "h1.8xlarge": {
-        "bandwidth": 10,
-        "disk": 8000,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "97",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "h1.8xlarge",
-            "instancesku": "V92EE38S25QMHCHR",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "128 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 2000 HDD",
-            "vcpu": "32"
-        },
-        "id": "h1.8xlarge",
-        "name": "h1.8xlarge",
-        "ram": 131072
-    },
-    "hs1.8xlarge": {
-        "bandwidth": 10,
-        "disk": 48000,
-        "extra": {
-            "clockSpeed": "2 GHz",
-            "currentGeneration": "No",
-            "ecu": "35",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "hs1.8xlarge",
-            "memory": "117 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2650",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "24 x 2000",
-            "vcpu": "17"
-        },
-        "id": "hs1.8xlarge",
-        "name": "hs1.8xlarge",
-        "ram": 119808
-    },
-    "i2.2xlarge": {
-        "bandwidth": None,
-        "disk": 1600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "dedicatedEbsThroughput": "1500 Mbps",
-            "ecu": "27",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i2.2xlarge",
-            "instancesku": "S3CUTS4VY2N7TUAC",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "61 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 800 SSD",
-            "vcpu": "8"
-        },
-        "id": "i2.2xlarge",
-        "name": "i2.2xlarge",
-        "ram": 62464
-    },
-    "i2.4xlarge": {
-        "bandwidth": None,
-        "disk": 3200,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "dedicatedEbsThroughput": "1500 Mbps",
-            "ecu": "53",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i2.4xlarge",
-            "instancesku": "QAS6U8F8Z43CEYDJ",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "122 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 800 SSD",
-            "vcpu": "16"
-        },
-        "id": "i2.4xlarge",
-        "name": "i2.4xlarge",
-        "ram": 124928
-    },
-    "i2.8xlarge": {
-        "bandwidth": 10,
-        "disk": 6400,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "dedicatedEbsThroughput": "1500 Mbps",
-            "ecu": "104",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i2.8xlarge",
-            "instancesku": "GJUYG5H8K4MVD9B2",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "244 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "8 x 800 SSD",
-            "vcpu": "32"
-        },
-        "id": "i2.8xlarge",
-        "name": "i2.8xlarge",
-        "ram": 249856
-    },
-    "i2.xlarge": {
-        "bandwidth": None,
-        "disk": 800,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "dedicatedEbsThroughput": "750 Mbps",
-            "ecu": "14",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i2.xlarge",
-            "instancesku": "VJV23STC4X8PNAQM",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "30.5 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 800 SSD",
-            "vcpu": "4"
-        },
-        "id": "i2.xlarge",
-        "name": "i2.xlarge",
-        "ram": 31232
-    },
-    "i3.16xlarge": {
-        "bandwidth": 20,
-        "disk": 15200,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "201",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3.16xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "488 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "8 x 1900 NVMe SSD",
-            "vcpu": "64"
-        },
-        "id": "i3.16xlarge",
-        "name": "i3.16xlarge",
-        "ram": 499712
-    },
-    "i3.2xlarge": {
-        "bandwidth": 10,
-        "disk": 1900,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "1750 Mbps",
-            "ecu": "31",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3.2xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "61 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 1900 NVMe SSD",
-            "vcpu": "8"
-        },
-        "id": "i3.2xlarge",
-        "name": "i3.2xlarge",
-        "ram": 62464
-    },
-    "i3.4xlarge": {
-        "bandwidth": 10,
-        "disk": 3800,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "53",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3.4xlarge",
-            "memory": "122 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX, Intel AVX2, Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 1900 NVMe SSD",
-            "vcpu": "16"
-        },
-        "id": "i3.4xlarge",
-        "name": "i3.4xlarge",
-        "ram": 124928
-    },
-    "i3.8xlarge": {
-        "bandwidth": 10,
-        "disk": 7600,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "97",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3.8xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "244 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 1900 NVMe SSD",
-            "vcpu": "32"
-        },
-        "id": "i3.8xlarge",
-        "name": "i3.8xlarge",
-        "ram": 249856
-    },
-    "i3.large": {
-        "bandwidth": 10,
-        "disk": 475,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "425 Mbps",
-            "ecu": "8",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3.large",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "15.25 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 475 NVMe SSD",
-            "vcpu": "2"
-        },
-        "id": "i3.large",
-        "name": "i3.large",
-        "ram": 15616
-    },
-    "i3.xlarge": {
-        "bandwidth": 10,
-        "disk": 950,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "850 Mbps",
-            "ecu": "16",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3.xlarge",
-            "instancesku": "99QZ9VR3AF2FW3TB",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "30.5 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 950 NVMe SSD",
-            "vcpu": "4"
-        },
-        "id": "i3.xlarge",
-        "name": "i3.xlarge",
-        "ram": 31232
-    },
-    "i3en.12xlarge": {
-        "bandwidth": 50,
-        "disk": 30000,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "168",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3en.12xlarge",
-            "instancesku": "GVPZRNHNZPE4JV4G",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "384 GiB",
-            "networkPerformance": "50 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 7500 NVMe SSD",
-            "vcpu": "48"
-        },
-        "id": "i3en.12xlarge",
-        "name": "i3en.12xlarge",
-        "ram": 393216
-    },
-    "i3en.24xlarge": {
-        "bandwidth": 100,
-        "disk": 60000,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "337",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3en.24xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "768 GiB",
-            "networkPerformance": "100 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "8 x 7500 NVMe SSD",
-            "vcpu": "96"
-        },
-        "id": "i3en.24xlarge",
-        "name": "i3en.24xlarge",
-        "ram": 786432
-    },
-    "i3en.2xlarge": {
-        "bandwidth": 25,
-        "disk": 5000,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "37",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3en.2xlarge",
-            "instancesku": "KPSBHZJSEURW9AUU",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 2500 NVMe SSD",
-            "vcpu": "8"
-        },
-        "id": "i3en.2xlarge",
-        "name": "i3en.2xlarge",
-        "ram": 65536
-    },
-    "i3en.3xlarge": {
-        "bandwidth": 25,
-        "disk": 7500,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3en.3xlarge",
-            "instancesku": "4M9CWY3DF8ZQRQ2F",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "96 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "24",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 7500 NVMe SSD",
-            "vcpu": "12"
-        },
-        "id": "i3en.3xlarge",
-        "name": "i3en.3xlarge",
-        "ram": 98304
-    },
-    "i3en.6xlarge": {
-        "bandwidth": 25,
-        "disk": 15000,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3en.6xlarge",
-            "instancesku": "8RHN5TZKA9MW3AWW",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "192 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "48",
-            "physicalProcessor": "Intel Xeon Platinum 8175",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 7500 NVMe SSD",
-            "vcpu": "24"
-        },
-        "id": "i3en.6xlarge",
-        "name": "i3en.6xlarge",
-        "ram": 196608
-    },
-    "i3en.large": {
-        "bandwidth": 25,
-        "disk": 1250,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "10",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3en.large",
-            "instancesku": "EDC6Z6KEEJ6KENE8",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 1250 NVMe SSD",
-            "vcpu": "2"
-        },
-        "id": "i3en.large",
-        "name": "i3en.large",
-        "ram": 16384
-    },
-    "i3en.xlarge": {
-        "bandwidth": 25,
-        "disk": 2500,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Storage optimized",
-            "instanceType": "i3en.xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 2500 NVMe SSD",
-            "vcpu": "4"
-        },
-        "id": "i3en.xlarge",
-        "name": "i3en.xlarge",
-        "ram": 32768
-    },
-    "inf1.24xlarge": {
-        "bandwidth": 100,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Machine Learning ASIC Instances",
-            "instanceType": "inf1.24xlarge",
-            "instancesku": "YKZ73T2PBEWV8HSM",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "192 GiB",
-            "networkPerformance": "100 Gigabit",
-            "normalizationSizeFactor": "NA",
-            "physicalProcessor": "Intel Xeon Platinum 8275CL (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "96"
-        },
-        "id": "inf1.24xlarge",
-        "name": "inf1.24xlarge",
-        "ram": 196608
-    },
-    "inf1.2xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "875 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Machine Learning ASIC Instances",
-            "instanceType": "inf1.2xlarge",
-            "instancesku": "66AAM3URQPDCTMXY",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "NA",
-            "physicalProcessor": "Intel Xeon Platinum 8275CL (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "inf1.2xlarge",
-        "name": "inf1.2xlarge",
-        "ram": 16384
-    },
-    "inf1.6xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Machine Learning ASIC Instances",
-            "instanceType": "inf1.6xlarge",
-            "instancesku": "CGXS8PYBHFGKES9Z",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "48 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "NA",
-            "physicalProcessor": "Intel Xeon Platinum 8275CL (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "24"
-        },
-        "id": "inf1.6xlarge",
-        "name": "inf1.6xlarge",
-        "ram": 49152
-    },
-    "inf1.xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "875 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Machine Learning ASIC Instances",
-            "instanceType": "inf1.xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "8 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "NA",
-            "physicalProcessor": "Intel Xeon Platinum 8275CL (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "inf1.xlarge",
-        "name": "inf1.xlarge",
-        "ram": 8192
-    },
-    "m1.large": {
-        "bandwidth": None,
-        "disk": 840,
-        "extra": {
-            "currentGeneration": "No",
-            "ecu": "4",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m1.large",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "7.5 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 420 SSD",
-            "vcpu": "2"
-        },
-        "id": "m1.large",
-        "name": "m1.large",
-        "ram": 7680
-    },
-    "m1.medium": {
-        "bandwidth": None,
-        "disk": 410,
-        "extra": {
-            "currentGeneration": "No",
-            "ecu": "2",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m1.medium",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "3.75 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "2",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "32-bit or 64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 410 SSD",
-            "vcpu": "1"
-        },
-        "id": "m1.medium",
-        "name": "m1.medium",
-        "ram": 3840
-    },
-    "m1.small": {
-        "bandwidth": None,
-        "disk": 160,
-        "extra": {
-            "currentGeneration": "No",
-            "ecu": "1",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m1.small",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "1.7 GiB",
-            "networkPerformance": "Low",
-            "normalizationSizeFactor": "1",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "32-bit or 64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 160 SSD",
-            "vcpu": "1"
-        },
-        "id": "m1.small",
-        "name": "m1.small",
-        "ram": 1740
-    },
-    "m1.xlarge": {
-        "bandwidth": None,
-        "disk": 1680,
-        "extra": {
-            "currentGeneration": "No",
-            "ecu": "8",
-            "instanceFamily": "General purpose",
-            "instanceType": "m1.xlarge",
-            "memory": "15 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 420",
-            "vcpu": "4"
-        },
-        "id": "m1.xlarge",
-        "name": "m1.xlarge",
-        "ram": 15360
-    },
-    "m2.2xlarge": {
-        "bandwidth": None,
-        "disk": 850,
-        "extra": {
-            "currentGeneration": "No",
-            "ecu": "13",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "m2.2xlarge",
-            "memory": "34.2 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 850",
-            "vcpu": "4"
-        },
-        "id": "m2.2xlarge",
-        "name": "m2.2xlarge",
-        "ram": 35020
-    },
-    "m2.4xlarge": {
-        "bandwidth": None,
-        "disk": 1680,
-        "extra": {
-            "currentGeneration": "No",
-            "ecu": "26",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "m2.4xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "68.4 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 840 SSD",
-            "vcpu": "8"
-        },
-        "id": "m2.4xlarge",
-        "name": "m2.4xlarge",
-        "ram": 70041
-    },
-    "m2.xlarge": {
-        "bandwidth": None,
-        "disk": 420,
-        "extra": {
-            "currentGeneration": "No",
-            "ecu": "6.5",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "m2.xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "17.1 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 420 SSD",
-            "vcpu": "2"
-        },
-        "id": "m2.xlarge",
-        "name": "m2.xlarge",
-        "ram": 17510
-    },
-    "m3.2xlarge": {
-        "bandwidth": None,
-        "disk": 160,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "dedicatedEbsThroughput": "1000 Mbps",
-            "ecu": "26",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m3.2xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "30 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge/Sandy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 80 SSD",
-            "vcpu": "8"
-        },
-        "id": "m3.2xlarge",
-        "name": "m3.2xlarge",
-        "ram": 30720
-    },
-    "m3.large": {
-        "bandwidth": None,
-        "disk": 32,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "ecu": "6.5",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m3.large",
-            "instancesku": "8KTQAHWA58GUHDGC",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "7.5 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge/Sandy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 32 SSD",
-            "vcpu": "2"
-        },
-        "id": "m3.large",
-        "name": "m3.large",
-        "ram": 7680
-    },
-    "m3.medium": {
-        "bandwidth": None,
-        "disk": 4,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "ecu": "3",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m3.medium",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "3.75 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "2",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge/Sandy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 4 SSD",
-            "vcpu": "1"
-        },
-        "id": "m3.medium",
-        "name": "m3.medium",
-        "ram": 3840
-    },
-    "m3.xlarge": {
-        "bandwidth": None,
-        "disk": 80,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "dedicatedEbsThroughput": "500 Mbps",
-            "ecu": "13",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m3.xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "15 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge/Sandy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 40 SSD",
-            "vcpu": "4"
-        },
-        "id": "m3.xlarge",
-        "name": "m3.xlarge",
-        "ram": 15360
-    },
-    "m4.10xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.4 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "4000 Mbps",
-            "ecu": "124.5",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m4.10xlarge",
-            "instancesku": "MDVS9QJ4U4VXR7P6",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "160 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "80",
-            "physicalProcessor": "Intel Xeon E5-2676 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "40"
-        },
-        "id": "m4.10xlarge",
-        "name": "m4.10xlarge",
-        "ram": 163840
-    },
-    "m4.16xlarge": {
-        "bandwidth": 20,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.4 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "188",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m4.16xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "256 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "64"
-        },
-        "id": "m4.16xlarge",
-        "name": "m4.16xlarge",
-        "ram": 262144
-    },
-    "m4.2xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.4 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "1000 Mbps",
-            "ecu": "26",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m4.2xlarge",
-            "memory": "32 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2676 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "m4.2xlarge",
-        "name": "m4.2xlarge",
-        "ram": 32768
-    },
-    "m4.4xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.4 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "2000 Mbps",
-            "ecu": "53.5",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m4.4xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "64 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon E5-2676 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "m4.4xlarge",
-        "name": "m4.4xlarge",
-        "ram": 65536
-    },
-    "m4.large": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.4 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "450 Mbps",
-            "ecu": "6.5",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m4.large",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "8 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon E5-2676 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "m4.large",
-        "name": "m4.large",
-        "ram": 8192
-    },
-    "m4.xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.4 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "750 Mbps",
-            "ecu": "13",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m4.xlarge",
-            "instancesku": "5RFD7HVPT29ZZRJZ",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "16 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon E5-2676 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "m4.xlarge",
-        "name": "m4.xlarge",
-        "ram": 16384
-    },
-    "m5.12xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "168",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5.12xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "192 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "48"
-        },
-        "id": "m5.12xlarge",
-        "name": "m5.12xlarge",
-        "ram": 196608
-    },
-    "m5.16xlarge": {
-        "bandwidth": 20,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "256",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5.16xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "256 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "64"
-        },
-        "id": "m5.16xlarge",
-        "name": "m5.16xlarge",
-        "ram": 262144
-    },
-    "m5.24xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "12000 Mbps",
-            "ecu": "337",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5.24xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "384 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "96"
-        },
-        "id": "m5.24xlarge",
-        "name": "m5.24xlarge",
-        "ram": 393216
-    },
-    "m5.2xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "37",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5.2xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "m5.2xlarge",
-        "name": "m5.2xlarge",
-        "ram": 32768
-    },
-    "m5.4xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "2120 Mbps",
-            "ecu": "70",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5.4xlarge",
-            "instancesku": "GPN9XWJXU6R7VNVU",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "m5.4xlarge",
-        "name": "m5.4xlarge",
-        "ram": 65536
-    },
-    "m5.8xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "128",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5.8xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "128 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "32"
-        },
-        "id": "m5.8xlarge",
-        "name": "m5.8xlarge",
-        "ram": 131072
-    },
-    "m5.large": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Upto 2120 Mbps",
-            "ecu": "8",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5.large",
-            "instancesku": "2WTZUAPYXZ92MPYV",
-            "memory": "8 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8175",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX, Intel AVX2, Intel AVX512, Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "m5.large",
-        "name": "m5.large",
-        "ram": 8192
-    },
-    "m5.metal": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "12000 Mbps",
-            "ecu": "345",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5.metal",
-            "instancesku": "NEA5ZGBNTVZY47F8",
-            "memory": "384 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8175",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX, Intel AVX2, Intel AVX512, Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "96"
-        },
-        "id": "m5.metal",
-        "name": "m5.metal",
-        "ram": 393216
-    },
-    "m5.xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "16",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5.xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "m5.xlarge",
-        "name": "m5.xlarge",
-        "ram": 16384
-    },
-    "m5a.12xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5a.12xlarge",
-            "instancesku": "NTCQHKBGDWZV9A4S",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "192 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "48"
-        },
-        "id": "m5a.12xlarge",
-        "name": "m5a.12xlarge",
-        "ram": 196608
-    },
-    "m5a.16xlarge": {
-        "bandwidth": 12,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5a.16xlarge",
-            "instancesku": "PDTXJ9FD3DSMTAWR",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "256 GiB",
-            "networkPerformance": "12 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "64"
-        },
-        "id": "m5a.16xlarge",
-        "name": "m5a.16xlarge",
-        "ram": 262144
-    },
-    "m5a.24xlarge": {
-        "bandwidth": 20,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5a.24xlarge",
-            "instancesku": "3DZQSBC8ACN83U66",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "384 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "96"
-        },
-        "id": "m5a.24xlarge",
-        "name": "m5a.24xlarge",
-        "ram": 393216
-    },
-    "m5a.2xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5a.2xlarge",
-            "instancesku": "SQ6QFVBCH7QJN7WE",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "m5a.2xlarge",
-        "name": "m5a.2xlarge",
-        "ram": 32768
-    },
-    "m5a.4xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5a.4xlarge",
-            "instancesku": "YHV5N59X2JZJT7UF",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "m5a.4xlarge",
-        "name": "m5a.4xlarge",
-        "ram": 65536
-    },
-    "m5a.8xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5a.8xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "128 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "32"
-        },
-        "id": "m5a.8xlarge",
-        "name": "m5a.8xlarge",
-        "ram": 131072
-    },
-    "m5a.large": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5a.large",
-            "instancesku": "YETHAPD3GP4N3ZNK",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "8 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "m5a.large",
-        "name": "m5a.large",
-        "ram": 8192
-    },
-    "m5a.xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5a.xlarge",
-            "instancesku": "2DC7PA6547H9EQEU",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "m5a.xlarge",
-        "name": "m5a.xlarge",
-        "ram": 16384
-    },
-    "m5ad.12xlarge": {
-        "bandwidth": 10,
-        "disk": 1800,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5ad.12xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "192 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 900 NVMe SSD",
-            "vcpu": "48"
-        },
-        "id": "m5ad.12xlarge",
-        "name": "m5ad.12xlarge",
-        "ram": 196608
-    },
-    "m5ad.16xlarge": {
-        "bandwidth": 12,
-        "disk": 2400,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5ad.16xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "256 GiB",
-            "networkPerformance": "12 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 600 NVMe SSD",
-            "vcpu": "64"
-        },
-        "id": "m5ad.16xlarge",
-        "name": "m5ad.16xlarge",
-        "ram": 262144
-    },
-    "m5ad.24xlarge": {
-        "bandwidth": 20,
-        "disk": 3600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5ad.24xlarge",
-            "instancesku": "6QSKH897CEX9D5PD",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "384 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 900 NVMe SSD",
-            "vcpu": "96"
-        },
-        "id": "m5ad.24xlarge",
-        "name": "m5ad.24xlarge",
-        "ram": 393216
-    },
-    "m5ad.2xlarge": {
-        "bandwidth": 10,
-        "disk": 300,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5ad.2xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 300 NVMe SSD",
-            "vcpu": "8"
-        },
-        "id": "m5ad.2xlarge",
-        "name": "m5ad.2xlarge",
-        "ram": 32768
-    },
-    "m5ad.4xlarge": {
-        "bandwidth": 10,
-        "disk": 600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5ad.4xlarge",
-            "instancesku": "53D2DUQDA28GP4FA",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 300 NVMe SSD",
-            "vcpu": "16"
-        },
-        "id": "m5ad.4xlarge",
-        "name": "m5ad.4xlarge",
-        "ram": 65536
-    },
-    "m5ad.8xlarge": {
-        "bandwidth": 10,
-        "disk": 1200,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5ad.8xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "128 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 600 NVMe SSD",
-            "vcpu": "32"
-        },
-        "id": "m5ad.8xlarge",
-        "name": "m5ad.8xlarge",
-        "ram": 131072
-    },
-    "m5ad.large": {
-        "bandwidth": 10,
-        "disk": 75,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5ad.large",
-            "instancesku": "DV2FPCRNYQC737FY",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "8 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 75 NVMe SSD",
-            "vcpu": "2"
-        },
-        "id": "m5ad.large",
-        "name": "m5ad.large",
-        "ram": 8192
-    },
-    "m5ad.xlarge": {
-        "bandwidth": 10,
-        "disk": 150,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5ad.xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 150 NVMe SSD",
-            "vcpu": "4"
-        },
-        "id": "m5ad.xlarge",
-        "name": "m5ad.xlarge",
-        "ram": 16384
-    },
-    "m5d.12xlarge": {
-        "bandwidth": 10,
-        "disk": 1800,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "6000 Mbps",
-            "ecu": "168",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5d.12xlarge",
-            "instancesku": "GMGGY8H6FE639R7J",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "192 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 900 NVMe SSD",
-            "vcpu": "48"
-        },
-        "id": "m5d.12xlarge",
-        "name": "m5d.12xlarge",
-        "ram": 196608
-    },
-    "m5d.16xlarge": {
-        "bandwidth": 20,
-        "disk": 2400,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "256",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5d.16xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "256 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 600 NVMe SSD",
-            "vcpu": "64"
-        },
-        "id": "m5d.16xlarge",
-        "name": "m5d.16xlarge",
-        "ram": 262144
-    },
-    "m5d.24xlarge": {
-        "bandwidth": 25,
-        "disk": 3600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "12000 Mbps",
-            "ecu": "337",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5d.24xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "384 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 900 NVMe SSD",
-            "vcpu": "96"
-        },
-        "id": "m5d.24xlarge",
-        "name": "m5d.24xlarge",
-        "ram": 393216
-    },
-    "m5d.2xlarge": {
-        "bandwidth": 10,
-        "disk": 300,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "37",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5d.2xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 300 NVMe SSD",
-            "vcpu": "8"
-        },
-        "id": "m5d.2xlarge",
-        "name": "m5d.2xlarge",
-        "ram": 32768
-    },
-    "m5d.4xlarge": {
-        "bandwidth": 10,
-        "disk": 600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "2120 Mbps",
-            "ecu": "70",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5d.4xlarge",
-            "instancesku": "SJTJT7YB2TAKEFUZ",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 300 NVMe SSD",
-            "vcpu": "16"
-        },
-        "id": "m5d.4xlarge",
-        "name": "m5d.4xlarge",
-        "ram": 65536
-    },
-    "m5d.8xlarge": {
-        "bandwidth": 10,
-        "disk": 1200,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "128",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5d.8xlarge",
-            "instancesku": "7WTXDDTKVDX74SRU",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "128 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 600 NVMe SSD",
-            "vcpu": "32"
-        },
-        "id": "m5d.8xlarge",
-        "name": "m5d.8xlarge",
-        "ram": 131072
-    },
-    "m5d.large": {
-        "bandwidth": 10,
-        "disk": 75,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "10",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5d.large",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "8 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 75 NVMe SSD",
-            "vcpu": "2"
-        },
-        "id": "m5d.large",
-        "name": "m5d.large",
-        "ram": 8192
-    },
-    "m5d.xlarge": {
-        "bandwidth": 10,
-        "disk": 150,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Upto 2120 Mbps",
-            "ecu": "16",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5d.xlarge",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8175",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX, Intel AVX2, Intel AVX512, Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 150 NVMe SSD",
-            "vcpu": "4"
-        },
-        "id": "m5d.xlarge",
-        "name": "m5d.xlarge",
-        "ram": 16384
-    },
-    "m5dn.12xlarge": {
-        "bandwidth": 50,
-        "disk": 1800,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5dn.12xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "192 GiB",
-            "networkPerformance": "50 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 900 GB NVMe SSD",
-            "vcpu": "48"
-        },
-        "id": "m5dn.12xlarge",
-        "name": "m5dn.12xlarge",
-        "ram": 196608
-    },
-    "m5dn.16xlarge": {
-        "bandwidth": 75,
-        "disk": 2400,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5dn.16xlarge",
-            "instancesku": "2UXZVUW3AW4RWSVK",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "256 GiB",
-            "networkPerformance": "75 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 600 NVMe SSD",
-            "vcpu": "64"
-        },
-        "id": "m5dn.16xlarge",
-        "name": "m5dn.16xlarge",
-        "ram": 262144
-    },
-    "m5dn.24xlarge": {
-        "bandwidth": 100,
-        "disk": 3600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5dn.24xlarge",
-            "instancesku": "3CSFMMFP6H6R4C8N",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "384 GiB",
-            "networkPerformance": "100 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 900 NVMe SSD",
-            "vcpu": "96"
-        },
-        "id": "m5dn.24xlarge",
-        "name": "m5dn.24xlarge",
-        "ram": 393216
-    },
-    "m5dn.2xlarge": {
-        "bandwidth": 25,
-        "disk": 300,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5dn.2xlarge",
-            "instancesku": "EFERZJ2267U6HKKN",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 300 NVMe SSD",
-            "vcpu": "8"
-        },
-        "id": "m5dn.2xlarge",
-        "name": "m5dn.2xlarge",
-        "ram": 32768
-    },
-    "m5dn.4xlarge": {
-        "bandwidth": 25,
-        "disk": 600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5dn.4xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 300 NVMe SSD",
-            "vcpu": "16"
-        },
-        "id": "m5dn.4xlarge",
-        "name": "m5dn.4xlarge",
-        "ram": 65536
-    },
-    "m5dn.8xlarge": {
-        "bandwidth": 25,
-        "disk": 1200,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5dn.8xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "128 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 600 NVMe SSD",
-            "vcpu": "32"
-        },
-        "id": "m5dn.8xlarge",
-        "name": "m5dn.8xlarge",
-        "ram": 131072
-    },
-    "m5dn.large": {
-        "bandwidth": 25,
-        "disk": 75,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5dn.large",
-            "instancesku": "TP3PAHR3346GJ67W",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "8 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 75 NVMe SSD",
-            "vcpu": "2"
-        },
-        "id": "m5dn.large",
-        "name": "m5dn.large",
-        "ram": 8192
-    },
-    "m5dn.xlarge": {
-        "bandwidth": 25,
-        "disk": 150,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5dn.xlarge",
-            "instancesku": "SHVB6RBA3NZZ9V4Z",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 150 NVMe SSD",
-            "vcpu": "4"
-        },
-        "id": "m5dn.xlarge",
-        "name": "m5dn.xlarge",
-        "ram": 16384
-    },
-    "m5n.12xlarge": {
-        "bandwidth": 50,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5n.12xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "192 GiB",
-            "networkPerformance": "50 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "48"
-        },
-        "id": "m5n.12xlarge",
-        "name": "m5n.12xlarge",
-        "ram": 196608
-    },
-    "m5n.16xlarge": {
-        "bandwidth": 75,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5n.16xlarge",
-            "instancesku": "EA8S423TQADF5CY2",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "256 GiB",
-            "networkPerformance": "75 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "64"
-        },
-        "id": "m5n.16xlarge",
-        "name": "m5n.16xlarge",
-        "ram": 262144
-    },
-    "m5n.24xlarge": {
-        "bandwidth": 100,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5n.24xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "384 GiB",
-            "networkPerformance": "100 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "96"
-        },
-        "id": "m5n.24xlarge",
-        "name": "m5n.24xlarge",
-        "ram": 393216
-    },
-    "m5n.2xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5n.2xlarge",
-            "instancesku": "UYEPHYDEF5R5EBP5",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "m5n.2xlarge",
-        "name": "m5n.2xlarge",
-        "ram": 32768
-    },
-    "m5n.4xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5n.4xlarge",
-            "instancesku": "ZH4K42CV65578MRJ",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "m5n.4xlarge",
-        "name": "m5n.4xlarge",
-        "ram": 65536
-    },
-    "m5n.8xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5n.8xlarge",
-            "instancesku": "ATZJ9KFTKYZZMGEJ",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "128 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "32"
-        },
-        "id": "m5n.8xlarge",
-        "name": "m5n.8xlarge",
-        "ram": 131072
-    },
-    "m5n.large": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5n.large",
-            "instancesku": "2FNJS8YA6UBP65EW",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "8 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "m5n.large",
-        "name": "m5n.large",
-        "ram": 8192
-    },
-    "m5n.xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m5n.xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "m5n.xlarge",
-        "name": "m5n.xlarge",
-        "ram": 16384
-    },
-    "m6g.12xlarge": {
-        "bandwidth": 12,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "ecu": "NA",
-            "instanceFamily": "General purpose",
-            "instanceType": "m6g.12xlarge",
-            "instancesku": "WW7AYBVNX4P6DKEG",
-            "memory": "192 GiB",
-            "networkPerformance": "12 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "AWS Graviton2 Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "48"
-        },
-        "id": "m6g.12xlarge",
-        "name": "m6g.12xlarge",
-        "ram": 196608
-    },
-    "m6g.16xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "18000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m6g.16xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "256 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "AWS Graviton2 Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "64"
-        },
-        "id": "m6g.16xlarge",
-        "name": "m6g.16xlarge",
-        "ram": 262144
-    },
-    "m6g.2xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "2250 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m6g.2xlarge",
-            "instancesku": "275QHDMHEFGAB9QZ",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "AWS Graviton2 Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "m6g.2xlarge",
-        "name": "m6g.2xlarge",
-        "ram": 32768
-    },
-    "m6g.4xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "4500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m6g.4xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "AWS Graviton2 Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "m6g.4xlarge",
-        "name": "m6g.4xlarge",
-        "ram": 65536
-    },
-    "m6g.8xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "9000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m6g.8xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "128 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "AWS Graviton2 Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "32"
-        },
-        "id": "m6g.8xlarge",
-        "name": "m6g.8xlarge",
-        "ram": 131072
-    },
-    "m6g.large": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "600 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m6g.large",
-            "instancesku": "WKZUYUTMHZP7PGQS",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "8 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "AWS Graviton2 Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "m6g.large",
-        "name": "m6g.large",
-        "ram": 8192
-    },
-    "m6g.medium": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "300 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m6g.medium",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "4 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "2",
-            "physicalProcessor": "AWS Graviton2 Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "1"
-        },
-        "id": "m6g.medium",
-        "name": "m6g.medium",
-        "ram": 4096
-    },
-    "m6g.xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "1125 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "m6g.xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "AWS Graviton2 Processor",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "m6g.xlarge",
-        "name": "m6g.xlarge",
-        "ram": 16384
-    },
-    "p2.16xlarge": {
-        "bandwidth": 20,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "201",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "16",
-            "instanceFamily": "GPU instance",
-            "instanceType": "p2.16xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "732 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "64"
-        },
-        "id": "p2.16xlarge",
-        "name": "p2.16xlarge",
-        "ram": 749568
-    },
-    "p2.8xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "97",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "8",
-            "instanceFamily": "GPU instance",
-            "instanceType": "p2.8xlarge",
-            "instancesku": "CJQFCM483GYMQ4H7",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "488 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "32"
-        },
-        "id": "p2.8xlarge",
-        "name": "p2.8xlarge",
-        "ram": 499712
-    },
-    "p2.xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "750 Mbps",
-            "ecu": "16",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "1",
-            "instanceFamily": "GPU instance",
-            "instanceType": "p2.xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "61 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "p2.xlarge",
-        "name": "p2.xlarge",
-        "ram": 62464
-    },
-    "p3.16xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "201",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "8",
-            "instanceFamily": "GPU instance",
-            "instanceType": "p3.16xlarge",
-            "instancesku": "23X4DDDYPQ4U9WXE",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "488 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "64"
-        },
-        "id": "p3.16xlarge",
-        "name": "p3.16xlarge",
-        "ram": 499712
-    },
-    "p3.2xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "1750 Mbps",
-            "ecu": "31",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "1",
-            "instanceFamily": "GPU instance",
-            "instanceType": "p3.2xlarge",
-            "instancesku": "BQCBF2WYFFDEDXN7",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "61 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "p3.2xlarge",
-        "name": "p3.2xlarge",
-        "ram": 62464
-    },
-    "p3.8xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "97",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "4",
-            "instanceFamily": "GPU instance",
-            "instanceType": "p3.8xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "244 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "32"
-        },
-        "id": "p3.8xlarge",
-        "name": "p3.8xlarge",
-        "ram": 249856
-    },
-    "p3dn.24xlarge": {
-        "bandwidth": 100,
-        "disk": 1800,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "337",
-            "enhancedNetworkingSupported": "Yes",
-            "gpu": "8",
-            "instanceFamily": "GPU instance",
-            "instanceType": "p3dn.24xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "768 GiB",
-            "networkPerformance": "100 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 900 NVMe SSD",
-            "vcpu": "96"
-        },
-        "id": "p3dn.24xlarge",
-        "name": "p3dn.24xlarge",
-        "ram": 786432
-    },
-    "r3.2xlarge": {
-        "bandwidth": None,
-        "disk": 160,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "ecu": "26",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r3.2xlarge",
-            "instancesku": "QPBU35XRU5BNBBFE",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "61 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 160 SSD",
-            "vcpu": "8"
-        },
-        "id": "r3.2xlarge",
-        "name": "r3.2xlarge",
-        "ram": 62464
-    },
-    "r3.4xlarge": {
-        "bandwidth": None,
-        "disk": 320,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "ecu": "52",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r3.4xlarge",
-            "instancesku": "Y9WDY7HG6S2NXFSP",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "122 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 320 SSD",
-            "vcpu": "16"
-        },
-        "id": "r3.4xlarge",
-        "name": "r3.4xlarge",
-        "ram": 124928
-    },
-    "r3.8xlarge": {
-        "bandwidth": 10,
-        "disk": 640,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "ecu": "104",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r3.8xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "244 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 320 SSD",
-            "vcpu": "32"
-        },
-        "id": "r3.8xlarge",
-        "name": "r3.8xlarge",
-        "ram": 249856
-    },
-    "r3.large": {
-        "bandwidth": None,
-        "disk": 32,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "ecu": "6.5",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r3.large",
-            "memory": "15.25 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 32 SSD",
-            "vcpu": "2"
-        },
-        "id": "r3.large",
-        "name": "r3.large",
-        "ram": 15616
-    },
-    "r3.xlarge": {
-        "bandwidth": None,
-        "disk": 80,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "No",
-            "ecu": "13",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r3.xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "30.5 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon E5-2670 v2 (Ivy Bridge)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 80 SSD",
-            "vcpu": "4"
-        },
-        "id": "r3.xlarge",
-        "name": "r3.xlarge",
-        "ram": 31232
-    },
-    "r4.16xlarge": {
-        "bandwidth": 20,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "12000 Mbps",
-            "ecu": "195",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r4.16xlarge",
-            "instancesku": "M3PF8AJDMYE8CTHJ",
-            "memory": "488 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX, Intel AVX2, Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "64"
-        },
-        "id": "r4.16xlarge",
-        "name": "r4.16xlarge",
-        "ram": 499712
-    },
-    "r4.2xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "1600 Mbps",
-            "ecu": "31",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r4.2xlarge",
-            "instancesku": "T73VEGF6Z7U2FM2E",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "61 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "r4.2xlarge",
-        "name": "r4.2xlarge",
-        "ram": 62464
-    },
-    "r4.4xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3000 Mbps",
-            "ecu": "58",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r4.4xlarge",
-            "instancesku": "Q4JYWMFXQ9MM3WYP",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "122 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "r4.4xlarge",
-        "name": "r4.4xlarge",
-        "ram": 124928
-    },
-    "r4.8xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "6000 Mbps",
-            "ecu": "97",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r4.8xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "244 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "32"
-        },
-        "id": "r4.8xlarge",
-        "name": "r4.8xlarge",
-        "ram": 249856
-    },
-    "r4.large": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "400 Mbps",
-            "ecu": "7",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r4.large",
-            "instancesku": "EMEXNPTCFPMK9SZ6",
-            "memory": "15.25 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX, Intel AVX2, Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "r4.large",
-        "name": "r4.large",
-        "ram": 15616
-    },
-    "r4.xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "800 Mbps",
-            "ecu": "16",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r4.xlarge",
-            "instancesku": "Q985NTC5RUN6W6FN",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "30.5 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon E5-2686 v4 (Broadwell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "r4.xlarge",
-        "name": "r4.xlarge",
-        "ram": 31232
-    },
-    "r5.12xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "6000 Mbps",
-            "ecu": "168",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5.12xlarge",
-            "instancesku": "DEBR9WT8ZEH5SVYY",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "384 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "48"
-        },
-        "id": "r5.12xlarge",
-        "name": "r5.12xlarge",
-        "ram": 393216
-    },
-    "r5.16xlarge": {
-        "bandwidth": 20,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "256",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5.16xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "512 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "64"
-        },
-        "id": "r5.16xlarge",
-        "name": "r5.16xlarge",
-        "ram": 524288
-    },
-    "r5.24xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "12000 Mbps",
-            "ecu": "337",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5.24xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "768 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "96"
-        },
-        "id": "r5.24xlarge",
-        "name": "r5.24xlarge",
-        "ram": 786432
-    },
-    "r5.2xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "37",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5.2xlarge",
-            "instancesku": "TX6VCU4AX7SURS3R",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "r5.2xlarge",
-        "name": "r5.2xlarge",
-        "ram": 65536
-    },
-    "r5.4xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "2120 Mbps",
-            "ecu": "70",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5.4xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "128 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "r5.4xlarge",
-        "name": "r5.4xlarge",
-        "ram": 131072
-    },
-    "r5.8xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "128",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5.8xlarge",
-            "instancesku": "8J9E8648XRY8KRTV",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "256 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "32"
-        },
-        "id": "r5.8xlarge",
-        "name": "r5.8xlarge",
-        "ram": 262144
-    },
-    "r5.large": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "10",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5.large",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "r5.large",
-        "name": "r5.large",
-        "ram": 16384
-    },
-    "r5.xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "3.1 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "19",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5.xlarge",
-            "instancesku": "RYY8KJSCAHAJ2S2N",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "r5.xlarge",
-        "name": "r5.xlarge",
-        "ram": 32768
-    },
-    "r5a.12xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5a.12xlarge",
-            "instancesku": "K4WF4MUAD8NH6F85",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "384 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "48"
-        },
-        "id": "r5a.12xlarge",
-        "name": "r5a.12xlarge",
-        "ram": 393216
-    },
-    "r5a.16xlarge": {
-        "bandwidth": 12,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5a.16xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "512 GiB",
-            "networkPerformance": "12 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "64"
-        },
-        "id": "r5a.16xlarge",
-        "name": "r5a.16xlarge",
-        "ram": 524288
-    },
-    "r5a.24xlarge": {
-        "bandwidth": 20,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5a.24xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "768 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "96"
-        },
-        "id": "r5a.24xlarge",
-        "name": "r5a.24xlarge",
-        "ram": 786432
-    },
-    "r5a.2xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5a.2xlarge",
-            "instancesku": "P7S4KAQ9D4GAFR54",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "64 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "r5a.2xlarge",
-        "name": "r5a.2xlarge",
-        "ram": 65536
-    },
-    "r5a.4xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5a.4xlarge",
-            "instancesku": "SDQK54UK2HRQTUXV",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "128 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "16"
-        },
-        "id": "r5a.4xlarge",
-        "name": "r5a.4xlarge",
-        "ram": 131072
-    },
-    "r5a.8xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5a.8xlarge",
-            "instancesku": "6B56HCXAHSRM98ZB",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "256 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "32"
-        },
-        "id": "r5a.8xlarge",
-        "name": "r5a.8xlarge",
-        "ram": 262144
-    },
-    "r5a.large": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5a.large",
-            "instancesku": "UG5A9S2YU4GDQ6VS",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "r5a.large",
-        "name": "r5a.large",
-        "ram": 16384
-    },
-    "r5a.xlarge": {
-        "bandwidth": 10,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5a.xlarge",
-            "instancesku": "3QM2JUUU3729P3XF",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "r5a.xlarge",
-        "name": "r5a.xlarge",
-        "ram": 32768
-    },
-    "r5ad.12xlarge": {
-        "bandwidth": 10,
-        "disk": 1800,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5ad.12xlarge",
-            "instancesku": "CVGPBG74JXGXFUPZ",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "384 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 900 NVMe SSD",
-            "vcpu": "48"
-        },
-        "id": "r5ad.12xlarge",
-        "name": "r5ad.12xlarge",
-        "ram": 393216
-    },
-    "r5ad.16xlarge": {
-        "bandwidth": 12,
-        "disk": 2400,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5ad.16xlarge",
-            "instancesku": "5ECTGJZ54PJWVXSR",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "512 GiB",
-            "networkPerformance": "12 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 600 NVMe SSD",
-            "vcpu": "64"
-        },
-        "id": "r5ad.16xlarge",
-        "name": "r5ad.16xlarge",
-        "ram": 524288
-    },
-    "r5ad.24xlarge": {
-        "bandwidth": 20,
-        "disk": 3600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5ad.24xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "768 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 900 NVMe SSD",
-            "vcpu": "96"
-        },
-        "id": "r5ad.24xlarge",
-        "name": "r5ad.24xlarge",
-        "ram": 786432
-    },
-    "r5ad.2xlarge": {
-        "bandwidth": 10,
-        "disk": 300,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5ad.2xlarge",
-            "instancesku": "GUVRRZUCEA4W2NA2",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "64 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 300 NVMe SSD",
-            "vcpu": "8"
-        },
-        "id": "r5ad.2xlarge",
-        "name": "r5ad.2xlarge",
-        "ram": 65536
-    },
-    "r5ad.4xlarge": {
-        "bandwidth": 10,
-        "disk": 600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5ad.4xlarge",
-            "instancesku": "VT3PC6G59VCVCDVN",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "128 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 300 NVMe SSD",
-            "vcpu": "16"
-        },
-        "id": "r5ad.4xlarge",
-        "name": "r5ad.4xlarge",
-        "ram": 131072
-    },
-    "r5ad.8xlarge": {
-        "bandwidth": 10,
-        "disk": 1200,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5ad.8xlarge",
-            "instancesku": "Y7ZUMCMQMBHWWD67",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "256 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 600 NVMe SSD",
-            "vcpu": "32"
-        },
-        "id": "r5ad.8xlarge",
-        "name": "r5ad.8xlarge",
-        "ram": 262144
-    },
-    "r5ad.large": {
-        "bandwidth": 10,
-        "disk": 75,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5ad.large",
-            "instancesku": "DZNY4VEMMSVRTR73",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 75 NVMe SSD",
-            "vcpu": "2"
-        },
-        "id": "r5ad.large",
-        "name": "r5ad.large",
-        "ram": 16384
-    },
-    "r5ad.xlarge": {
-        "bandwidth": 10,
-        "disk": 150,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5ad.xlarge",
-            "instancesku": "X9QQDFJ8MS8FB32D",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 150 NVMe SSD",
-            "vcpu": "4"
-        },
-        "id": "r5ad.xlarge",
-        "name": "r5ad.xlarge",
-        "ram": 32768
-    },
-    "r5d.12xlarge": {
-        "bandwidth": 10,
-        "disk": 1800,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "6000 Mbps",
-            "ecu": "168",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5d.12xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "384 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 900 NVMe SSD",
-            "vcpu": "48"
-        },
-        "id": "r5d.12xlarge",
-        "name": "r5d.12xlarge",
-        "ram": 393216
-    },
-    "r5d.16xlarge": {
-        "bandwidth": 20,
-        "disk": 2400,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "256",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5d.16xlarge",
-            "instancesku": "7A8KJ5V5P6RMFWQ8",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "512 GiB",
-            "networkPerformance": "20 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 600 NVMe SSD",
-            "vcpu": "64"
-        },
-        "id": "r5d.16xlarge",
-        "name": "r5d.16xlarge",
-        "ram": 524288
-    },
-    "r5d.24xlarge": {
-        "bandwidth": 25,
-        "disk": 3600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "12000 Mbps",
-            "ecu": "337",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5d.24xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "768 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 900 NVMe SSD",
-            "vcpu": "96"
-        },
-        "id": "r5d.24xlarge",
-        "name": "r5d.24xlarge",
-        "ram": 786432
-    },
-    "r5d.2xlarge": {
-        "bandwidth": 10,
-        "disk": 300,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "37",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5d.2xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "64 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 300 NVMe SSD",
-            "vcpu": "8"
-        },
-        "id": "r5d.2xlarge",
-        "name": "r5d.2xlarge",
-        "ram": 65536
-    },
-    "r5d.4xlarge": {
-        "bandwidth": 10,
-        "disk": 600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "2120 Mbps",
-            "ecu": "70",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5d.4xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "128 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 300 NVMe SSD",
-            "vcpu": "16"
-        },
-        "id": "r5d.4xlarge",
-        "name": "r5d.4xlarge",
-        "ram": 131072
-    },
-    "r5d.8xlarge": {
-        "bandwidth": 10,
-        "disk": 1200,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "128",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5d.8xlarge",
-            "instancesku": "KDH339PT4BZYF4KZ",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "256 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 600 NVMe SSD",
-            "vcpu": "32"
-        },
-        "id": "r5d.8xlarge",
-        "name": "r5d.8xlarge",
-        "ram": 262144
-    },
-    "r5d.large": {
-        "bandwidth": 10,
-        "disk": 75,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "10",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5d.large",
-            "instancesku": "GGDAM58JTEWKNJHM",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "16 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 75 NVMe SSD",
-            "vcpu": "2"
-        },
-        "id": "r5d.large",
-        "name": "r5d.large",
-        "ram": 16384
-    },
-    "r5d.xlarge": {
-        "bandwidth": 10,
-        "disk": 150,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "19",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5d.xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "32 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8175 (Skylake)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 150 NVMe SSD",
-            "vcpu": "4"
-        },
-        "id": "r5d.xlarge",
-        "name": "r5d.xlarge",
-        "ram": 32768
-    },
-    "r5dn.12xlarge": {
-        "bandwidth": 50,
-        "disk": 1800,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "6000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5dn.12xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "384 GiB",
-            "networkPerformance": "50 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 900 GB NVMe SSD",
-            "vcpu": "48"
-        },
-        "id": "r5dn.12xlarge",
-        "name": "r5dn.12xlarge",
-        "ram": 393216
-    },
-    "r5dn.16xlarge": {
-        "bandwidth": 75,
-        "disk": 2400,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "10000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5dn.16xlarge",
-            "instancesku": "7V498XTUEEHCJRGZ",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "512 GiB",
-            "networkPerformance": "75 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 600 NVMe SSD",
-            "vcpu": "64"
-        },
-        "id": "r5dn.16xlarge",
-        "name": "r5dn.16xlarge",
-        "ram": 524288
-    },
-    "r5dn.24xlarge": {
-        "bandwidth": 100,
-        "disk": 3600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "12000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5dn.24xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "768 GiB",
-            "networkPerformance": "100 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "4 x 900 NVMe SSD",
-            "vcpu": "96"
-        },
-        "id": "r5dn.24xlarge",
-        "name": "r5dn.24xlarge",
-        "ram": 786432
-    },
-    "r5dn.2xlarge": {
-        "bandwidth": 25,
-        "disk": 300,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5dn.2xlarge",
-            "instancesku": "SV48KRP8HM2DH2UC",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 300 NVMe SSD",
-            "vcpu": "8"
-        },
-        "id": "r5dn.2xlarge",
-        "name": "r5dn.2xlarge",
-        "ram": 65536
-    },
-    "r5dn.4xlarge": {
-        "bandwidth": 25,
-        "disk": 600,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5dn.4xlarge",
-            "instancesku": "KFFG95QS5WUKQP8D",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "128 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 300 NVMe SSD",
-            "vcpu": "16"
-        },
-        "id": "r5dn.4xlarge",
-        "name": "r5dn.4xlarge",
-        "ram": 131072
-    },
-    "r5dn.8xlarge": {
-        "bandwidth": 25,
-        "disk": 1200,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5dn.8xlarge",
-            "instancesku": "WJB3V98YXM2CZ9US",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "256 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 600 NVMe SSD",
-            "vcpu": "32"
-        },
-        "id": "r5dn.8xlarge",
-        "name": "r5dn.8xlarge",
-        "ram": 262144
-    },
-    "r5dn.large": {
-        "bandwidth": 25,
-        "disk": 75,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5dn.large",
-            "instancesku": "5SM96WH3QZND6QG9",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 75 NVMe SSD",
-            "vcpu": "2"
-        },
-        "id": "r5dn.large",
-        "name": "r5dn.large",
-        "ram": 16384
-    },
-    "r5dn.xlarge": {
-        "bandwidth": 25,
-        "disk": 150,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5dn.xlarge",
-            "instancesku": "KW4K9UDQ493ER24R",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 150 NVMe SSD",
-            "vcpu": "4"
-        },
-        "id": "r5dn.xlarge",
-        "name": "r5dn.xlarge",
-        "ram": 32768
-    },
-    "r5n.12xlarge": {
-        "bandwidth": 50,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "6000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5n.12xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "384 GiB",
-            "networkPerformance": "50 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "48"
-        },
-        "id": "r5n.12xlarge",
-        "name": "r5n.12xlarge",
-        "ram": 393216
-    },
-    "r5n.16xlarge": {
-        "bandwidth": 75,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "ecu": "NA",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5n.16xlarge",
-            "instancesku": "8V7ZBPH5MUDT6TF5",
-            "memory": "512 GiB",
-            "networkPerformance": "75 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "NA",
-            "vcpu": "64"
-        },
-        "id": "r5n.16xlarge",
-        "name": "r5n.16xlarge",
-        "ram": 524288
-    },
-    "r5n.24xlarge": {
-        "bandwidth": 100,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "12000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5n.24xlarge",
-            "instancesku": "84XC4EP5DDTNC8ZA",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "768 GiB",
-            "networkPerformance": "100 Gigabit",
-            "normalizationSizeFactor": "192",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "96"
-        },
-        "id": "r5n.24xlarge",
-        "name": "r5n.24xlarge",
-        "ram": 786432
-    },
-    "r5n.2xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5n.2xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "r5n.2xlarge",
-        "name": "r5n.2xlarge",
-        "ram": 65536
-    },
-    "r5n.4xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "Yes",
-            "ecu": "NA",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5n.4xlarge",
-            "instancesku": "QDCRSRKZM3MX7XAG",
-            "memory": "128 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "NA",
-            "vcpu": "16"
-        },
-        "id": "r5n.4xlarge",
-        "name": "r5n.4xlarge",
-        "ram": 131072
-    },
-    "r5n.8xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "5000 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5n.8xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "256 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "32"
-        },
-        "id": "r5n.8xlarge",
-        "name": "r5n.8xlarge",
-        "ram": 262144
-    },
-    "r5n.large": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5n.large",
-            "instancesku": "KN56TRZD3CM72VXU",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "r5n.large",
-        "name": "r5n.large",
-        "ram": 16384
-    },
-    "r5n.xlarge": {
-        "bandwidth": 25,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "NA",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "r5n.xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 25 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8259 (Cascade Lake)",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "r5n.xlarge",
-        "name": "r5n.xlarge",
-        "ram": 32768
-    },
-    "t1.micro": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "currentGeneration": "No",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "Micro instances",
-            "instanceType": "t1.micro",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "0.613 GiB",
-            "networkPerformance": "Very Low",
-            "normalizationSizeFactor": "0.5",
-            "physicalProcessor": "Variable",
-            "processorArchitecture": "32-bit or 64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "1"
-        },
-        "id": "t1.micro",
-        "name": "t1.micro",
-        "ram": 627
-    },
-    "t2.2xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "Up to 3.3 GHz",
-            "currentGeneration": "Yes",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t2.2xlarge",
-            "instancesku": "WKK3DC7GCMFXGGYP",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "32 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "t2.2xlarge",
-        "name": "t2.2xlarge",
-        "ram": 32768
-    },
-    "t2.large": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "Up to 3.3 GHz",
-            "currentGeneration": "Yes",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t2.large",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "8 GiB",
-            "networkPerformance": "Low to Moderate",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "t2.large",
-        "name": "t2.large",
-        "ram": 8192
-    },
-    "t2.medium": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "Up to 3.3 GHz",
-            "currentGeneration": "Yes",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t2.medium",
-            "instancesku": "HSW33TU9JRSFYRKF",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "4 GiB",
-            "networkPerformance": "Low to Moderate",
-            "normalizationSizeFactor": "2",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "32-bit or 64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "t2.medium",
-        "name": "t2.medium",
-        "ram": 4096
-    },
-    "t2.micro": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "Up to 3.3 GHz",
-            "currentGeneration": "Yes",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t2.micro",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "1 GiB",
-            "networkPerformance": "Low to Moderate",
-            "normalizationSizeFactor": "0.5",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "32-bit or 64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "1"
-        },
-        "id": "t2.micro",
-        "name": "t2.micro",
-        "ram": 1024
-    },
-    "t2.nano": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "Up to 3.3 GHz",
-            "currentGeneration": "Yes",
-            "ecu": "Variable",
-            "instanceFamily": "General purpose",
-            "instanceType": "t2.nano",
-            "memory": "0.5 GiB",
-            "networkPerformance": "Low",
-            "normalizationSizeFactor": "0.25",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "32-bit or 64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "1"
-        },
-        "id": "t2.nano",
-        "name": "t2.nano",
-        "ram": 512
-    },
-    "t2.small": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "Up to 3.3 GHz",
-            "currentGeneration": "Yes",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t2.small",
-            "instancesku": "XQ8FKG65FR9Z4ZPR",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "2 GiB",
-            "networkPerformance": "Low to Moderate",
-            "normalizationSizeFactor": "1",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "32-bit or 64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "1"
-        },
-        "id": "t2.small",
-        "name": "t2.small",
-        "ram": 2048
-    },
-    "t2.xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "Up to 3.3 GHz",
-            "currentGeneration": "Yes",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t2.xlarge",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "16 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Family",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "t2.xlarge",
-        "name": "t2.xlarge",
-        "ram": 16384
-    },
-    "t3.2xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2048 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3.2xlarge",
-            "instancesku": "56TSPRQERU8CAJ43",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Skylake E5 2686 v5",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "t3.2xlarge",
-        "name": "t3.2xlarge",
-        "ram": 32768
-    },
-    "t3.large": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2048 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3.large",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "8 GiB",
-            "networkPerformance": "Low to Moderate",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Skylake E5 2686 v5",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "t3.large",
-        "name": "t3.large",
-        "ram": 8192
-    },
-    "t3.medium": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 1536 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3.medium",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "4 GiB",
-            "networkPerformance": "Low to Moderate",
-            "normalizationSizeFactor": "2",
-            "physicalProcessor": "Intel Skylake E5 2686 v5",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "t3.medium",
-        "name": "t3.medium",
-        "ram": 4096
-    },
-    "t3.micro": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 1536 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3.micro",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "1 GiB",
-            "networkPerformance": "Low to Moderate",
-            "normalizationSizeFactor": "0.5",
-            "physicalProcessor": "Intel Skylake E5 2686 v5",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "t3.micro",
-        "name": "t3.micro",
-        "ram": 1024
-    },
-    "t3.nano": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 1536 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3.nano",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "0.5 GiB",
-            "networkPerformance": "Low",
-            "normalizationSizeFactor": "0.25",
-            "physicalProcessor": "Intel Skylake E5 2686 v5",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "t3.nano",
-        "name": "t3.nano",
-        "ram": 512
-    },
-    "t3.small": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 1536 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3.small",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "2 GiB",
-            "networkPerformance": "Low to Moderate",
-            "normalizationSizeFactor": "1",
-            "physicalProcessor": "Intel Skylake E5 2686 v5",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "t3.small",
-        "name": "t3.small",
-        "ram": 2048
-    },
-    "t3.xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2048 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "No",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3.xlarge",
-            "instancesku": "6YPUHM9X2FGUB8D2",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "16 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Skylake E5 2686 v5",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "t3.xlarge",
-        "name": "t3.xlarge",
-        "ram": 16384
-    },
-    "t3a.2xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3a.2xlarge",
-            "instancesku": "FSP74JWHB79FDG9T",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "32 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "8"
-        },
-        "id": "t3a.2xlarge",
-        "name": "t3a.2xlarge",
-        "ram": 32768
-    },
-    "t3a.large": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Upto 2120 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3a.large",
-            "instancesku": "QE64UKF9H7MH4QTP",
-            "memory": "8 GiB",
-            "networkPerformance": "Low to Moderate",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX, AVX2, AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "t3a.large",
-        "name": "t3a.large",
-        "ram": 8192
-    },
-    "t3a.medium": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2120 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3a.medium",
-            "instancesku": "F5K4DYDG9JZ549EQ",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "4 GiB",
-            "networkPerformance": "Low to Moderate",
-            "normalizationSizeFactor": "2",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "t3a.medium",
-        "name": "t3a.medium",
-        "ram": 4096
-    },
-    "t3a.micro": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 1500 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3a.micro",
-            "instancesku": "C92KHZUPSGNAZA8G",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "1 GiB",
-            "networkPerformance": "Low to Moderate",
-            "normalizationSizeFactor": "0.5",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "t3a.micro",
-        "name": "t3a.micro",
-        "ram": 1024
-    },
-    "t3a.nano": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 1500 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3a.nano",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "0.5 GiB",
-            "networkPerformance": "Low",
-            "normalizationSizeFactor": "0.25",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "t3a.nano",
-        "name": "t3a.nano",
-        "ram": 512
-    },
-    "t3a.small": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 1500 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3a.small",
-            "instancesku": "JE8UDWJG8MPPHAZZ",
-            "intelAvx2Available": "No",
-            "intelAvxAvailable": "No",
-            "intelTurboAvailable": "No",
-            "memory": "2 GiB",
-            "networkPerformance": "Low to Moderate",
-            "normalizationSizeFactor": "1",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX; AVX2; AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "2"
-        },
-        "id": "t3a.small",
-        "name": "t3a.small",
-        "ram": 2048
-    },
-    "t3a.xlarge": {
-        "bandwidth": None,
-        "disk": 0,
-        "extra": {
-            "clockSpeed": "2.5 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Upto 2120 Mbps",
-            "ecu": "Variable",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "General purpose",
-            "instanceType": "t3a.xlarge",
-            "instancesku": "TBV6C3VKSXKFHHSC",
-            "memory": "16 GiB",
-            "networkPerformance": "Moderate",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "AMD EPYC 7571",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "AVX, AVX2, AMD Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "EBS only",
-            "vcpu": "4"
-        },
-        "id": "t3a.xlarge",
-        "name": "t3a.xlarge",
-        "ram": 16384
-    },
-    "x1.16xlarge": {
-        "bandwidth": None,
-        "disk": 1920,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "174.5",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "x1.16xlarge",
-            "instancesku": "PCDN4738CD5856G7",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "976 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "High Frequency Intel Xeon E7-8880 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 1920 SSD",
-            "vcpu": "64"
-        },
-        "id": "x1.16xlarge",
-        "name": "x1.16xlarge",
-        "ram": 999424
-    },
-    "x1.32xlarge": {
-        "bandwidth": None,
-        "disk": 3840,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "349",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "x1.32xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "1952 GiB",
-            "networkPerformance": "High",
-            "normalizationSizeFactor": "256",
-            "physicalProcessor": "High Frequency Intel Xeon E7-8880 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 1920 SSD",
-            "vcpu": "128"
-        },
-        "id": "x1.32xlarge",
-        "name": "x1.32xlarge",
-        "ram": 1998848
-    },
-    "x1e.16xlarge": {
-        "bandwidth": 10,
-        "disk": 1920,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "179",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "x1e.16xlarge",
-            "instancesku": "WGPFFCGF4UHBGVDH",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "No",
-            "memory": "1952 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "128",
-            "physicalProcessor": "High Frequency Intel Xeon E7-8880 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 1920 SSD",
-            "vcpu": "64"
-        },
-        "id": "x1e.16xlarge",
-        "name": "x1e.16xlarge",
-        "ram": 1998848
-    },
-    "x1e.2xlarge": {
-        "bandwidth": 10,
-        "disk": 240,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "1000 Mbps",
-            "ecu": "23",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "x1e.2xlarge",
-            "instancesku": "UA4QBJUCBNHDQX2B",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "No",
-            "memory": "244 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "High Frequency Intel Xeon E7-8880 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 240 SSD",
-            "vcpu": "8"
-        },
-        "id": "x1e.2xlarge",
-        "name": "x1e.2xlarge",
-        "ram": 249856
-    },
-    "x1e.32xlarge": {
-        "bandwidth": 25,
-        "disk": 3840,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "340",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "x1e.32xlarge",
-            "instancesku": "A52J7F6ERS7NFNBK",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "No",
-            "memory": "3904 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "256",
-            "physicalProcessor": "High Frequency Intel Xeon E7-8880 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 1920 SSD",
-            "vcpu": "128"
-        },
-        "id": "x1e.32xlarge",
-        "name": "x1e.32xlarge",
-        "ram": 3997696
-    },
-    "x1e.4xlarge": {
-        "bandwidth": 10,
-        "disk": 480,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "1750 Mbps",
-            "ecu": "47",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "x1e.4xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "No",
-            "memory": "488 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "32",
-            "physicalProcessor": "High Frequency Intel Xeon E7-8880 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 480 SSD",
-            "vcpu": "16"
-        },
-        "id": "x1e.4xlarge",
-        "name": "x1e.4xlarge",
-        "ram": 499712
-    },
-    "x1e.8xlarge": {
-        "bandwidth": 10,
-        "disk": 960,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "3500 Mbps",
-            "ecu": "91",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "x1e.8xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "No",
-            "memory": "976 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "64",
-            "physicalProcessor": "High Frequency Intel Xeon E7-8880 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 960 SSD",
-            "vcpu": "32"
-        },
-        "id": "x1e.8xlarge",
-        "name": "x1e.8xlarge",
-        "ram": 999424
-    },
-    "x1e.xlarge": {
-        "bandwidth": 10,
-        "disk": 120,
-        "extra": {
-            "clockSpeed": "2.3 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "500 Mbps",
-            "ecu": "12",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "x1e.xlarge",
-            "instancesku": "F4FMFRXVW3TMHF72",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "No",
-            "memory": "122 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "High Frequency Intel Xeon E7-8880 v3 (Haswell)",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 120 SSD",
-            "vcpu": "4"
-        },
-        "id": "x1e.xlarge",
-        "name": "x1e.xlarge",
-        "ram": 124928
-    },
-    "z1d.12xlarge": {
-        "bandwidth": 25,
-        "disk": 1800,
-        "extra": {
-            "clockSpeed": "4.0 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "14000 Mbps",
-            "ecu": "235",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "z1d.12xlarge",
-            "instancesku": "3NPW8NJBUPE5PHWG",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "384 GiB",
-            "networkPerformance": "25 Gigabit",
-            "normalizationSizeFactor": "96",
-            "physicalProcessor": "Intel Xeon Platinum 8151",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "2 x 900 NVMe SSD",
-            "vcpu": "48"
-        },
-        "id": "z1d.12xlarge",
-        "name": "z1d.12xlarge",
-        "ram": 393216
-    },
-    "z1d.2xlarge": {
-        "bandwidth": 10,
-        "disk": 300,
-        "extra": {
-            "clockSpeed": "4.0 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "2333 Mbps",
-            "ecu": "45",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "z1d.2xlarge",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "64 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "16",
-            "physicalProcessor": "Intel Xeon Platinum 8151",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 300 NVMe SSD",
-            "vcpu": "8"
-        },
-        "id": "z1d.2xlarge",
-        "name": "z1d.2xlarge",
-        "ram": 65536
-    },
-    "z1d.3xlarge": {
-        "bandwidth": 10,
-        "disk": 450,
-        "extra": {
-            "currentGeneration": "Yes",
-            "ecu": "75",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "z1d.3xlarge",
-            "memory": "96 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "24",
-            "physicalProcessor": "Intel Xeon Platinum 8151",
-            "processorArchitecture": "64-bit",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 450 NVMe SSD",
-            "vcpu": "12"
-        },
-        "id": "z1d.3xlarge",
-        "name": "z1d.3xlarge",
-        "ram": 98304
-    },
-    "z1d.6xlarge": {
-        "bandwidth": 10,
-        "disk": 900,
-        "extra": {
-            "clockSpeed": "4.0 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "7000 Mbps",
-            "ecu": "116",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "z1d.6xlarge",
-            "instancesku": "6KCEGJ35VRAHEDVX",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "192 GiB",
-            "networkPerformance": "10 Gigabit",
-            "normalizationSizeFactor": "48",
-            "physicalProcessor": "Intel Xeon Platinum 8151",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 900 NVMe SSD",
-            "vcpu": "24"
-        },
-        "id": "z1d.6xlarge",
-        "name": "z1d.6xlarge",
-        "ram": 196608
-    },
-    "z1d.large": {
-        "bandwidth": 10,
-        "disk": 75,
-        "extra": {
-            "clockSpeed": "4.0 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2333 Mbps",
-            "ecu": "12",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "z1d.large",
-            "instancesku": "A7FTGGDM8KVFNGQB",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "16 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "4",
-            "physicalProcessor": "Intel Xeon Platinum 8151",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 75 NVMe SSD",
-            "vcpu": "2"
-        },
-        "id": "z1d.large",
-        "name": "z1d.large",
-        "ram": 16384
-    },
-    "z1d.xlarge": {
-        "bandwidth": 10,
-        "disk": 150,
-        "extra": {
-            "clockSpeed": "4.0 GHz",
-            "currentGeneration": "Yes",
-            "dedicatedEbsThroughput": "Up to 2333 Mbps",
-            "ecu": "23",
-            "enhancedNetworkingSupported": "Yes",
-            "instanceFamily": "Memory optimized",
-            "instanceType": "z1d.xlarge",
-            "instancesku": "DAVJWHZW3NM7TCJW",
-            "intelAvx2Available": "Yes",
-            "intelAvxAvailable": "Yes",
-            "intelTurboAvailable": "Yes",
-            "memory": "32 GiB",
-            "networkPerformance": "Up to 10 Gigabit",
-            "normalizationSizeFactor": "8",
-            "physicalProcessor": "Intel Xeon Platinum 8151",
-            "processorArchitecture": "64-bit",
-            "processorFeatures": "Intel AVX; Intel AVX2; Intel AVX512; Intel Turbo",
-            "servicecode": "AmazonEC2",
-            "servicename": "Amazon Elastic Compute Cloud",
-            "storage": "1 x 150 NVMe SSD",
-            "vcpu": "4"
-        },
-        "id": "z1d.xlarge",
-        "name": "z1d.xlarge",
-        "ram": 32768
-    }
-}
 REGION_DETAILS = {
     "ap-northeast-1": {
         "api_name": "ec2_ap_northeast",
         "country": "Japan",
         "endpoint": "ec2.ap-northeast-1.amazonaws.com",
         "id": "ap-northeast-1",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "cc2.8xlarge",
-            "cr1.8xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "p3dn.24xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
         "signature_version": "2"
     },
     "ap-northeast-2": {
@@ -7813,199 +26,6 @@ REGION_DETAILS = {
         "country": "South Korea",
         "endpoint": "ec2.ap-northeast-2.amazonaws.com",
         "id": "ap-northeast-2",
-        "instance_types": [
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
         "signature_version": "4"
     },
     "ap-northeast-3": {
@@ -8013,107 +33,6 @@ REGION_DETAILS = {
         "country": "Japan",
         "endpoint": "ec2.ap-northeast-3.amazonaws.com",
         "id": "ap-northeast-3",
-        "instance_types": [
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.18xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.18xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge"
-        ],
         "signature_version": "4"
     },
     "ap-south-1": {
@@ -8121,177 +40,6 @@ REGION_DETAILS = {
         "country": "India",
         "endpoint": "ec2.ap-south-1.amazonaws.com",
         "id": "ap-south-1",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.18xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
         "signature_version": "4"
     },
     "ap-southeast-1": {
@@ -8299,247 +47,6 @@ REGION_DETAILS = {
         "country": "Singapore",
         "endpoint": "ec2.ap-southeast-1.amazonaws.com",
         "id": "ap-southeast-1",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.metal",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
         "signature_version": "2"
     },
     "ap-southeast-2": {
@@ -8547,218 +54,6 @@ REGION_DETAILS = {
         "country": "Australia",
         "endpoint": "ec2.ap-southeast-2.amazonaws.com",
         "id": "ap-southeast-2",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "f1.16xlarge",
-            "f1.2xlarge",
-            "f1.4xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
         "signature_version": "2"
     },
     "ca-central-1": {
@@ -8766,169 +61,6 @@ REGION_DETAILS = {
         "country": "Canada",
         "endpoint": "ec2.ca-central-1.amazonaws.com",
         "id": "ca-central-1",
-        "instance_types": [
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge"
-        ],
         "signature_version": "4"
     },
     "cn-north-1": {
@@ -8936,7 +68,6 @@ REGION_DETAILS = {
         "country": "China",
         "endpoint": "ec2.cn-north-1.amazonaws.com.cn",
         "id": "cn-north-1",
-        "instance_types": [],
         "signature_version": "4"
     },
     "cn-northwest-1": {
@@ -8944,7 +75,6 @@ REGION_DETAILS = {
         "country": "China",
         "endpoint": "ec2.cn-northwest-1.amazonaws.com.cn",
         "id": "cn-northwest-1",
-        "instance_types": [],
         "signature_version": "4"
     },
     "eu-central-1": {
@@ -8952,236 +82,6 @@ REGION_DETAILS = {
         "country": "Frankfurt",
         "endpoint": "ec2.eu-central-1.amazonaws.com",
         "id": "eu-central-1",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
         "signature_version": "4"
     },
     "eu-west-1": {
@@ -9189,257 +89,6 @@ REGION_DETAILS = {
         "country": "Ireland",
         "endpoint": "ec2.eu-west-1.amazonaws.com",
         "id": "eu-west-1",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "cc2.8xlarge",
-            "cr1.8xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "f1.16xlarge",
-            "f1.2xlarge",
-            "f1.4xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "h1.16xlarge",
-            "h1.2xlarge",
-            "h1.4xlarge",
-            "h1.8xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "p3dn.24xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
         "signature_version": "2"
     },
     "eu-west-2": {
@@ -9447,164 +96,6 @@ REGION_DETAILS = {
         "country": "United Kingdom",
         "endpoint": "ec2.eu-west-2.amazonaws.com",
         "id": "eu-west-2",
-        "instance_types": [
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
         "signature_version": "4"
     },
     "eu-west-3": {
@@ -9612,149 +103,6 @@ REGION_DETAILS = {
         "country": "France",
         "endpoint": "ec2.eu-west-3.amazonaws.com",
         "id": "eu-west-3",
-        "instance_types": [
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.18xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge"
-        ],
         "signature_version": "4"
     },
     "sa-east-1": {
@@ -9762,181 +110,6 @@ REGION_DETAILS = {
         "country": "Brazil",
         "endpoint": "ec2.sa-east-1.amazonaws.com",
         "id": "sa-east-1",
-        "instance_types": [
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge"
-        ],
         "signature_version": "2"
     },
     "us-east-1": {
@@ -9944,265 +117,6 @@ REGION_DETAILS = {
         "country": "USA",
         "endpoint": "ec2.us-east-1.amazonaws.com",
         "id": "us-east-1",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "cc2.8xlarge",
-            "cr1.8xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "f1.16xlarge",
-            "f1.2xlarge",
-            "f1.4xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "h1.16xlarge",
-            "h1.2xlarge",
-            "h1.4xlarge",
-            "h1.8xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "p3dn.24xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
         "signature_version": "2"
     },
     "us-east-2": {
@@ -10210,226 +124,6 @@ REGION_DETAILS = {
         "country": "USA",
         "endpoint": "ec2.us-east-2.amazonaws.com",
         "id": "us-east-2",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "h1.16xlarge",
-            "h1.2xlarge",
-            "h1.4xlarge",
-            "h1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.metal",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
         "signature_version": "4"
     },
     "us-gov-west-1": {
@@ -10437,206 +131,6 @@ REGION_DETAILS = {
         "country": "US",
         "endpoint": "ec2.us-gov-west-1.amazonaws.com",
         "id": "us-gov-west-1",
-        "instance_types": [
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "cc2.8xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "f1.16xlarge",
-            "f1.2xlarge",
-            "f1.4xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "p3dn.24xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge"
-        ],
         "signature_version": "2"
     },
     "us-west-1": {
@@ -10644,198 +138,6 @@ REGION_DETAILS = {
         "country": "USA",
         "endpoint": "ec2.us-west-1.amazonaws.com",
         "id": "us-west-1",
-        "instance_types": [
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "f1.16xlarge",
-            "f1.2xlarge",
-            "f1.4xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
         "signature_version": "2"
     },
     "us-west-2": {
@@ -10843,262 +145,6 @@ REGION_DETAILS = {
         "country": "US",
         "endpoint": "ec2.us-west-2.amazonaws.com",
         "id": "us-west-2",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "cc2.8xlarge",
-            "cr1.8xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "f1.16xlarge",
-            "f1.2xlarge",
-            "f1.4xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "h1.16xlarge",
-            "h1.2xlarge",
-            "h1.4xlarge",
-            "h1.8xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.metal",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "p3dn.24xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
         "signature_version": "2"
     }
 }
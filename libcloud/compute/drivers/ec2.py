@@ -17,13 +17,23 @@
 Amazon EC2, Eucalyptus, Nimbus and Outscale drivers.
 """
 
+from typing import Dict
 from typing import List
+from typing import Any
 
+import os
 import re
+import json
 import base64
 import copy
 import warnings
 import time
+import threading
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 
 from libcloud.utils.py3 import ET
 from libcloud.utils.py3 import b, basestring, ensure_string
@@ -32,8 +42,12 @@ from libcloud.utils.xml import fixxpath, findtext, findattr, findall
 from libcloud.utils.publickey import get_pubkey_ssh2_fingerprint
 from libcloud.utils.publickey import get_pubkey_comment
 from libcloud.utils.iso8601 import parse_date
+from libcloud.utils.misc import intern_str
+from libcloud.utils.ratelimit import RateLimit
 from libcloud.common.aws import AWSBaseResponse, SignedAWSConnection
 from libcloud.common.aws import DEFAULT_SIGNATURE_VERSION
+from libcloud.common.base import StreamingXmlResponse
+from libcloud.common.exceptions import BaseHTTPError
 from libcloud.common.types import (InvalidCredsError, MalformedResponseError,
                                    LibcloudError)
 from libcloud.compute.providers import Provider
@@ -42,7 +56,8 @@ from libcloud.compute.base import NodeImage, StorageVolume, VolumeSnapshot
 from libcloud.compute.base import KeyPair
 from libcloud.compute.types import NodeState, KeyPairDoesNotExistError, \
     StorageVolumeState, VolumeSnapshotState
-from libcloud.compute.constants import INSTANCE_TYPES, REGION_DETAILS
+from libcloud.compute.constants import REGION_DETAILS
+from libcloud.pricing import register_pricing_change_callback
 
 __all__ = [
     'API_VERSION',
@@ -90,6 +105,83 @@ EUCA_NAMESPACE = 'http://msgs.eucalyptus.com/%s' % (DEFAULT_EUCA_API_VERSION)
 DEFAULT_OUTSCALE_API_VERSION = '2016-04-01'
 OUTSCALE_NAMESPACE = 'http://api.outscale.com/wsdl/fcuext/2014-04-15/'
 
+# Prefixes of the actions which only retrieve data and can be safely retried
+IDEMPOTENT_ACTION_PREFIXES = ('Describe', 'Get')
+
+# Path to the instance type catalog which is generated by
+# contrib/scrape-ec2-sizes.py
+INSTANCE_TYPES_FILE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))), 'data', 'ec2_instance_types.json')
+
+# Instance type catalog cache. Catalog is only loaded when it's needed for the
+# first time and it's shared by all the driver instances.
+INSTANCE_TYPES_DATA = {}  # type: Dict[str, Dict]
+INSTANCE_TYPES_DATA_LOCK = threading.Lock()
+
+
+def get_instance_types_data():
+    """
+    Return the EC2 instance type catalog.
+
+    :return: Dictionary with ``instance_types`` (size attributes keyed by
+             instance type) and ``regions`` (instance types which are
+             available in a region keyed by region name) keys.
+    :rtype: ``dict``
+    """
+    if not INSTANCE_TYPES_DATA:
+        with INSTANCE_TYPES_DATA_LOCK:
+            if not INSTANCE_TYPES_DATA:
+                with open(INSTANCE_TYPES_FILE_PATH) as fp:
+                    data = json.load(fp)
+
+                INSTANCE_TYPES_DATA.update(data)
+
+    return INSTANCE_TYPES_DATA
+
+
+class LazyInstanceTypes(Mapping):
+    """
+    Read-only mapping of instance type attributes which loads the instance
+    type catalog on the first access.
+    """
+
+    def __getitem__(self, key):
+        return get_instance_types_data()['instance_types'][key]
+
+    def __iter__(self):
+        return iter(get_instance_types_data()['instance_types'])
+
+    def __len__(self):
+        return len(get_instance_types_data()['instance_types'])
+
+
+INSTANCE_TYPES = LazyInstanceTypes()
+
+# NodeSize objects (tuple keyed by driver class, region name and api name) and
+# size prices (keyed by api name, region name and size id) cache. Both are
+# shared by all the driver instances and cleared when the pricing data changes.
+SIZES_CACHE = {}  # type: Dict[tuple, tuple]
+SIZE_PRICES_CACHE = {}  # type: Dict[tuple, Any]
+SIZES_CACHE_LOCK = threading.Lock()
+
+# Incremented each time the caches are cleared so the sizes which were built
+# using the old pricing data are not stored in the cache
+SIZES_CACHE_GENERATION = [0]
+
+
+def clear_sizes_cache():
+    """
+    Clear the NodeSize objects and size prices cache.
+    """
+    with SIZES_CACHE_LOCK:
+        SIZES_CACHE.clear()
+        SIZE_PRICES_CACHE.clear()
+        SIZES_CACHE_GENERATION[0] += 1
+
+
+register_pricing_change_callback(clear_sizes_cache)
+
 # Add Nimbus region
 REGION_DETAILS['nimbus'] = {
     # Nimbus clouds have 3 EC2-style instance types but their particular
@@ -634,6 +726,9 @@ OUTSCALE_INC_REGION_DETAILS = {
 
 """
 Define the extra dictionary for specific resources
+
+Values which are shared by many resources (states, zones, instance types,
+etc.) use intern_str so a large listing only holds one copy of each value.
 """
 RESOURCE_EXTRA_ATTRIBUTES_MAP = {
     'ebs_instance_block_device': {
@@ -705,27 +800,27 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
     'image': {
         'state': {
             'xpath': 'imageState',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'owner_id': {
             'xpath': 'imageOwnerId',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'owner_alias': {
             'xpath': 'imageOwnerAlias',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'is_public': {
             'xpath': 'isPublic',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'architecture': {
             'xpath': 'architecture',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'image_type': {
             'xpath': 'imageType',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'image_location': {
             'xpath': 'imageLocation',
@@ -733,7 +828,7 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
         },
         'platform': {
             'xpath': 'platform',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'description': {
             'xpath': 'description',
@@ -741,31 +836,31 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
         },
         'root_device_type': {
             'xpath': 'rootDeviceType',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'virtualization_type': {
             'xpath': 'virtualizationType',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'hypervisor': {
             'xpath': 'hypervisor',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'kernel_id': {
             'xpath': 'kernelId',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'ramdisk_id': {
             'xpath': 'ramdiskId',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'ena_support': {
             'xpath': 'enaSupport',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'sriov_net_support': {
             'xpath': 'sriovNetSupport',
-            'transform_func': str
+            'transform_func': intern_str
         }
     },
     'network': {
@@ -853,11 +948,11 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
     'node': {
         'availability': {
             'xpath': 'placement/availabilityZone',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'architecture': {
             'xpath': 'architecture',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'client_token': {
             'xpath': 'clientToken',
@@ -869,7 +964,7 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
         },
         'hypervisor': {
             'xpath': 'hypervisor',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'iam_profile': {
             'xpath': 'iamInstanceProfile/id',
@@ -877,7 +972,7 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
         },
         'image_id': {
             'xpath': 'imageId',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'instance_id': {
             'xpath': 'instanceId',
@@ -885,19 +980,19 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
         },
         'instance_lifecycle': {
             'xpath': 'instanceLifecycle',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'instance_tenancy': {
             'xpath': 'placement/tenancy',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'instance_type': {
             'xpath': 'instanceType',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'key_name': {
             'xpath': 'keyName',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'launch_index': {
             'xpath': 'amiLaunchIndex',
@@ -909,15 +1004,15 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
         },
         'kernel_id': {
             'xpath': 'kernelId',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'monitoring': {
             'xpath': 'monitoring/state',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'platform': {
             'xpath': 'platform',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'private_dns': {
             'xpath': 'privateDnsName',
@@ -925,15 +1020,15 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
         },
         'ramdisk_id': {
             'xpath': 'ramdiskId',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'root_device_type': {
             'xpath': 'rootDeviceType',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'root_device_name': {
             'xpath': 'rootDeviceName',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'reason': {
             'xpath': 'reason',
@@ -941,27 +1036,27 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
         },
         'source_dest_check': {
             'xpath': 'sourceDestCheck',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'status': {
             'xpath': 'instanceState/name',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'subnet_id': {
             'xpath': 'subnetId',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'virtualization_type': {
             'xpath': 'virtualizationType',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'ebs_optimized': {
             'xpath': 'ebsOptimized',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'vpc_id': {
             'xpath': 'vpcId',
-            'transform_func': str
+            'transform_func': intern_str
         }
     },
     'reserved_node': {
@@ -1071,7 +1166,7 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
     'volume': {
         'device': {
             'xpath': 'attachmentSet/item/device',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'snapshot_id': {
             'xpath': 'snapshotId',
@@ -1083,7 +1178,7 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
         },
         'zone': {
             'xpath': 'availabilityZone',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'create_time': {
             'xpath': 'createTime',
@@ -1091,7 +1186,7 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
         },
         'state': {
             'xpath': 'status',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'encrypted': {
             'xpath': 'encrypted',
@@ -1103,7 +1198,7 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
         },
         'attachment_status': {
             'xpath': 'attachmentSet/item/status',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'instance_id': {
             'xpath': 'attachmentSet/item/instanceId',
@@ -1111,11 +1206,11 @@ RESOURCE_EXTRA_ATTRIBUTES_MAP = {
         },
         'delete': {
             'xpath': 'attachmentSet/item/deleteOnTermination',
-            'transform_func': str
+            'transform_func': intern_str
         },
         'volume_type': {
             'xpath': 'volumeType',
-            'transform_func': str
+            'transform_func': intern_str
         }
     },
     'route_table': {
@@ -1240,6 +1335,10 @@ class EC2Response(AWSBaseResponse):
         return '\n'.join(err_list)
 
 
+class EC2StreamingResponse(EC2Response, StreamingXmlResponse):
+    pass
+
+
 class EC2Connection(SignedAWSConnection):
     """
     Represents a single connection to the EC2 Endpoint.
@@ -1248,8 +1347,33 @@ class EC2Connection(SignedAWSConnection):
     version = API_VERSION
     host = REGION_DETAILS['us-east-1']['endpoint']
     responseCls = EC2Response
+    streamResponseCls = EC2StreamingResponse
     service_name = 'ec2'
 
+    # EC2 throttles API requests per account and region using a token bucket
+    # (bucket size of 100 and refill rate of 20 requests per second for
+    # non-mutating actions)
+    rate_limits = [RateLimit(rate=20, burst=100, scope='account')]
+
+    def get_rate_limit_action(self, action, params=None, method='GET'):
+        return (params or {}).get('Action', action)
+
+    def is_idempotent_request(self, method, params=None, headers=None):
+        params = params or {}
+        action = params.get('Action', None)
+
+        if action is None:
+            return super(EC2Connection, self).is_idempotent_request(
+                method=method, params=params, headers=headers)
+
+        # All the actions are sent using GET so the HTTP method can't be used.
+        # Only actions which retrieve data and requests which include a
+        # client token can be safely retried.
+        if 'ClientToken' in params:
+            return True
+
+        return action.startswith(IDEMPOTENT_ACTION_PREFIXES)
+
 
 class ExEC2AvailabilityZone(object):
     """
@@ -1660,6 +1784,102 @@ class BaseEC2NodeDriver(NodeDriver):
         :rtype: ``list`` of :class:`Node`
         """
 
+        return list(self.iterate_nodes(ex_node_ids=ex_node_ids,
+                                       ex_filters=ex_filters))
+
+    def iterate_nodes(self, ex_node_ids=None, ex_filters=None,
+                      ex_page_size=None):
+        """
+        Return a generator of nodes.
+
+        Follows ``NextToken`` and requests the next page only once all the
+        nodes from the previous page have been consumed. Elastic IP addresses
+        are retrieved once and re-used for all the pages.
+
+        :param      ex_node_ids: List of ``node.id``
+        :type       ex_node_ids: ``list`` of ``str``
+
+        :param      ex_filters: The filters so that the list includes
+                                information for certain nodes only.
+        :type       ex_filters: ``dict``
+
+        :param      ex_page_size: Maximum number of nodes returned in a
+                                  single page (5 - 1000). Can't be used
+                                  together with ``ex_node_ids``.
+        :type       ex_page_size: ``int``
+
+        :rtype: ``generator`` of :class:`Node`
+        """
+        params = self._get_list_nodes_params(ex_node_ids=ex_node_ids,
+                                             ex_filters=ex_filters)
+        # Response of the DescribeAddresses request which is shared by all
+        # the pages
+        addresses_cache = {}  # type: Dict[str, Any]
+
+        for response in self._iterate_pages(params=params,
+                                            page_size=ex_page_size):
+            # Reservations are parsed while the response is being downloaded
+            # so the whole DescribeInstances document is never held in memory
+            nodes = self._to_reservation_nodes(response)
+
+            nodes_elastic_ips_mappings = self._describe_addresses_for_page(
+                nodes=nodes, cache=addresses_cache)
+            self._add_elastic_ips_to_nodes(nodes, nodes_elastic_ips_mappings)
+
+            for node in nodes:
+                yield node
+
+    async def list_nodes_async(self, ex_node_ids=None, ex_filters=None):
+        """
+        Asyncio variant of :meth:`list_nodes`.
+
+        :param      ex_node_ids: List of ``node.id``
+        :type       ex_node_ids: ``list`` of ``str``
+
+        :param      ex_filters: The filters so that the list includes
+                                information for certain nodes only.
+        :type       ex_filters: ``dict``
+
+        :rtype: ``list`` of :class:`Node`
+        """
+        params = self._get_list_nodes_params(ex_node_ids=ex_node_ids,
+                                             ex_filters=ex_filters)
+        response = await self.async_connection.request(self.path,
+                                                       params=params)
+        nodes = self._to_reservation_nodes(response)
+
+        mappings = await self._ex_describe_addresses_async(nodes)
+        self._add_elastic_ips_to_nodes(nodes, mappings)
+
+        return nodes
+
+    def _get_nodes(self, nodes):
+        """
+        Retrieve the provided nodes using ``ex_node_ids`` filter.
+
+        Newly created instances can be missing from the ``DescribeInstances``
+        response for a short time. In that case the nodes are retrieved one
+        by one so the instances which are already visible are returned.
+
+        @inherits: :class:`NodeDriver._get_nodes`
+        """
+        node_ids = [node.id for node in nodes]
+
+        try:
+            return self.list_nodes(ex_node_ids=node_ids)
+        except BaseHTTPError as e:
+            if 'InvalidInstanceID.NotFound' not in str(e):
+                raise
+
+        result = []
+
+        if len(nodes) > 1:
+            for node in nodes:
+                result.extend(self._get_nodes(nodes=[node]))
+
+        return result
+
+    def _get_list_nodes_params(self, ex_node_ids=None, ex_filters=None):
         params = {'Action': 'DescribeInstances'}
 
         if ex_node_ids:
@@ -1668,35 +1888,111 @@ class BaseEC2NodeDriver(NodeDriver):
         if ex_filters:
             params.update(self._build_filters(ex_filters))
 
-        elem = self.connection.request(self.path, params=params).object
+        return params
+
+    def _iterate_pages(self, params, page_size=None):
+        """
+        Return a generator of streaming responses for all the pages of a
+        paginated ``Describe*`` request.
+
+        Caller needs to consume each response using ``iterparse`` before
+        advancing the generator so the ``nextToken`` element is available.
+        """
+        params = copy.copy(params)
+
+        if page_size:
+            params['MaxResults'] = page_size
+
+        while True:
+            response = self.connection.request(self.path, params=params,
+                                               stream=True)
+            yield response
+
+            if response.object is None or not len(response.object):
+                break
 
+            next_token = findtext(element=response.object, xpath='nextToken',
+                                  namespace=NAMESPACE)
+
+            if not next_token:
+                break
+
+            params['NextToken'] = next_token
+
+    def _to_reservation_nodes(self, response):
         nodes = []
-        for rs in findall(element=elem, xpath='reservationSet/item',
-                          namespace=NAMESPACE):
+        for rs in response.iterparse(xpath='reservationSet/item',
+                                     namespace=NAMESPACE):
             nodes += self._to_nodes(rs, 'instancesSet/item')
 
-        nodes_elastic_ips_mappings = self.ex_describe_addresses(nodes)
+        return nodes
 
+    def _add_elastic_ips_to_nodes(self, nodes, nodes_elastic_ips_mappings):
         for node in nodes:
             ips = nodes_elastic_ips_mappings[node.id]
             node.public_ips.extend(ips)
 
-        return nodes
-
     def list_sizes(self, location=None):
-        available_types = REGION_DETAILS[self.region_name]['instance_types']
-        sizes = []
+        """
+        List sizes available in the driver region.
+
+        NodeSize objects are cached and shared by all the driver instances
+        for the same region so they should be treated as read-only (copy a
+        size before modifying it). Cache is cleared when the pricing data
+        changes.
+
+        :rtype: ``list`` of :class:`NodeSize`
+        """
+        key = (self.__class__, self.region_name, self.api_name)
+        sizes = SIZES_CACHE.get(key, None)
+
+        if sizes is None:
+            generation = SIZES_CACHE_GENERATION[0]
+            sizes = tuple(self._get_region_sizes())
+
+            with SIZES_CACHE_LOCK:
+                if generation == SIZES_CACHE_GENERATION[0]:
+                    sizes = SIZES_CACHE.setdefault(key, sizes)
+
+        return list(sizes)
+
+    def _get_region_sizes(self):
+        details = REGION_DETAILS[self.region_name]
+
+        if 'instance_types' in details:
+            available_types = details['instance_types']
+        else:
+            data = get_instance_types_data()
+            available_types = data['regions'].get(self.region_name, [])
 
         for instance_type in available_types:
-            attributes = INSTANCE_TYPES[instance_type]
-            attributes = copy.deepcopy(attributes)
+            attributes = dict(INSTANCE_TYPES[instance_type])
+            # Values are strings so a shallow copy is enough
+            attributes['extra'] = dict(attributes['extra'])
             try:
                 price = self._get_size_price(size_id=instance_type)
                 attributes['price'] = price
             except KeyError:
                 attributes['price'] = None  # pricing not available
-            sizes.append(NodeSize(driver=self, **attributes))
-        return sizes
+            yield NodeSize(driver=self, **attributes)
+
+    def _get_size_price(self, size_id):
+        key = (self.api_name, self.region_name, size_id)
+
+        try:
+            return SIZE_PRICES_CACHE[key]
+        except KeyError:
+            pass
+
+        generation = SIZES_CACHE_GENERATION[0]
+        # KeyError (pricing not available) is propagated and not cached
+        price = super(BaseEC2NodeDriver, self)._get_size_price(size_id=size_id)
+
+        with SIZES_CACHE_LOCK:
+            if generation == SIZES_CACHE_GENERATION[0]:
+                SIZE_PRICES_CACHE[key] = price
+
+        return price
 
     def list_images(self, location=None, ex_image_ids=None, ex_owner=None,
                     ex_executableby=None, ex_filters=None):
@@ -1739,6 +2035,44 @@ class BaseEC2NodeDriver(NodeDriver):
 
         :rtype: ``list`` of :class:`NodeImage`
         """
+        return list(self.iterate_images(location=location,
+                                        ex_image_ids=ex_image_ids,
+                                        ex_owner=ex_owner,
+                                        ex_executableby=ex_executableby,
+                                        ex_filters=ex_filters))
+
+    def iterate_images(self, location=None, ex_image_ids=None, ex_owner=None,
+                       ex_executableby=None, ex_filters=None,
+                       ex_page_size=None):
+        """
+        Return a generator of images.
+
+        Images are parsed while the response is being downloaded and the next
+        page is requested only once the previous one has been consumed, so
+        this method can be used to go over large image lists (e.g.
+        ``ex_owner='all'``) without holding all of them in memory.
+
+        Takes the same arguments as :meth:`list_images`.
+
+        :param      ex_page_size: Maximum number of images returned in a
+                                  single page (5 - 1000). Can't be used
+                                  together with ``ex_image_ids``.
+        :type       ex_page_size: ``int``
+
+        :rtype: ``generator`` of :class:`NodeImage`
+        """
+        params = self._get_list_images_params(
+            ex_image_ids=ex_image_ids, ex_owner=ex_owner,
+            ex_executableby=ex_executableby, ex_filters=ex_filters)
+
+        for response in self._iterate_pages(params=params,
+                                            page_size=ex_page_size):
+            for element in response.iterparse(xpath='imagesSet/item',
+                                              namespace=NAMESPACE):
+                yield self._to_image(element)
+
+    def _get_list_images_params(self, ex_image_ids=None, ex_owner=None,
+                                ex_executableby=None, ex_filters=None):
         params = {'Action': 'DescribeImages'}
 
         if ex_owner:
@@ -1755,10 +2089,7 @@ class BaseEC2NodeDriver(NodeDriver):
         if ex_filters:
             params.update(self._build_filters(ex_filters))
 
-        images = self._to_images(
-            self.connection.request(self.path, params=params).object
-        )
-        return images
+        return params
 
     def get_image(self, image_id):
         """
@@ -1801,6 +2132,28 @@ class BaseEC2NodeDriver(NodeDriver):
         :return: The list of volumes that match the criteria.
         :rtype: ``list`` of :class:`StorageVolume`
         """
+        return list(self.iterate_volumes(node=node, ex_filters=ex_filters))
+
+    def iterate_volumes(self, node=None, ex_filters=None, ex_page_size=None):
+        """
+        Return a generator of volumes that are attached to a node, if
+        specified and those that satisfy the filters, if specified.
+
+        Follows ``NextToken`` and requests the next page only once all the
+        volumes from the previous page have been consumed.
+
+        :param node: The node to which the volumes are attached.
+        :type node: :class:`Node`
+
+        :param ex_filters: The dictionary of additional filters.
+        :type ex_filters: ``dict``
+
+        :param ex_page_size: Maximum number of volumes returned in a single
+                             page (5 - 500).
+        :type ex_page_size: ``int``
+
+        :rtype: ``generator`` of :class:`StorageVolume`
+        """
         params = {
             'Action': 'DescribeVolumes',
         }
@@ -1811,11 +2164,11 @@ class BaseEC2NodeDriver(NodeDriver):
         if node or ex_filters:
             params.update(self._build_filters(ex_filters))
 
-        response = self.connection.request(self.path, params=params).object
-        volumes = [self._to_volume(el) for el in response.findall(
-            fixxpath(xpath='volumeSet/item', namespace=NAMESPACE))
-        ]
-        return volumes
+        for response in self._iterate_pages(params=params,
+                                            page_size=ex_page_size):
+            for element in response.iterparse(xpath='volumeSet/item',
+                                              namespace=NAMESPACE):
+                yield self._to_volume(element)
 
     def create_node(self, name, size, image, location=None, auth=None,
                     ex_keyname=None, ex_userdata=None,
@@ -3655,13 +4008,53 @@ class BaseEC2NodeDriver(NodeDriver):
         if not nodes:
             return {}
 
+        params = self._get_describe_addresses_params(nodes)
+        result = self.connection.request(self.path, params=params).object
+        return self._to_nodes_elastic_ip_mappings(result, nodes)
+
+    async def _ex_describe_addresses_async(self, nodes):
+        """
+        Asyncio variant of :meth:`ex_describe_addresses`.
+        """
+        if not nodes:
+            return {}
+
+        params = self._get_describe_addresses_params(nodes)
+        response = await self.async_connection.request(self.path,
+                                                       params=params)
+        return self._to_nodes_elastic_ip_mappings(response.object, nodes)
+
+    def _describe_addresses_for_page(self, nodes, cache):
+        """
+        Return Elastic IP addresses for the nodes from a single page of a
+        paginated listing.
+
+        Addresses for multiple nodes are retrieved using an unfiltered
+        request so the response is stored in the provided cache dictionary
+        and re-used for the subsequent pages instead of downloading all the
+        addresses for each page again.
+
+        :rtype: ``dict``
+        """
+        if 'result' not in cache:
+            if len(nodes) <= 1:
+                return self.ex_describe_addresses(nodes)
+
+            params = self._get_describe_addresses_params(nodes)
+            cache['result'] = self.connection.request(self.path,
+                                                      params=params).object
+
+        return self._to_nodes_elastic_ip_mappings(cache['result'], nodes)
+
+    def _get_describe_addresses_params(self, nodes):
         params = {'Action': 'DescribeAddresses'}
 
         if len(nodes) == 1:
             self._add_instance_filter(params, nodes[0])
 
-        result = self.connection.request(self.path, params=params).object
+        return params
 
+    def _to_nodes_elastic_ip_mappings(self, result, nodes):
         node_instance_ids = [node.id for node in nodes]
         nodes_elastic_ip_mappings = {}
 
@@ -3671,14 +4064,12 @@ class BaseEC2NodeDriver(NodeDriver):
 
         for node_id in node_instance_ids:
             nodes_elastic_ip_mappings.setdefault(node_id, [])
-            for addr in self._to_addresses(result,
-                                           only_associated):
 
-                instance_id = addr.instance_id
+        for addr in self._to_addresses(result, only_associated):
+            instance_id = addr.instance_id
 
-                if node_id == instance_id:
-                    nodes_elastic_ip_mappings[instance_id].append(
-                        addr.ip)
+            if instance_id in nodes_elastic_ip_mappings:
+                nodes_elastic_ip_mappings[instance_id].append(addr.ip)
 
         return nodes_elastic_ip_mappings
 
@@ -5937,6 +6328,12 @@ class NimbusNodeDriver(BaseEC2NodeDriver):
             nodes_elastic_ip_mappings[node.id] = []
         return nodes_elastic_ip_mappings
 
+    async def _ex_describe_addresses_async(self, nodes):
+        return self.ex_describe_addresses(nodes)
+
+    def _describe_addresses_for_page(self, nodes, cache):
+        return self.ex_describe_addresses(nodes)
+
     def ex_create_tags(self, resource, tags):
         """
         Nimbus doesn't support creating tags, so this is a pass-through.
@@ -6181,26 +6578,20 @@ class OutscaleNodeDriver(BaseEC2NodeDriver):
         """
         raise NotImplementedError(self._not_implemented_msg)
 
-    def list_sizes(self, location=None):
+    def _get_region_sizes(self):
         """
-        Lists available nodes sizes.
-
         This overrides the EC2 default method in order to use Outscale
         information or data.
-
-        :rtype: ``list`` of :class:`NodeSize`
         """
         available_types =\
             self.region_details[self.region_name]['instance_types']
-        sizes = []
 
         for instance_type in available_types:
             attributes = OUTSCALE_INSTANCE_TYPES[instance_type]
             attributes = copy.deepcopy(attributes)
             price = self._get_size_price(size_id=instance_type)
             attributes.update({'price': price})
-            sizes.append(NodeSize(driver=self, **attributes))
-        return sizes
+            yield NodeSize(driver=self, **attributes)
 
     def ex_modify_instance_keypair(self, instance_id, key_name=None):
         """
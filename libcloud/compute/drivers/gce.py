@@ -19,10 +19,25 @@ Module for Google Compute Engine Driver.
 
 from __future__ import with_statement
 
+from typing import Dict
+from typing import List
+
+import os
+import re
+import copy
 import datetime
 import time
 import itertools
 import sys
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, wait
+
+try:
+    import simplejson as json
+except ImportError:
+    import json  # type: ignore
 
 from libcloud.common.base import LazyObject
 from libcloud.common.google import GoogleOAuth2Credential
@@ -39,10 +54,15 @@ from libcloud.compute.base import UuidMixin
 from libcloud.compute.providers import Provider
 from libcloud.compute.types import NodeState
 from libcloud.utils.iso8601 import parse_date
+from libcloud.utils.ratelimit import RateLimit
 
 API_VERSION = 'v1'
 DEFAULT_TASK_COMPLETION_TIMEOUT = 180
 
+# Zones and regions rarely change so cached zone and region metadata is
+# considered valid for a day
+DEFAULT_LOCATION_CACHE_TTL = 24 * 60 * 60
+
 
 def timestamp_to_datetime(timestamp):
     """
@@ -95,14 +115,32 @@ class GCEConnection(GoogleBaseConnection):
     host = 'www.googleapis.com'
     responseCls = GCEResponse
 
+    # Compute Engine API rate quota defaults to 20 requests per second per
+    # project
+    rate_limits = [RateLimit(rate=20, burst=20, scope='account')]
+
+    # Maximum number of per-zone requests which are performed in parallel
+    # when an aggregated result spans multiple pages (1 means that the
+    # aggregated request is always used)
+    aggregated_list_workers = 1
+
     def __init__(self, user_id, key, secure, auth_type=None,
                  credential_file=None, project=None, **kwargs):
         super(GCEConnection, self).__init__(
             user_id, key, secure=secure, auth_type=auth_type,
             credential_file=credential_file, **kwargs)
         self.request_path = '/compute/%s/projects/%s' % (API_VERSION, project)
+        self.project = project
         self.gce_params = None
 
+    def get_rate_limit_account(self):
+        """
+        Rate quota applies to the whole project.
+
+        @inherits: :class:`GoogleBaseConnection.get_rate_limit_account`
+        """
+        return self.project
+
     def pre_connect_hook(self, params, headers):
         """
         Update URL parameters with values from self.gce_params.
@@ -142,6 +180,9 @@ class GCEConnection(GoogleBaseConnection):
         all results are received.  It will then, through a helper function,
         combine all results and return a single 'items' dictionary.
 
+        Use :meth:`iterate_aggregated_items` to process the results as they
+        are received instead.
+
         :param    api_name: Name of API to call. Consult API docs
                   for valid names.
         :type     api_name: ``str``
@@ -154,31 +195,171 @@ class GCEConnection(GoogleBaseConnection):
                   ex: { 'items': {'zones/us-central1-a': {disks: []}} }
         :rtype:   ``dict``
         """
+        api_responses = []
+
+        for key, items in self.iterate_aggregated_items(api_name, zone=zone):
+            api_responses.append({'items': {key: {api_name: items}}})
+
+        return self._merge_response_items(api_name, api_responses)
+
+    def iterate_aggregated_items(self, api_name, zone=None, zones=None):
+        """
+        Iterate over all the results from 'api_name' as the pages are
+        received.
+
+        Results of an aggregated request are fetched page by page. If the
+        result doesn't fit in a single page, ``zones`` are provided and
+        ``aggregated_list_workers`` is greater than 1, the results are
+        instead fetched using per-zone requests which are performed in
+        parallel (each worker thread uses its own connection).
+
+        :param    api_name: Name of API to call. Consult API docs
+                  for valid names.
+        :type     api_name: ``str``
+
+        :param   zone: Optional zone to use.
+        :type zone: :class:`GCEZone`
+
+        :param   zones: Optional names of all the zones which can be used
+                        for parallel per-zone requests. Only applies to
+                        zonal resources (e.g. 'instances' or 'disks').
+        :type zones: ``list`` of ``str``
+
+        :return:  Generator which yields (key, items) tuples.
+                  ex: ('zones/us-central1-a', [{...}, {...}])
+        :rtype:   ``generator``
+        """
         if zone:
-            request_path = "/zones/%s/%s" % (zone.name, api_name)
-        else:
-            request_path = "/aggregated/%s" % (api_name)
+            request_path = '/zones/%s/%s' % (zone.name, api_name)
+            key = 'zones/%s' % (zone.name)
 
-        api_responses = []
+            for response in self._iterate_pages(self, request_path):
+                items = response.get('items', [])
+
+                if items:
+                    yield key, items
+            return
+
+        request_path = '/aggregated/%s' % (api_name)
+        responses = self._iterate_pages(self, request_path)
+        response = next(responses)
+
+        if 'nextPageToken' in response and zones and \
+                self.aggregated_list_workers > 1:
+            # Result spans multiple pages so it's faster to fetch the
+            # zones in parallel
+            responses.close()
+
+            for key, items in self._iterate_zones_in_parallel(api_name,
+                                                              zones):
+                yield key, items
+            return
+
+        for response in itertools.chain([response], responses):
+            for key, value in response.get('items', {}).items():
+                if value.get(api_name, []):
+                    yield key, value[api_name]
 
+    def _iterate_pages(self, connection, request_path, page_token=None):
+        """
+        Yield response objects of all the pages for the provided path.
+        """
         params = {'maxResults': 500}
-        more_results = True
-        while more_results:
-            self.gce_params = params
-            response = self.request(request_path, method='GET').object
-            if 'items' in response:
-                if zone:
-                    # Special case when we are handling pagination for a
-                    # specific zone
-                    items = response['items']
-                    response['items'] = {
-                        'zones/%s' % (zone): {
-                            api_name: items
-                        }
-                    }
-                api_responses.append(response)
-            more_results = 'pageToken' in params
-        return self._merge_response_items(api_name, api_responses)
+
+        while True:
+            if page_token:
+                params['pageToken'] = page_token
+
+            response = connection.request(request_path, method='GET',
+                                          params=dict(params)).object
+            yield response
+
+            page_token = response.get('nextPageToken', None)
+
+            if not page_token:
+                break
+
+    def _iterate_zones_in_parallel(self, api_name, zones):
+        """
+        Yield (key, items) tuples for 'api_name' using per-zone requests
+        which are performed in parallel.
+        """
+        local = threading.local()
+        lock = threading.Lock()
+        connections = []
+
+        def fetch(zone_name, page_token):
+            connection = getattr(local, 'connection', None)
+
+            if connection is None:
+                connection = self._get_worker_connection()
+                local.connection = connection
+
+                with lock:
+                    connections.append(connection)
+
+            request_path = '/zones/%s/%s' % (zone_name, api_name)
+            response = next(self._iterate_pages(connection, request_path,
+                                                page_token=page_token))
+            return zone_name, response
+
+        executor = ThreadPoolExecutor(max_workers=self.aggregated_list_workers)
+        pending = set()
+
+        try:
+            pending = set([executor.submit(fetch, zone_name, None)
+                           for zone_name in zones])
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    zone_name, response = future.result()
+                    page_token = response.get('nextPageToken', None)
+
+                    if page_token:
+                        pending.add(executor.submit(fetch, zone_name,
+                                                    page_token))
+
+                    items = response.get('items', [])
+
+                    if items:
+                        yield 'zones/%s' % (zone_name), items
+        finally:
+            for future in pending:
+                future.cancel()
+
+            executor.shutdown(wait=True)
+
+            for connection in connections:
+                self._close_worker_connection(connection)
+
+    def _get_worker_connection(self):
+        """
+        Return a shallow copy of this connection which can be safely used
+        from a worker thread.
+        """
+        connection = copy.copy(self)
+        connection.context = {}
+        connection.gce_params = None
+        connection.connect()
+        return connection
+
+    def get_poll_connection(self):
+        """
+        @inherits: :class:`PollingConnection.get_poll_connection`
+        """
+        return self._get_worker_connection()
+
+    def _close_worker_connection(self, connection):
+        """
+        Release pooled connections held by a connection returned by
+        ``_get_worker_connection``.
+        """
+        session = getattr(connection.connection, 'session', None)
+
+        if session is not None:
+            session.close()
 
     def _merge_response_items(self, list_name, response_list):
         """
@@ -325,6 +506,143 @@ class GCEList(object):
         return self
 
 
+class GCELocationCache(object):
+    """
+    Cache of zone and region metadata keyed by project.
+
+    Raw API representations of zones and regions are cached so the same cache
+    can be shared by multiple driver instances. If ``path`` is provided,
+    entries are also stored in a JSON file per project in that directory so
+    they can be shared between processes or pre-seeded from disk.
+
+    Format of the file is::
+
+        {"zones": {"timestamp": <unix time>, "items": [<zone>, ...]},
+         "regions": {"timestamp": <unix time>, "items": [<region>, ...]}}
+    """
+
+    KINDS = ['zones', 'regions']
+
+    def __init__(self, path=None, ttl=DEFAULT_LOCATION_CACHE_TTL):
+        """
+        :keyword  path: Path to the directory where the cache files are
+                        stored. If not provided, entries are only cached in
+                        memory.
+        :type     path: ``str``
+
+        :keyword  ttl: Number of seconds after which cached entries expire.
+                       ``None`` means entries never expire.
+        :type     ttl: ``int``
+        """
+        self.path = os.path.expanduser(path) if path else None
+        self.ttl = ttl
+
+        self._entries = {}  # type: Dict[tuple, tuple]
+        self._lock = threading.Lock()
+
+    def get(self, project, kind):
+        """
+        Return cached items or None if there are no (valid) cached items.
+
+        :param  project: Project name.
+        :type   project: ``str``
+
+        :param  kind: Kind of the items ("zones" or "regions").
+        :type   kind: ``str``
+
+        :rtype: ``list`` of ``dict`` or ``None``
+        """
+        with self._lock:
+            entry = self._entries.get((project, kind), None)
+
+        if not self._is_valid(entry) and self.path:
+            # Entry could have been updated by another process
+            entry = self._read_file(project).get(kind, None)
+
+            if self._is_valid(entry):
+                with self._lock:
+                    self._entries[(project, kind)] = entry
+
+        if not self._is_valid(entry):
+            return None
+
+        return entry[1]
+
+    def put(self, project, kind, items):
+        """
+        Store items in the cache.
+
+        :param  project: Project name.
+        :type   project: ``str``
+
+        :param  kind: Kind of the items ("zones" or "regions").
+        :type   kind: ``str``
+
+        :param  items: Raw API representation of the items.
+        :type   items: ``list`` of ``dict``
+        """
+        if kind not in self.KINDS:
+            raise ValueError('Invalid kind: %s' % (kind))
+
+        entry = (time.time(), items)
+
+        with self._lock:
+            self._entries[(project, kind)] = entry
+
+            if self.path:
+                data = self._read_file(project)
+                data[kind] = entry
+                self._write_file(project, data)
+
+    def clear(self):
+        """
+        Remove all the entries from the in-memory cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _is_valid(self, entry):
+        if entry is None:
+            return False
+
+        if self.ttl is None:
+            return True
+
+        return time.time() - entry[0] < self.ttl
+
+    def _get_file_path(self, project):
+        name = re.sub(r'[^a-zA-Z0-9_.-]', '_', project)
+        return os.path.join(self.path, '%s.json' % (name))
+
+    def _read_file(self, project):
+        try:
+            with open(self._get_file_path(project), 'r') as fp:
+                data = json.load(fp)
+
+            return dict((kind, (value['timestamp'], value['items']))
+                        for kind, value in data.items()
+                        if kind in self.KINDS)
+        except (IOError, OSError, ValueError, KeyError, TypeError,
+                AttributeError):
+            # Missing or invalid file, treat it as empty
+            return {}
+
+    def _write_file(self, project, data):
+        file_path = self._get_file_path(project)
+        tmp_file_path = '%s.%s.tmp' % (file_path, os.getpid())
+
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+
+        data = dict((kind, {'timestamp': value[0], 'items': value[1]})
+                    for kind, value in data.items())
+
+        with open(tmp_file_path, 'w') as fp:
+            json.dump(data, fp)
+
+        os.replace(tmp_file_path, file_path)
+
+
 class GCELicense(UuidMixin, LazyObject):
     """A GCE License used to track software usage in GCE nodes."""
 
@@ -1756,6 +2074,11 @@ class GCENodeDriver(NodeDriver):
     website = 'https://cloud.google.com/'
     features = {'create_node': ['ssh_key']}
 
+    # Cache of zone and region metadata which is shared by all the driver
+    # instances (see :class:`GCELocationCache`). Can be overridden using
+    # location_cache constructor argument.
+    location_cache = None  # type: GCELocationCache
+
     # Google Compute Engine node states are mapped to Libcloud node states
     # per the following dict. GCE does not have an actual 'stopped' state
     # but instead uses a 'terminated' state to indicate the node exists
@@ -1873,7 +2196,9 @@ class GCENodeDriver(NodeDriver):
     BACKEND_SERVICE_PROTOCOLS = ['HTTP', 'HTTPS', 'HTTP2', 'TCP', 'SSL']
 
     def __init__(self, user_id, key=None, datacenter=None, project=None,
-                 auth_type=None, scopes=None, credential_file=None, **kwargs):
+                 auth_type=None, scopes=None, credential_file=None,
+                 location_cache=None, ex_aggregated_list_workers=None,
+                 **kwargs):
         """
         :param  user_id: The email address (for service accounts) or Client ID
                          (for installed apps) to be used for authentication.
@@ -1907,6 +2232,17 @@ class GCENodeDriver(NodeDriver):
         :keyword  credential_file: Path to file for caching authentication
                                    information used by GCEConnection.
         :type     credential_file: ``str``
+
+        :keyword  location_cache: Cache which is used to share zone and region
+                                  metadata between driver instances.
+        :type     location_cache: :class:`GCELocationCache`
+
+        :keyword  ex_aggregated_list_workers: Maximum number of per-zone
+                                              requests which are performed
+                                              in parallel when listing nodes
+                                              and volumes in all the zones
+                                              spans multiple pages.
+        :type     ex_aggregated_list_workers: ``int``
         """
         if not project:
             raise ValueError('Project name must be specified using '
@@ -1920,33 +2256,160 @@ class GCENodeDriver(NodeDriver):
 
         super(GCENodeDriver, self).__init__(user_id, key, **kwargs)
 
-        # Cache Zone and Region information to reduce API calls and
-        # increase speed
+        if location_cache is not None:
+            self.location_cache = location_cache
+
+        if ex_aggregated_list_workers is not None:
+            self.connection.aggregated_list_workers = \
+                ex_aggregated_list_workers
+
         self.base_path = '/compute/%s/projects/%s' % (API_VERSION,
                                                       self.project)
-        self.zone_list = self.ex_list_zones()
-        self.zone_dict = {}
-        for zone in self.zone_list:
-            self.zone_dict[zone.name] = zone
-        if datacenter:
-            self.zone = self.ex_get_zone(datacenter)
-        else:
-            self.zone = None
-
-        self.region_list = self.ex_list_regions()
-        self.region_dict = {}
-        for region in self.region_list:
-            self.region_dict[region.name] = region
 
-        if self.zone:
-            self.region = self._get_region_from_zone(self.zone)
-        else:
-            self.region = None
+        # Zone and Region information is cached to reduce API calls and
+        # increase speed. It's retrieved lazily on first access (see
+        # zone_dict and region_dict properties).
+        self.datacenter = datacenter
+        self._zone_list = None  # type: List[GCEZone]
+        self._zone_dict = None  # type: Dict[str, GCEZone]
+        self._region_list = None  # type: List[GCERegion]
+        self._region_dict = None  # type: Dict[str, GCERegion]
+        self._zone = None  # type: GCEZone
+        self._region = None  # type: GCERegion
+        self._zone_loaded = False
+        self._region_loaded = False
+        self._location_lock = threading.RLock()
 
         # Volume details are looked up in this name-zone dict.
         # It is populated if the volume name is not found or the dict is empty.
         self._ex_volume_dict = {}
 
+    @property
+    def zone_list(self):
+        self._load_zones()
+        return self._zone_list
+
+    @zone_list.setter
+    def zone_list(self, value):
+        self._zone_list = value
+
+    @property
+    def zone_dict(self):
+        self._load_zones()
+        return self._zone_dict
+
+    @zone_dict.setter
+    def zone_dict(self, value):
+        self._zone_dict = value
+
+    @property
+    def region_list(self):
+        self._load_regions()
+        return self._region_list
+
+    @region_list.setter
+    def region_list(self, value):
+        self._region_list = value
+
+    @property
+    def region_dict(self):
+        self._load_regions()
+        return self._region_dict
+
+    @region_dict.setter
+    def region_dict(self, value):
+        self._region_dict = value
+
+    @property
+    def zone(self):
+        """
+        Default zone (``datacenter`` constructor argument).
+        """
+        if not self._zone_loaded:
+            with self._location_lock:
+                if not self._zone_loaded:
+                    if self.datacenter:
+                        self._zone = self.ex_get_zone(self.datacenter)
+                    self._zone_loaded = True
+
+        return self._zone
+
+    @zone.setter
+    def zone(self, value):
+        self._zone = value
+        self._zone_loaded = True
+
+    @property
+    def region(self):
+        """
+        Region of the default zone.
+        """
+        if not self._region_loaded:
+            with self._location_lock:
+                if not self._region_loaded:
+                    zone = self.zone
+                    if zone:
+                        self._region = self._get_region_from_zone(zone)
+                    self._region_loaded = True
+
+        return self._region
+
+    @region.setter
+    def region(self, value):
+        self._region = value
+        self._region_loaded = True
+
+    def _load_zones(self):
+        if self._zone_dict is not None:
+            return
+
+        with self._location_lock:
+            if self._zone_dict is not None:
+                return
+
+            items = self._get_location_items('zones')
+            zone_list = [self._to_zone(z) for z in items]
+
+            self._zone_list = zone_list
+            self._zone_dict = dict((zone.name, zone) for zone in zone_list)
+
+    def _load_regions(self):
+        if self._region_dict is not None:
+            return
+
+        with self._location_lock:
+            if self._region_dict is not None:
+                return
+
+            items = self._get_location_items('regions')
+            region_list = [self._to_region(r) for r in items]
+
+            self._region_list = region_list
+            self._region_dict = dict((region.name, region)
+                                     for region in region_list)
+
+    def _get_location_items(self, kind):
+        """
+        Return raw zone or region items either from the location cache or
+        using the API.
+        """
+        cache = self.location_cache
+
+        if cache is not None:
+            items = cache.get(self.project, kind)
+
+            if items is not None:
+                return items
+
+        response = self.connection.request('/%s' % (kind),
+                                           method='GET').object
+        items = response.get('items', [])
+
+        if cache is not None:
+            cache.put(self.project, kind, items)
+
+        return items
+
     def ex_add_access_config(self, node, name, nic, nat_ip=None,
                              config_type=None):
         """
@@ -2592,37 +3055,32 @@ class GCENodeDriver(NodeDriver):
         :rtype:   ``list`` of :class:`Node`
         """
         zone = self._set_zone(ex_zone)
-        response = self.connection.request_aggregated_items('instances',
-                                                            zone=zone)
-
-        if not response.get('items', []):
-            return []
-
         list_nodes = []
+        volume_dict_populated = False
 
-        # The aggregated response returns a dict for each zone
-        # Create volume cache now for fast lookups of disk info.
-        self._ex_populate_volume_dict()
-
-        items = response['items'].values()
-        instances = [item.get('instances', []) for item in items]
-        instances = itertools.chain(*instances)
+        # Instances are converted as the pages (zones) are received
+        for _, instances in self._iterate_aggregated_items('instances',
+                                                           zone=zone):
+            if not volume_dict_populated:
+                # Create volume cache now for fast lookups of disk info.
+                self._ex_populate_volume_dict()
+                volume_dict_populated = True
 
-        for instance in instances:
-            try:
-                node = self._to_node(instance,
-                                     use_disk_cache=ex_use_disk_cache)
-            except ResourceNotFoundError:
-                # If a GCE node has been deleted between
-                #   - is was listed by `request('.../instances', 'GET')
-                #   - it is converted by `self._to_node(i)`
-                # `_to_node()` will raise a ResourceNotFoundError.
-                #
-                # Just ignore that node and return the list of the
-                # other nodes.
-                continue
+            for instance in instances:
+                try:
+                    node = self._to_node(instance,
+                                         use_disk_cache=ex_use_disk_cache)
+                except ResourceNotFoundError:
+                    # If a GCE node has been deleted between
+                    #   - is was listed by `request('.../instances', 'GET')
+                    #   - it is converted by `self._to_node(i)`
+                    # `_to_node()` will raise a ResourceNotFoundError.
+                    #
+                    # Just ignore that node and return the list of the
+                    # other nodes.
+                    continue
 
-            list_nodes.append(node)
+                list_nodes.append(node)
 
         # Clear the volume cache as lookups are complete.
         self._ex_volume_dict = {}
@@ -2909,22 +3367,19 @@ class GCENodeDriver(NodeDriver):
         """
         list_volumes = []
         zone = self._set_zone(ex_zone)
-        if zone is None:
-            request = '/aggregated/disks'
-        else:
-            request = '/zones/%s/disks' % (zone.name)
 
-        response = self.connection.request(request, method='GET').object
-        if 'items' in response:
-            # The aggregated response returns a dict for each zone
-            if zone is None:
-                for v in response['items'].values():
-                    zone_volumes = [self._to_storage_volume(d)
-                                    for d in v.get('disks', [])]
-                    list_volumes.extend(zone_volumes)
-            else:
-                list_volumes = [self._to_storage_volume(d)
-                                for d in response['items']]
+        # Volumes of all the zones are also used to refresh the volume cache
+        volume_dict = {} if zone is None else None
+
+        for key, disks in self._iterate_aggregated_items('disks', zone=zone):
+            if volume_dict is not None:
+                self._update_volume_dict(volume_dict, key, disks)
+
+            list_volumes.extend([self._to_storage_volume(d) for d in disks])
+
+        if volume_dict is not None:
+            self._ex_volume_dict = volume_dict
+
         return list_volumes
 
     def ex_list_zones(self):
@@ -7533,6 +7988,25 @@ class GCENodeDriver(NodeDriver):
         response = self.connection.request(request, method='GET').object
         return self._to_node(response)
 
+    def _get_nodes(self, nodes):
+        """
+        Retrieve the provided nodes one by one using ``ex_get_node``.
+
+        @inherits: :class:`NodeDriver._get_nodes`
+        """
+        result = []
+
+        for node in nodes:
+            try:
+                node = self.ex_get_node(node.name,
+                                        zone=node.extra.get('zone', None))
+            except ResourceNotFoundError:
+                continue
+
+            result.append(node)
+
+        return result
+
     def ex_get_project(self):
         """
         Return a Project object with project-wide information.
@@ -7881,14 +8355,30 @@ class GCENodeDriver(NodeDriver):
         """
         name_zone_dict = {}
         for k, v in zone_dict.items():
-            zone_name = k.replace('zones/', '')
-            disks = v.get('disks', [])
-            for disk in disks:
-                n = disk['name']
-                name_zone_dict.setdefault(n, {})
-                name_zone_dict[n].update({zone_name: disk})
+            self._update_volume_dict(name_zone_dict, k, v.get('disks', []))
         return name_zone_dict
 
+    def _update_volume_dict(self, name_zone_dict, key, disks):
+        """
+        Add disks of a single zone to a dictionary in [name][zone]=disk
+        format.
+
+        :param  name_zone_dict: dict of volumes, organized by name, then zone
+        :type   name_zone_dict: ``dict``
+
+        :param  key: Key of the zone in the aggregated response
+                     (e.g. 'zones/us-central1-a').
+        :type   key: ``str``
+
+        :param  disks: List of disks in the zone.
+        :type   disks: ``list`` of ``dict``
+        """
+        zone_name = key.replace('zones/', '')
+        for disk in disks:
+            n = disk['name']
+            name_zone_dict.setdefault(n, {})
+            name_zone_dict[n].update({zone_name: disk})
+
     def _ex_lookup_volume(self, volume_name, zone=None):
         """
         Look up volume by name and zone in volume dict.
@@ -7927,6 +8417,22 @@ class GCENodeDriver(NodeDriver):
                                                           zone), None, None)
         return self._to_storage_volume(volume)
 
+    def _iterate_aggregated_items(self, api_name, zone=None):
+        """
+        Iterate over the results of an aggregated (or a single zone) request
+        for a zonal resource as they are received.
+
+        :return:  Generator which yields (key, items) tuples.
+        :rtype:   ``generator``
+        """
+        zones = None
+
+        if zone is None and self.connection.aggregated_list_workers > 1:
+            zones = [z.name for z in self.zone_list]
+
+        return self.connection.iterate_aggregated_items(api_name, zone=zone,
+                                                        zones=zones)
+
     def _ex_populate_volume_dict(self):
         """
         Fetch the volume information using disks/aggregatedList
@@ -7934,14 +8440,15 @@ class GCENodeDriver(NodeDriver):
 
         return:  ``None``
         """
-        # fill the volume dict by making an aggegatedList call to disks.
-        aggregated_items = self.connection.request_aggregated_items(
-            "disks")
-
         # _ex_volume_dict is in the format of:
         # { 'disk_name' : { 'zone1': disk, 'zone2': disk, ... }}
-        self._ex_volume_dict = self._build_volume_dict(
-            aggregated_items['items'])
+        volume_dict = {}
+
+        # fill the volume dict as the aggregatedList pages are received.
+        for key, disks in self._iterate_aggregated_items('disks'):
+            self._update_volume_dict(volume_dict, key, disks)
+
+        self._ex_volume_dict = volume_dict
 
         return None
 
@@ -8050,12 +8557,17 @@ class GCENodeDriver(NodeDriver):
             rz = 'zone'
         rz_name = None
         res_name = res_name or res_type
-        res_list = self.connection.request_aggregated_items(res_type)
-        for k, v in res_list['items'].items():
-            for res in v.get(res_type, []):
+        res_list = self.connection.iterate_aggregated_items(res_type)
+        for k, resources in res_list:
+            for res in resources:
                 if res['name'] == name:
                     rz_name = k.replace('%ss/' % (rz), '')
                     break
+
+            if rz_name:
+                # Stop fetching the remaining pages
+                res_list.close()
+                break
         if not rz_name:
             raise ResourceNotFoundError('%s \'%s\' not found in any %s.' %
                                         (res_name, name, rz), None, None)
@@ -1415,6 +1415,23 @@ class OpenStack_1_1_NodeDriver(OpenStackNodeDriver):
 
         return self._to_node(server_object)
 
+    def _get_nodes(self, nodes):
+        """
+        Retrieve the provided nodes one by one using
+        ``ex_get_node_details``.
+
+        @inherits: :class:`NodeDriver._get_nodes`
+        """
+        result = []
+
+        for node in nodes:
+            node = self.ex_get_node_details(node.id)
+
+            if node is not None:
+                result.append(node)
+
+        return result
+
     def _to_images(self, obj, ex_only_active):
         images = []
         for image in obj['images']:
@@ -17,11 +17,13 @@
 Wraps multiple ways to communicate over SSH.
 """
 
+from typing import Dict
 from typing import Type
 from typing import Optional
 from typing import Tuple
 from typing import List
 from typing import Union
+from typing import Callable
 from typing import cast
 
 have_paramiko = False
@@ -36,11 +38,18 @@ except ImportError:
 # warning on Python 2.6.
 # Ref: https://bugs.launchpad.net/paramiko/+bug/392973
 
+import io
 import os
 import time
+import codecs
+import select
+import hashlib
+import tempfile
+import threading
 import subprocess
 import logging
 import warnings
+from collections import OrderedDict
 
 from os.path import split as psplit
 from os.path import join as pjoin
@@ -53,12 +62,35 @@ __all__ = [
     'BaseSSHClient',
     'ParamikoSSHClient',
     'ShellOutSSHClient',
+    'SSHClientPool',
 
-    'SSHCommandTimeoutError'
+    'SSHCommandTimeoutError',
+
+    'clear_pkey_cache'
 ]
 
 SUPPORTED_KEY_TYPES_URL = 'https://libcloud.readthedocs.io/en/latest/compute/deployment.html#supported-private-ssh-key-types' # NOQA
 
+# Parsed (and decrypted) private keys (paramiko.PKey objects) by hash of the
+# key and password. Least recently used keys are evicted once the cache holds
+# PKEY_CACHE_MAX_SIZE keys.
+PKEY_CACHE_MAX_SIZE = 32
+
+_PKEY_CACHE = OrderedDict()  # type: OrderedDict
+_PKEY_CACHE_LOCK = threading.Lock()
+
+
+def clear_pkey_cache():
+    # type: () -> None
+    """
+    Remove all the parsed private keys from the cache.
+
+    Parsed keys are decrypted so they stay in memory (in clear text) until
+    they are evicted from the cache or until this function is called.
+    """
+    with _PKEY_CACHE_LOCK:
+        _PKEY_CACHE.clear()
+
 
 class SSHCommandTimeoutError(Exception):
     """
@@ -228,10 +260,15 @@ class ParamikoSSHClient(BaseSSHClient):
     # Maximum number of bytes to read at once from a socket
     CHUNK_SIZE = 4096
 
-    # How long to sleep while waiting for command to finish (to prevent busy
-    # waiting)
+    # Maximum number of seconds to wait for new output before checking if the
+    # command has finished (waiting is interrupted as soon as data is
+    # received)
     SLEEP_DELAY = 0.2
 
+    # Maximum number of characters of stdout and stderr of a command which are
+    # kept in memory (None means no limit)
+    MAX_OUTPUT_SIZE = None  # type: Optional[int]
+
     def __init__(self,
                  hostname,  # type: str
                  port=22,  # type: int
@@ -266,6 +303,13 @@ class ParamikoSSHClient(BaseSSHClient):
 
         self.key_material = key_material
 
+        # Paths to the files with the whole output of the last command if it
+        # exceeded max_output_size
+        self.last_stdout_path = None  # type: Optional[str]
+        self.last_stderr_path = None  # type: Optional[str]
+
+        self._sftp = None  # type: Optional[paramiko.SFTPClient]
+
         self.client = paramiko.SSHClient()
         self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         self.logger = self._get_and_setup_logger()
@@ -337,15 +381,16 @@ class ParamikoSSHClient(BaseSSHClient):
         extra = {'_path': path, '_mode': mode, '_chmod': chmod}
         self.logger.debug('Uploading file', extra=extra)
 
-        sftp = self.client.open_sftp()
+        sftp = self._get_sftp_client()
         # less than ideal, but we need to mkdir stuff otherwise file() fails
         head, tail = psplit(path)
 
         if path[0] == "/":
             sftp.chdir("/")
         else:
-            # Relative path - start from a home directory (~)
-            sftp.chdir('.')
+            # Relative path - start from a home directory (~). SFTP session
+            # is re-used so the working directory needs to be reset.
+            sftp.chdir(None)
 
         for part in head.split("/"):
             if part != "":
@@ -364,7 +409,6 @@ class ParamikoSSHClient(BaseSSHClient):
         if chmod is not None:
             ak.chmod(chmod)
         ak.close()
-        sftp.close()
 
         if path[0] == '/':
             file_path = path
@@ -377,24 +421,52 @@ class ParamikoSSHClient(BaseSSHClient):
         extra = {'_path': path}
         self.logger.debug('Deleting file', extra=extra)
 
-        sftp = self.client.open_sftp()
+        sftp = self._get_sftp_client()
         sftp.unlink(path)
-        sftp.close()
         return True
 
-    def run(self, cmd, timeout=None):
-        # type: (str, Optional[float]) -> Tuple[str, str, int]
+    def run(self, cmd, timeout=None, stdout_callback=None,
+            stderr_callback=None, max_output_size=None):
+        # type: (str, Optional[float], Optional[Callable], Optional[Callable], Optional[int]) -> Tuple[str, str, int]  # noqa: E501
         """
         Note: This function is based on paramiko's exec_command()
         method.
 
+        Output is consumed as soon as it's received from the channel.
+
         :param timeout: How long to wait (in seconds) for the command to
                         finish (optional).
         :type timeout: ``float``
+
+        :param stdout_callback: Optional function which is called with each
+                                chunk of stdout as it's received.
+        :type stdout_callback: ``callable``
+
+        :param stderr_callback: Optional function which is called with each
+                                chunk of stderr as it's received.
+        :type stderr_callback: ``callable``
+
+        :param max_output_size: Maximum number of characters of stdout and
+                                stderr which are kept in memory (defaults to
+                                ``MAX_OUTPUT_SIZE``). If the output is larger,
+                                only the last ``max_output_size`` characters
+                                are returned and the whole output is written
+                                to a temporary file. Paths to those files are
+                                available as ``last_stdout_path`` and
+                                ``last_stderr_path`` attributes. Files are
+                                removed on the next ``run`` call and when the
+                                client is closed so they need to be copied if
+                                they should be kept.
+        :type max_output_size: ``int``
         """
         extra1 = {'_cmd': cmd}
         self.logger.debug('Executing command', extra=extra1)
 
+        self._remove_output_files()
+
+        if max_output_size is None:
+            max_output_size = self.MAX_OUTPUT_SIZE
+
         # Use the system default buffer size
         bufsize = -1
 
@@ -404,8 +476,21 @@ class ParamikoSSHClient(BaseSSHClient):
         start_time = time.time()
         chan.exec_command(cmd)
 
-        stdout = StringIO()
-        stderr = StringIO()
+        stdout = _CommandOutput(max_size=max_output_size,
+                                callback=stdout_callback)
+        stderr = _CommandOutput(max_size=max_output_size,
+                                callback=stderr_callback)
+
+        # Output is decoded incrementally because a single chunk could contain
+        # a part of multi byte UTF-8 character
+        stdout_decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        stderr_decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+
+        def consume():
+            stdout.write(self._consume_stdout(
+                chan, decoder=stdout_decoder).getvalue())
+            stderr.write(self._consume_stderr(
+                chan, decoder=stderr_decoder).getvalue())
 
         # Create a stdin file and immediately close it to prevent any
         # interactive script from hanging the process.
@@ -420,40 +505,44 @@ class ParamikoSSHClient(BaseSSHClient):
         # Note #2: If you are going to remove "ready" checks inside the loop
         # you are going to have a bad time. Trying to consume from a channel
         # which is not ready will block for indefinitely.
-        exit_status_ready = chan.exit_status_ready()
+        try:
+            while not chan.exit_status_ready():
+                elapsed_time = (time.time() - start_time)
 
-        if exit_status_ready:
-            # It's possible that some data is already available when exit
-            # status is ready
-            stdout.write(self._consume_stdout(chan).getvalue())
-            stderr.write(self._consume_stderr(chan).getvalue())
+                if timeout and (elapsed_time > timeout):
+                    # TODO: Is this the right way to clean up?
+                    chan.close()
 
-        while not exit_status_ready:
-            current_time = time.time()
-            elapsed_time = (current_time - start_time)
+                    stdout_str = stdout.getvalue()  # type: str
+                    stderr_str = stderr.getvalue()  # type: str
+                    raise SSHCommandTimeoutError(cmd=cmd, timeout=timeout,
+                                                 stdout=stdout_str,
+                                                 stderr=stderr_str)
 
-            if timeout and (elapsed_time > timeout):
-                # TODO: Is this the right way to clean up?
-                chan.close()
+                consume()
 
-                stdout_str = stdout.getvalue()  # type: str
-                stderr_str = stderr.getvalue()  # type: str
-                raise SSHCommandTimeoutError(cmd=cmd, timeout=timeout,
-                                             stdout=stdout_str,
-                                             stderr=stderr_str)
+                # We need to check the exit status here, because the command
+                # could print some output and exit while we were consuming it
+                if chan.exit_status_ready():
+                    break
 
-            stdout.write(self._consume_stdout(chan).getvalue())
-            stderr.write(self._consume_stderr(chan).getvalue())
+                wait = self.SLEEP_DELAY
 
-            # We need to check the exist status here, because the command could
-            # print some output and exit during this sleep below.
-            exit_status_ready = chan.exit_status_ready()
+                if timeout:
+                    wait = max(min(wait, timeout - elapsed_time), 0)
 
-            if exit_status_ready:
-                break
+                self._wait_for_channel(chan, wait)
 
-            # Short sleep to prevent busy waiting
-            time.sleep(self.SLEEP_DELAY)
+            # It's possible that some data is still available when exit status
+            # is ready
+            consume()
+            stdout.write(stdout_decoder.decode(b'', final=True))
+            stderr.write(stderr_decoder.decode(b'', final=True))
+        finally:
+            stdout.close()
+            stderr.close()
+            self.last_stdout_path = stdout.path
+            self.last_stderr_path = stderr.path
 
         # Receive the exit status code of the command we ran.
         status = chan.recv_exit_status()  # type: int
@@ -471,35 +560,83 @@ class ParamikoSSHClient(BaseSSHClient):
     def close(self):
         self.logger.debug('Closing server connection')
 
+        if self._sftp is not None:
+            self._sftp.close()
+            self._sftp = None
+
+        self._remove_output_files()
         self.client.close()
         return True
 
-    def _consume_stdout(self, chan):
+    def is_active(self):
+        # type: () -> bool
+        """
+        Return True if the connection to the remote node is open.
+
+        :rtype: ``bool``
+        """
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def _remove_output_files(self):
+        """
+        Remove the files with the whole output of the last command.
+        """
+        for path in [self.last_stdout_path, self.last_stderr_path]:
+            if path is None:
+                continue
+
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+        self.last_stdout_path = None
+        self.last_stderr_path = None
+
+    def _get_sftp_client(self):
+        """
+        Return SFTP client which is opened on first use and shared by all the
+        file operations over this connection.
+        """
+        if self._sftp is None or self._sftp.sock.closed:
+            self._sftp = self.client.open_sftp()
+
+        return self._sftp
+
+    def _consume_stdout(self, chan, decoder=None):
         """
         Try to consume stdout data from chan if it's receive ready.
         """
         stdout = self._consume_data_from_channel(
             chan=chan,
             recv_method=chan.recv,
-            recv_ready_method=chan.recv_ready)
+            recv_ready_method=chan.recv_ready,
+            decoder=decoder)
         return stdout
 
-    def _consume_stderr(self, chan):
+    def _consume_stderr(self, chan, decoder=None):
         """
         Try to consume stderr data from chan if it's receive ready.
         """
         stderr = self._consume_data_from_channel(
             chan=chan,
             recv_method=chan.recv_stderr,
-            recv_ready_method=chan.recv_stderr_ready)
+            recv_ready_method=chan.recv_stderr_ready,
+            decoder=decoder)
         return stderr
 
-    def _consume_data_from_channel(self, chan, recv_method, recv_ready_method):
+    def _consume_data_from_channel(self, chan, recv_method, recv_ready_method,
+                                   decoder=None):
         """
         Try to consume data from the provided channel.
 
         Keep in mind that data is only consumed if the channel is receive
         ready.
+
+        If an incremental decoder is provided, a part of multi byte UTF-8
+        character at the end of the data is kept by the decoder until the
+        rest of the character is received.
         """
         result = StringIO()
         result_bytes = bytearray()
@@ -520,14 +657,64 @@ class ParamikoSSHClient(BaseSSHClient):
         # We only decode data at the end because a single chunk could contain
         # a part of multi byte UTF-8 character (whole multi bytes character
         # could be split over two chunks)
-        result.write(result_bytes.decode('utf-8', errors='ignore'))
+        if decoder is not None:
+            result.write(decoder.decode(bytes(result_bytes)))
+        else:
+            result.write(result_bytes.decode('utf-8', errors='ignore'))
         return result
 
+    def _wait_for_channel(self, chan, timeout):
+        """
+        Block until new data is available on the channel, the exit status is
+        received or until timeout seconds have passed.
+        """
+        if getattr(chan, 'eof_received', False) is True:
+            # No more data will be received, only wait for the exit status
+            chan.status_event.wait(timeout)
+            return
+
+        try:
+            # Channel file descriptor becomes readable when stdout or stderr
+            # data is received or when the remote side closes the channel
+            select.select([chan], [], [], timeout)
+        except (TypeError, ValueError, OSError):
+            # Channel doesn't support polling
+            time.sleep(timeout)
+
     def _get_pkey_object(self, key, password=None):
         """
         Try to detect private key type and return paramiko.PKey object.
 
         # NOTE: Paramiko only supports key in PKCS#1 PEM format.
+
+        Parsed keys are cached (up to ``PKEY_CACHE_MAX_SIZE`` keys) so the
+        same key is only parsed once per process. Keep in mind that cached
+        keys are decrypted, use ``clear_pkey_cache`` to remove them from
+        memory.
+        """
+        cache_key = hashlib.sha256(b(key) + b'\0' +
+                                   b(password or '')).hexdigest()
+
+        with _PKEY_CACHE_LOCK:
+            pkey = _PKEY_CACHE.get(cache_key, None)
+
+            if pkey is not None:
+                _PKEY_CACHE.move_to_end(cache_key)
+                return pkey
+
+        pkey = self._parse_pkey_object(key=key, password=password)
+
+        with _PKEY_CACHE_LOCK:
+            _PKEY_CACHE[cache_key] = pkey
+
+            while len(_PKEY_CACHE) > PKEY_CACHE_MAX_SIZE:
+                _PKEY_CACHE.popitem(last=False)
+
+        return pkey
+
+    def _parse_pkey_object(self, key, password=None):
+        """
+        Try to detect private key type and return paramiko.PKey object.
         """
         key_types = [
             (paramiko.RSAKey, 'RSA'),
@@ -581,6 +768,185 @@ class ParamikoSSHClient(BaseSSHClient):
         raise paramiko.ssh_exception.SSHException(msg)
 
 
+class SSHClientPool(object):
+    """
+    Pool of connected SSH clients.
+
+    Clients are keyed by hostname, port, username and fingerprint of the
+    credentials so the same connection (transport) is re-used for all the
+    commands and file transfers performed on a node, including deployment
+    retries.
+
+    A client returned by the pool should only be used by a single thread at
+    a time.
+    """
+
+    def __init__(self):
+        self._clients = {}  # type: Dict[Tuple, BaseSSHClient]
+        self._lock = threading.Lock()
+
+    def get(self,
+            hostname,  # type: str
+            port=22,  # type: int
+            username='root',  # type: str
+            password=None,  # type: Optional[str]
+            key_files=None  # type: Optional[Union[str, List[str]]]
+            ):
+        # type: (...) -> Optional[BaseSSHClient]
+        """
+        Return connected client for the provided host and credentials or
+        None if there is no such client in the pool.
+        """
+        key = self._get_key(hostname=hostname, port=port, username=username,
+                            password=password, key_files=key_files)
+
+        with self._lock:
+            client = self._clients.get(key, None)
+
+        if client is None:
+            return None
+
+        if not getattr(client, 'is_active', lambda: False)():
+            self.remove(client)
+            return None
+
+        return client
+
+    def add(self, client):
+        # type: (BaseSSHClient) -> None
+        """
+        Add connected client to the pool.
+        """
+        key = self._get_client_key(client)
+
+        with self._lock:
+            existing = self._clients.get(key, None)
+            self._clients[key] = client
+
+        if existing is not None and existing is not client:
+            existing.close()
+
+    def remove(self, client):
+        # type: (BaseSSHClient) -> None
+        """
+        Remove client from the pool and close it.
+        """
+        key = self._get_client_key(client)
+
+        with self._lock:
+            if self._clients.get(key, None) is client:
+                del self._clients[key]
+
+        try:
+            client.close()
+        except Exception:
+            pass
+
+    def close(self):
+        # type: () -> None
+        """
+        Close all the clients in the pool.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def _get_client_key(self, client):
+        return self._get_key(hostname=client.hostname, port=client.port,
+                             username=client.username,
+                             password=client.password,
+                             key_files=client.key_files)
+
+    def _get_key(self, hostname, port, username, password, key_files):
+        if isinstance(key_files, (list, tuple)):
+            key_files = list(key_files)
+        elif key_files:
+            key_files = [key_files]
+        else:
+            key_files = []
+
+        fingerprint = hashlib.sha256(b(password or ''))
+
+        for key_file in key_files:
+            fingerprint.update(b'\0' + b(key_file))
+
+            if os.path.isfile(key_file):
+                with open(key_file, 'rb') as fp:
+                    fingerprint.update(fp.read())
+
+        return (hostname, port, username, fingerprint.hexdigest())
+
+
+class _CommandOutput(object):
+    """
+    Output (stdout or stderr) of a command.
+
+    If ``max_size`` is provided, only the last ``max_size`` characters are
+    kept in memory and the whole output is written to a temporary file once
+    it exceeds that size.
+    """
+
+    def __init__(self, max_size=None, callback=None):
+        # type: (Optional[int], Optional[Callable]) -> None
+        self.max_size = max_size
+        self.callback = callback
+        self.path = None  # type: Optional[str]
+
+        self._chunks = []  # type: List[str]
+        self._size = 0
+        self._file = None  # type: Optional[io.TextIOWrapper]
+
+    def write(self, data):
+        # type: (str) -> None
+        if not data:
+            return
+
+        if self.callback:
+            self.callback(data)
+
+        if self.max_size is not None:
+            if self._file is None and \
+                    self._size + len(data) > self.max_size:
+                fd, self.path = tempfile.mkstemp(prefix='libcloud-ssh-',
+                                                 suffix='.log')
+                self._file = io.open(fd, 'w', encoding='utf-8')
+                self._file.write(''.join(self._chunks))
+
+            if self._file is not None:
+                self._file.write(data)
+
+        self._chunks.append(data)
+        self._size += len(data)
+
+        # Memory is trimmed only once it holds twice the limit so the
+        # chunks are not joined on every write
+        if self.max_size is not None and self._size > self.max_size * 2:
+            value = self.getvalue()
+            self._chunks = [value]
+            self._size = len(value)
+
+    def getvalue(self):
+        # type: () -> str
+        value = ''.join(self._chunks)
+
+        if self.max_size is not None and len(value) > self.max_size:
+            value = value[len(value) - self.max_size:]
+
+        return value
+
+    def close(self):
+        # type: () -> None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 class ShellOutSSHClient(BaseSSHClient):
     """
     This client shells out to "ssh" binary to run commands on the remote
@@ -28,7 +28,9 @@ import datetime
 from libcloud import __version__
 from libcloud.common.base import Connection
 from libcloud.common.base import ConnectionUserAndKey, BaseDriver
+from libcloud.common.base import AsyncPageIterator
 from libcloud.dns.types import RecordType
+from libcloud.utils.misc import SlotsStateMixin
 
 __all__ = [
     'Zone',
@@ -37,11 +39,13 @@ __all__ = [
 ]
 
 
-class Zone(object):
+class Zone(SlotsStateMixin):
     """
     DNS zone.
     """
 
+    __slots__ = ('id', 'domain', 'type', 'ttl', 'driver', 'extra')
+
     def __init__(self,
                  id,  # type: str
                  domain,  # type: str
@@ -114,11 +118,14 @@ class Zone(object):
                 (self.domain, self.ttl, self.driver.name))
 
 
-class Record(object):
+class Record(SlotsStateMixin):
     """
     Zone record / resource.
     """
 
+    __slots__ = ('id', 'name', 'type', 'data', 'zone', 'driver', 'ttl',
+                 'extra')
+
     def __init__(self,
                  id,  # type: str
                  name,  # type: str
@@ -277,6 +284,19 @@ class DNSDriver(BaseDriver):
         """
         return list(self.iterate_zones())
 
+    def iterate_zones_async(self):
+        # type: () -> AsyncPageIterator
+        """
+        Asyncio variant of :meth:`iterate_zones`.
+
+        Drivers with native asyncio support override this method. The default
+        implementation advances the blocking iterator in the default
+        executor.
+
+        :rtype: :class:`libcloud.common.base.AsyncPageIterator`
+        """
+        return AsyncPageIterator.from_iterator(self.iterate_zones)
+
     def iterate_records(self, zone):
         # type: (Zone) -> Iterator[Record]
         """
@@ -302,6 +322,23 @@ class DNSDriver(BaseDriver):
         """
         return list(self.iterate_records(zone))
 
+    def iterate_records_async(self, zone):
+        # type: (Zone) -> AsyncPageIterator
+        """
+        Asyncio variant of :meth:`iterate_records`.
+
+        Drivers with native asyncio support override this method. The default
+        implementation advances the blocking iterator in the default
+        executor.
+
+        :param zone: Zone to list records for.
+        :type zone: :class:`Zone`
+
+        :rtype: :class:`libcloud.common.base.AsyncPageIterator`
+        """
+        return AsyncPageIterator.from_iterator(
+            lambda: self.iterate_records(zone))
+
     def get_zone(self, zone_id):
         # type: (str) -> Zone
         """
@@ -30,12 +30,14 @@ from libcloud.utils.py3 import ET
 from libcloud.utils.py3 import b, urlencode
 
 from libcloud.utils.xml import findtext, findall, fixxpath
+from libcloud.utils.ratelimit import RateLimit
 from libcloud.dns.types import Provider, RecordType
 from libcloud.dns.types import ZoneDoesNotExistError, RecordDoesNotExistError
 from libcloud.dns.base import DNSDriver, Zone, Record
 from libcloud.common.types import LibcloudError
 from libcloud.common.aws import AWSGenericResponse, AWSTokenConnection
 from libcloud.common.base import ConnectionUserAndKey
+from libcloud.common.base import AsyncPageIterator
 
 
 API_VERSION = '2012-02-29'
@@ -93,7 +95,8 @@ class BaseRoute53Connection(ConnectionUserAndKey):
 
 
 class Route53Connection(AWSTokenConnection, BaseRoute53Connection):
-    pass
+    # Route 53 API allows 5 requests per second per AWS account
+    rate_limits = [RateLimit(rate=5, burst=5, scope='account')]
 
 
 class Route53DNSDriver(DNSDriver):
@@ -125,6 +128,12 @@ class Route53DNSDriver(DNSDriver):
     def iterate_records(self, zone):
         return self._get_more('records', zone=zone)
 
+    def iterate_zones_async(self):
+        return self._get_more_async('zones')
+
+    def iterate_records_async(self, zone):
+        return self._get_more_async('records', zone=zone)
+
     def get_zone(self, zone_id):
         self.connection.set_context({'zone_id': zone_id})
         uri = API_ROOT + 'hostedzone/' + zone_id
@@ -524,20 +533,39 @@ class Route53DNSDriver(DNSDriver):
             for item in items:
                 yield item
 
+    def _get_more_async(self, rtype, **kwargs):
+        async def fetch_page(last_key):
+            path, params = self._get_data_request(rtype, last_key, **kwargs)
+            response = await self.async_connection.request(path,
+                                                           params=params)
+            items, last_key, exhausted = self._parse_data_response(
+                rtype, response, **kwargs)
+            return items, (None if exhausted else last_key)
+
+        return AsyncPageIterator(fetch_page)
+
     def _get_data(self, rtype, last_key, **kwargs):
+        path, params = self._get_data_request(rtype, last_key, **kwargs)
+        response = self.connection.request(path, params=params)
+        return self._parse_data_response(rtype, response, **kwargs)
+
+    def _get_data_request(self, rtype, last_key, **kwargs):
         params = {}
         if last_key:
             params['name'] = last_key
         path = API_ROOT + 'hostedzone'
 
-        if rtype == 'zones':
-            response = self.connection.request(path, params=params)
-            transform_func = self._to_zones
-        elif rtype == 'records':
+        if rtype == 'records':
             zone = kwargs['zone']
             path += '/%s/rrset' % (zone.id)
             self.connection.set_context({'zone_id': zone.id})
-            response = self.connection.request(path, params=params)
+
+        return path, params
+
+    def _parse_data_response(self, rtype, response, **kwargs):
+        if rtype == 'zones':
+            transform_func = self._to_zones
+        elif rtype == 'records':
             transform_func = self._to_records
 
         if response.status == httplib.OK:
@@ -19,10 +19,22 @@ verification, depending on libcloud.security settings.
 """
 
 import os
+import ssl
+import asyncio
+import time
+import threading
 import warnings
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.poolmanager import PoolManager
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import aiohttp
+    have_aiohttp = True
+except ImportError:
+    have_aiohttp = False
 
 import libcloud.security
 from libcloud.utils.py3 import urlparse, PY3
@@ -30,7 +42,11 @@ from libcloud.utils.py3 import urlparse, PY3
 
 __all__ = [
     'LibcloudBaseConnection',
-    'LibcloudConnection'
+    'LibcloudConnection',
+    'AsyncLibcloudConnection',
+    'ConnectionPoolRegistry',
+
+    'CONNECTION_POOL_REGISTRY'
 ]
 
 ALLOW_REDIRECTS = 1
@@ -53,6 +69,221 @@ class SignedHTTPSAdapter(HTTPAdapter):
             key_file=self.key_file)
 
 
+class SharedHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter which is shared between multiple connection (session)
+    instances and managed by :class:`ConnectionPoolRegistry`.
+
+    The adapter owns the urllib3 connection pools so keep-alive sockets are
+    reused across all the connections which use the same adapter.
+    """
+
+    def __init__(self, pool_connections, pool_maxsize, cert_file=None,
+                 key_file=None):
+        self.cert_file = cert_file
+        self.key_file = key_file
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        self.requests = 0
+        super(SharedHTTPAdapter, self).__init__(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+    def init_poolmanager(self, connections, maxsize, block=False,
+                         **pool_kwargs):
+        if self.cert_file or self.key_file:
+            pool_kwargs['cert_file'] = self.cert_file
+            pool_kwargs['key_file'] = self.key_file
+
+        super(SharedHTTPAdapter, self).init_poolmanager(
+            connections, maxsize, block=block, **pool_kwargs)
+
+    def send(self, request, *args, **kwargs):
+        self.last_used = time.time()
+        self.requests += 1
+        return super(SharedHTTPAdapter, self).send(request, *args, **kwargs)
+
+    def close(self):
+        # Adapter is shared so closing a single session shouldn't close the
+        # pooled connections. Those are closed by the registry once the
+        # adapter becomes idle.
+        pass
+
+    def close_pools(self):
+        super(SharedHTTPAdapter, self).close()
+
+    def get_stats(self):
+        """
+        Return statistics for this adapter.
+
+        :rtype: ``dict``
+        """
+        pools = []
+
+        for manager in [self.poolmanager] + list(self.proxy_manager.values()):
+            # NOTE: RecentlyUsedContainer doesn't support iteration
+            for key in manager.pools.keys():
+                pool = manager.pools.get(key, None)
+
+                if pool is not None:
+                    pools.append(pool)
+
+        return {
+            'created_at': self.created_at,
+            'last_used': self.last_used,
+            'requests': self.requests,
+            'pools': len(pools),
+            'connections': sum([pool.num_connections for pool in pools]),
+            'idle_connections': sum([pool.pool.qsize() for pool in pools
+                                     if pool.pool is not None])
+        }
+
+
+class ConnectionPoolRegistry(object):
+    """
+    Process wide registry of HTTP connection pools which can be shared by
+    multiple connection (and driver) instances.
+
+    Pools are keyed by the (scheme, host, port), TLS settings and proxy URL
+    so connections to the same endpoint reuse keep-alive sockets instead of
+    each performing its own TCP and TLS handshake.
+
+    Pools which haven't been used for more than ``idle_timeout`` seconds are
+    closed and removed from the registry.
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10,
+                 idle_timeout=300):
+        """
+        :param pool_connections: Number of connection pools (hosts) to cache
+                                 per registry entry.
+        :type pool_connections: ``int``
+
+        :param pool_maxsize: Maximum number of connections to keep open per
+                             pool.
+        :type pool_maxsize: ``int``
+
+        :param idle_timeout: Number of seconds after which idle pools are
+                             closed. ``None`` disables idle eviction.
+        :type idle_timeout: ``int``
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+
+        self._adapters = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def configure(self, pool_connections=None, pool_maxsize=None,
+                  idle_timeout=None):
+        """
+        Update registry settings. New settings only apply to the pools which
+        are created after this method has been called.
+        """
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+
+        if idle_timeout is not None:
+            self.idle_timeout = idle_timeout
+
+    def get_adapter(self, host, verify=True, cert_file=None, key_file=None,
+                    proxy_url=None):
+        """
+        Return a shared adapter for the provided endpoint and settings.
+
+        :param host: Base URL (``<scheme>://<host>[:<port>]``).
+        :type host: ``str``
+
+        :rtype: :class:`SharedHTTPAdapter`
+        """
+        key = (host, verify, cert_file, key_file, proxy_url)
+
+        with self._lock:
+            self._evict_idle()
+
+            adapter = self._adapters.get(key, None)
+
+            if adapter is None:
+                self._misses += 1
+                adapter = SharedHTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    cert_file=cert_file, key_file=key_file)
+                self._adapters[key] = adapter
+            else:
+                self._hits += 1
+
+            adapter.last_used = time.time()
+
+        return adapter
+
+    def evict_idle(self):
+        """
+        Close and remove pools which have been idle for more than
+        ``idle_timeout`` seconds.
+
+        :return: Number of evicted pools.
+        :rtype: ``int``
+        """
+        with self._lock:
+            return self._evict_idle()
+
+    def clear(self):
+        """
+        Close and remove all the pools.
+        """
+        with self._lock:
+            for adapter in self._adapters.values():
+                adapter.close_pools()
+
+            self._adapters = {}
+
+    def get_stats(self):
+        """
+        Return registry statistics.
+
+        :rtype: ``dict``
+        """
+        with self._lock:
+            pools = dict([(key, adapter.get_stats()) for key, adapter in
+                          self._adapters.items()])
+
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'pools': pools
+            }
+
+    def _evict_idle(self):
+        if not self.idle_timeout:
+            return 0
+
+        now = time.time()
+        evicted = 0
+
+        for key, adapter in list(self._adapters.items()):
+            if (now - adapter.last_used) >= self.idle_timeout:
+                # NOTE: Sessions which still reference this adapter can
+                # still use it, urllib3 will simply open new connections
+                adapter.close_pools()
+                del self._adapters[key]
+                evicted += 1
+
+        self._evictions += evicted
+        return evicted
+
+
+# Default process wide registry used by connections which have
+# ``shared_pool`` enabled
+CONNECTION_POOL_REGISTRY = ConnectionPoolRegistry()
+
+
 class LibcloudBaseConnection(object):
     """
     Base connection class to inherit from.
@@ -171,6 +402,8 @@ class LibcloudBaseConnection(object):
         Setup request signing by mounting a signing
         adapter to the session
         """
+        self.cert_file = cert_file
+        self.key_file = key_file
         self.session.mount('https://', SignedHTTPSAdapter(cert_file, key_file))
 
 
@@ -179,6 +412,9 @@ class LibcloudConnection(LibcloudBaseConnection):
     host = None
     response = None
 
+    # Registry which is used when shared connection pool is enabled
+    pool_registry = CONNECTION_POOL_REGISTRY
+
     def __init__(self, host, port, secure=None, **kwargs):
         scheme = 'https' if secure is not None and secure else 'http'
         self.host = '{0}://{1}{2}'.format(
@@ -203,12 +439,39 @@ class LibcloudConnection(LibcloudBaseConnection):
         LibcloudBaseConnection.__init__(self)
 
         self.session.timeout = kwargs.pop('timeout', 60)
+        self.shared_pool = kwargs.pop('shared_pool', False)
 
         if 'cert_file' in kwargs or 'key_file' in kwargs:
             self._setup_signing(**kwargs)
 
         if proxy_url:
             self.set_http_proxy(proxy_url=proxy_url)
+        elif self.shared_pool:
+            self._mount_shared_pool_adapter()
+
+    def set_http_proxy(self, proxy_url):
+        super(LibcloudConnection, self).set_http_proxy(proxy_url=proxy_url)
+
+        if getattr(self, 'shared_pool', False):
+            self._mount_shared_pool_adapter()
+
+    def _mount_shared_pool_adapter(self):
+        """
+        Mount adapter from the shared connection pool registry for requests
+        to this connection host.
+        """
+        proxy_url = self.session.proxies.get('https' if
+                                             self.host.startswith('https')
+                                             else 'http', None)
+        cert_file = getattr(self, 'cert_file', None)
+        key_file = getattr(self, 'key_file', None)
+
+        adapter = self.pool_registry.get_adapter(host=self.host,
+                                                 verify=self.verification,
+                                                 cert_file=cert_file,
+                                                 key_file=key_file,
+                                                 proxy_url=proxy_url)
+        self.session.mount(self.host + '/', adapter)
 
     @property
     def verification(self):
@@ -288,6 +551,166 @@ class LibcloudConnection(LibcloudBaseConnection):
         return headers
 
 
+class AsyncLibcloudConnection(object):
+    """
+    Non-blocking counterpart of :class:`LibcloudConnection` which is built on
+    top of ``asyncio`` and ``aiohttp``.
+
+    The response body is read in full and returned as a
+    :class:`requests.Response` instance so the existing ``Response`` classes
+    (and their ``parse_body`` / ``parse_error`` methods) can be used as-is.
+
+    Note: ``aiohttp`` is an optional dependency which is only needed when
+    using the asyncio driver methods.
+    """
+    timeout = None
+    host = None
+    response = None
+
+    # Maximum number of simultaneously open connections in the pool
+    connection_limit = 100
+
+    def __init__(self, host, port, secure=None, **kwargs):
+        if not have_aiohttp:
+            raise RuntimeError('Missing "aiohttp" dependency. You can install '
+                               'it using pip - pip install aiohttp')
+
+        scheme = 'https' if secure is not None and secure else 'http'
+        self.host = '{0}://{1}{2}'.format(
+            'https' if port == 443 else scheme,
+            host,
+            ":{0}".format(port) if port not in (80, 443) else ""
+        )
+
+        https_proxy_url_env = os.environ.get(HTTPS_PROXY_ENV_VARIABLE_NAME,
+                                             None)
+        http_proxy_url_env = os.environ.get(HTTP_PROXY_ENV_VARIABLE_NAME,
+                                            https_proxy_url_env)
+
+        # Connection argument has precedence over environment variables
+        self.proxy_url = kwargs.pop('proxy_url', http_proxy_url_env)
+        self.timeout = kwargs.pop('timeout', 60)
+        self.connection_limit = kwargs.pop('connection_limit',
+                                           self.connection_limit)
+
+        self.verify = libcloud.security.VERIFY_SSL_CERT
+        self.ca_cert = libcloud.security.CA_CERTS_PATH
+        self.session = None
+        self._session_loop = None
+
+    def _get_ssl_context(self):
+        if not self.verify:
+            return False
+
+        ca_cert = self.ca_cert
+
+        if isinstance(ca_cert, list):
+            ca_cert = ca_cert[0]
+
+        return ssl.create_default_context(cafile=ca_cert)
+
+    async def _get_session(self):
+        # Session needs to be created inside a running event loop and it can
+        # only be used with that loop. If the connection is used with a
+        # different loop (e.g. by subsequent asyncio.run() calls), a new
+        # session is created and the old one is closed.
+        loop = asyncio.get_event_loop()
+
+        if self.session is not None and self._session_loop is not loop:
+            await self._close_stale_session()
+
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit,
+                                             ssl=self._get_ssl_context())
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 timeout=timeout,
+                                                 auto_decompress=True)
+            self._session_loop = loop
+
+        return self.session
+
+    async def request(self, method, url, body=None, headers=None, raw=False,
+                      stream=False):
+        url = urlparse.urljoin(self.host, url)
+        headers = self._normalize_headers(headers=headers)
+
+        # Host header is set by aiohttp based on the URL
+        headers.pop('Host', None)
+
+        session = await self._get_session()
+        async with session.request(method=method.upper(), url=url,
+                                   data=body, headers=headers,
+                                   allow_redirects=bool(ALLOW_REDIRECTS),
+                                   proxy=self.proxy_url) as response:
+            content = await response.read()
+            self.response = self._to_requests_response(
+                method=method, url=url, headers=headers, response=response,
+                content=content)
+
+        return self.response
+
+    async def _close_stale_session(self):
+        session = self.session
+        session_loop = self._session_loop
+        self.session = None
+        self._session_loop = None
+
+        if session.closed:
+            return
+
+        if session_loop.is_closed():
+            # Nothing in a closed loop needs to be waited on so the session
+            # can be closed from the current loop. This closes the connector
+            # and drops its pooled connections.
+            await session.close()
+        else:
+            # Session can only be closed in the loop it was created in, it's
+            # closed once that loop runs again
+            session_loop.create_task(session.close())
+
+    async def close(self):
+        if self.session is None:
+            return
+
+        if self._session_loop is not asyncio.get_event_loop():
+            await self._close_stale_session()
+            return
+
+        await self.session.close()
+        self.session = None
+        self._session_loop = None
+
+    def getresponse(self):
+        return self.response
+
+    def _to_requests_response(self, method, url, headers, response, content):
+        """
+        Convert ``aiohttp.ClientResponse`` to a ``requests.Response`` object
+        which is what the ``Response`` classes operate on.
+        """
+        result = requests.Response()
+        result.status_code = response.status
+        result.reason = response.reason
+        result.headers = CaseInsensitiveDict(response.headers)
+        result.url = url
+        result.encoding = get_encoding_from_headers(result.headers)
+        result.request = requests.Request(method=method.upper(), url=url,
+                                          headers=headers).prepare()
+        result._content = content
+        return result
+
+    def _normalize_headers(self, headers):
+        headers = dict(headers or {})
+
+        # all headers should be strings
+        for key, value in headers.items():
+            if isinstance(value, (int, float)):
+                headers[key] = str(value)
+
+        return headers
+
+
 class HttpLibResponseProxy(object):
     """
     Provides a proxy pattern around the :class:`requests.Reponse`
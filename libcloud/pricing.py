@@ -16,12 +16,21 @@
 from __future__ import with_statement
 
 from typing import Dict
+from typing import Optional
+from typing import List
+from typing import Callable
 
 """
 A class which handles loading the pricing files.
 """
 
+import os
 import os.path
+import mmap
+import time
+import struct
+import logging
+import threading
 from os.path import join as pjoin
 
 try:
@@ -35,14 +44,27 @@ except ImportError:
     import json  # type: ignore
     JSONDecodeError = ValueError  # type: ignore
 
+try:
+    from urllib.request import url2pathname
+except ImportError:
+    from urllib import url2pathname  # type: ignore
+
+from libcloud.utils.py3 import urlparse
+
 __all__ = [
     'get_pricing',
     'get_size_price',
     'set_pricing',
+    'compile_pricing_index',
+    'PricingIndex',
     'clear_pricing_data',
-    'download_pricing_file'
+    'register_pricing_change_callback',
+    'download_pricing_file',
+    'PricingRefresher'
 ]
 
+LOG = logging.getLogger(__name__)
+
 # Default URL to the pricing file
 DEFAULT_FILE_URL = 'https://git-wip-us.apache.org/repos/asf?p=libcloud.git;a=blob_plain;f=libcloud/data/pricing.json'  # NOQA
 
@@ -50,6 +72,9 @@ CURRENT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_PRICING_FILE_PATH = pjoin(CURRENT_DIRECTORY, 'data/pricing.json')
 CUSTOM_PRICING_FILE_PATH = os.path.expanduser('~/.libcloud/pricing.json')
 
+# How often PricingRefresher checks for a new pricing file (in seconds)
+DEFAULT_PRICING_REFRESH_INTERVAL = 24 * 60 * 60
+
 # Pricing data cache
 PRICING_DATA = {
     'compute': {},
@@ -58,6 +83,23 @@ PRICING_DATA = {
 
 VALID_PRICING_DRIVER_TYPES = ['compute', 'storage']
 
+# Functions which are called when the pricing data changes so the caches which
+# are derived from it (e.g. EC2 sizes) can be cleared
+PRICING_CHANGE_CALLBACKS = []  # type: List[Callable]
+
+# Compiled pricing index cache (index file path -> PricingIndex instance)
+PRICING_INDEXES = {}  # type: Dict[str, PricingIndex]
+
+# Compiled pricing index format. The file starts with a header which is
+# followed by fixed size records sorted by key and a blob with the keys. Each
+# key is "<driver_type>\0<driver_name>\0<size_id>" encoded as UTF-8. Size
+# and modification time of the source pricing file are stored in the header
+# so a stale index can be detected without reading the pricing file.
+PRICING_INDEX_MAGIC = b'LCPRIDX1'
+PRICING_INDEX_HEADER = struct.Struct('<8sIIqq')
+PRICING_INDEX_RECORD = struct.Struct('<IId')
+PRICING_INDEX_FILE_EXTENSION = '.idx'
+
 
 def get_pricing_file_path(file_path=None):
     if os.path.exists(CUSTOM_PRICING_FILE_PATH) and \
@@ -68,6 +110,231 @@ def get_pricing_file_path(file_path=None):
     return DEFAULT_PRICING_FILE_PATH
 
 
+def get_pricing_index_path(pricing_file_path):
+    """
+    Return path to the compiled index for the provided pricing file.
+    """
+    return os.path.splitext(pricing_file_path)[0] + \
+        PRICING_INDEX_FILE_EXTENSION
+
+
+def _get_pricing_index_key(driver_type, driver_name, size_id=''):
+    key = '%s\0%s\0%s' % (driver_type, driver_name, size_id)
+    return key.encode('utf-8')
+
+
+class PricingIndex(object):
+    """
+    Read-only memory-mapped view of a compiled pricing index.
+
+    Lookups use a binary search over the sorted records so only the pages
+    which are needed to answer a query are read from disk.
+    """
+
+    def __init__(self, index_file_path):
+        self.index_file_path = index_file_path
+
+        with open(index_file_path, 'rb') as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            header = PRICING_INDEX_HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            header = None
+
+        if not header or header[0] != PRICING_INDEX_MAGIC:
+            self.close()
+            raise ValueError('%s is not a valid pricing index' %
+                             (index_file_path))
+
+        (_, self.count, _, self.source_size, self.source_mtime) = header
+
+    def is_up_to_date(self, pricing_file_path):
+        """
+        Return True if the index has been compiled from the current version
+        of the provided pricing file.
+
+        :rtype: ``bool``
+        """
+        try:
+            stat = os.stat(pricing_file_path)
+        except OSError:
+            return False
+
+        return (stat.st_size == self.source_size and
+                stat.st_mtime_ns == self.source_mtime)
+
+    def get(self, driver_type, driver_name, size_id):
+        """
+        Return price for the provided size or None if the size has no price.
+
+        KeyError is thrown if the index contains no pricing for the provided
+        driver.
+
+        :rtype: ``float``
+        """
+        key = _get_pricing_index_key(driver_type, driver_name, size_id)
+        prefix = _get_pricing_index_key(driver_type, driver_name)
+
+        index = self._bisect(key)
+
+        if index < self.count:
+            record_key, price = self._get_record(index)
+
+            if record_key == key:
+                return price
+
+            if record_key.startswith(prefix):
+                return None
+
+        if index > 0 and self._get_record(index - 1)[0].startswith(prefix):
+            return None
+
+        raise KeyError(driver_name)
+
+    def get_pricing(self, driver_type, driver_name):
+        """
+        Return pricing for all the sizes of the provided driver.
+
+        :rtype: ``dict``
+        """
+        prefix = _get_pricing_index_key(driver_type, driver_name)
+        pricing = {}
+
+        for index in range(self._bisect(prefix), self.count):
+            record_key, price = self._get_record(index)
+
+            if not record_key.startswith(prefix):
+                break
+
+            size_id = record_key[len(prefix):].decode('utf-8')
+            pricing[size_id] = price
+
+        if not pricing:
+            raise KeyError(driver_name)
+
+        return pricing
+
+    def close(self):
+        self._mmap.close()
+
+    def _get_record(self, index):
+        offset = PRICING_INDEX_HEADER.size + index * PRICING_INDEX_RECORD.size
+        key_offset, key_length, price = \
+            PRICING_INDEX_RECORD.unpack_from(self._mmap, offset)
+        return self._mmap[key_offset:key_offset + key_length], price
+
+    def _bisect(self, key):
+        low, high = 0, self.count
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if self._get_record(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+
+def compile_pricing_index(pricing_file_path=None, index_file_path=None):
+    """
+    Compile pricing file into an index which can be memory-mapped.
+
+    :type pricing_file_path: ``str``
+    :param pricing_file_path: Path to the pricing file. If not provided it
+                              uses a default path.
+
+    :type index_file_path: ``str``
+    :param index_file_path: Path where the index will be saved. If not
+                            provided, the pricing file path with a ".idx"
+                            extension is used.
+
+    :rtype: ``str``
+    :return: Path to the compiled index.
+    """
+    if not pricing_file_path:
+        pricing_file_path = get_pricing_file_path(file_path=pricing_file_path)
+
+    if not index_file_path:
+        index_file_path = get_pricing_index_path(pricing_file_path)
+
+    with open(pricing_file_path) as fp:
+        stat = os.fstat(fp.fileno())
+        pricing_data = json.loads(fp.read())
+
+    items = []
+
+    for driver_type in VALID_PRICING_DRIVER_TYPES:
+        # pylint: disable=maybe-no-member
+        for driver_name, pricing in pricing_data.get(driver_type, {}).items():
+            for size_id, price in pricing.items():
+                try:
+                    price = float(price)
+                except (TypeError, ValueError):
+                    # Not a simple price (e.g. a nested structure)
+                    continue
+
+                key = _get_pricing_index_key(driver_type, driver_name,
+                                             size_id)
+                items.append((key, price))
+
+    items.sort()
+
+    header = PRICING_INDEX_HEADER.pack(PRICING_INDEX_MAGIC, len(items), 0,
+                                       stat.st_size, stat.st_mtime_ns)
+    key_offset = PRICING_INDEX_HEADER.size + \
+        len(items) * PRICING_INDEX_RECORD.size
+
+    tmp_file_path = index_file_path + '.tmp'
+
+    with open(tmp_file_path, 'wb') as fp:
+        fp.write(header)
+
+        for key, price in items:
+            fp.write(PRICING_INDEX_RECORD.pack(key_offset, len(key), price))
+            key_offset += len(key)
+
+        for key, _ in items:
+            fp.write(key)
+
+    os.replace(tmp_file_path, index_file_path)
+    return index_file_path
+
+
+def get_pricing_index(pricing_file_path=None):
+    """
+    Return compiled index for the provided pricing file.
+
+    None is returned if the index doesn't exist or if it's out of date.
+
+    :rtype: :class:`PricingIndex`
+    """
+    if not pricing_file_path:
+        pricing_file_path = get_pricing_file_path(file_path=pricing_file_path)
+
+    index_file_path = get_pricing_index_path(pricing_file_path)
+
+    if index_file_path in PRICING_INDEXES:
+        return PRICING_INDEXES[index_file_path]
+
+    if not os.path.isfile(index_file_path):
+        return None
+
+    try:
+        index = PricingIndex(index_file_path)
+    except (IOError, ValueError):
+        return None
+
+    if not index.is_up_to_date(pricing_file_path):
+        index.close()
+        return None
+
+    PRICING_INDEXES[index_file_path] = index
+    return index
+
+
 def get_pricing(driver_type, driver_name, pricing_file_path=None):
     """
     Return pricing for the provided driver.
@@ -95,6 +362,14 @@ def get_pricing(driver_type, driver_name, pricing_file_path=None):
     if not pricing_file_path:
         pricing_file_path = get_pricing_file_path(file_path=pricing_file_path)
 
+    index = get_pricing_index(pricing_file_path=pricing_file_path)
+
+    if index is not None:
+        # Only load and cache pricing for the requested driver
+        size_pricing = index.get_pricing(driver_type, driver_name)
+        PRICING_DATA[driver_type][driver_name] = size_pricing
+        return size_pricing
+
     with open(pricing_file_path) as fp:
         content = fp.read()
 
@@ -125,6 +400,7 @@ def set_pricing(driver_type, driver_name, pricing):
     """
 
     PRICING_DATA[driver_type][driver_name] = pricing
+    _notify_pricing_change()
 
 
 def get_size_price(driver_type, driver_name, size_id):
@@ -144,6 +420,14 @@ def get_size_price(driver_type, driver_name, size_id):
     :rtype: ``float``
     :return: Size price.
     """
+    if driver_type in VALID_PRICING_DRIVER_TYPES and \
+            driver_name not in PRICING_DATA[driver_type]:
+        index = get_pricing_index()
+
+        if index is not None:
+            # Look up a single price without loading the whole driver table
+            return index.get(driver_type, driver_name, size_id)
+
     pricing = get_pricing(driver_type=driver_type, driver_name=driver_name)
 
     try:
@@ -162,6 +446,11 @@ def invalidate_pricing_cache():
     PRICING_DATA['compute'] = {}
     PRICING_DATA['storage'] = {}
 
+    # Other threads might still be using the cached indexes so they are not
+    # closed here and they are released once they are not referenced anymore
+    PRICING_INDEXES.clear()
+    _notify_pricing_change()
+
 
 def clear_pricing_data():
     """
@@ -186,6 +475,27 @@ def invalidate_module_pricing_cache(driver_type, driver_name):
     if driver_name in PRICING_DATA[driver_type]:
         del PRICING_DATA[driver_type][driver_name]
 
+    _notify_pricing_change()
+
+
+def register_pricing_change_callback(callback):
+    """
+    Register function which is called (without arguments) when the pricing
+    data changes (pricing cache is invalidated, pricing is set using
+    :func:`set_pricing` or a new pricing file is used by
+    :class:`PricingRefresher`).
+
+    :type callback: ``callable``
+    :param callback: Function to call.
+    """
+    if callback not in PRICING_CHANGE_CALLBACKS:
+        PRICING_CHANGE_CALLBACKS.append(callback)
+
+
+def _notify_pricing_change():
+    for callback in list(PRICING_CHANGE_CALLBACKS):
+        callback()
+
 
 def download_pricing_file(file_url=DEFAULT_FILE_URL,
                           file_path=CUSTOM_PRICING_FILE_PATH):
@@ -193,13 +503,23 @@ def download_pricing_file(file_url=DEFAULT_FILE_URL,
     Download pricing file from the file_url and save it to file_path.
 
     :type file_url: ``str``
-    :param file_url: URL pointing to the pricing file.
+    :param file_url: URL pointing to the pricing file. ``file://`` URLs are
+                     also supported.
 
     :type file_path: ``str``
     :param file_path: Path where a download pricing file will be saved.
     """
-    from libcloud.utils.connection import get_response_object
+    _validate_pricing_file_path(file_path=file_path)
+
+    body = _fetch_pricing_file(file_url=file_url)
+
+    # Verify pricing file is valid
+    _parse_pricing_file(body=body)
+
+    _write_pricing_file(file_path=file_path, body=body)
 
+
+def _validate_pricing_file_path(file_path):
     dir_name = os.path.dirname(file_path)
 
     if not os.path.exists(dir_name):
@@ -213,10 +533,21 @@ def download_pricing_file(file_url=DEFAULT_FILE_URL,
                ' directory' % (file_path))
         raise ValueError(msg)
 
+
+def _fetch_pricing_file(file_url):
+    parsed_url = urlparse.urlparse(file_url)
+
+    if parsed_url.scheme == 'file':
+        with open(url2pathname(parsed_url.path)) as fp:
+            return fp.read()
+
+    from libcloud.utils.connection import get_response_object
+
     response = get_response_object(file_url)
-    body = response.body
+    return response.body
 
-    # Verify pricing file is valid
+
+def _parse_pricing_file(body):
     try:
         data = json.loads(body)
     except JSONDecodeError:
@@ -228,6 +559,197 @@ def download_pricing_file(file_url=DEFAULT_FILE_URL,
         msg = 'Provided URL doesn\'t contain valid pricing data'
         raise Exception(msg)
 
+    return data
+
+
+def _write_pricing_file(file_path, body):
+    # Write to a temporary file in the same directory and rename it so
+    # readers never see a partially written pricing file
+    tmp_file_path = '%s.%s.tmp' % (file_path, os.getpid())
+
     # No need to stream it since file is small
-    with open(file_path, 'w') as file_handle:
+    with open(tmp_file_path, 'w') as file_handle:
         file_handle.write(body)
+
+    os.replace(tmp_file_path, file_path)
+
+
+class PricingRefresher(object):
+    """
+    Periodically re-fetches the pricing file in a background thread.
+
+    The pricing file is only replaced when the ``updated`` value of the
+    downloaded file is newer than the one of the current file. If the
+    refreshed file is the one which is used by :func:`get_pricing`, cached
+    pricing tables are swapped with the new ones. Tables are replaced (and not
+    mutated) so readers are never blocked and always see either the old or
+    the new pricing.
+    """
+
+    def __init__(self, file_url=DEFAULT_FILE_URL,
+                 file_path=CUSTOM_PRICING_FILE_PATH,
+                 interval=DEFAULT_PRICING_REFRESH_INTERVAL):
+        """
+        :type file_url: ``str``
+        :param file_url: URL pointing to the pricing file. ``file://`` URLs
+                         are also supported.
+
+        :type file_path: ``str``
+        :param file_path: Path where a download pricing file will be saved.
+
+        :type interval: ``int``
+        :param interval: How often to check for a new pricing file (in
+                         seconds).
+        """
+        self.file_url = file_url
+        self.file_path = file_path
+        self.interval = interval
+
+        self.pricing_updated = None  # type: Optional[int]
+        self.last_refresh_time = None  # type: Optional[float]
+        self.last_update_time = None  # type: Optional[float]
+        self.last_error = None  # type: Optional[Exception]
+        self.refresh_count = 0
+        self.update_count = 0
+        self.error_count = 0
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None  # type: Optional[threading.Thread]
+
+    def start(self):
+        """
+        Start refreshing pricing in a background thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name='libcloud-pricing-refresher')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stop the background thread and wait for it to finish.
+        """
+        self._stop_event.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def refresh(self):
+        """
+        Check for a new pricing file and use it if it's available.
+
+        :rtype: ``bool``
+        :return: True if the pricing file has been updated.
+        """
+        with self._lock:
+            _validate_pricing_file_path(file_path=self.file_path)
+
+            body = _fetch_pricing_file(file_url=self.file_url)
+            data = _parse_pricing_file(body=body)
+
+            if self.pricing_updated is None:
+                self.pricing_updated = self._get_current_pricing_updated()
+
+            self.last_refresh_time = time.time()
+            self.refresh_count += 1
+
+            if self.pricing_updated is not None and \
+                    data['updated'] <= self.pricing_updated:
+                # Current pricing is up to date
+                return False
+
+            _write_pricing_file(file_path=self.file_path, body=body)
+            self._swap_pricing_data(data=data)
+
+            self.pricing_updated = data['updated']
+            self.last_update_time = time.time()
+            self.update_count += 1
+
+        return True
+
+    def get_metrics(self):
+        """
+        Return metrics about the pricing refreshes.
+
+        ``last_refresh_age`` and ``pricing_age`` are in seconds and are
+        None if the pricing hasn't been refreshed yet.
+
+        :rtype: ``dict``
+        """
+        now = time.time()
+
+        last_refresh_age = None
+        pricing_age = None
+
+        if self.last_refresh_time is not None:
+            last_refresh_age = now - self.last_refresh_time
+
+        if self.pricing_updated is not None:
+            pricing_age = now - self.pricing_updated
+
+        return {
+            'last_refresh_time': self.last_refresh_time,
+            'last_refresh_age': last_refresh_age,
+            'last_update_time': self.last_update_time,
+            'pricing_updated': self.pricing_updated,
+            'pricing_age': pricing_age,
+            'refresh_count': self.refresh_count,
+            'update_count': self.update_count,
+            'error_count': self.error_count,
+            'last_error': self.last_error
+        }
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                self.error_count += 1
+                self.last_error = e
+                LOG.warning('Failed to refresh pricing file from %s: %s',
+                            self.file_url, e)
+
+            self._stop_event.wait(self.interval)
+
+    def _get_current_pricing_updated(self):
+        try:
+            with open(self.file_path) as fp:
+                # pylint: disable=maybe-no-member
+                return json.loads(fp.read()).get('updated', None)
+        except (IOError, JSONDecodeError):
+            return None
+
+    def _swap_pricing_data(self, data):
+        file_path = os.path.abspath(self.file_path)
+        index_file_path = get_pricing_index_path(file_path)
+
+        if os.path.isfile(index_file_path):
+            # Keep an existing index in sync with the new pricing file
+            compile_pricing_index(pricing_file_path=file_path,
+                                  index_file_path=index_file_path)
+
+        # Other threads might still be using the old index so it's not closed
+        # here and it's released once it's not referenced anymore
+        PRICING_INDEXES.pop(index_file_path, None)
+
+        if file_path != os.path.abspath(get_pricing_file_path()):
+            # Refreshed file is not used by get_pricing
+            _notify_pricing_change()
+            return
+
+        for driver_type in VALID_PRICING_DRIVER_TYPES:
+            # Only replace tables which have already been loaded
+            loaded = PRICING_DATA[driver_type]
+            # pylint: disable=maybe-no-member
+            pricing = data.get(driver_type, {})
+            PRICING_DATA[driver_type] = dict(
+                (driver_name, pricing[driver_name]) for driver_name in loaded
+                if driver_name in pricing)
+
+        _notify_pricing_change()
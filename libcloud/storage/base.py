@@ -21,24 +21,31 @@ Provides base classes for working with storage
 from __future__ import with_statement
 
 from typing import Dict
+from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 
 import os.path                          # pylint: disable-msg=W0404
+import copy
 import hashlib
 import warnings
 import errno
+import threading
 from os.path import join as pjoin
+from concurrent.futures import ThreadPoolExecutor
 
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import b
+from libcloud.utils.misc import SlotsStateMixin
 
 import libcloud.utils.files
-from libcloud.common.types import LibcloudError
+from libcloud.common.types import InvalidCredsError, LibcloudError
 from libcloud.common.base import Connection
 from libcloud.common.base import ConnectionUserAndKey, BaseDriver
+from libcloud.common.base import AsyncPageIterator
 from libcloud.storage.types import ObjectDoesNotExistError
 
 __all__ = [
@@ -47,21 +54,31 @@ __all__ = [
     'StorageDriver',
 
     'CHUNK_SIZE',
-    'DEFAULT_CONTENT_TYPE'
+    'DEFAULT_CONTENT_TYPE',
+    'DEFAULT_DOWNLOAD_PART_SIZE',
+    'DEFAULT_DOWNLOAD_CONCURRENCY'
 ]
 
 CHUNK_SIZE = 8096
 
+# Default size of a single range (in bytes) and number of ranges which are
+# downloaded concurrently by download_object_parallel
+DEFAULT_DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+
 # Default Content-Type which is sent when uploading an object if one is not
 # supplied and can't be detected when using non-strict mode.
 DEFAULT_CONTENT_TYPE = 'application/octet-stream'
 
 
-class Object(object):
+class Object(SlotsStateMixin):
     """
     Represents an object (BLOB).
     """
 
+    __slots__ = ('name', 'size', 'hash', 'container', 'extra', 'meta_data',
+                 'driver')
+
     def __init__(self,
                  name,  # type: str
                  size,  # type: int
@@ -119,6 +136,18 @@ class Object(object):
             overwrite_existing=overwrite_existing,
             delete_on_failure=delete_on_failure)
 
+    def download_parallel(self, destination_path, part_size=None,
+                          concurrency=None, overwrite_existing=False,
+                          delete_on_failure=True):
+        # type: (str, Optional[int], Optional[int], bool, bool) -> bool
+        return self.driver.download_object_parallel(
+            obj=self,
+            destination_path=destination_path,
+            part_size=part_size,
+            concurrency=concurrency,
+            overwrite_existing=overwrite_existing,
+            delete_on_failure=delete_on_failure)
+
     def as_stream(self, chunk_size=None):
         # type: (Optional[int]) -> Iterator[bytes]
         return self.driver.download_object_as_stream(obj=self,
@@ -153,11 +182,13 @@ class Object(object):
                 (self.name, self.size, self.hash, self.driver.name))
 
 
-class Container(object):
+class Container(SlotsStateMixin):
     """
     Represents a container (bucket) which can hold multiple objects.
     """
 
+    __slots__ = ('name', 'extra', 'driver')
+
     def __init__(self,
                  name,  # type: str
                  extra,  # type: dict
@@ -296,6 +327,20 @@ class StorageDriver(BaseDriver):
         """
         return list(self.iterate_containers())
 
+    def iterate_containers_async(self):
+        # type: () -> AsyncPageIterator
+        """
+        Asyncio variant of :meth:`iterate_containers`.
+
+        Drivers with native asyncio support override this method. The default
+        implementation advances the blocking iterator in the default
+        executor.
+
+        :return: An asynchronous iterator of Container instances.
+        :rtype: :class:`libcloud.common.base.AsyncPageIterator`
+        """
+        return AsyncPageIterator.from_iterator(self.iterate_containers)
+
     def iterate_container_objects(self, container, prefix=None,
                                   ex_prefix=None):
         # type: (Container, Optional[str], Optional[str]) -> Iterator[Object]
@@ -338,6 +383,27 @@ class StorageDriver(BaseDriver):
                                                    prefix=prefix,
                                                    ex_prefix=ex_prefix))
 
+    def iterate_container_objects_async(self, container, prefix=None):
+        # type: (Container, Optional[str]) -> AsyncPageIterator
+        """
+        Asyncio variant of :meth:`iterate_container_objects`.
+
+        Drivers with native asyncio support override this method. The default
+        implementation advances the blocking iterator in the default
+        executor.
+
+        :param container: Container instance
+        :type container: :class:`libcloud.storage.base.Container`
+
+        :param prefix: Filter objects starting with a prefix.
+        :type  prefix: ``str``
+
+        :return: An asynchronous iterator of Object instances.
+        :rtype: :class:`libcloud.common.base.AsyncPageIterator`
+        """
+        return AsyncPageIterator.from_iterator(
+            lambda: self.iterate_container_objects(container, prefix=prefix))
+
     def _normalize_prefix_argument(self, prefix, ex_prefix):
         if ex_prefix:
             warnings.warn('The ``ex_prefix`` argument is deprecated - '
@@ -555,6 +621,154 @@ class StorageDriver(BaseDriver):
         raise NotImplementedError(
             'download_object_range_as_stream not implemented for this driver')
 
+    def download_object_parallel(self, obj, destination_path, part_size=None,
+                                 concurrency=None, overwrite_existing=False,
+                                 delete_on_failure=True, max_retries=2):
+        # type: (Object, str, Optional[int], Optional[int], bool, bool, int) -> bool  # noqa: E501
+        """
+        Download an object to the specified destination path by fetching
+        multiple byte ranges of the object concurrently.
+
+        Each range is written at its offset into a preallocated file. Ranges
+        which fail or are incomplete are resumed from the last written byte
+        up to ``max_retries`` times.
+
+        This method only works with drivers which support
+        ``download_object_range_as_stream``. Objects which are smaller than
+        ``part_size`` are downloaded using ``download_object``.
+
+        :param obj: Object instance.
+        :type obj: :class:`libcloud.storage.base.Object`
+
+        :param destination_path: Full path to a file or a directory where the
+                                 incoming file will be saved.
+        :type destination_path: ``str``
+
+        :param part_size: Size of a single range in bytes (defaults to
+                          ``DEFAULT_DOWNLOAD_PART_SIZE``).
+        :type part_size: ``int``
+
+        :param concurrency: Maximum number of ranges which are downloaded
+                            concurrently (defaults to
+                            ``DEFAULT_DOWNLOAD_CONCURRENCY``).
+        :type concurrency: ``int``
+
+        :param overwrite_existing: True to overwrite an existing file,
+                                   defaults to False.
+        :type overwrite_existing: ``bool``
+
+        :param delete_on_failure: True to delete a partially downloaded file if
+                                   the download was not successful.
+        :type delete_on_failure: ``bool``
+
+        :param max_retries: How many times to resume ranges which failed.
+        :type max_retries: ``int``
+
+        :return: True if an object has been successfully downloaded, False
+                 otherwise.
+        :rtype: ``bool``
+        """
+        part_size = part_size or DEFAULT_DOWNLOAD_PART_SIZE
+        concurrency = concurrency or DEFAULT_DOWNLOAD_CONCURRENCY
+
+        if part_size < 1:
+            raise ValueError('part_size must be greater than 0')
+
+        if concurrency < 1:
+            raise ValueError('concurrency must be greater than 0')
+
+        size = int(obj.size or 0)
+
+        if size <= part_size:
+            return self.download_object(obj=obj,
+                                        destination_path=destination_path,
+                                        overwrite_existing=overwrite_existing,
+                                        delete_on_failure=delete_on_failure)
+
+        file_path = self._get_destination_file_path(
+            obj=obj, destination_path=destination_path,
+            overwrite_existing=overwrite_existing)
+
+        # Preallocate the file so the ranges can be written at their offsets
+        with open(file_path, 'wb') as file_handle:
+            file_handle.truncate(size)
+
+        # List of [start offset, end offset (non-inclusive), bytes written]
+        ranges = [[start, min(start + part_size, size), 0]
+                  for start in range(0, size, part_size)]
+
+        local = threading.local()
+        drivers = []
+        drivers_lock = threading.Lock()
+
+        def download_range(part):
+            driver = getattr(local, 'driver', None)
+
+            if driver is None:
+                driver = self._get_worker_driver()
+                local.driver = driver
+
+                with drivers_lock:
+                    drivers.append(driver)
+
+            start, end, written = part
+            stream = driver.download_object_range_as_stream(
+                obj=obj, start_bytes=start + written, end_bytes=end)
+
+            with open(file_path, 'r+b') as file_handle:
+                file_handle.seek(start + written)
+
+                for chunk in stream:
+                    if part[2] + len(chunk) > end - start:
+                        raise LibcloudError(
+                            value='Received more data than requested for '
+                                  'range %s-%s' % (start, end),
+                            driver=self)
+
+                    file_handle.write(chunk)
+                    part[2] += len(chunk)
+
+        error = None
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+
+        try:
+            for _ in range(max_retries + 1):
+                pending = [part for part in ranges
+                           if part[2] < part[1] - part[0]]
+
+                if not pending:
+                    break
+
+                futures = [executor.submit(download_range, part)
+                           for part in pending]
+
+                for future in futures:
+                    exc = future.exception()
+
+                    if exc is not None:
+                        error = exc
+        finally:
+            executor.shutdown(wait=True)
+
+            for driver in drivers:
+                self._close_worker_driver(driver)
+
+        complete = all(part[2] == part[1] - part[0] for part in ranges)
+
+        if complete and os.path.getsize(file_path) == size:
+            return True
+
+        if delete_on_failure:
+            try:
+                os.unlink(file_path)
+            except Exception:
+                pass
+
+        if error is not None:
+            raise error
+
+        return False
+
     def upload_object(self, file_path, container, object_name, extra=None,
                       verify_hash=True, headers=None):
         # type: (str, Container, str, Optional[dict], bool, Optional[Dict[str, str]]) -> Object  # noqa: E501
@@ -646,6 +860,46 @@ class StorageDriver(BaseDriver):
         raise NotImplementedError(
             'delete_object not implemented for this driver')
 
+    def delete_objects(self, objs):
+        # type: (Iterable[Object]) -> Iterator[Tuple[Object, Optional[Exception]]]  # noqa: E501
+        """
+        Delete multiple objects.
+
+        Drivers which support it delete objects in batches using a single
+        HTTP request per batch. Other drivers fall back to calling
+        ``delete_object`` for each object.
+
+        Objects are consumed lazily and results are yielded as soon as they
+        are available so this method can be used with very large iterators
+        (e.g. the one returned by ``iterate_container_objects``) without
+        keeping all the objects in memory.
+
+        Keep in mind that drivers which use bulk delete API may report
+        objects which don't exist as successfully deleted.
+
+        :param objs: Objects to delete.
+        :type objs: ``iterable`` of :class:`libcloud.storage.base.Object`
+
+        :return: Generator which yields a (object, error) tuple for each
+                 object. ``error`` is ``None`` if the object has been
+                 successfully deleted and an exception instance otherwise.
+        :rtype: ``iterator`` of ``tuple``
+        """
+        for obj in objs:
+            try:
+                deleted = self.delete_object(obj)
+            except InvalidCredsError:
+                raise
+            except LibcloudError as e:
+                yield (obj, e)
+                continue
+
+            if deleted:
+                yield (obj, None)
+            else:
+                yield (obj, LibcloudError(value='Failed to delete object %s'
+                                          % (obj.name), driver=self))
+
     def create_container(self, container_name):
         # type: (str) -> Container
         """
@@ -754,23 +1008,9 @@ class StorageDriver(BaseDriver):
 
         chunk_size = chunk_size or CHUNK_SIZE
 
-        base_name = os.path.basename(destination_path)
-
-        if not base_name and not os.path.exists(destination_path):
-            raise LibcloudError(
-                value='Path %s does not exist' % (destination_path),
-                driver=self)
-
-        if not base_name:
-            file_path = pjoin(destination_path, obj.name)
-        else:
-            file_path = destination_path
-
-        if os.path.exists(file_path) and not overwrite_existing:
-            raise LibcloudError(
-                value='File %s already exists, but ' % (file_path) +
-                'overwrite_existing=False',
-                driver=self)
+        file_path = self._get_destination_file_path(
+            obj=obj, destination_path=destination_path,
+            overwrite_existing=overwrite_existing)
 
         bytes_transferred = 0
 
@@ -793,6 +1033,81 @@ class StorageDriver(BaseDriver):
 
         return True
 
+    def _get_object_batches(self, objs, batch_size, same_container=False):
+        """
+        Lazily split objects into lists of up to ``batch_size`` objects.
+
+        :param same_container: True to start a new batch when the container
+                               changes so all the objects in a batch belong
+                               to the same container.
+        :type same_container: ``bool``
+        """
+        batch = []  # type: List[Object]
+
+        for obj in objs:
+            if batch and (len(batch) >= batch_size or
+                          (same_container and
+                           obj.container.name != batch[0].container.name)):
+                yield batch
+                batch = []
+
+            batch.append(obj)
+
+        if batch:
+            yield batch
+
+    def _get_destination_file_path(self, obj, destination_path,
+                                   overwrite_existing=False):
+        """
+        Return path to the local file where the object data should be saved.
+
+        If destination path is a directory, object name is used as a file
+        name.
+        """
+        base_name = os.path.basename(destination_path)
+
+        if not base_name and not os.path.exists(destination_path):
+            raise LibcloudError(
+                value='Path %s does not exist' % (destination_path),
+                driver=self)
+
+        if not base_name:
+            file_path = pjoin(destination_path, obj.name)
+        else:
+            file_path = destination_path
+
+        if os.path.exists(file_path) and not overwrite_existing:
+            raise LibcloudError(
+                value='File %s already exists, but ' % (file_path) +
+                'overwrite_existing=False',
+                driver=self)
+
+        return file_path
+
+    def _get_worker_driver(self):
+        """
+        Return a shallow copy of this driver with its own connection which can
+        be safely used from a worker thread.
+        """
+        driver = copy.copy(self)
+        driver.connection = copy.copy(self.connection)
+        driver.connection.driver = driver
+        driver.connection.context = {}
+        driver.connection.connect()
+        driver._async_connection = None
+        return driver
+
+    def _close_worker_driver(self, driver):
+        """
+        Release pooled connections held by a driver returned by
+        ``_get_worker_driver``.
+        """
+        connection = getattr(driver.connection, 'connection', None)
+        session = getattr(connection, 'session', None)
+
+        if session is not None:
+            session.close()
+
     def _upload_object(self, object_name, content_type, request_path,
                        request_method='PUT',
                        headers=None, file_path=None, stream=None,
@@ -814,28 +1129,46 @@ class StorageDriver(BaseDriver):
         headers['Content-Type'] = self._determine_content_type(
             content_type, object_name, file_path=file_path)
 
+        # Hash is calculated on the fly while the data is being sent so the
+        # source only needs to be read once. Stream is rewound before the
+        # upload so the whole stream is uploaded and hashed.
         if stream:
-            response = self.connection.request(
-                request_path,
-                method=request_method, data=stream,
-                headers=headers, raw=True)
-            stream_hash, stream_length = self._hash_buffered_stream(
-                stream,
-                self._get_hash_function())
-        else:
-            with open(file_path, 'rb') as file_stream:
-                response = self.connection.request(
-                    request_path,
-                    method=request_method, data=file_stream,
-                    headers=headers, raw=True)
-            with open(file_path, 'rb') as file_stream:
-                stream_hash, stream_length = self._hash_buffered_stream(
-                    file_stream,
-                    self._get_hash_function())
+            self._rewind_stream(stream)
+            return self._upload_hashing_body(stream=stream,
+                                             request_path=request_path,
+                                             request_method=request_method,
+                                             headers=headers)
+
+        with open(file_path, 'rb') as file_stream:
+            return self._upload_hashing_body(stream=file_stream,
+                                             request_path=request_path,
+                                             request_method=request_method,
+                                             headers=headers)
+
+    def _upload_hashing_body(self, stream, request_path, request_method,
+                             headers):
+        """
+        Send the provided stream and calculate its hash while the data is
+        being sent.
+        """
+        body = self._get_hashing_body(stream)
+        response = self.connection.request(
+            request_path,
+            method=request_method, data=body,
+            headers=headers, raw=True)
 
         if not response.success():
             response.parse_error()
 
+            # Upload has failed so there is no point in reading the rest of
+            # the source, hash only covers the data which has been sent
+            return {'response': response,
+                    'bytes_transferred': body.bytes_read,
+                    'data_hash': body.hasher.hexdigest()}
+
+        # Data which hasn't been consumed by the HTTP client is still hashed
+        stream_hash, stream_length = body.finish()
+
         return {'response': response,
                 'bytes_transferred': stream_length,
                 'data_hash': stream_hash}
@@ -855,27 +1188,44 @@ class StorageDriver(BaseDriver):
 
         return content_type or DEFAULT_CONTENT_TYPE
 
+    def _get_hashing_body(self, stream):
+        """
+        Wrap the provided stream so the hash of the data is calculated while
+        the data is being consumed by the HTTP client.
+        """
+        hasher = self._get_hash_function()
+
+        if hasattr(stream, 'read'):
+            return libcloud.utils.files.HashingReader(stream, hasher)
+
+        return libcloud.utils.files.HashingIterator(stream, hasher)
+
+    def _rewind_stream(self, stream):
+        """
+        Ensure we start from the begining of a stream in case stream is not at
+        the beginning.
+        """
+        if not hasattr(stream, 'seek'):
+            return
+
+        try:
+            stream.seek(0)
+        except OSError as e:
+            if e.errno != errno.ESPIPE:
+                # This represents "OSError: [Errno 29] Illegal seek" error.
+                # This could either mean that the underlying handle doesn't
+                # support seek operation (e.g. pipe) or that the invalid seek
+                # position is provided. Sadly there is no good robust way to
+                # distinghuish that so we simply ignore all the "Illeal seek"
+                # errors so this function works correctly with pipes.
+                # See https://github.com/apache/libcloud/pull/1427 for details
+                raise e
+
     def _hash_buffered_stream(self, stream, hasher, blocksize=65536):
         total_len = 0
 
         if hasattr(stream, '__next__') or hasattr(stream, 'next'):
-            # Ensure we start from the begining of a stream in case stream is
-            # not at the beginning
-            if hasattr(stream, 'seek'):
-                try:
-                    stream.seek(0)
-                except OSError as e:
-                    if e.errno != errno.ESPIPE:
-                        # This represents "OSError: [Errno 29] Illegal seek"
-                        # error. This could either mean that the underlying
-                        # handle doesn't support seek operation (e.g. pipe) or
-                        # that the invalid seek position is provided. Sadly
-                        # there is no good robust way to distinghuish that so
-                        # we simply ignore all the "Illeal seek" errors so
-                        # this function works correctly with pipes.
-                        # See https://github.com/apache/libcloud/pull/1427 for
-                        # details
-                        raise e
+            self._rewind_stream(stream)
 
             for chunk in libcloud.utils.files.read_in_chunks(iterator=stream):
                 hasher.update(b(chunk))
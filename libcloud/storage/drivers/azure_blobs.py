@@ -19,6 +19,9 @@ import base64
 import hashlib
 import hmac
 import os
+import re
+import time
+import uuid
 import binascii
 from datetime import datetime, timedelta
 
@@ -33,6 +36,7 @@ from libcloud.utils.xml import fixxpath
 from libcloud.utils.files import read_in_chunks
 from libcloud.common.types import LibcloudError
 from libcloud.common.azure import AzureConnection
+from libcloud.common.azure import AZURE_TIME_FORMAT
 
 from libcloud.storage.base import Object, Container, StorageDriver
 from libcloud.storage.types import ContainerIsNotEmptyError
@@ -45,6 +49,10 @@ from libcloud.storage.types import ObjectHashMismatchError
 # Desired number of items in each response inside a paginated request
 RESPONSES_PER_REQUEST = 100
 
+# Maximum number of sub-requests which can be included in a single blob batch
+# request
+AZURE_BATCH_MAX_SUBREQUESTS = 256
+
 # According to the Azure Docs:
 # > The block must be less than or equal to 100 MB in size for version
 # > 2016-05-31 and later (4 MB for older versions).
@@ -929,6 +937,137 @@ class AzureBlobsStorageDriver(StorageDriver):
 
         return False
 
+    def delete_objects(self, objs):
+        """
+        @inherits: :class:`StorageDriver.delete_objects`
+
+        Objects are deleted using blob batch API which allows up to 256
+        objects to be deleted with a single request.
+        """
+        batches = self._get_object_batches(
+            objs, batch_size=AZURE_BATCH_MAX_SUBREQUESTS)
+
+        for batch in batches:
+            errors = self._delete_objects_batch(batch)
+
+            for index, obj in enumerate(batch):
+                yield (obj, errors.get(index, None))
+
+    def _delete_objects_batch(self, objs):
+        """
+        Delete objects using a single blob batch request.
+
+        :return: Dictionary which maps index of the object in the batch to an
+                 exception for all the objects which couldn't be deleted.
+        :rtype: ``dict``
+        """
+        boundary = 'batch_%s' % (uuid.uuid4())
+        date = time.strftime(AZURE_TIME_FORMAT, time.gmtime())
+        parts = []
+
+        for index, obj in enumerate(objs):
+            object_path = self.connection.morph_action_hook(
+                self._get_object_path(obj.container, obj.name))
+
+            # Each sub-request needs to be signed separately
+            authorization = self.connection._get_azure_auth_signature(
+                method='DELETE',
+                headers={'x-ms-date': date},
+                params={},
+                account=self.connection.user_id,
+                secret_key=self.connection.key,
+                path=object_path)
+
+            parts.append('\r\n'.join([
+                '--%s' % (boundary),
+                'Content-Type: application/http',
+                'Content-Transfer-Encoding: binary',
+                'Content-ID: %s' % (index),
+                '',
+                'DELETE %s HTTP/1.1' % (object_path),
+                'x-ms-date: %s' % (date),
+                'Authorization: %s' % (authorization),
+                'Content-Length: 0',
+                '',
+                ''
+            ]))
+
+        parts.append('--%s--\r\n' % (boundary))
+        data = ''.join(parts)
+
+        headers = {
+            'Content-Type': 'multipart/mixed; boundary=%s' % (boundary),
+            'Content-Length': len(data)
+        }
+        params = {'comp': 'batch'}
+
+        response = self.connection.request('/', method='POST', params=params,
+                                           headers=headers, data=data,
+                                           raw=True)
+
+        if response.status != httplib.ACCEPTED:
+            raise LibcloudError('Unexpected status code: %s' %
+                                (response.status), driver=self)
+
+        statuses = self._parse_batch_response(response)
+        errors = {}
+
+        for index, obj in enumerate(objs):
+            status, error_code = statuses.get(index, (None, None))
+
+            if status == httplib.ACCEPTED:
+                continue
+            elif status == httplib.NOT_FOUND:
+                errors[index] = ObjectDoesNotExistError(
+                    value=None, driver=self, object_name=obj.name)
+            else:
+                errors[index] = LibcloudError(
+                    value='Failed to delete object %s: %s (%s)' %
+                          (obj.name, error_code, status),
+                    driver=self)
+
+        return errors
+
+    def _parse_batch_response(self, response):
+        """
+        Parse multipart blob batch response.
+
+        :return: Dictionary which maps sub-request index (Content-ID) to a
+                 (status code, error code) tuple.
+        :rtype: ``dict``
+        """
+        content_type = response.headers.get('content-type', '')
+        match = re.search(r'boundary=([^;\s]+)', content_type)
+
+        if not match:
+            raise LibcloudError('Missing boundary in batch response',
+                                driver=self)
+
+        boundary = match.group(1).strip('"')
+        body = response.body
+
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+
+        result = {}
+
+        for part in body.split('--%s' % (boundary))[1:]:
+            content_id = re.search(r'^Content-ID:\s*(\d+)', part,
+                                   re.MULTILINE | re.IGNORECASE)
+            status = re.search(r'^HTTP/\d\.\d (\d+)', part, re.MULTILINE)
+
+            if not content_id or not status:
+                continue
+
+            error_code = re.search(r'^x-ms-error-code:\s*(\S+)', part,
+                                   re.MULTILINE | re.IGNORECASE)
+            error_code = error_code.group(1) if error_code else None
+
+            result[int(content_id.group(1))] = (int(status.group(1)),
+                                                error_code)
+
+        return result
+
     def _update_metadata(self, headers, meta_data):
         """
         Update the given metadata in the headers
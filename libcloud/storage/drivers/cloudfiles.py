@@ -54,6 +54,11 @@ from libcloud.common.rackspace import AUTH_URL
 CDN_HOST = 'cdn.clouddrive.com'
 API_VERSION = 'v1.0'
 
+# Maximum number of objects which are deleted using a single bulk delete
+# request. Swift default limit is 10000, but we use a lower value to keep
+# request body size reasonable.
+BULK_DELETE_MAX_OBJECTS = 1000
+
 # Keys which are used to select a correct endpoint from the service catalog.
 INTERNAL_ENDPOINT_KEY = 'internalURL'
 PUBLIC_ENDPOINT_KEY = 'publicURL'
@@ -509,6 +514,71 @@ class CloudFilesStorageDriver(StorageDriver, OpenStackDriverMixin):
 
         raise LibcloudError('Unexpected status code: %s' % (response.status))
 
+    def delete_objects(self, objs):
+        """
+        @inherits: :class:`StorageDriver.delete_objects`
+
+        Objects are deleted using Swift bulk delete middleware which allows
+        multiple objects to be deleted with a single request. Objects which
+        don't exist are reported as successfully deleted.
+        """
+        batches = self._get_object_batches(
+            objs, batch_size=BULK_DELETE_MAX_OBJECTS)
+
+        for batch in batches:
+            paths = [self._get_bulk_delete_path(obj) for obj in batch]
+            errors = self._delete_objects_batch(paths)
+
+            for obj, path in zip(batch, paths):
+                yield (obj, errors.get(path, None))
+
+    def _get_bulk_delete_path(self, obj):
+        container_name = self._encode_container_name(obj.container.name)
+        object_name = self._encode_object_name(obj.name)
+        return '/%s/%s' % (container_name, object_name)
+
+    def _delete_objects_batch(self, paths):
+        """
+        Delete objects using a single bulk delete request.
+
+        :param paths: Encoded /<container>/<object> paths of the objects to
+                      delete.
+        :type paths: ``list`` of ``str``
+
+        :return: Dictionary which maps object path to an exception for all the
+                 objects which couldn't be deleted.
+        :rtype: ``dict``
+        """
+        data = '\n'.join(paths)
+        headers = {'Content-Type': 'text/plain',
+                   'Accept': 'application/json'}
+        params = {'bulk-delete': 'true'}
+
+        response = self.connection.request('/', method='POST', params=params,
+                                           headers=headers, data=data)
+
+        if response.status != httplib.OK:
+            raise LibcloudError('Unexpected status code: %s' %
+                                (response.status), driver=self)
+
+        result = response.object or {}
+        errors = {}
+
+        for path, status in result.get('Errors', []):
+            errors[path] = LibcloudError(
+                value='Failed to delete object %s: %s' % (path, status),
+                driver=self)
+
+        response_status = result.get('Response Status', '200 OK')
+
+        if not errors and not response_status.startswith('2'):
+            raise LibcloudError('Bulk delete failed: %s %s' %
+                                (response_status,
+                                 result.get('Response Body', '')),
+                                driver=self)
+
+        return errors
+
     def ex_purge_object_from_cdn(self, obj, email=None):
         """
         Purge edge cache for the specified object.
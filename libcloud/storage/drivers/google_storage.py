@@ -27,6 +27,7 @@ from libcloud.storage.drivers.s3 import BaseS3Connection
 from libcloud.storage.drivers.s3 import BaseS3StorageDriver
 from libcloud.storage.drivers.s3 import S3RawResponse
 from libcloud.storage.drivers.s3 import S3Response
+from libcloud.storage.drivers.s3 import S3StreamingResponse
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import urlquote
 
@@ -77,6 +78,7 @@ class GoogleStorageConnection(ConnectionUserAndKey):
     host = 'storage.googleapis.com'
     responseCls = S3Response
     rawResponseCls = S3RawResponse
+    streamResponseCls = S3StreamingResponse
     PROJECT_ID_HEADER = 'x-goog-project-id'
 
     def __init__(self, user_id, key, secure=True, auth_type=None,
@@ -152,6 +154,7 @@ class GoogleStorageJSONConnection(GoogleStorageConnection):
     host = 'www.googleapis.com'
     responseCls = GCSResponse
     rawResponseCls = None
+    streamResponseCls = None
 
     def add_default_headers(self, headers):
         headers = super(GoogleStorageJSONConnection, self).add_default_headers(
@@ -197,6 +200,7 @@ class GoogleStorageDriver(BaseS3StorageDriver):
     namespace = NAMESPACE
     supports_chunked_encoding = False
     supports_s3_multipart_upload = False
+    supports_s3_multi_object_delete = False
     http_vendor_prefix = 'x-goog'
 
     def __init__(self, key, secret=None, project=None, **kwargs):
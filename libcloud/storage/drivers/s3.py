@@ -16,9 +16,11 @@
 import base64
 import hmac
 import time
+import threading
 from hashlib import sha1
 import os
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 import libcloud.utils.py3
 
@@ -38,8 +40,14 @@ from libcloud.utils.py3 import urlencode
 
 from libcloud.utils.xml import fixxpath, findtext
 from libcloud.utils.files import read_in_chunks
+from libcloud.utils.misc import RETRY_EXCEPTIONS
+from libcloud.utils.misc import intern_str
 from libcloud.common.types import InvalidCredsError, LibcloudError
+from libcloud.common.types import ProviderError
+from libcloud.common.types import MalformedResponseError
 from libcloud.common.base import ConnectionUserAndKey, RawResponse
+from libcloud.common.base import AsyncPageIterator
+from libcloud.common.base import StreamingXmlResponse
 from libcloud.common.aws import AWSBaseResponse, AWSDriver, \
     AWSTokenConnection, SignedAWSConnection, UnsignedPayloadSentinel
 
@@ -107,6 +115,22 @@ NAMESPACE = 'http://s3.amazonaws.com/doc/%s/' % (API_VERSION)
 # AWS multi-part chunks must be minimum 5MB
 CHUNK_SIZE = 5 * 1024 * 1024
 
+# Maximum number of keys which can be deleted using a single multi-object
+# delete request
+MULTI_OBJECT_DELETE_MAX_KEYS = 1000
+
+# Delay (in seconds) before the first retry of a failed multipart upload part.
+# Delay is doubled on each subsequent retry.
+MULTIPART_PART_RETRY_DELAY = 1
+
+# Status codes of the failed multipart upload part requests which indicate a
+# transient error and are retried. Other errors are raised immediately.
+MULTIPART_PART_RETRY_STATUS_CODES = [httplib.TOO_MANY_REQUESTS,
+                                     httplib.INTERNAL_SERVER_ERROR,
+                                     httplib.BAD_GATEWAY,
+                                     httplib.SERVICE_UNAVAILABLE,
+                                     httplib.GATEWAY_TIMEOUT]
+
 # Desired number of items in each response inside a paginated request in
 # ex_iterate_multipart_uploads.
 RESPONSES_PER_REQUEST = 100
@@ -138,14 +162,18 @@ class S3Response(AWSBaseResponse):
                                 'Bucket region "%s", used region "%s".' %
                                 (bucket_region, used_region),
                                 driver=S3StorageDriver)
-        raise LibcloudError('Unknown error. Status code: %d' % (self.status),
-                            driver=S3StorageDriver)
+        raise ProviderError('Unknown error. Status code: %d' % (self.status),
+                            http_code=self.status, driver=S3StorageDriver)
 
 
 class S3RawResponse(S3Response, RawResponse):
     pass
 
 
+class S3StreamingResponse(S3Response, StreamingXmlResponse):
+    pass
+
+
 class BaseS3Connection(ConnectionUserAndKey):
     """
     Represents a single connection to the S3 Endpoint
@@ -154,6 +182,7 @@ class BaseS3Connection(ConnectionUserAndKey):
     host = 's3.amazonaws.com'
     responseCls = S3Response
     rawResponseCls = S3RawResponse
+    streamResponseCls = S3StreamingResponse
 
     @staticmethod
     def get_auth_signature(method, headers, params, expires, secret_key, path,
@@ -281,10 +310,21 @@ class BaseS3StorageDriver(StorageDriver):
     hash_type = 'md5'
     supports_chunked_encoding = False
     supports_s3_multipart_upload = True
+    supports_s3_multi_object_delete = True
     ex_location_name = ''
     namespace = NAMESPACE
     http_vendor_prefix = 'x-amz'
 
+    # Size of a single part (in bytes) used with multipart uploads
+    multipart_part_size = CHUNK_SIZE
+
+    # Maximum number of parts which are uploaded concurrently. Memory usage is
+    # bound to (multipart_concurrency + 1) * multipart_part_size bytes.
+    multipart_concurrency = 1
+
+    # How many times to retry upload of a single part before giving up
+    multipart_part_retries = 2
+
     def iterate_containers(self):
         response = self.connection.request('/')
         if response.status == httplib.OK:
@@ -327,24 +367,84 @@ class BaseS3StorageDriver(StorageDriver):
             if last_key:
                 params['marker'] = last_key
 
+            # Objects are parsed while the listing page is being downloaded
+            # so only a single object element is held in memory at a time
             response = self.connection.request(container_path,
-                                               params=params)
+                                               params=params, stream=True)
 
             if response.status != httplib.OK:
                 raise LibcloudError('Unexpected status code: %s' %
                                     (response.status), driver=self)
 
-            objects = self._to_objs(obj=response.object,
-                                    xpath='Contents', container=container)
-            is_truncated = response.object.findtext(fixxpath(
-                xpath='IsTruncated', namespace=self.namespace)).lower()
-            exhausted = (is_truncated == 'false')
-
             last_key = None
-            for obj in objects:
+
+            for element in response.iterparse(xpath='Contents',
+                                              namespace=self.namespace):
+                obj = self._to_obj(element, container)
                 last_key = obj.name
                 yield obj
 
+            if response.object is None:
+                raise MalformedResponseError('Empty response body',
+                                             body=response.body, driver=self)
+
+            is_truncated = response.object.findtext(fixxpath(
+                xpath='IsTruncated', namespace=self.namespace)).lower()
+            exhausted = is_truncated == 'false' or last_key is None
+
+    def iterate_container_objects_async(self, container, prefix=None):
+        """
+        Return an asynchronous iterator of objects for the given container.
+
+        :param container: Container instance
+        :type container: :class:`Container`
+
+        :param prefix: Only return objects starting with prefix
+        :type prefix: ``str``
+
+        :return: An asynchronous iterator of Object instances.
+        :rtype: :class:`libcloud.common.base.AsyncPageIterator`
+        """
+        container_path = self._get_container_path(container)
+
+        async def fetch_page(marker):
+            params = {}
+
+            if prefix:
+                params['prefix'] = prefix
+
+            if marker:
+                params['marker'] = marker
+
+            response = await self.async_connection.request(container_path,
+                                                           params=params)
+            return self._to_container_objects_page(response=response,
+                                                   container=container)
+
+        return AsyncPageIterator(fetch_page)
+
+    def _to_container_objects_page(self, response, container):
+        """
+        Parse a single page of the object listing response.
+
+        :return: A tuple of (objects, marker for the next page). Marker is
+                 ``None`` if this is the last page.
+        :rtype: ``tuple``
+        """
+        if response.status != httplib.OK:
+            raise LibcloudError('Unexpected status code: %s' %
+                                (response.status), driver=self)
+
+        objects = self._to_objs(obj=response.object,
+                                xpath='Contents', container=container)
+        is_truncated = response.object.findtext(fixxpath(
+            xpath='IsTruncated', namespace=self.namespace)).lower()
+
+        if is_truncated == 'false' or not objects:
+            return objects, None
+
+        return objects, objects[-1].name
+
     def get_container(self, container_name):
         try:
             response = self.connection.request('/%s' % container_name,
@@ -568,7 +668,8 @@ class BaseS3StorageDriver(StorageDriver):
                         namespace=self.namespace)
 
     def _upload_multipart_chunks(self, container, object_name, upload_id,
-                                 stream, calculate_hash=True):
+                                 stream, calculate_hash=True, part_size=None,
+                                 concurrency=None):
         """
         Uploads data from an iterator in fixed sized chunks to S3
 
@@ -587,58 +688,183 @@ class BaseS3StorageDriver(StorageDriver):
         :keyword calculate_hash: Indicates if we must calculate the data hash
         :type calculate_hash: ``bool``
 
+        :keyword part_size: Size of a single part in bytes (defaults to
+                            ``multipart_part_size``).
+        :type part_size: ``int``
+
+        :keyword concurrency: Maximum number of parts which are uploaded
+                              concurrently (defaults to
+                              ``multipart_concurrency``).
+        :type concurrency: ``int``
+
         :return: A tuple of (chunk info, checksum, bytes transferred)
         :rtype: ``tuple``
         """
+        part_size = part_size or self.multipart_part_size
+        concurrency = concurrency or self.multipart_concurrency
+
+        if part_size < CHUNK_SIZE:
+            raise ValueError('part_size must be at least %s bytes' %
+                             (CHUNK_SIZE))
+
+        if concurrency < 1:
+            raise ValueError('concurrency must be greater than 0')
+
         data_hash = None
         if calculate_hash:
             data_hash = self._get_hash_function()
 
         bytes_transferred = 0
-        count = 1
+        request_path = self._get_object_path(container, object_name)
+
+        # Read the input data in chunk sizes suitable for AWS. Empty part is
+        # only uploaded if the whole stream is empty.
+        data_chunks = read_in_chunks(stream, chunk_size=part_size,
+                                     fill_size=True, yield_empty=True)
+        parts = ((part_number, data) for part_number, data
+                 in enumerate(data_chunks, start=1)
+                 if len(data) > 0 or part_number == 1)
+
+        if concurrency == 1:
+            chunks = []
+
+            for part_number, data in parts:
+                bytes_transferred += len(data)
+
+                if calculate_hash:
+                    data_hash.update(data)
+
+                server_hash = self._upload_multipart_part(
+                    self.connection, request_path, upload_id, part_number,
+                    data)
+
+                # Keep this data for a later commit
+                chunks.append((part_number, server_hash))
+        else:
+            chunks, bytes_transferred = self._upload_multipart_parts_parallel(
+                request_path, upload_id, parts, concurrency, data_hash)
+
+        if calculate_hash:
+            data_hash = data_hash.hexdigest()
+
+        return (chunks, data_hash, bytes_transferred)
+
+    def _upload_multipart_parts_parallel(self, request_path, upload_id, parts,
+                                         concurrency, data_hash=None):
+        """
+        Upload parts using a pool of worker threads.
+
+        Parts are read from the source in the calling thread and at most
+        ``concurrency`` parts are in flight at any given time so memory usage
+        stays bounded. Each worker thread uses its own connection.
+
+        :return: A tuple of (sorted chunk info, bytes transferred)
+        :rtype: ``tuple``
+        """
+        local = threading.local()
+        drivers = []
+        drivers_lock = threading.Lock()
+
+        def upload_part(part_number, data):
+            driver = getattr(local, 'driver', None)
+
+            if driver is None:
+                driver = self._get_worker_driver()
+                local.driver = driver
+
+                with drivers_lock:
+                    drivers.append(driver)
+
+            server_hash = self._upload_multipart_part(
+                driver.connection, request_path, upload_id, part_number, data)
+            return (part_number, server_hash)
+
+        bytes_transferred = 0
         chunks = []
-        params = {'uploadId': upload_id}
+        pending = set()
+        executor = ThreadPoolExecutor(max_workers=concurrency)
 
-        request_path = self._get_object_path(container, object_name)
+        try:
+            for part_number, data in parts:
+                bytes_transferred += len(data)
 
-        # Read the input data in chunk sizes suitable for AWS
-        for data in read_in_chunks(stream, chunk_size=CHUNK_SIZE,
-                                   fill_size=True, yield_empty=True):
-            bytes_transferred += len(data)
+                if data_hash is not None:
+                    data_hash.update(data)
 
-            if calculate_hash:
-                data_hash.update(data)
+                pending.add(executor.submit(upload_part, part_number, data))
 
-            chunk_hash = self._get_hash_function()
-            chunk_hash.update(data)
-            chunk_hash = base64.b64encode(chunk_hash.digest()).decode('utf-8')
+                if len(pending) >= concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
 
-            # The Content-MD5 header provides an extra level of data check and
-            # is recommended by amazon
-            headers = {
-                'Content-Length': len(data),
-                'Content-MD5': chunk_hash,
-            }
+                    for future in done:
+                        chunks.append(future.result())
 
-            params['partNumber'] = count
+            done, pending = wait(pending)
 
-            resp = self.connection.request(request_path, method='PUT',
-                                           data=data, headers=headers,
-                                           params=params)
+            for future in done:
+                chunks.append(future.result())
+        finally:
+            for future in pending:
+                future.cancel()
 
-            if resp.status != httplib.OK:
-                raise LibcloudError('Error uploading chunk', driver=self)
+            executor.shutdown(wait=True)
 
-            server_hash = resp.headers['etag'].replace('"', '')
+            for driver in drivers:
+                self._close_worker_driver(driver)
 
-            # Keep this data for a later commit
-            chunks.append((count, server_hash))
-            count += 1
+        chunks.sort(key=lambda chunk: chunk[0])
+        return (chunks, bytes_transferred)
 
-        if calculate_hash:
-            data_hash = data_hash.hexdigest()
+    def _upload_multipart_part(self, connection, request_path, upload_id,
+                               part_number, data):
+        """
+        Upload a single part of a multipart upload, retrying the upload up to
+        ``multipart_part_retries`` times on a transient failure (connection
+        error or one of ``MULTIPART_PART_RETRY_STATUS_CODES``).
 
-        return (chunks, data_hash, bytes_transferred)
+        :return: The server side hash of the uploaded part
+        :rtype: ``str``
+        """
+        chunk_hash = self._get_hash_function()
+        chunk_hash.update(data)
+        chunk_hash = base64.b64encode(chunk_hash.digest()).decode('utf-8')
+
+        # The Content-MD5 header provides an extra level of data check and
+        # is recommended by amazon
+        headers = {
+            'Content-Length': len(data),
+            'Content-MD5': chunk_hash,
+        }
+        params = {'uploadId': upload_id, 'partNumber': part_number}
+
+        retry_delay = MULTIPART_PART_RETRY_DELAY
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            try:
+                resp = connection.request(request_path, method='PUT',
+                                          data=data, headers=headers,
+                                          params=params)
+
+                if resp.status != httplib.OK:
+                    raise ProviderError('Error uploading chunk',
+                                        http_code=resp.status, driver=self)
+            except RETRY_EXCEPTIONS:
+                if attempt > self.multipart_part_retries:
+                    raise
+            except ProviderError as e:
+                # Permanent errors (e.g. upload doesn't exist anymore) are
+                # not retried
+                if attempt > self.multipart_part_retries or \
+                        e.http_code not in MULTIPART_PART_RETRY_STATUS_CODES:
+                    raise
+            else:
+                return resp.headers['etag'].replace('"', '')
+
+            time.sleep(retry_delay)
+            retry_delay *= 2
 
     def _commit_multipart(self, container, object_name, upload_id, chunks):
         """
@@ -756,6 +982,86 @@ class BaseS3StorageDriver(StorageDriver):
 
         return False
 
+    def delete_objects(self, objs):
+        """
+        @inherits: :class:`StorageDriver.delete_objects`
+
+        Objects are deleted using multi-object delete API which allows up to
+        1000 objects from the same container to be deleted with a single
+        request.
+        """
+        if not self.supports_s3_multi_object_delete:
+            for result in super(BaseS3StorageDriver, self).delete_objects(
+                    objs):
+                yield result
+            return
+
+        batches = self._get_object_batches(
+            objs, batch_size=MULTI_OBJECT_DELETE_MAX_KEYS, same_container=True)
+
+        for batch in batches:
+            errors = self._delete_objects_batch(batch)
+
+            for obj in batch:
+                yield (obj, errors.get(obj.name, None))
+
+    def _delete_objects_batch(self, objs):
+        """
+        Delete objects which belong to the same container using a single
+        multi-object delete request.
+
+        :return: Dictionary which maps object name to an exception for all the
+                 objects which couldn't be deleted.
+        :rtype: ``dict``
+        """
+        root = Element('Delete')
+        quiet = SubElement(root, 'Quiet')
+        quiet.text = 'true'
+
+        for obj in objs:
+            item = SubElement(root, 'Object')
+            key = SubElement(item, 'Key')
+            key.text = obj.name
+
+        data = tostring(root)
+
+        # Content-MD5 header is required for multi-object delete requests
+        data_hash = self._get_hash_function()
+        data_hash.update(b(data))
+        headers = {
+            'Content-Length': len(data),
+            'Content-MD5': base64.b64encode(data_hash.digest()).decode('utf-8')
+        }
+        params = {'delete': ''}
+        request_path = self._get_container_path(objs[0].container)
+
+        response = self.connection.request(request_path, method='POST',
+                                           headers=headers, params=params,
+                                           data=data)
+
+        if response.status != httplib.OK:
+            raise LibcloudError('Unexpected status code: %s' %
+                                (response.status), driver=self)
+
+        errors = {}
+
+        if not response.body:
+            return errors
+
+        error_xpath = fixxpath(xpath='Error', namespace=self.namespace)
+
+        for node in response.object.findall(error_xpath):
+            name = findtext(element=node, xpath='Key',
+                            namespace=self.namespace)
+            code = findtext(element=node, xpath='Code',
+                            namespace=self.namespace)
+            message = findtext(element=node, xpath='Message',
+                               namespace=self.namespace)
+            errors[name] = LibcloudError(value='%s: %s' % (code, message),
+                                         driver=self)
+
+        return errors
+
     def ex_iterate_multipart_uploads(self, container, prefix=None,
                                      delimiter=None):
         """
@@ -1062,11 +1368,13 @@ class BaseS3StorageDriver(StorageDriver):
         return obj
 
     def _to_obj(self, element, container):
-        owner_id = findtext(element=element, xpath='Owner/ID',
-                            namespace=self.namespace)
-        owner_display_name = findtext(element=element,
-                                      xpath='Owner/DisplayName',
-                                      namespace=self.namespace)
+        # Owner and storage class are usually the same for all the objects
+        # in a listing so they are interned to keep memory usage low
+        owner_id = intern_str(findtext(element=element, xpath='Owner/ID',
+                                       namespace=self.namespace))
+        owner_display_name = intern_str(findtext(element=element,
+                                                 xpath='Owner/DisplayName',
+                                                 namespace=self.namespace))
         meta_data = {'owner': {'id': owner_id,
                                'display_name': owner_display_name}}
         last_modified = findtext(element=element,
@@ -1074,6 +1382,12 @@ class BaseS3StorageDriver(StorageDriver):
                                  namespace=self.namespace)
         extra = {'last_modified': last_modified}
 
+        storage_class = findtext(element=element, xpath='StorageClass',
+                                 namespace=self.namespace)
+
+        if storage_class:
+            extra['storage_class'] = intern_str(storage_class)
+
         obj = Object(name=findtext(element=element, xpath='Key',
                                    namespace=self.namespace),
                      size=int(findtext(element=element, xpath='Size',
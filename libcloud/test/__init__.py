@@ -15,9 +15,12 @@
 
 import unittest
 import random
+import asyncio
+import threading
 import requests
 from libcloud.common.base import Response
 from libcloud.http import LibcloudConnection
+from libcloud.http import AsyncLibcloudConnection
 from libcloud.utils.py3 import PY2
 
 if PY2:
@@ -36,6 +39,10 @@ from libcloud.utils.py3 import urlquote
 
 XML_HEADERS = {'content-type': 'application/xml'}
 
+# requests_mock patches requests globally so mocked requests which are issued
+# from multiple threads (e.g. parallel uploads) need to be serialized
+REQUESTS_MOCK_LOCK = threading.RLock()
+
 
 class LibcloudTestCase(unittest.TestCase):
     def __init__(self, *args, **kwargs):
@@ -135,7 +142,7 @@ class MockHttp(LibcloudConnection):
         # this is to catch any special chars e.g. ~ in the request. URL
         url = urlquote(url)
 
-        with requests_mock.mock() as m:
+        with REQUESTS_MOCK_LOCK, requests_mock.mock() as m:
             m.register_uri(method, url, text=r_body, reason=r_reason,
                            headers=r_headers, status_code=r_status)
             try:
@@ -152,7 +159,7 @@ class MockHttp(LibcloudConnection):
         headers = self._normalize_headers(headers=headers)
         r_status, r_body, r_headers, r_reason = self._get_request(method, url, body, headers)
 
-        with requests_mock.mock() as m:
+        with REQUESTS_MOCK_LOCK, requests_mock.mock() as m:
             m.register_uri(method, url, text=r_body, reason=r_reason,
                            headers=r_headers, status_code=r_status)
             super(MockHttp, self).prepared_request(
@@ -221,6 +228,44 @@ class MockHttp(LibcloudConnection):
                 assert params[key] == value
 
 
+class AsyncMockHttp(AsyncLibcloudConnection):
+    """
+    A mock asyncio transport which dispatches all the requests to the regular
+    :class:`MockHttp` class specified in the ``mock_cls`` attribute.
+
+    This way the same mock methods and fixtures can be used to test the
+    asyncio driver methods.
+    """
+    mock_cls = None  # type: type
+
+    def __init__(self, host, port, secure=None, **kwargs):
+        self.mock = self.mock_cls(host, port, secure=secure, **kwargs)
+        self.host = self.mock.host
+        self.session = None
+
+    async def request(self, method, url, body=None, headers=None, raw=False,
+                      stream=False):
+        # Give other coroutines a chance to run to simulate network I/O
+        await asyncio.sleep(0)
+
+        self.mock.request(method=method, url=url, body=body,
+                          headers=headers)
+        self.response = self.mock.getresponse()
+        return self.response
+
+
+def run_async(coro):
+    """
+    Run the provided coroutine in a new event loop and return the result.
+    """
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
 class MockConnection(object):
     def __init__(self, action):
         self.action = action
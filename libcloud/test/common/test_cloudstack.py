@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import sys
+import time
 import unittest
 
 try:
@@ -26,13 +27,16 @@ from libcloud.utils.py3 import urlparse
 from libcloud.utils.py3 import b
 from libcloud.utils.py3 import parse_qsl
 
+from libcloud.common.base import JobWaiter
 from libcloud.common.cloudstack import CloudStackConnection
 from libcloud.common.types import MalformedResponseError
+from libcloud.utils.retry import RetryPolicy
 
 from libcloud.test import MockHttp
 
 
 async_delay = 0
+batch_jobs = {}
 
 
 class CloudStackMockDriver(object):
@@ -87,6 +91,70 @@ class CloudStackCommonTest(unittest.TestCase):
         self.connection._async_request('fake')
         self.assertEqual(async_delay, 0)
 
+    def test_job_waiter_batch_polling(self):
+        global batch_jobs
+        self.driver.path = '/async/batch'
+        batch_jobs = {}
+
+        jobs = [self.connection._start_async_request('deployVirtualMachine')
+                for _ in range(4)]
+
+        waiter = JobWaiter()
+        responses = waiter.wait(jobs, timeout=5)
+        waiter.shutdown()
+
+        self.assertEqual([r['jobresult'] for r in responses],
+                         [{'id': str(i)} for i in range(1, 5)])
+
+        # Job 3 is not listed by listAsyncJobs and is queried separately
+        self.assertEqual(batch_jobs['listasyncjobs'], 2)
+        self.assertEqual(batch_jobs['queryasyncjobresult'], ['3'])
+
+        # Only recent jobs are listed
+        start_time = min(job.stats.start_time for job in jobs) - 300
+        self.assertEqual(batch_jobs['startdate'],
+                         time.strftime('%Y-%m-%dT%H:%M:%S+0000',
+                                       time.gmtime(start_time)))
+
+        # Jobs are polled using a separate connection
+        self.assertTrue(batch_jobs['connection'] is not None)
+        self.assertTrue(batch_jobs['connection'] is not
+                        self.connection.connection)
+
+    def test_job_waiter_batch_polling_pagination(self):
+        global batch_jobs
+        self.driver.path = '/async/batch'
+        self.connection.poll_jobs_page_size = 2
+        batch_jobs = {}
+
+        jobs = [self.connection._start_async_request('deployVirtualMachine')
+                for _ in range(4)]
+
+        waiter = JobWaiter()
+        responses = waiter.wait(jobs, timeout=5)
+        waiter.shutdown()
+
+        self.assertEqual([r['jobresult'] for r in responses],
+                         [{'id': str(i)} for i in range(1, 5)])
+
+        # Two pages are retrieved on each poll
+        self.assertEqual(batch_jobs['listasyncjobs'], 4)
+        self.assertEqual(batch_jobs['pages'], ['1', '2', '1', '2'])
+        self.assertEqual(batch_jobs['queryasyncjobresult'], ['3'])
+
+    def test_is_idempotent_request(self):
+        self.connection.retry_policy = RetryPolicy()
+
+        # All the commands are sent using GET
+        self.assertTrue(self.connection.is_idempotent_request(
+            'GET', params={'command': 'listVirtualMachines'}))
+        self.assertTrue(self.connection.is_idempotent_request(
+            'GET', params={'command': 'queryAsyncJobResult'}))
+        self.assertFalse(self.connection.is_idempotent_request(
+            'GET', params={'command': 'deployVirtualMachine'}))
+        self.assertFalse(self.connection.is_idempotent_request(
+            'GET', params={'command': 'destroyVirtualMachine'}))
+
     def test_signature_algorithm(self):
         cases = [
             (
@@ -204,5 +272,45 @@ class CloudStackMockHttp(MockHttp, unittest.TestCase):
             result = {query['command'].lower() + 'response': {'jobid': '42'}}
         return self._response(httplib.OK, result, httplib.responses[httplib.OK])
 
+    def _async_batch(self, method, url, body, headers):
+        query = self._check_request(url)
+        command = query['command'].lower()
+
+        if command == 'deployvirtualmachine':
+            job_id = str(len(batch_jobs) + 1)
+            batch_jobs[job_id] = 1
+            result = {command + 'response': {'jobid': job_id}}
+        elif command == 'listasyncjobs':
+            self.assertEqual(query['listall'], 'true')
+            batch_jobs['listasyncjobs'] = batch_jobs.get('listasyncjobs', 0) + 1
+            batch_jobs['startdate'] = query['startdate']
+            batch_jobs['connection'] = self
+            batch_jobs.setdefault('pages', []).append(query['page'])
+            page = int(query['page'])
+            page_size = int(query['pagesize'])
+            async_jobs = []
+
+            for job_id in ['1', '2', '4'][(page - 1) * page_size:page * page_size]:
+                job = {'jobid': job_id, 'jobstatus': 0}
+
+                if batch_jobs[job_id] == 0:
+                    job['jobstatus'] = 1
+                    job['jobresult'] = {'id': job_id}
+                else:
+                    batch_jobs[job_id] -= 1
+
+                async_jobs.append(job)
+
+            result = {command + 'response': {'count': len(async_jobs),
+                                             'asyncjobs': async_jobs}}
+        else:
+            self.assertEqual(command, 'queryasyncjobresult')
+            batch_jobs.setdefault(command, []).append(query['jobid'])
+            result = {command + 'response': {'jobstatus': 1,
+                                             'jobresult': {'id': query['jobid']}}}
+
+        return self._response(httplib.OK, result, httplib.responses[httplib.OK])
+
+
 if __name__ == '__main__':
     sys.exit(unittest.main())
@@ -15,10 +15,15 @@
 """
 Tests for Google Connection classes.
 """
+import base64
 import datetime
 import mock
 import os
 import sys
+import time
+import shutil
+import tempfile
+import threading
 import unittest
 
 try:
@@ -291,6 +296,99 @@ class GoogleOAuth2CredentialTest(GoogleTestCase):
         cred.access_token
         self.assertTrue(cred._refresh_token.called)
 
+    def test_refresh_ahead_in_background(self):
+        args = list(GCE_PARAMS) + [GoogleAuthType.GCE]
+        cred = GoogleOAuth2Credential(*args)
+
+        new_token = {'access_token': 'New Token!',
+                     'expire_time': _utc_timestamp(
+                         STUB_UTCNOW + datetime.timedelta(seconds=3600))}
+
+        def refresh_token():
+            cred.token = new_token
+
+        cred._refresh_token = mock.Mock(side_effect=refresh_token)
+
+        # Token which expires soon, current token is returned and a new one
+        # is requested in the background
+        soon = STUB_UTCNOW + datetime.timedelta(
+            seconds=cred.refresh_ahead - 10)
+        cred.token = {'access_token': 'Access Token!',
+                      'expire_time': _utc_timestamp(soon)}
+        self.assertEqual(cred.access_token, 'Access Token!')
+
+        cred._refresh_thread.join()
+        self.assertEqual(cred._refresh_token.call_count, 1)
+        self.assertEqual(cred.access_token, 'New Token!')
+
+        # Background refresh is not retried right away
+        cred.token = {'access_token': 'Access Token!',
+                      'expire_time': _utc_timestamp(soon)}
+        self.assertEqual(cred.access_token, 'Access Token!')
+        cred._refresh_thread.join()
+        self.assertEqual(cred._refresh_token.call_count, 1)
+
+    def test_background_refresh_failure_is_not_fatal(self):
+        args = list(GCE_PARAMS) + [GoogleAuthType.GCE]
+        cred = GoogleOAuth2Credential(*args)
+        cred._refresh_token = mock.Mock(side_effect=ValueError('failure'))
+
+        soon = STUB_UTCNOW + datetime.timedelta(seconds=10)
+        cred.token = {'access_token': 'Access Token!',
+                      'expire_time': _utc_timestamp(soon)}
+        self.assertEqual(cred.access_token, 'Access Token!')
+
+        cred._refresh_thread.join()
+        self.assertEqual(cred._refresh_token.call_count, 1)
+        self.assertEqual(cred.access_token, 'Access Token!')
+
+    def test_no_background_refresh_without_refresh_token(self):
+        kwargs = {'auth_type': GoogleAuthType.IA}
+        cred = GoogleOAuth2Credential(*GCE_PARAMS_IA, **kwargs)
+        cred._refresh_token = mock.Mock()
+
+        soon = STUB_UTCNOW + datetime.timedelta(seconds=10)
+        cred.token = {'access_token': 'Access Token!',
+                      'expire_time': _utc_timestamp(soon)}
+        self.assertEqual(cred.access_token, 'Access Token!')
+        self.assertEqual(cred._refresh_thread, None)
+
+        cred.background_refresh = True
+        cred.token['refresh_token'] = 'refreshrefresh'
+        self.assertEqual(cred.access_token, 'Access Token!')
+        cred._refresh_thread.join()
+        self.assertEqual(cred._refresh_token.call_count, 1)
+
+    def test_expired_token_is_refreshed_once(self):
+        args = list(GCE_PARAMS) + [GoogleAuthType.GCE]
+        cred = GoogleOAuth2Credential(*args)
+
+        yesterday = STUB_UTCNOW - datetime.timedelta(days=1)
+        cred.token = {'access_token': 'Access Token!',
+                      'expire_time': _utc_timestamp(yesterday)}
+
+        def refresh_token():
+            time.sleep(0.1)
+            cred.token = {'access_token': 'New Token!',
+                          'expire_time': _utc_timestamp(
+                              STUB_UTCNOW + datetime.timedelta(hours=1))}
+
+        cred._refresh_token = mock.Mock(side_effect=refresh_token)
+
+        tokens = []
+        threads = [threading.Thread(
+            target=lambda: tokens.append(cred.access_token))
+            for _ in range(0, 5)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(cred._refresh_token.call_count, 1)
+        self.assertEqual(tokens, ['New Token!'] * 5)
+
     def test_auth_connection(self):
         # Test a bogus auth type
         self.assertRaises(GoogleAuthError, GoogleOAuth2Credential, *GCE_PARAMS,
@@ -327,6 +425,70 @@ class GoogleOAuth2CredentialTest(GoogleTestCase):
                                    GoogleGCEServiceAcctAuthConnection))
 
 
+class GoogleServiceAcctAuthConnectionTest(GoogleTestCase):
+
+    @unittest.skipIf(SHA256 is None, 'cryptography library is unavailable')
+    def test_assertion_is_reused(self):
+        conn = GoogleServiceAcctAuthConnection(*GCE_PARAMS_KEY,
+                                               scopes=['foo'])
+        conn._token_request = mock.Mock(return_value=STUB_TOKEN)
+        private_key = mock.Mock()
+        private_key.sign.return_value = b'signature'
+        conn._private_key = private_key
+
+        with mock.patch('libcloud.common.google.time.time',
+                        return_value=1000):
+            conn.get_new_token()
+            conn.get_new_token()
+
+        self.assertEqual(private_key.sign.call_count, 1)
+
+        assertion = conn._token_request.call_args_list[0][0][0]['assertion']
+        self.assertEqual(
+            conn._token_request.call_args_list[1][0][0]['assertion'],
+            assertion)
+
+        claim_set = assertion.split(b'.')[1]
+        claim_set = json.loads(base64.urlsafe_b64decode(claim_set).decode())
+        self.assertEqual(claim_set['iat'], 1000)
+        self.assertEqual(claim_set['exp'], 4600)
+        self.assertEqual(claim_set['scope'], 'foo')
+
+        # Assertion which is about to expire is signed again
+        with mock.patch('libcloud.common.google.time.time',
+                        return_value=4400):
+            conn.get_new_token()
+
+        self.assertEqual(private_key.sign.call_count, 2)
+        self.assertNotEqual(
+            conn._token_request.call_args_list[2][0][0]['assertion'],
+            assertion)
+
+
+class GoogleOAuth2CredentialFileTest(LibcloudTestCase):
+
+    def setUp(self):
+        self.tmp_path = tempfile.mkdtemp()
+        self.credential_file = os.path.join(self.tmp_path, 'credential')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_path)
+
+    def test_write_token_to_file(self):
+        with mock.patch.object(GoogleOAuth2Credential, '_get_token_from_file',
+                               return_value=STUB_TOKEN_FROM_FILE):
+            cred = GoogleOAuth2Credential(
+                *GCE_PARAMS, auth_type=GoogleAuthType.GCE,
+                credential_file=self.credential_file)
+
+        cred._write_token_to_file()
+
+        self.assertEqual(os.listdir(self.tmp_path), ['credential'])
+        self.assertEqual(os.stat(self.credential_file).st_mode & 0o777,
+                         0o600)
+        self.assertEqual(cred._get_token_from_file(), STUB_TOKEN_FROM_FILE)
+
+
 class GoogleBaseConnectionTest(GoogleTestCase):
     """
     Tests for GoogleBaseConnection
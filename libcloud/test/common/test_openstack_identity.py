@@ -13,8 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import sys
+import shutil
 import datetime
+import tempfile
 
 try:
     import simplejson as json
@@ -22,9 +25,12 @@ except ImportError:
     import json
 
 from mock import Mock
+from mock import patch
 
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import assertRaisesRegex
+from libcloud.common.base import ConnectionUserAndKey
+from libcloud.common.exceptions import BaseHTTPError
 from libcloud.common.openstack import OpenStackBaseConnection
 from libcloud.common.openstack_identity import AUTH_TOKEN_EXPIRES_GRACE_SECONDS
 from libcloud.common.openstack_identity import get_class_for_auth_version
@@ -33,6 +39,9 @@ from libcloud.common.openstack_identity import OpenStackIdentity_2_0_Connection
 from libcloud.common.openstack_identity import OpenStackIdentity_3_0_Connection
 from libcloud.common.openstack_identity import OpenStackIdentity_3_0_Connection_OIDC_access_token
 from libcloud.common.openstack_identity import OpenStackIdentityUser
+from libcloud.common.openstack_identity import OpenStackAuthCacheEntry
+from libcloud.common.openstack_identity import OpenStackMemoryAuthCache
+from libcloud.common.openstack_identity import OpenStackFileAuthCache
 from libcloud.compute.drivers.openstack import OpenStack_1_0_NodeDriver
 from libcloud.common.openstack_identity import OpenStackIdentity_2_0_Connection_VOMS
 
@@ -707,6 +716,219 @@ class OpenStackServiceCatalogTestCase(unittest.TestCase):
                                          'nova'])
 
 
+class OpenStackAuthCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        OpenStackBaseConnection.auth_url = 'https://auth.api.example.com'
+        OpenStackBaseConnection.conn_class = OpenStack_2_0_MockHttp
+        OpenStack_2_0_MockHttp.type = None
+
+        self.tmp_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        OpenStackBaseConnection.auth_url = None
+        shutil.rmtree(self.tmp_path)
+
+    def test_memory_cache_is_shared_between_connections(self):
+        cache = OpenStackMemoryAuthCache()
+        auth_method = OpenStackIdentity_2_0_Connection._authenticate_2_0_with_body
+
+        with patch.object(OpenStackIdentity_2_0_Connection,
+                          '_authenticate_2_0_with_body', autospec=True,
+                          side_effect=auth_method) as mocked_auth_method:
+            connection1 = self._get_connection(auth_cache=cache)
+            connection1._populate_hosts_and_request_paths()
+
+            connection2 = self._get_connection(auth_cache=cache)
+            connection2._populate_hosts_and_request_paths()
+
+        self.assertEqual(mocked_auth_method.call_count, 1)
+        self.assertEqual(connection1.auth_token, connection2.auth_token)
+        self.assertEqual(connection1.auth_token_expires,
+                         connection2.auth_token_expires)
+        self.assertEqual(connection1.auth_user_info,
+                         connection2.auth_user_info)
+
+        # Service catalog is only parsed once
+        self.assertTrue(connection1.service_catalog is
+                        connection2.service_catalog)
+
+    def test_cache_is_not_used_by_default(self):
+        auth_method = OpenStackIdentity_2_0_Connection._authenticate_2_0_with_body
+
+        with patch.object(OpenStackIdentity_2_0_Connection,
+                          '_authenticate_2_0_with_body', autospec=True,
+                          side_effect=auth_method) as mocked_auth_method:
+            for _ in range(0, 2):
+                connection = self._get_connection()
+                connection._populate_hosts_and_request_paths()
+
+        self.assertEqual(mocked_auth_method.call_count, 2)
+
+    def test_token_is_refreshed_ahead_of_expiration(self):
+        cache = OpenStackMemoryAuthCache(refresh_ahead=300)
+        connection = self._get_connection(auth_cache=cache)
+        key = connection.get_auth_class().get_auth_cache_key()
+
+        soon = datetime.datetime.utcnow() + datetime.timedelta(seconds=60)
+        cache.put(key, OpenStackAuthCacheEntry(auth_token='old',
+                                               expires=soon))
+
+        connection._populate_hosts_and_request_paths()
+
+        self.assertEqual(connection.auth_token,
+                         'aaaaaaaaaaaa-bbb-cccccccccccccc')
+        self.assertEqual(cache.get(key).auth_token,
+                         'aaaaaaaaaaaa-bbb-cccccccccccccc')
+
+        # Token which is stored on the connection itself is also refreshed
+        # ahead of expiration
+        osa = connection.get_auth_class()
+        osa.auth_token_expires = soon
+        self.assertFalse(connection._is_token_valid(osa))
+
+        cache.refresh_ahead = 30
+        self.assertTrue(connection._is_token_valid(osa))
+
+    def test_cached_token_is_used(self):
+        cache = OpenStackMemoryAuthCache()
+        connection = self._get_connection(auth_cache=cache)
+        key = connection.get_auth_class().get_auth_cache_key()
+
+        tomorrow = datetime.datetime.utcnow() + datetime.timedelta(1)
+        cache.put(key, OpenStackAuthCacheEntry(auth_token='cached',
+                                               expires=tomorrow, urls=[]))
+
+        connection._populate_hosts_and_request_paths()
+        self.assertEqual(connection.auth_token, 'cached')
+        self.assertEqual(connection.get_auth_class().auth_token, 'cached')
+
+    def test_cache_key(self):
+        connection = self._get_connection()
+        key = connection.get_auth_class().get_auth_cache_key()
+
+        connection = self._get_connection(ex_tenant_name='other')
+        self.assertNotEqual(key, connection.get_auth_class().get_auth_cache_key())
+
+        connection = self._get_connection(ex_force_auth_url='https://other')
+        self.assertNotEqual(key, connection.get_auth_class().get_auth_cache_key())
+
+        cache = OpenStackMemoryAuthCache()
+        self.assertEqual(len(cache.get_cache_key(key)), 64)
+        self.assertTrue(OPENSTACK_PARAMS[1] not in cache.get_cache_key(key))
+
+    def test_file_cache(self):
+        path = os.path.join(self.tmp_path, 'cache')
+        cache = OpenStackFileAuthCache(path=path)
+        connection = self._get_connection(auth_cache=cache)
+        connection._populate_hosts_and_request_paths()
+
+        key = connection.get_auth_class().get_auth_cache_key()
+        file_path = os.path.join(path, '%s.json' % (cache.get_cache_key(key)))
+        self.assertTrue(os.path.isfile(file_path))
+        self.assertEqual(os.stat(file_path).st_mode & 0o777, 0o600)
+
+        # Entry is not parsed again if the file hasn't changed
+        self.assertTrue(cache.get(key) is cache.get(key))
+
+        # New cache instance (e.g. in a different process) uses the same
+        # entry
+        cache = OpenStackFileAuthCache(path=path)
+        entry = cache.get(key)
+        self.assertEqual(entry.auth_token, connection.auth_token)
+        self.assertEqual(entry.expires, connection.auth_token_expires)
+        self.assertEqual(entry.urls, connection.get_auth_class().urls)
+
+        with patch.object(OpenStackIdentity_2_0_Connection,
+                          '_authenticate_2_0_with_body') as mocked_auth_method:
+            connection = self._get_connection(auth_cache=cache)
+            connection._populate_hosts_and_request_paths()
+
+        self.assertEqual(mocked_auth_method.call_count, 0)
+        self.assertEqual(connection.auth_token, entry.auth_token)
+        endpoint = connection.service_catalog.get_endpoint(
+            service_type='compute', name='nova', region='RegionOne')
+        self.assertTrue(endpoint.url)
+
+        # Corrupted entry is ignored
+        with open(file_path, 'w') as fp:
+            fp.write('{invalid')
+
+        self.assertEqual(OpenStackFileAuthCache(path=path).get(key), None)
+
+        cache.delete(key)
+        self.assertFalse(os.path.exists(file_path))
+        self.assertEqual(cache.get(key), None)
+
+        cache.put(key, entry)
+
+        with cache.lock(key):
+            pass
+
+        cache.clear()
+        self.assertEqual(cache.get(key), None)
+        self.assertEqual(os.listdir(path), [])
+
+    def test_revoked_cached_token_is_evicted(self):
+        cache = OpenStackMemoryAuthCache()
+        connection = self._get_connection(auth_cache=cache)
+        key = connection.get_auth_class().get_auth_cache_key()
+
+        tomorrow = datetime.datetime.utcnow() + datetime.timedelta(1)
+        cache.put(key, OpenStackAuthCacheEntry(auth_token='revoked',
+                                               expires=tomorrow, urls=[]))
+        connection._populate_hosts_and_request_paths()
+        self.assertEqual(connection.auth_token, 'revoked')
+
+        error = BaseHTTPError(code=httplib.UNAUTHORIZED,
+                              message='Unauthorized')
+
+        with patch.object(ConnectionUserAndKey, 'request',
+                          side_effect=[error, 'response']) as mocked_request:
+            self.assertEqual(connection.request('/servers'), 'response')
+
+        self.assertEqual(mocked_request.call_count, 2)
+        self.assertEqual(cache.get(key), None)
+        self.assertEqual(connection.auth_token, None)
+
+        # New token is requested and stored in the cache
+        connection._populate_hosts_and_request_paths()
+        self.assertEqual(connection.auth_token,
+                         'aaaaaaaaaaaa-bbb-cccccccccccccc')
+        self.assertEqual(cache.get(key).auth_token,
+                         'aaaaaaaaaaaa-bbb-cccccccccccccc')
+
+        # Request is only retried once
+        with patch.object(ConnectionUserAndKey, 'request',
+                          side_effect=[error, error]) as mocked_request:
+            self.assertRaises(BaseHTTPError, connection.request, '/servers')
+
+        self.assertEqual(mocked_request.call_count, 2)
+
+    def test_unauthorized_error_without_auth_cache_is_not_retried(self):
+        connection = self._get_connection()
+        connection._populate_hosts_and_request_paths()
+
+        error = BaseHTTPError(code=httplib.UNAUTHORIZED,
+                              message='Unauthorized')
+
+        with patch.object(ConnectionUserAndKey, 'request',
+                          side_effect=[error]) as mocked_request:
+            self.assertRaises(BaseHTTPError, connection.request, '/servers')
+
+        self.assertEqual(mocked_request.call_count, 1)
+        self.assertEqual(connection.auth_token,
+                         'aaaaaaaaaaaa-bbb-cccccccccccccc')
+
+    def _get_connection(self, auth_cache=None, **kwargs):
+        connection = OpenStackBaseConnection(*OPENSTACK_PARAMS,
+                                             ex_force_auth_version='2.0',
+                                             ex_auth_cache=auth_cache,
+                                             **kwargs)
+        connection._ex_force_base_url = 'https://www.foo.com'
+        connection.driver = OpenStack_1_0_NodeDriver(*OPENSTACK_PARAMS)
+        return connection
+
+
 class OpenStackIdentity_2_0_MockHttp(MockHttp):
     fixtures = ComputeFileFixtures('openstack_identity/v2')
     json_content_headers = {'content-type': 'application/json; charset=UTF-8'}
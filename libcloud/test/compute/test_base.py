@@ -20,6 +20,8 @@ from libcloud.common.types import LibcloudError
 from libcloud.compute.base import Node, NodeSize, NodeImage, NodeDriver, StorageVolume
 from libcloud.compute.base import NodeAuthSSHKey, NodeAuthPassword
 from libcloud.compute.types import StorageVolumeState
+from libcloud.compute.drivers.dummy import DummyNodeDriver
+from libcloud.test import run_async
 
 
 class FakeDriver(object):
@@ -42,6 +44,25 @@ class BaseTests(unittest.TestCase):
     def test_base_storage_volume(self):
         StorageVolume(id="0", name="0", size=10, driver=FakeDriver(), state=StorageVolumeState.AVAILABLE)
 
+    def test_base_objects_use_slots(self):
+        node = Node(id=0, name=0, state=0, public_ips=0, private_ips=0,
+                    driver=FakeDriver())
+        image = NodeImage(id=0, name=0, driver=FakeDriver())
+
+        for obj in [node, image]:
+            self.assertFalse(hasattr(obj, '__dict__'))
+            self.assertRaises(AttributeError, setattr, obj, 'foo', 'bar')
+
+        # Subclasses which don't define __slots__ can use arbitrary attributes
+        class CustomNode(Node):
+            pass
+
+        node = CustomNode(id=0, name=0, state=0, public_ips=0, private_ips=0,
+                          driver=FakeDriver())
+        node.foo = 'bar'
+        self.assertEqual(node.foo, 'bar')
+        self.assertEqual(node.get_uuid(), node.uuid)
+
     def test_base_node_driver(self):
         NodeDriver('foo')
 
@@ -54,6 +75,12 @@ class BaseTests(unittest.TestCase):
     def test_base_connection_timeout(self):
         Connection(timeout=10)
 
+    def test_list_nodes_async_fallback(self):
+        driver = DummyNodeDriver(0)
+        nodes = run_async(driver.list_nodes_async())
+        self.assertEqual([node.id for node in nodes],
+                         [node.id for node in driver.list_nodes()])
+
 
 class TestValidateAuth(unittest.TestCase):
 
@@ -47,7 +47,7 @@ from libcloud.test.secrets import RACKSPACE_PARAMS
 # create_node()
 DEPLOY_NODE_KWARGS = ['deploy', 'ssh_username', 'ssh_alternate_usernames',
                       'ssh_port', 'ssh_timeout', 'ssh_key', 'timeout',
-                      'max_tries', 'ssh_interface']
+                      'max_tries', 'ssh_interface', 'ssh_client_pool']
 
 FILE_PATH = '{0}home{0}ubuntu{0}relative.sh'.format(os.path.sep)
 
@@ -361,6 +361,81 @@ class DeploymentTests(unittest.TestCase):
         self.assertEqual(['67.23.21.33'], nodes[0][1])
         self.assertEqual(['67.23.21.34'], nodes[1][1])
 
+    def test_wait_until_running_uses_targeted_lookups(self):
+        def get_node(node, state, public_ips):
+            return Node(id=node.id, name=node.name, state=state,
+                        public_ips=public_ips, private_ips=[],
+                        driver=self.driver)
+
+        responses = [
+            [get_node(self.node, NodeState.PENDING, []),
+             get_node(self.node2, NodeState.PENDING, [])],
+            [get_node(self.node, NodeState.RUNNING, ['1.2.3.4']),
+             get_node(self.node2, NodeState.PENDING, [])],
+            [get_node(self.node2, NodeState.RUNNING, ['1.2.3.5'])]
+        ]
+        calls = []
+
+        def get_nodes(nodes):
+            calls.append(sorted([node.id for node in nodes]))
+            return responses[len(calls) - 1]
+
+        self.driver._get_nodes = get_nodes
+        self.driver.list_nodes = Mock()
+        callback = Mock()
+
+        nodes = self.driver.wait_until_running(
+            nodes=[self.node, self.node2], wait_period=0.01, timeout=1,
+            ex_progress_callback=callback)
+
+        # Only the nodes which are not running yet are looked up
+        self.assertEqual(calls, [['12345', '123456'], ['12345', '123456'],
+                                 ['123456']])
+        self.assertEqual(self.driver.list_nodes.call_count, 0)
+        self.assertEqual([node.uuid for node, _ in nodes],
+                         [self.node.uuid, self.node2.uuid])
+        self.assertEqual([ips for _, ips in nodes],
+                         [['1.2.3.4'], ['1.2.3.5']])
+        self.assertEqual(callback.call_count, 2)
+        self.assertEqual(callback.call_args_list[0][0][0].uuid,
+                         self.node.uuid)
+        self.assertEqual(callback.call_args_list[1][0][0].uuid,
+                         self.node2.uuid)
+
+    def test_wait_until_running_list_nodes_kwargs(self):
+        self.driver._get_nodes = Mock()
+        self.driver.list_nodes = Mock(return_value=[
+            Node(id=self.node.id, name=self.node.name,
+                 state=NodeState.RUNNING, public_ips=['1.2.3.4'],
+                 private_ips=[], driver=self.driver)])
+
+        nodes = self.driver.wait_until_running(
+            nodes=[self.node], wait_period=0.01, timeout=1,
+            ex_list_nodes_kwargs={'ex_node_ids': ['12345']})
+
+        # All the nodes are listed when list_nodes arguments are provided
+        self.assertEqual(self.driver._get_nodes.call_count, 0)
+        self.driver.list_nodes.assert_called_once_with(ex_node_ids=['12345'])
+        self.assertEqual([node.uuid for node, _ in nodes], [self.node.uuid])
+
+    @patch('libcloud.compute.base.time')
+    def test_wait_until_running_backs_off(self, mock_time):
+        clock = [0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        mock_time.time.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = sleep
+        RackspaceMockHttp.type = 'TIMEOUT'
+
+        self.assertRaises(LibcloudError, self.driver.wait_until_running,
+                          nodes=[self.node], wait_period=1, timeout=10,
+                          ex_max_wait_period=3)
+
+        delays = [c[0][0] for c in mock_time.sleep.call_args_list]
+        self.assertEqual(delays[:5], [1, 1.5, 2.25, 3, 2.25])
+
     def test_ssh_client_connect_success(self):
         mock_ssh_client = Mock()
         mock_ssh_client.return_value = None
@@ -672,6 +747,101 @@ class DeploymentTests(unittest.TestCase):
         node = self.driver.deploy_node(deploy=Mock())
         self.assertEqual(self.node.id, node.id)
 
+    @patch('libcloud.compute.base.SSHClient')
+    @patch('libcloud.compute.ssh')
+    def test_deploy_node_ssh_client_pool(self, mock_ssh_module,
+                                         mock_ssh_client_cls):
+        self.driver.create_node = Mock()
+        self.driver.create_node.return_value = self.node
+        mock_ssh_module.have_paramiko = True
+
+        pool = Mock()
+        pool.get.return_value = None
+        ssh_client = mock_ssh_client_cls.return_value
+
+        # New connection is added to the pool and kept open
+        self.driver.deploy_node(deploy=Mock(), ssh_client_pool=pool)
+        self.assertEqual(mock_ssh_client_cls.call_count, 1)
+        pool.add.assert_called_once_with(ssh_client)
+        self.assertEqual(ssh_client.close.call_count, 0)
+
+        # Connection from the pool is re-used
+        pool.get.return_value = ssh_client
+        self.driver.deploy_node(deploy=Mock(), ssh_client_pool=pool)
+        self.assertEqual(mock_ssh_client_cls.call_count, 1)
+        self.assertEqual(pool.add.call_count, 1)
+        self.assertEqual(ssh_client.connect.call_count, 1)
+        self.assertEqual(ssh_client.close.call_count, 0)
+
+        pool.get.assert_called_with(hostname='67.23.21.33', port=22,
+                                    username='root', password=None,
+                                    key_files=None)
+
+    @patch('libcloud.compute.ssh')
+    def test_deploy_nodes(self, mock_ssh_module):
+        RackspaceMockHttp.type = 'MULTIPLE_NODES'
+        mock_ssh_module.have_paramiko = True
+
+        create_error = Exception('quota exceeded')
+        self.driver.create_node = Mock(side_effect=[self.node, create_error,
+                                                    self.node2])
+
+        def run_deployment_script(task, node, ssh_hostname, **kwargs):
+            if ssh_hostname == '67.23.21.34':
+                raise Exception('connection refused')
+
+            return node
+
+        self.driver._connect_and_run_deployment_script = Mock(
+            side_effect=run_deployment_script)
+
+        deploy = ScriptDeployment(script='echo 1')
+        results = self.driver.deploy_nodes(deploy=deploy, count=3,
+                                           name='web', image='image',
+                                           max_workers=2)
+
+        self.assertEqual(len(results), 3)
+        names = [c[1]['name'] for c in
+                 self.driver.create_node.call_args_list]
+        self.assertEqual(names, ['web-1', 'web-2', 'web-3'])
+
+        # Each node is deployed using its own copy of the deployment
+        deployments = [result[1] for result in results]
+        self.assertTrue(deploy not in deployments)
+        self.assertEqual(len(set([id(d) for d in deployments])), 3)
+
+        node, _, error = results[0]
+        self.assertEqual(node.uuid, self.node.uuid)
+        self.assertTrue(error is None)
+
+        node, _, error = results[1]
+        self.assertTrue(node is None)
+        self.assertEqual(error, create_error)
+
+        node, _, error = results[2]
+        self.assertEqual(node.uuid, self.node2.uuid)
+        self.assertTrue(isinstance(error, DeploymentError))
+        self.assertEqual(error.node.uuid, self.node2.uuid)
+        self.assertTrue('connection refused' in str(error.value))
+
+    @patch('libcloud.compute.ssh')
+    def test_deploy_nodes_node_not_running(self, mock_ssh_module):
+        RackspaceMockHttp.type = 'TIMEOUT'
+        mock_ssh_module.have_paramiko = True
+
+        self.driver.create_node = Mock(return_value=self.node)
+        self.driver._connect_and_run_deployment_script = Mock()
+
+        results = self.driver.deploy_nodes(deploy=Mock(), count=1,
+                                           timeout=0.1)
+
+        self.assertEqual(len(results), 1)
+        node, _, error = results[0]
+        self.assertTrue(isinstance(error, DeploymentError))
+        self.assertTrue('Timed out' in str(error.value))
+        self.assertEqual(
+            self.driver._connect_and_run_deployment_script.call_count, 0)
+
     @patch('libcloud.compute.base.SSHClient')
     @patch('libcloud.compute.ssh')
     def test_exception_is_thrown_is_paramiko_is_not_available(self,
@@ -16,36 +16,52 @@
 from __future__ import with_statement
 
 from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, HTTPServer
 
 import os
+import socket
+import asyncio
+import mock
 import sys
+import threading
 import base64
 from datetime import datetime
 from libcloud.utils.iso8601 import UTC
 
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import parse_qs
+from libcloud.utils.py3 import urlparse
 from libcloud.utils.py3 import b
 
+from libcloud.pricing import set_pricing, clear_pricing_data
+from libcloud.pricing import invalidate_pricing_cache
+from libcloud.pricing import PricingRefresher
+
 from libcloud.compute.drivers.ec2 import EC2NodeDriver
 from libcloud.compute.drivers.ec2 import EC2PlacementGroup
 from libcloud.compute.drivers.ec2 import NimbusNodeDriver, EucNodeDriver
 from libcloud.compute.drivers.ec2 import OutscaleSASNodeDriver
 from libcloud.compute.drivers.ec2 import IdempotentParamError
 from libcloud.compute.drivers.ec2 import REGION_DETAILS, VALID_EC2_REGIONS
+from libcloud.compute.drivers.ec2 import INSTANCE_TYPES
+from libcloud.compute.drivers.ec2 import clear_sizes_cache
 from libcloud.compute.drivers.ec2 import ExEC2AvailabilityZone
 from libcloud.compute.drivers.ec2 import EC2NetworkSubnet
 from libcloud.compute.base import Node, NodeImage, NodeSize, NodeLocation
+from libcloud.utils.retry import RetryPolicy
+from libcloud.common.exceptions import BaseHTTPError
 from libcloud.compute.base import StorageVolume, VolumeSnapshot
 from libcloud.compute.types import KeyPairDoesNotExistError, StorageVolumeState, \
     VolumeSnapshotState
 
 from libcloud.test import MockHttp, LibcloudTestCase
+from libcloud.test import AsyncMockHttp, run_async
 from libcloud.test.compute import TestCaseMixin
 from libcloud.test.file_fixtures import ComputeFileFixtures
 
 from libcloud.test import unittest
 from libcloud.test.secrets import EC2_PARAMS
+from libcloud.http import have_aiohttp
 
 
 null_fingerprint = '00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:' + \
@@ -97,6 +113,9 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
     image_name = 'ec2-public-images/fedora-8-i386-base-v1.04.manifest.xml'
     region = 'us-east-1'
 
+    # Number of DescribeAddresses requests made by iterate_nodes
+    describe_addresses_calls = 1
+
     def setUp(self):
         EC2MockHttp.test = self
         EC2NodeDriver.connectionCls.conn_class = EC2MockHttp
@@ -237,6 +256,90 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
         self.assertEqual(node.id, 'i-2ba64342')
         self.assertEqual(node.name, 'foo')
 
+    def test_list_nodes_async(self):
+        self.driver.async_connection.conn_class = type(
+            'AsyncEC2MockHttp', (AsyncMockHttp, ), {'mock_cls': EC2MockHttp})
+
+        async def list_nodes():
+            # Multiple concurrent calls share the same connection
+            return await asyncio.gather(self.driver.list_nodes_async(),
+                                        self.driver.list_nodes_async())
+
+        nodes1, nodes2 = run_async(list_nodes())
+        expected = self.driver.list_nodes()
+
+        for nodes in (nodes1, nodes2):
+            self.assertEqual([node.id for node in nodes],
+                             [node.id for node in expected])
+            self.assertEqual(sorted(nodes[0].public_ips),
+                             sorted(expected[0].public_ips))
+
+    @unittest.skipIf(not have_aiohttp, 'aiohttp is not available')
+    def test_list_nodes_async_multiple_event_loops(self):
+        fixtures = ComputeFileFixtures('ec2')
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse.urlparse(self.path).query)
+                action = query['Action'][0]
+                fixture = {
+                    'DescribeInstances': 'describe_instances.xml',
+                    'DescribeAddresses': 'describe_addresses_multi.xml'
+                }[action]
+                body = b(fixtures.load(fixture))
+
+                self.send_response(httplib.OK)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), RequestHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        driver = EC2NodeDriver(*EC2_PARAMS, region=self.region,
+                               host='127.0.0.1', port=server.server_port,
+                               secure=False)
+
+        async def list_nodes():
+            return await driver.list_nodes_async()
+
+        def run(coro):
+            loop = asyncio.new_event_loop()
+
+            try:
+                return loop.run_until_complete(coro)
+            finally:
+                loop.close()
+
+        # Each call uses a new event loop and aiohttp session can't be shared
+        # between the loops
+        with mock.patch.dict(os.environ):
+            os.environ.pop('http_proxy', None)
+            os.environ.pop('https_proxy', None)
+
+            nodes1 = run(list_nodes())
+            session1 = driver.async_connection.connection.session
+            nodes2 = run(list_nodes())
+            session2 = driver.async_connection.connection.session
+
+        self.assertEqual(nodes1[0].id, 'i-4382922a')
+        self.assertEqual([node.id for node in nodes2],
+                         [node.id for node in nodes1])
+
+        # Session of the previous loop has been closed
+        self.assertTrue(session1 is not session2)
+        self.assertTrue(session1.closed)
+
+        run(driver.close_async())
+        self.assertTrue(session2.closed)
+
     def test_list_nodes(self):
         node = self.driver.list_nodes()[0]
         public_ips = sorted(node.public_ips)
@@ -282,6 +385,31 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
         self.assertIn('instance_type', ret_node1.extra)
         self.assertIn('instance_type', ret_node2.extra)
 
+    def test_get_nodes(self):
+        nodes = [Node('i-4382922a', None, None, None, None, self.driver),
+                 Node('i-8474834a', None, None, None, None, self.driver)]
+        result = self.driver._get_nodes(nodes)
+        self.assertEqual([node.id for node in result],
+                         ['i-4382922a', 'i-8474834a'])
+
+    def test_get_nodes_node_not_visible_yet(self):
+        nodes = [Node('i-4382922a', None, None, None, None, self.driver),
+                 Node('i-missing', None, None, None, None, self.driver)]
+
+        def list_nodes(ex_node_ids):
+            if 'i-missing' in ex_node_ids:
+                raise BaseHTTPError(code=400, message=(
+                    'InvalidInstanceID.NotFound: The instance ID '
+                    'i-missing does not exist'))
+            return [nodes[0]]
+
+        with mock.patch.object(self.driver, 'list_nodes',
+                               side_effect=list_nodes) as mock_list_nodes:
+            result = self.driver._get_nodes(nodes)
+
+        self.assertEqual(result, [nodes[0]])
+        self.assertEqual(mock_list_nodes.call_count, 3)
+
     def test_ex_list_reserved_nodes(self):
         node = self.driver.ex_list_reserved_nodes()[0]
         self.assertEqual(node.id, '93bbbca2-c500-49d0-9ede-9d8737400498')
@@ -442,6 +570,120 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
             self.assertNotEqual(len(sizes), 0)
         self.driver.region_name = region_old
 
+    def test_list_sizes_are_cached(self):
+        clear_sizes_cache()
+        driver = self.driver
+
+        with mock.patch.object(driver, '_get_region_sizes',
+                               wraps=driver._get_region_sizes) as \
+                mock_get_region_sizes:
+            sizes1 = driver.list_sizes()
+            self.assertEqual(mock_get_region_sizes.call_count, 1)
+
+            # Second call doesn't rebuild sizes or look up prices
+            with mock.patch.object(driver, '_get_size_price') as \
+                    mock_get_size_price:
+                sizes2 = driver.list_sizes()
+
+            self.assertEqual(mock_get_region_sizes.call_count, 1)
+            self.assertEqual(mock_get_size_price.call_count, 0)
+
+        self.assertEqual(len(sizes1), len(sizes2))
+        self.assertTrue(all([s1 is s2 for s1, s2 in zip(sizes1, sizes2)]))
+
+        # Modifying the returned list doesn't affect subsequent calls
+        sizes2.pop()
+        self.assertEqual(len(driver.list_sizes()), len(sizes1))
+
+        # Driver with a different region gets its own sizes
+        driver = EC2NodeDriver(*EC2_PARAMS, **{'region': 'cn-north-1'})
+        sizes3 = driver.list_sizes()
+        self.assertTrue(all([s.driver is driver for s in sizes3]))
+        self.assertTrue(all([s.price is None for s in sizes3]))
+
+    def test_list_sizes_cache_is_cleared_when_pricing_changes(self):
+        self.addCleanup(clear_pricing_data)
+        sizes1 = self.driver.list_sizes()
+
+        invalidate_pricing_cache()
+        sizes2 = self.driver.list_sizes()
+        self.assertTrue(sizes1[0] is not sizes2[0])
+
+        set_pricing('compute', 'some_driver', {'m1.small': 1.5})
+        sizes3 = self.driver.list_sizes()
+        self.assertTrue(sizes2[0] is not sizes3[0])
+
+        # Refreshing the pricing file also clears the cache
+        refresher = PricingRefresher(file_path=os.path.join(
+            os.path.dirname(__file__), 'not-used-pricing.json'))
+        refresher._swap_pricing_data({'compute': {}, 'storage': {}})
+        sizes4 = self.driver.list_sizes()
+        self.assertTrue(sizes3[0] is not sizes4[0])
+
+    def test_list_sizes_use_current_pricing_data(self):
+        api_name = self.driver.api_name
+        self.addCleanup(clear_pricing_data)
+
+        set_pricing('compute', api_name, {'m1.small': 1.5})
+        sizes = dict([(s.id, s) for s in self.driver.list_sizes()])
+        self.assertEqual(sizes['m1.small'].price, 1.5)
+
+        set_pricing('compute', api_name, {'m1.small': 2.5})
+        sizes = dict([(s.id, s) for s in self.driver.list_sizes()])
+        self.assertEqual(sizes['m1.small'].price, 2.5)
+
+    def test_instance_types_mapping(self):
+        self.assertTrue('m1.small' in INSTANCE_TYPES)
+        self.assertEqual(INSTANCE_TYPES['m1.small']['id'], 'm1.small')
+        self.assertEqual(len(INSTANCE_TYPES), len(list(INSTANCE_TYPES)))
+
+    def test_client_token_requests_are_idempotent(self):
+        connection = self.driver.connection
+        connection.retry_policy = RetryPolicy()
+
+        try:
+            self.assertTrue(connection.is_idempotent_request('GET'))
+            self.assertFalse(connection.is_idempotent_request(
+                'POST', params={'Action': 'RunInstances'}))
+            self.assertTrue(connection.is_idempotent_request(
+                'POST', params={'Action': 'RunInstances',
+                                'ClientToken': 'token'}))
+            # All the actions are sent using GET
+            self.assertFalse(connection.is_idempotent_request(
+                'GET', params={'Action': 'RunInstances'}))
+            self.assertFalse(connection.is_idempotent_request(
+                'GET', params={'Action': 'TerminateInstances'}))
+            self.assertTrue(connection.is_idempotent_request(
+                'GET', params={'Action': 'DescribeInstances'}))
+            self.assertTrue(connection.is_idempotent_request(
+                'GET', params={'Action': 'GetConsoleOutput'}))
+        finally:
+            connection.retry_policy = None
+
+    @mock.patch('libcloud.utils.retry.time.sleep')
+    def test_non_idempotent_actions_are_not_retried(self, mock_sleep):
+        connection = self.driver.connection
+        connection.retry_policy = RetryPolicy(max_attempts=3)
+
+        try:
+            with mock.patch.object(connection, '_send_request',
+                                   side_effect=socket.timeout()) \
+                    as mock_send_request:
+                self.assertRaises(socket.timeout, connection.request, '/',
+                                  params={'Action': 'RunInstances'})
+                self.assertEqual(mock_send_request.call_count, 1)
+
+                self.assertRaises(socket.timeout, connection.request, '/',
+                                  params={'Action': 'RunInstances',
+                                          'ClientToken': 'token'})
+                self.assertEqual(mock_send_request.call_count, 4)
+
+                self.assertRaises(socket.timeout, connection.request, '/',
+                                  params={'Action': 'DescribeInstances'})
+                self.assertEqual(mock_send_request.call_count, 7)
+        finally:
+            connection.retry_policy = None
+
     def test_ex_create_node_with_ex_iam_profile(self):
         iamProfile = {
             'id': 'AIDGPMS9RO4H3FEXAMPLE',
@@ -481,6 +723,36 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
                                        ex_spot=True, ex_spot_max_price=1.5)
         self.assertEqual(node.extra['instance_lifecycle'], 'spot')
 
+    def test_iterate_nodes_pagination(self):
+        expected = self.driver.list_nodes()
+
+        EC2MockHttp.type = 'paginated'
+
+        with mock.patch.object(EC2MockHttp, '_paginated_DescribeAddresses',
+                               autospec=True,
+                               side_effect=EC2MockHttp._DescribeAddresses) \
+                as mock_describe_addresses:
+            nodes = list(self.driver.iterate_nodes(ex_page_size=5))
+
+        # Elastic IP addresses are only retrieved once for all the pages
+        self.assertEqual(mock_describe_addresses.call_count,
+                         self.describe_addresses_calls)
+        self.assertEqual(len(nodes), 2 * len(expected))
+        self.assertEqual([node.id for node in nodes],
+                         [node.id for node in expected] * 2)
+        self.assertEqual(sorted(nodes[0].public_ips),
+                         sorted(expected[0].public_ips))
+
+    def test_iterate_images_pagination(self):
+        EC2MockHttp.type = 'paginated'
+        images = self.driver.iterate_images(ex_owner='all', ex_page_size=5)
+        self.assertFalse(isinstance(images, list))
+
+        images = list(images)
+        self.assertEqual(len(images), 4)
+        self.assertEqual([image.id for image in images],
+                         ['ami-57ba933a', 'ami-85b2a8ae'] * 2)
+
     def test_list_images(self):
         images = self.driver.list_images()
 
@@ -863,6 +1135,14 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
         result = self.driver.ex_change_node_size(node=node, new_size=size)
         self.assertTrue(result)
 
+    def test_iterate_volumes_pagination(self):
+        EC2MockHttp.type = 'paginated'
+        volumes = list(self.driver.iterate_volumes(ex_page_size=5))
+
+        self.assertEqual(len(volumes), 6)
+        self.assertEqual(volumes[0].id, 'vol-10ae5e2b')
+        self.assertEqual(volumes[3].id, 'vol-10ae5e2b')
+
     def test_list_volumes(self):
         volumes = self.driver.list_volumes()
 
@@ -1383,6 +1663,32 @@ class EC2MockHttp(MockHttp, unittest.TestCase):
         body = self.fixtures.load('describe_instances.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _paginated_DescribeInstances(self, method, url, body, headers):
+        return self._load_page('describe_instances.xml', url)
+
+    def _paginated_DescribeAddresses(self, method, url, body, headers):
+        return self._DescribeAddresses(method, url, body, headers)
+
+    def _paginated_DescribeImages(self, method, url, body, headers):
+        return self._load_page('describe_images.xml', url)
+
+    def _paginated_DescribeVolumes(self, method, url, body, headers):
+        return self._load_page('describe_volumes.xml', url)
+
+    def _load_page(self, fixture, url):
+        # First page is returned with a nextToken element and the second
+        # page is the plain fixture
+        self.assertUrlContainsQueryParams(url, {'MaxResults': '5'})
+        body = self.fixtures.load(fixture)
+
+        if 'NextToken=' in url:
+            self.assertUrlContainsQueryParams(url, {'NextToken': 'page2'})
+        else:
+            index = body.rindex('</')
+            body = body[:index] + '<nextToken>page2</nextToken>' + body[index:]
+
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
     def _DescribeReservedInstances(self, method, url, body, headers):
         body = self.fixtures.load('describe_reserved_instances.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
@@ -1845,6 +2151,8 @@ class EucMockHttp(EC2MockHttp):
 
 
 class NimbusTests(EC2Tests):
+    # Nimbus doesn't support elastic IPs
+    describe_addresses_calls = 0
 
     def setUp(self):
         NimbusNodeDriver.connectionCls.conn_class = EC2MockHttp
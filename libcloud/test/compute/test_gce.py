@@ -16,7 +16,12 @@
 Tests for Google Compute Engine Driver
 """
 
+import os
+import json
+import time
+import shutil
 import datetime
+import tempfile
 import mock
 import sys
 import unittest
@@ -26,7 +31,8 @@ from libcloud.compute.drivers.gce import (
     GCENodeDriver, API_VERSION, timestamp_to_datetime, GCEAddress, GCEBackend,
     GCEBackendService, GCEFirewall, GCEForwardingRule, GCEHealthCheck,
     GCENetwork, GCENodeImage, GCERoute, GCERegion, GCETargetHttpProxy,
-    GCEUrlMap, GCEZone, GCESubnetwork, GCEProject)
+    GCEUrlMap, GCEZone, GCESubnetwork, GCEProject, GCELocationCache,
+    GCEConnection)
 from libcloud.common.google import (GoogleBaseAuthConnection,
                                     ResourceNotFoundError, ResourceExistsError,
                                     GoogleBaseError)
@@ -397,6 +403,9 @@ class GCENodeDriverTest(GoogleTestCase, TestCaseMixin):
         self.assertEqual(actual[1].name, 'myname2')
 
     def test_ex_list_instancegroups_zone_attribute_not_present_in_response(self):
+        # Zones are loaded lazily, make sure they are loaded before the mock
+        # type is changed
+        self.driver.zone_dict
         GCEMockHttp.type = 'zone_attribute_not_present'
         loc = 'us-central1-a'
         actual = self.driver.ex_list_instancegroups(loc)
@@ -778,11 +787,165 @@ class GCENodeDriverTest(GoogleTestCase, TestCaseMixin):
         names = [v.name for v in volumes_all]
         self.assertTrue('libcloud-demo-europe-boot-disk' in names)
 
+    def test_list_volumes_populates_volume_dict(self):
+        self.driver._ex_volume_dict = {}
+        self.driver.list_volumes('all')
+        self.assertTrue('lcdisk' in self.driver._ex_volume_dict)
+
+        self.driver._ex_volume_dict = {}
+        self.driver.list_volumes('us-central1-a')
+        self.assertEqual(self.driver._ex_volume_dict, {})
+
+    def test_iterate_aggregated_items(self):
+        conn = self.driver.connection
+        results = list(conn.iterate_aggregated_items('disks'))
+        self.assertTrue(len(results) > 1)
+
+        for key, items in results:
+            self.assertTrue(key.startswith('zones/'))
+            self.assertTrue(len(items) > 0)
+
+        merged = conn.request_aggregated_items('disks')
+        self.assertEqual(len(merged['items']), len(results))
+
+        zone = self.driver.ex_get_zone('us-central1-a')
+        results = list(conn.iterate_aggregated_items('disks', zone=zone))
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0][0], 'zones/us-central1-a')
+
+    def test_iterate_aggregated_items_zones_in_parallel(self):
+        responses = {
+            ('/aggregated/instances', None): {
+                'items': {'zones/a': {'instances': [{'name': 'agg'}]}},
+                'nextPageToken': 'agg-token'},
+            ('/aggregated/instances', 'agg-token'): {
+                'items': {'zones/b': {'instances': [{'name': 'agg2'}]}}},
+            ('/zones/a/instances', None): {
+                'items': [{'name': 'a1'}], 'nextPageToken': 'a-token'},
+            ('/zones/a/instances', 'a-token'): {'items': [{'name': 'a2'}]},
+            ('/zones/b/instances', None): {'items': [{'name': 'b1'}]},
+            ('/zones/c/instances', None): {}
+        }
+        connections = set()
+
+        def request(conn, action, method='GET', params=None):
+            connections.add(id(conn))
+            response = mock.Mock()
+            response.object = responses[(action, params.get('pageToken'))]
+            return response
+
+        driver = self._get_driver(ex_aggregated_list_workers=2)
+        conn = driver.connection
+
+        with mock.patch.object(GCEConnection, 'request', autospec=True,
+                               side_effect=request) as mock_request:
+            results = list(conn.iterate_aggregated_items(
+                'instances', zones=['a', 'b', 'c']))
+
+        names = sorted([(key, items[0]['name']) for key, items in results])
+        self.assertEqual(names, [('zones/a', 'a1'), ('zones/a', 'a2'),
+                                 ('zones/b', 'b1')])
+        self.assertEqual(mock_request.call_count, 5)
+        # Per-zone requests are performed using worker connections
+        self.assertTrue(len(connections) > 1)
+
+        # Aggregated request is used if the result fits in a single page
+        # or parallel requests are not enabled
+        conn.aggregated_list_workers = 1
+
+        with mock.patch.object(GCEConnection, 'request', autospec=True,
+                               side_effect=request):
+            results = list(conn.iterate_aggregated_items(
+                'instances', zones=['a', 'b', 'c']))
+
+        self.assertEqual(results, [('zones/a', [{'name': 'agg'}]),
+                                   ('zones/b', [{'name': 'agg2'}])])
+
     def test_ex_list_zones(self):
         zones = self.driver.ex_list_zones()
         self.assertEqual(len(zones), 6)
         self.assertEqual(zones[0].name, 'asia-east1-a')
 
+    def test_zones_and_regions_are_loaded_lazily(self):
+        with mock.patch.object(GCEMockHttp, '_zones', autospec=True,
+                               side_effect=GCEMockHttp._zones) as zones, \
+                mock.patch.object(GCEMockHttp, '_regions', autospec=True,
+                                  side_effect=GCEMockHttp._regions) as regions:
+            driver = self._get_driver()
+            self.assertEqual(zones.call_count, 0)
+            self.assertEqual(regions.call_count, 0)
+
+            self.assertEqual(driver.zone.name, self.datacenter)
+            self.assertEqual(len(driver.zone_list), 6)
+            self.assertEqual(zones.call_count, 1)
+            self.assertEqual(regions.call_count, 0)
+
+            self.assertEqual(driver.region.name, 'us-central1')
+            self.assertEqual(len(driver.region_dict), 3)
+            self.assertEqual(zones.call_count, 1)
+            self.assertEqual(regions.call_count, 1)
+
+    def test_location_cache_is_shared_between_drivers(self):
+        cache = GCELocationCache()
+
+        with mock.patch.object(GCEMockHttp, '_zones', autospec=True,
+                               side_effect=GCEMockHttp._zones) as zones, \
+                mock.patch.object(GCEMockHttp, '_regions', autospec=True,
+                                  side_effect=GCEMockHttp._regions) as regions:
+            driver1 = self._get_driver(location_cache=cache)
+            driver2 = self._get_driver(location_cache=cache)
+
+            self.assertEqual(driver1.region.name, 'us-central1')
+            self.assertEqual(driver2.region.name, 'us-central1')
+            self.assertEqual(sorted(driver2.zone_dict.keys()),
+                             sorted(driver1.zone_dict.keys()))
+
+        self.assertEqual(zones.call_count, 1)
+        self.assertEqual(regions.call_count, 1)
+
+        # Objects are created for each driver
+        self.assertTrue(driver2.zone_dict['us-central1-a'].driver is driver2)
+
+    def test_location_cache_ttl_and_file(self):
+        tmp_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_path)
+
+        driver = self._get_driver(
+            location_cache=GCELocationCache(path=tmp_path))
+        self.assertEqual(len(driver.region_list), 3)
+
+        # Cache files can be used by a different process
+        cache = GCELocationCache(path=tmp_path)
+        self.assertEqual(len(cache.get(driver.project, 'zones')), 6)
+        self.assertEqual(len(cache.get(driver.project, 'regions')), 3)
+        self.assertEqual(cache.get('other-project', 'zones'), None)
+
+        # Pre-seeded file
+        with open(os.path.join(tmp_path, 'seeded.json'), 'w') as fp:
+            json.dump({'zones': {'timestamp': time.time(),
+                                 'items': [{'id': '1', 'name': 'zone-a',
+                                            'status': 'UP'}]}}, fp)
+
+        driver = self._get_driver(
+            project='seeded', location_cache=GCELocationCache(path=tmp_path))
+        self.assertEqual(list(driver.zone_dict.keys()), ['zone-a'])
+
+        # Expired entries are ignored
+        cache = GCELocationCache(path=tmp_path, ttl=10)
+
+        with mock.patch('libcloud.compute.drivers.gce.time.time',
+                        return_value=time.time() + 20):
+            self.assertEqual(cache.get('seeded', 'zones'), None)
+
+        self.assertEqual(len(cache.get('seeded', 'zones')), 1)
+
+    def _get_driver(self, **kwargs):
+        params = GCE_KEYWORD_PARAMS.copy()
+        params['auth_type'] = 'IA'
+        params['datacenter'] = self.datacenter
+        params.update(kwargs)
+        return GCENodeDriver(*GCE_PARAMS, **params)
+
     def test_ex_create_address_global(self):
         address_name = 'lcaddressglobal'
         address = self.driver.ex_create_address(address_name, 'global')
@@ -1987,6 +2150,14 @@ class GCENodeDriverTest(GoogleTestCase, TestCaseMixin):
         self.assertEqual(network.extra['gatewayIPv4'], '10.11.0.1')
         self.assertEqual(network.extra['description'], 'A custom network')
 
+    def test_get_nodes(self):
+        node = self.driver.ex_get_node('node-name', 'us-central1-a')
+        removed_node = Node('123', 'libcloud-lb-demo-www-002', None, None,
+                            None, self.driver,
+                            extra={'zone': 'us-central1-b'})
+        nodes = self.driver._get_nodes([node, removed_node])
+        self.assertEqual([n.name for n in nodes], ['node-name'])
+
     def test_ex_get_node(self):
         node_name = 'node-name'
         zone = 'us-central1-a'
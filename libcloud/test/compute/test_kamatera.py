@@ -18,6 +18,7 @@ import sys
 import json
 
 from libcloud.utils.py3 import httplib
+from libcloud.utils.misc import get_object_attributes
 from libcloud.compute.drivers.kamatera import KamateraNodeDriver
 from libcloud.compute.types import NodeState, Provider
 from libcloud.compute.base import NodeImage, NodeLocation, NodeAuthSSHKey
@@ -165,7 +166,7 @@ class KamateraNodeDriverTests(LibcloudTestCase):
                 expected_object, objects[:2]))
 
     def objects_equals(self, expected_obj, obj):
-        for name in vars(expected_obj):
+        for name in get_object_attributes(expected_obj):
             expected_data = getattr(expected_obj, name)
             actual_data = getattr(obj, name)
             same_data = self.data_equals(expected_data, actual_data)
@@ -1168,6 +1168,12 @@ class OpenStack_1_1_Tests(unittest.TestCase, TestCaseMixin):
         node = self.driver.ex_get_node_details('does-not-exist')
         self.assertTrue(node is None)
 
+    def test_get_nodes(self):
+        nodes = [Node('12064', None, None, None, None, self.driver),
+                 Node('does-not-exist', None, None, None, None, self.driver)]
+        nodes = self.driver._get_nodes(nodes)
+        self.assertEqual([node.id for node in nodes], ['12064'])
+
     def test_ex_get_size(self):
         size_id = '7'
         size = self.driver.ex_get_size(size_id)
@@ -19,6 +19,8 @@ from __future__ import with_statement
 
 import os
 import sys
+import time
+import socket
 import tempfile
 
 from libcloud import _init_once
@@ -26,7 +28,9 @@ from libcloud.test import LibcloudTestCase
 from libcloud.test import unittest
 from libcloud.compute.ssh import ParamikoSSHClient
 from libcloud.compute.ssh import ShellOutSSHClient
+from libcloud.compute.ssh import SSHClientPool
 from libcloud.compute.ssh import have_paramiko
+from libcloud.compute.ssh import clear_pkey_cache
 
 from libcloud.utils.py3 import StringIO
 from libcloud.utils.py3 import u
@@ -576,6 +580,226 @@ class ParamikoSSHClientTests(LibcloudTestCase):
         self.assertEqual('\x00\x00&\x01\x00ab', stderr)
         self.assertEqual(len(stderr), 7)
 
+    def _get_client_with_channel(self, batches):
+        client = ParamikoSSHClient(hostname='dummy.host.org',
+                                   username='ubuntu')
+        client.client = Mock()
+        chan = FakeChannel(batches=batches)
+        client.client.get_transport().open_session.return_value = chan
+        client._wait_for_channel = Mock(
+            side_effect=lambda chan, timeout: chan.deliver())
+        return client, chan
+
+    def test_run_output_is_streamed_to_callbacks(self):
+        client, chan = self._get_client_with_channel(batches=[
+            (b'hello \xe2\x82', b''),
+            (b'\xac world', b'error'),
+        ])
+        stdout_chunks = []
+        stderr_chunks = []
+
+        stdout, stderr, status = client.run(
+            'cmd', stdout_callback=stdout_chunks.append,
+            stderr_callback=stderr_chunks.append)
+
+        self.assertEqual(stdout, u('hello \u20ac world'))
+        self.assertEqual(stderr, 'error')
+        self.assertEqual(status, 0)
+        # Part of multi byte character is kept until the rest is received
+        self.assertEqual(stdout_chunks, ['hello ', u('\u20ac world')])
+        self.assertEqual(stderr_chunks, ['error'])
+        self.assertEqual(client._wait_for_channel.call_count, 1)
+        self.assertEqual(client._wait_for_channel.call_args[0][1],
+                         client.SLEEP_DELAY)
+
+    def test_run_max_output_size(self):
+        client, chan = self._get_client_with_channel(batches=[
+            (b'a' * 10, b''),
+            (b'b' * 10, b'c'),
+        ])
+
+        stdout, stderr, _ = client.run('cmd', max_output_size=5)
+
+        self.assertEqual(stdout, 'bbbbb')
+        self.assertEqual(stderr, 'c')
+        self.assertTrue(client.last_stderr_path is None)
+
+        with open(client.last_stdout_path, 'r') as fp:
+            self.assertEqual(fp.read(), 'a' * 10 + 'b' * 10)
+
+        # File is removed on the next run
+        path = client.last_stdout_path
+        client.client.get_transport().open_session.return_value = \
+            FakeChannel(batches=[(b'd' * 10, b'')])
+        client.run('cmd', max_output_size=5)
+        self.assertFalse(os.path.exists(path))
+        self.assertTrue(os.path.exists(client.last_stdout_path))
+
+        # And when the client is closed
+        path = client.last_stdout_path
+        client.close()
+        self.assertFalse(os.path.exists(path))
+        self.assertTrue(client.last_stdout_path is None)
+
+    def test_wait_for_channel(self):
+        client = ParamikoSSHClient(hostname='dummy.host.org',
+                                   username='ubuntu')
+
+        # Waiting is interrupted as soon as data is available
+        sock1, sock2 = socket.socketpair()
+        sock2.send(b'data')
+        start = time.time()
+        client._wait_for_channel(sock1, 5)
+        self.assertTrue(time.time() - start < 5)
+        sock1.close()
+        sock2.close()
+
+        # Once EOF is received, exit status is waited for
+        chan = Mock()
+        chan.eof_received = True
+        client._wait_for_channel(chan, 5)
+        chan.status_event.wait.assert_called_once_with(5)
+
+    def test_get_pkey_object_is_cached(self):
+        client = ParamikoSSHClient(hostname='dummy.host.org',
+                                   username='ubuntu')
+        private_key = 'test_get_pkey_object_is_cached'
+
+        with patch.object(ParamikoSSHClient, '_parse_pkey_object',
+                          side_effect=lambda key, password: Mock()) \
+                as mock_parse:
+            pkey1 = client._get_pkey_object(key=private_key)
+            pkey2 = client._get_pkey_object(key=private_key)
+            self.assertTrue(pkey1 is pkey2)
+            self.assertEqual(mock_parse.call_count, 1)
+
+            pkey3 = client._get_pkey_object(key=private_key, password='foo')
+            self.assertFalse(pkey1 is pkey3)
+            self.assertEqual(mock_parse.call_count, 2)
+
+            clear_pkey_cache()
+            pkey4 = client._get_pkey_object(key=private_key)
+            self.assertFalse(pkey1 is pkey4)
+            self.assertEqual(mock_parse.call_count, 3)
+
+    @patch('libcloud.compute.ssh.PKEY_CACHE_MAX_SIZE', 2)
+    def test_get_pkey_object_cache_is_bounded(self):
+        client = ParamikoSSHClient(hostname='dummy.host.org',
+                                   username='ubuntu')
+        clear_pkey_cache()
+        self.addCleanup(clear_pkey_cache)
+
+        with patch.object(ParamikoSSHClient, '_parse_pkey_object',
+                          side_effect=lambda key, password: Mock()) \
+                as mock_parse:
+            client._get_pkey_object(key='key1')
+            client._get_pkey_object(key='key2')
+            # key1 becomes the most recently used key
+            client._get_pkey_object(key='key1')
+            client._get_pkey_object(key='key3')
+            self.assertEqual(mock_parse.call_count, 3)
+
+            # key2 has been evicted
+            client._get_pkey_object(key='key1')
+            self.assertEqual(mock_parse.call_count, 3)
+            client._get_pkey_object(key='key2')
+            self.assertEqual(mock_parse.call_count, 4)
+
+    def test_sftp_session_is_reused(self):
+        mock = self.ssh_cli
+        mock.connect()
+        mock_cli = mock.client
+        mock_cli.open_sftp.return_value.sock.closed = False
+
+        mock.put('/root/script1.sh', contents='1')
+        mock.put('/root/script2.sh', contents='2')
+        mock.delete('/root/script1.sh')
+        self.assertEqual(mock_cli.open_sftp.call_count, 1)
+
+        mock.close()
+        mock_cli.open_sftp.return_value.close.assert_called_once_with()
+
+    def test_ssh_client_pool(self):
+        pool = SSHClientPool()
+        client = ParamikoSSHClient(hostname='dummy.host.org',
+                                   username='ubuntu', password='foo')
+        client.client = Mock()
+        client.client.get_transport.return_value.is_active.return_value = \
+            True
+
+        self.assertTrue(pool.get(hostname='dummy.host.org',
+                                 username='ubuntu', password='foo') is None)
+
+        pool.add(client)
+        self.assertTrue(pool.get(hostname='dummy.host.org',
+                                 username='ubuntu', password='foo') is client)
+
+        # Credentials are part of the key
+        self.assertTrue(pool.get(hostname='dummy.host.org',
+                                 username='ubuntu', password='bar') is None)
+        self.assertTrue(pool.get(hostname='dummy.host.org', port=2222,
+                                 username='ubuntu', password='foo') is None)
+
+        # Clients which have been disconnected are removed from the pool
+        client.client.get_transport.return_value.is_active.return_value = \
+            False
+        self.assertTrue(pool.get(hostname='dummy.host.org',
+                                 username='ubuntu', password='foo') is None)
+        self.assertEqual(client.client.close.call_count, 1)
+
+        client.client.get_transport.return_value.is_active.return_value = \
+            True
+        pool.add(client)
+        pool.close()
+        self.assertEqual(client.client.close.call_count, 2)
+        self.assertTrue(pool.get(hostname='dummy.host.org',
+                                 username='ubuntu', password='foo') is None)
+
+
+class FakeChannel(object):
+    """
+    Channel which makes the provided (stdout, stderr) batches available one by
+    one.
+    """
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.stdout = b''
+        self.stderr = b''
+        self.deliver()
+
+    def deliver(self):
+        if self.batches:
+            stdout, stderr = self.batches.pop(0)
+            self.stdout += stdout
+            self.stderr += stderr
+
+    def exec_command(self, cmd):
+        pass
+
+    def makefile(self, mode, bufsize):
+        return Mock()
+
+    def exit_status_ready(self):
+        return not self.batches and not self.stdout and not self.stderr
+
+    def recv_exit_status(self):
+        return 0
+
+    def recv_ready(self):
+        return bool(self.stdout)
+
+    def recv_stderr_ready(self):
+        return bool(self.stderr)
+
+    def recv(self, size):
+        data, self.stdout = self.stdout[:size], self.stdout[size:]
+        return data
+
+    def recv_stderr(self, size):
+        data, self.stderr = self.stderr[:size], self.stderr[size:]
+        return data
+
 
 class ShellOutSSHClientTests(LibcloudTestCase):
 
@@ -20,6 +20,7 @@ import json
 import base64
 
 from libcloud.utils.py3 import httplib, ensure_string
+from libcloud.utils.misc import get_object_attributes
 from libcloud.compute.drivers.upcloud import UpcloudDriver
 from libcloud.common.types import InvalidCredsError
 from libcloud.compute.drivers.upcloud import UpcloudResponse
@@ -176,7 +177,7 @@ class UpcloudDriverTests(LibcloudTestCase):
         self.assertTrue(same_data, "Objects does not match")
 
     def objects_equals(self, expected_obj, obj):
-        for name in vars(expected_obj):
+        for name in get_object_attributes(expected_obj):
             expected_data = getattr(expected_obj, name)
             actual_data = getattr(obj, name)
             same_data = self.data_equals(expected_data, actual_data)
@@ -21,7 +21,7 @@ from libcloud.utils.py3 import httplib
 from libcloud.dns.types import RecordType, ZoneDoesNotExistError
 from libcloud.dns.types import RecordDoesNotExistError
 from libcloud.dns.drivers.route53 import Route53DNSDriver
-from libcloud.test import MockHttp
+from libcloud.test import MockHttp, AsyncMockHttp, run_async
 from libcloud.test.file_fixtures import DNSFileFixtures
 from libcloud.test.secrets import DNS_PARAMS_ROUTE53
 
@@ -46,6 +46,27 @@ class Route53Tests(unittest.TestCase):
         self.assertEqual(zone.type, 'master')
         self.assertEqual(zone.domain, 't.com')
 
+    def test_iterate_records_async(self):
+        self.driver.async_connection.conn_class = type(
+            'AsyncRoute53MockHttp', (AsyncMockHttp, ),
+            {'mock_cls': Route53MockHttp})
+
+        async def list_records():
+            zones = []
+            async for zone in self.driver.iterate_zones_async():
+                zones.append(zone)
+
+            records = []
+            async for record in self.driver.iterate_records_async(zones[0]):
+                records.append(record)
+            return zones, records
+
+        zones, records = run_async(list_records())
+        self.assertEqual(len(zones), 5)
+        self.assertEqual(len(records), 10)
+        self.assertEqual(records[1].name, 'www')
+        self.assertEqual(records[1].data, '208.111.35.173')
+
     def test_list_records(self):
         zone = self.driver.list_zones()[0]
         records = self.driver.list_records(zone=zone)
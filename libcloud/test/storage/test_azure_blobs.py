@@ -16,10 +16,13 @@
 from __future__ import with_statement
 
 import os
+import re
 import sys
 import tempfile
 from io import BytesIO
 
+import mock
+
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import urlparse
 from libcloud.utils.py3 import parse_qs
@@ -389,6 +392,42 @@ class AzureBlobsMockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
                 headers,
                 httplib.responses[httplib.OK])
 
+    def _BATCH(self, method, url, body, headers):
+        # test_delete_objects
+        self.assertEqual(method, 'POST')
+        self.assertUrlContainsQueryParams(url, {'comp': 'batch'})
+        self.assertTrue(headers['Content-Type'].startswith(
+            'multipart/mixed; boundary=batch_'))
+
+        self.batch_requests.append(body)
+        subrequests = re.findall(r'Content-ID: (\d+)\r\n\r\n'
+                                 r'DELETE (\S+) HTTP/1.1\r\n'
+                                 r'x-ms-date: .*?\r\n'
+                                 r'Authorization: SharedKey .*?\r\n', body)
+
+        boundary = 'batchresponse_66925647-d0cb-4109-b6d3-28efe3e1e5ed'
+        parts = []
+
+        for content_id, path in subrequests:
+            if path.endswith('missing'):
+                status = ('HTTP/1.1 404 The specified blob does not exist.\r\n'
+                          'x-ms-error-code: BlobNotFound')
+            else:
+                status = 'HTTP/1.1 202 Accepted'
+
+            parts.append('--%s\r\nContent-Type: application/http\r\n'
+                         'Content-ID: %s\r\n\r\n%s\r\n'
+                         'x-ms-version: 2018-11-09\r\n\r\n'
+                         % (boundary, content_id, status))
+
+        body = ''.join(parts) + '--%s--' % (boundary)
+        headers = {'content-type': 'multipart/mixed; boundary=%s' % (boundary)}
+
+        return (httplib.ACCEPTED,
+                body,
+                headers,
+                httplib.responses[httplib.ACCEPTED])
+
     def _assert_content_length_header_is_string(self, headers):
         if 'Content-Length' in headers:
             self.assertTrue(isinstance(headers['Content-Length'], basestring))
@@ -919,6 +958,26 @@ class AzureBlobsTests(unittest.TestCase):
         result = self.driver.delete_object(obj=obj)
         self.assertTrue(result)
 
+    @mock.patch('libcloud.storage.drivers.azure_blobs.'
+                'AZURE_BATCH_MAX_SUBREQUESTS', 2)
+    def test_delete_objects(self):
+        self.mock_response_klass.type = 'BATCH'
+        self.mock_response_klass.batch_requests = []
+
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        objs = [Object(name=name, size=1234, hash=None, extra=None,
+                       meta_data=None, container=container, driver=self.driver)
+                for name in ['foo1', 'missing', 'foo3']]
+
+        results = list(self.driver.delete_objects(iter(objs)))
+
+        self.assertEqual(len(self.mock_response_klass.batch_requests), 2)
+        self.assertEqual([result[0] for result in results], objs)
+        self.assertIsNone(results[0][1])
+        self.assertTrue(isinstance(results[1][1], ObjectDoesNotExistError))
+        self.assertIsNone(results[2][1])
+
     def test_storage_driver_host(self):
         # Non regression tests for issue LIBCLOUD-399 dealing with the bad
         # management of the connectionCls.host class attribute
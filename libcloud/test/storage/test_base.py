@@ -13,9 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import sys
 import errno
+import shutil
+import socket
 import hashlib
+import tempfile
 
 from libcloud.utils.py3 import httplib
 from io import BytesIO
@@ -28,8 +32,13 @@ from libcloud.utils.py3 import b
 from libcloud.utils.py3 import PY2
 from libcloud.utils.py3 import assertRaisesRegex
 
+from libcloud.common.types import InvalidCredsError
+from libcloud.common.types import LibcloudError
+from libcloud.storage.base import Container
+from libcloud.storage.base import Object
 from libcloud.storage.base import StorageDriver
 from libcloud.storage.base import DEFAULT_CONTENT_TYPE
+from libcloud.storage.types import ObjectDoesNotExistError
 
 from libcloud.test import unittest
 from libcloud.test import MockHttp
@@ -140,23 +149,18 @@ class BaseStorageTests(unittest.TestCase):
     @mock.patch('libcloud.utils.files.read_in_chunks')
     def test_upload_object_hash_calculation_is_efficient(self, mock_read_in_chunks,
                                                          mock_exhaust_iterator):
-        # Verify that we don't buffer whole file in memory when calculating
-        # object has when iterator has __next__ method, but instead read and
-        # calculate hash in chunks
+        # Verify that we don't buffer whole file in memory and don't read the
+        # stream a second time when calculating object hash, but instead
+        # calculate hash on the fly while the data is being sent
         size = 100
 
         self.driver1.connection = Mock()
 
         # stream has __next__ method and next() method
-        mock_read_in_chunks.return_value = 'a' * size
-
         iterator = BodyStream('a' * size)
         self.assertTrue(hasattr(iterator, '__next__'))
         self.assertTrue(hasattr(iterator, 'next'))
 
-        self.assertEqual(mock_read_in_chunks.call_count, 0)
-        self.assertEqual(mock_exhaust_iterator.call_count, 0)
-
         result = self.driver1._upload_object(object_name='test1',
                                              content_type=None,
                                              request_path='/',
@@ -172,12 +176,10 @@ class BaseStorageTests(unittest.TestCase):
         headers = self.driver1.connection.request.call_args[-1]['headers']
         self.assertEqual(headers['Content-Type'], DEFAULT_CONTENT_TYPE)
 
-        self.assertEqual(mock_read_in_chunks.call_count, 1)
+        self.assertEqual(mock_read_in_chunks.call_count, 0)
         self.assertEqual(mock_exhaust_iterator.call_count, 0)
 
         # stream has only has next() method
-        mock_read_in_chunks.return_value = 'b' * size
-
         iterator = iter([str(v) for v in ['b' * size]])
 
         if PY2:
@@ -187,12 +189,6 @@ class BaseStorageTests(unittest.TestCase):
             self.assertTrue(hasattr(iterator, '__next__'))
             self.assertFalse(hasattr(iterator, 'next'))
 
-        self.assertEqual(mock_read_in_chunks.call_count, 1)
-        self.assertEqual(mock_exhaust_iterator.call_count, 0)
-
-        self.assertEqual(mock_read_in_chunks.call_count, 1)
-        self.assertEqual(mock_exhaust_iterator.call_count, 0)
-
         result = self.driver1._upload_object(object_name='test2',
                                              content_type=None,
                                              request_path='/',
@@ -208,9 +204,79 @@ class BaseStorageTests(unittest.TestCase):
         headers = self.driver1.connection.request.call_args[-1]['headers']
         self.assertEqual(headers['Content-Type'], DEFAULT_CONTENT_TYPE)
 
-        self.assertEqual(mock_read_in_chunks.call_count, 2)
+        self.assertEqual(mock_read_in_chunks.call_count, 0)
         self.assertEqual(mock_exhaust_iterator.call_count, 0)
 
+    def test_upload_object_hash_is_calculated_while_data_is_sent(self):
+        size = 100
+        consumed = []
+
+        def mock_request(*args, **kwargs):
+            # Simulate the HTTP client consuming the request body
+            consumed.append(b('').join(kwargs['data']))
+            return Mock()
+
+        self.driver1.connection = Mock()
+        self.driver1.connection.request.side_effect = mock_request
+
+        # Stream is rewound before the upload and only consumed by the HTTP
+        # client
+        iterator = BytesIO(b('a') * size)
+        iterator.seek(size)
+
+        result = self.driver1._upload_object(object_name='test1',
+                                             content_type=None,
+                                             request_path='/',
+                                             stream=iterator)
+
+        hasher = hashlib.md5()
+        hasher.update(b('a') * size)
+        expected_hash = hasher.hexdigest()
+
+        self.assertEqual(consumed, [b('a') * size])
+        self.assertEqual(result['data_hash'], expected_hash)
+        self.assertEqual(result['bytes_transferred'], size)
+
+    def test_upload_object_failed_upload_does_not_drain_stream(self):
+        size = 100
+
+        self.driver1.connection = Mock()
+        response = self.driver1.connection.request.return_value
+        response.success.return_value = False
+
+        iterator = BytesIO(b('a') * size)
+
+        result = self.driver1._upload_object(object_name='test1',
+                                             content_type=None,
+                                             request_path='/',
+                                             stream=iterator)
+
+        self.assertEqual(response.parse_error.call_count, 1)
+        self.assertEqual(iterator.tell(), 0)
+        self.assertEqual(result['bytes_transferred'], 0)
+        self.assertEqual(result['data_hash'], hashlib.md5().hexdigest())
+
+    @mock.patch('libcloud.storage.base.open', create=True)
+    def test_upload_object_from_file_opens_file_once(self, mock_open):
+        size = 100
+        mock_open.return_value = BytesIO(b('c') * size)
+
+        self.driver1.connection = Mock()
+
+        with mock.patch('os.path.exists', return_value=True):
+            result = self.driver1._upload_object(object_name='test1',
+                                                 content_type=None,
+                                                 request_path='/',
+                                                 file_path='/tmp/test1')
+
+        hasher = hashlib.md5()
+        hasher.update(b('c') * size)
+        expected_hash = hasher.hexdigest()
+
+        self.assertEqual(mock_open.call_count, 1)
+        self.assertEqual(result['data_hash'], expected_hash)
+        self.assertEqual(result['bytes_transferred'], size)
+
     def test_upload_object_via_stream_illegal_seek_errors_are_ignored(self):
         # Illegal seek errors should be ignored
         size = 100
@@ -252,6 +318,128 @@ class BaseStorageTests(unittest.TestCase):
                                request_path='/',
                                stream=iterator)
 
+    def test_download_object_parallel_resumes_failed_ranges(self):
+        content = b('0123456789') * 10
+        obj = Object(name='foo', size=len(content), hash=None, extra={},
+                     meta_data={}, container=None, driver=self.driver1)
+        calls = []
+        failed = []
+
+        def mock_download_range(obj, start_bytes, end_bytes=None,
+                                chunk_size=None):
+            calls.append((start_bytes, end_bytes))
+
+            if start_bytes == 40 and not failed:
+                # First attempt of this range fails half way through
+                failed.append(start_bytes)
+                yield content[40:50]
+                raise socket.error('Connection reset')
+
+            yield content[start_bytes:end_bytes]
+
+        self.driver1.download_object_range_as_stream = mock_download_range
+
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        destination_path = os.path.join(tmp_dir, 'foo')
+
+        result = self.driver1.download_object_parallel(
+            obj=obj, destination_path=destination_path, part_size=20,
+            concurrency=3)
+        self.assertTrue(result)
+
+        with open(destination_path, 'rb') as fp:
+            self.assertEqual(fp.read(), content)
+
+        # Only the missing part of the failed range is downloaded again
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(calls[-1], (50, 60))
+
+    def test_download_object_parallel_retries_exhausted(self):
+        obj = Object(name='foo', size=100, hash=None, extra={},
+                     meta_data={}, container=None, driver=self.driver1)
+
+        def mock_download_range(obj, start_bytes, end_bytes=None,
+                                chunk_size=None):
+            if start_bytes >= 80:
+                raise socket.error('Connection reset')
+
+            yield b('a') * (end_bytes - start_bytes)
+
+        self.driver1.download_object_range_as_stream = mock_download_range
+
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        destination_path = os.path.join(tmp_dir, 'foo')
+
+        self.assertRaisesRegex(socket.error, 'Connection reset',
+                               self.driver1.download_object_parallel,
+                               obj=obj, destination_path=destination_path,
+                               part_size=20, max_retries=1)
+        self.assertFalse(os.path.exists(destination_path))
+
+    def test_download_object_parallel_small_object(self):
+        obj = Object(name='foo', size=10, hash=None, extra={},
+                     meta_data={}, container=None, driver=self.driver1)
+
+        self.driver1.download_object = Mock(return_value=True)
+
+        result = self.driver1.download_object_parallel(
+            obj=obj, destination_path='/tmp/foo', part_size=20)
+        self.assertTrue(result)
+        self.driver1.download_object.assert_called_once_with(
+            obj=obj, destination_path='/tmp/foo', overwrite_existing=False,
+            delete_on_failure=True)
+
+    def test_delete_objects_serial_fallback(self):
+        objs = [Object(name='obj%s' % (i), size=1, hash=None, extra={},
+                       meta_data={}, container=None, driver=self.driver1)
+                for i in range(4)]
+        consumed = []
+
+        def iterate_objects():
+            for obj in objs:
+                consumed.append(obj)
+                yield obj
+
+        self.driver1.delete_object = Mock(side_effect=[
+            True, False,
+            ObjectDoesNotExistError(value='', driver=self.driver1,
+                                    object_name='obj2'),
+            True])
+
+        results = self.driver1.delete_objects(iterate_objects())
+
+        # Objects are consumed and results are returned lazily
+        self.assertEqual(next(results), (objs[0], None))
+        self.assertEqual(len(consumed), 1)
+
+        results = list(results)
+        self.assertEqual([result[0] for result in results], objs[1:])
+        self.assertTrue(isinstance(results[0][1], LibcloudError))
+        self.assertTrue(isinstance(results[1][1], ObjectDoesNotExistError))
+        self.assertIsNone(results[2][1])
+
+        # Invalid credentials errors are not reported per object
+        self.driver1.delete_object = Mock(side_effect=InvalidCredsError(''))
+        self.assertRaises(InvalidCredsError, list,
+                          self.driver1.delete_objects(objs))
+
+    def test_get_object_batches(self):
+        container1 = Container(name='a', extra={}, driver=self.driver1)
+        container2 = Container(name='b', extra={}, driver=self.driver1)
+        objs = [Object(name=str(i), size=1, hash=None, extra={}, meta_data={},
+                       container=container, driver=self.driver1)
+                for i, container in enumerate([container1, container1,
+                                               container1, container2])]
+
+        batches = list(self.driver1._get_object_batches(iter(objs), 2))
+        self.assertEqual(batches, [objs[0:2], objs[2:4]])
+
+        batches = list(self.driver1._get_object_batches(
+            iter(objs), 5, same_container=True))
+        self.assertEqual(batches, [objs[0:3], objs[3:4]])
+
     def test_get_standard_range_str(self):
         result = self.driver1._get_standard_range_str(0, 5)
         self.assertEqual(result, 'bytes=0-4')
@@ -20,6 +20,7 @@ import os.path                          # pylint: disable-msg=W0404
 import math
 import sys
 import copy
+import json
 from io import BytesIO
 import hashlib
 from hashlib import sha1
@@ -37,6 +38,7 @@ from libcloud.utils.py3 import StringIO
 from libcloud.utils.py3 import PY3
 from libcloud.utils.files import exhaust_iterator
 
+from libcloud.common.types import LibcloudError
 from libcloud.common.types import MalformedResponseError
 from libcloud.storage.base import CHUNK_SIZE, Container, Object
 from libcloud.storage.types import ContainerAlreadyExistsError
@@ -613,6 +615,26 @@ class CloudFilesTests(unittest.TestCase):
         else:
             self.fail('Object does not exist but an exception was not thrown')
 
+    def test_delete_objects(self):
+        CloudFilesMockHttp.type = 'BULK_DELETE'
+        CloudFilesMockHttp.bulk_delete_requests = []
+        container = Container(name='foo_bar_container', extra={}, driver=self)
+        objs = [Object(name=name, size=1000, hash=None, extra={},
+                       container=container, meta_data=None,
+                       driver=CloudFilesStorageDriver)
+                for name in ['foo 1', 'denied', 'foo3']]
+
+        result = list(self.driver.delete_objects(objs))
+
+        self.assertEqual([obj for obj, _ in result], objs)
+        self.assertIsNone(result[0][1])
+        self.assertTrue(isinstance(result[1][1], LibcloudError))
+        self.assertIsNone(result[2][1])
+        self.assertEqual(CloudFilesMockHttp.bulk_delete_requests,
+                         ['/foo_bar_container/foo%201\n'
+                          '/foo_bar_container/denied\n'
+                          '/foo_bar_container/foo3'])
+
     def test_ex_get_meta_data(self):
         meta_data = self.driver.ex_get_meta_data()
         self.assertTrue(isinstance(meta_data, dict))
@@ -953,6 +975,7 @@ class CloudFilesMockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
 
     fixtures = StorageFileFixtures('cloudfiles')
     base_headers = {'content-type': 'application/json; charset=UTF-8'}
+    bulk_delete_requests = []
 
     # fake auth token response
     def _v2_0_tokens(self, method, url, body, headers):
@@ -994,6 +1017,28 @@ class CloudFilesMockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
             status_code = httplib.NO_CONTENT
         return (status_code, body, headers, httplib.responses[httplib.OK])
 
+    def _v1_MossoCloudFS_BULK_DELETE(self, method, url, body, headers):
+        # test_delete_objects
+        self.assertEqual(method, 'POST')
+        self.assertUrlContainsQueryParams(url, {'bulk-delete': 'true'})
+        self.assertEqual(headers['Content-Type'], 'text/plain')
+
+        CloudFilesMockHttp.bulk_delete_requests.append(body)
+
+        paths = body.split('\n')
+        errors = [[path, '403 Forbidden'] for path in paths
+                  if path.endswith('denied')]
+        result = {
+            'Number Deleted': len(paths) - len(errors),
+            'Number Not Found': 0,
+            'Response Body': '',
+            'Response Status': '400 Bad Request' if errors else '200 OK',
+            'Errors': errors
+        }
+
+        return (httplib.OK, json.dumps(result), self.base_headers,
+                httplib.responses[httplib.OK])
+
     def _v1_MossoCloudFS_not_found(self, method, url, body, headers):
         # test_get_object_not_found
         if method == 'HEAD':
@@ -332,6 +332,20 @@ class GoogleStorageTests(S3Tests, GoogleTestCase):
         # Not supported on Google Storage
         pass
 
+    def test_delete_objects(self):
+        # Multi-object delete is not supported, objects are deleted one by one
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        objs = [Object(name=name, size=1234, hash=None, extra=None,
+                       meta_data=None, container=container, driver=self.driver)
+                for name in ['foo1', 'foo2']]
+
+        self.driver.delete_object = Mock(return_value=True)
+
+        results = list(self.driver.delete_objects(objs))
+        self.assertEqual(results, [(objs[0], None), (objs[1], None)])
+        self.assertEqual(self.driver.delete_object.call_count, 2)
+
     def test_delete_permissions(self):
         mock_request = mock.Mock()
         self.driver.json_connection.request = mock_request
@@ -410,6 +410,33 @@ class LocalTests(unittest.TestCase):
         self.remove_tmp_file(tmppath)
         os.unlink(destination_path)
 
+    def test_download_object_parallel_success(self):
+        content = os.urandom(1000)
+        tmppath = self.make_tmp_file(content=content)
+        container = self.driver.create_container('test6')
+        obj = container.upload_object(tmppath, 'test')
+
+        destination_path = tmppath + '.temp'
+
+        result = self.driver.download_object_parallel(
+            obj=obj, destination_path=destination_path, part_size=64,
+            concurrency=4, overwrite_existing=True)
+        self.assertTrue(result)
+
+        with open(destination_path, 'rb') as fp:
+            written_content = fp.read()
+
+        self.assertEqual(written_content, content)
+
+        # File already exists
+        self.assertRaisesRegex(LibcloudError, 'overwrite_existing=False',
+                               self.driver.download_object_parallel,
+                               obj=obj, destination_path=destination_path,
+                               part_size=64)
+
+        self.remove_tmp_file(tmppath)
+        self.remove_tmp_file(destination_path)
+
     def test_download_object_range_as_stream_success(self):
         content = b'0123456789123456789'
         tmppath = self.make_tmp_file(content=content)
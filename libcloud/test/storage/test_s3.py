@@ -17,6 +17,8 @@ import base64
 import hmac
 import os
 import sys
+import threading
+import time
 
 from io import BytesIO
 from hashlib import sha1
@@ -49,6 +51,7 @@ from libcloud.storage.drivers.s3 import CHUNK_SIZE
 from libcloud.utils.py3 import b
 
 from libcloud.test import MockHttp  # pylint: disable-msg=E0611
+from libcloud.test import AsyncMockHttp, run_async
 from libcloud.test import unittest, make_response, generate_random_data
 from libcloud.test.file_fixtures import StorageFileFixtures  # pylint: disable-msg=E0611
 from libcloud.test.secrets import STORAGE_S3_PARAMS
@@ -60,6 +63,10 @@ class S3MockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
     fixtures = StorageFileFixtures('s3')
     base_headers = {}
 
+    # Status code returned by the first attempt of each multipart upload part
+    # in the MULTIPART_RETRY tests
+    failed_part_status = httplib.INTERNAL_SERVER_ERROR
+
     def _UNAUTHORIZED(self, method, url, body, headers):
         return (httplib.UNAUTHORIZED,
                 '',
@@ -109,6 +116,12 @@ class S3MockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
                 self.base_headers,
                 httplib.responses[httplib.OK])
 
+    def _test_container_EMPTY_BODY(self, method, url, body, headers):
+        return (httplib.OK,
+                '',
+                self.base_headers,
+                httplib.responses[httplib.OK])
+
     def _test_container_ITERATOR(self, method, url, body, headers):
         if url.find('3.zip') == -1:
             # First part of the response (first 3 objects)
@@ -211,6 +224,27 @@ class S3MockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
                 headers,
                 httplib.responses[httplib.OK])
 
+    def _foo_bar_container_MULTI_DELETE(self, method, url, body, headers):
+        # test_delete_objects
+        self.assertEqual(method, 'POST')
+        self.assertTrue('delete=' in url)
+        self.assertTrue('Content-MD5' in headers)
+
+        self.multi_delete_requests.append(body)
+        keys = [key.text for key in ET.XML(body).findall('Object/Key')]
+
+        errors = ''.join(
+            '<Error><Key>%s</Key><Code>AccessDenied</Code>'
+            '<Message>Access Denied</Message></Error>' % (key)
+            for key in keys if key.startswith('denied'))
+        body = ('<DeleteResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+                '%s</DeleteResult>' % (errors))
+
+        return (httplib.OK,
+                body,
+                headers,
+                httplib.responses[httplib.OK])
+
     def _foo_bar_container_NOT_FOUND(self, method, url, body, headers):
         # test_delete_container_not_found
         return (httplib.NOT_FOUND,
@@ -274,6 +308,29 @@ class S3MockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
                     headers,
                     httplib.responses[httplib.OK])
 
+    def _foo_bar_container_foo_test_stream_data_MULTIPART_RETRY(
+            self, method, url, body, headers):
+        if method != 'PUT':
+            return self._foo_bar_container_foo_test_stream_data_MULTIPART(
+                method, url, body, headers)
+
+        # Upload chunk multipart request, fail first attempt of each part
+        query = parse_qs(urlparse.urlsplit(url).query)
+        part_number = int(query['partNumber'][0])
+
+        if part_number not in self.failed_parts:
+            self.failed_parts.add(part_number)
+            return (self.failed_part_status,
+                    '',
+                    headers,
+                    httplib.responses[self.failed_part_status])
+
+        headers = {'etag': '"0cc175b9c0f1b6a831c399e269772661"'}
+        return (httplib.OK,
+                '',
+                headers,
+                httplib.responses[httplib.OK])
+
     def _foo_bar_container_LIST_MULTIPART(self, method, url, body, headers):
         query_string = urlparse.urlsplit(url).query
         query = parse_qs(query_string)
@@ -496,8 +553,17 @@ class S3Tests(unittest.TestCase):
         self.assertEqual(obj.container.name, 'test_container')
         self.assertEqual(
             obj.extra['last_modified'], '2011-04-09T19:05:18.000Z')
+        self.assertEqual(obj.extra['storage_class'], 'STANDARD')
         self.assertTrue('owner' in obj.meta_data)
 
+    def test_list_container_objects_empty_response_body(self):
+        self.mock_response_klass.type = 'EMPTY_BODY'
+        container = Container(name='test_container', extra={},
+                              driver=self.driver)
+        self.assertRaises(MalformedResponseError,
+                          self.driver.list_container_objects,
+                          container=container)
+
     def test_list_container_objects_iterator_has_more(self):
         self.mock_response_klass.type = 'ITERATOR'
         container = Container(name='test_container', extra={},
@@ -526,6 +592,27 @@ class S3Tests(unittest.TestCase):
         self.assertEqual(obj.container.name, 'test_container')
         self.assertTrue('owner' in obj.meta_data)
 
+    def test_iterate_container_objects_async(self):
+        self.mock_response_klass.type = 'ITERATOR'
+        self.driver.async_connection.conn_class = type(
+            'AsyncS3MockHttp', (AsyncMockHttp, ),
+            {'mock_cls': self.mock_response_klass})
+        container = Container(name='test_container', extra={},
+                              driver=self.driver)
+
+        async def list_objects():
+            objects = []
+            async for obj in self.driver.iterate_container_objects_async(
+                    container=container):
+                objects.append(obj)
+            return objects
+
+        objects = run_async(list_objects())
+        self.assertEqual(len(objects), 5)
+        self.assertEqual(objects[0].name, '1.zip')
+        self.assertEqual(objects[0].hash, '4397da7a7649e8085de9916c240e8166')
+        self.assertEqual(objects[0].container.name, 'test_container')
+
     def test_get_container_doesnt_exist(self):
         self.mock_response_klass.type = 'get_container'
         try:
@@ -1079,6 +1166,164 @@ class S3Tests(unittest.TestCase):
 
         return
 
+    def test_upload_object_via_stream_parallel_multipart(self):
+        if not self.driver.supports_s3_multipart_upload:
+            return
+
+        self.mock_response_klass.type = 'MULTIPART'
+
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        object_name = 'foo_test_stream_data'
+        iterator = BytesIO(b('2345' * CHUNK_SIZE + '6'))
+        extra = {'content_type': 'text/plain'}
+
+        self.driver.multipart_concurrency = 3
+
+        with mock.patch.object(self.driver, '_commit_multipart',
+                               wraps=self.driver._commit_multipart) as \
+                mock_commit_multipart:
+            obj = self.driver.upload_object_via_stream(container=container,
+                                                       object_name=object_name,
+                                                       iterator=iterator,
+                                                       extra=extra)
+
+        self.assertEqual(obj.name, object_name)
+        self.assertEqual(obj.size, CHUNK_SIZE * 4 + 1)
+
+        # Parts are committed in order
+        chunks = mock_commit_multipart.call_args[0][3]
+        self.assertEqual([chunk[0] for chunk in chunks], [1, 2, 3, 4, 5])
+
+    def test_upload_multipart_chunks_concurrency_is_bounded(self):
+        if not self.driver.supports_s3_multipart_upload:
+            return
+
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        lock = threading.Lock()
+        state = {'active': 0, 'max_active': 0}
+
+        def mock_upload_part(connection, request_path, upload_id,
+                             part_number, data):
+            with lock:
+                state['active'] += 1
+                state['max_active'] = max(state['max_active'],
+                                          state['active'])
+
+            time.sleep(0.05)
+
+            with lock:
+                state['active'] -= 1
+
+            return 'etag-%s' % (part_number)
+
+        self.driver._upload_multipart_part = mock_upload_part
+
+        iterator = BytesIO(b('a' * CHUNK_SIZE * 6))
+        result = self.driver._upload_multipart_chunks(
+            container, 'foo_test_stream_data', 'upload-id', iterator,
+            concurrency=2)
+        chunks, data_hash, bytes_transferred = result
+
+        self.assertEqual(state['max_active'], 2)
+        self.assertEqual(chunks, [(i, 'etag-%s' % (i)) for i in range(1, 7)])
+        self.assertEqual(bytes_transferred, CHUNK_SIZE * 6)
+        self.assertTrue(data_hash)
+
+    def test_upload_multipart_chunks_invalid_arguments(self):
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+
+        self.assertRaisesRegex(ValueError, 'part_size must be at least',
+                               self.driver._upload_multipart_chunks,
+                               container, 'foo', 'upload-id', BytesIO(),
+                               part_size=CHUNK_SIZE - 1)
+        self.assertRaisesRegex(ValueError, 'concurrency must be greater',
+                               self.driver._upload_multipart_chunks,
+                               container, 'foo', 'upload-id', BytesIO(),
+                               concurrency=-1)
+
+    @mock.patch('libcloud.storage.drivers.s3.time.sleep')
+    def test_upload_object_via_stream_multipart_part_is_retried(self,
+                                                                mock_sleep):
+        if not self.driver.supports_s3_multipart_upload:
+            return
+
+        self.mock_response_klass.type = 'MULTIPART_RETRY'
+        self.mock_response_klass.failed_parts = set()
+
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        object_name = 'foo_test_stream_data'
+        iterator = BytesIO(b('23' * CHUNK_SIZE + '4'))
+        extra = {'content_type': 'text/plain'}
+
+        for concurrency in [1, 2]:
+            self.mock_response_klass.failed_parts = set()
+            self.driver.multipart_concurrency = concurrency
+            iterator.seek(0)
+
+            obj = self.driver.upload_object_via_stream(container=container,
+                                                       object_name=object_name,
+                                                       iterator=iterator,
+                                                       extra=extra)
+            self.assertEqual(obj.size, CHUNK_SIZE * 2 + 1)
+            self.assertEqual(self.mock_response_klass.failed_parts,
+                             set([1, 2, 3]))
+
+        self.assertEqual(mock_sleep.call_count, 6)
+
+        # Retries are exhausted, upload is aborted
+        self.mock_response_klass.failed_parts = set()
+        self.driver.multipart_part_retries = 0
+        iterator.seek(0)
+
+        with mock.patch.object(self.driver, '_abort_multipart') as \
+                mock_abort_multipart:
+            self.assertRaisesRegex(LibcloudError, 'Unknown error',
+                                   self.driver.upload_object_via_stream,
+                                   container=container,
+                                   object_name=object_name,
+                                   iterator=iterator,
+                                   extra=extra)
+
+        self.assertEqual(mock_abort_multipart.call_count, 1)
+
+    @mock.patch('libcloud.storage.drivers.s3.time.sleep')
+    def test_upload_object_via_stream_multipart_permanent_error(self,
+                                                                mock_sleep):
+        if not self.driver.supports_s3_multipart_upload:
+            return
+
+        # Permanent errors are not retried
+        self.mock_response_klass.type = 'MULTIPART_RETRY'
+        patcher = mock.patch.object(self.mock_response_klass,
+                                    'failed_part_status', httplib.NOT_FOUND)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        iterator = BytesIO(b('23' * CHUNK_SIZE + '4'))
+
+        for concurrency in [1, 2]:
+            self.mock_response_klass.failed_parts = set()
+            self.driver.multipart_concurrency = concurrency
+            iterator.seek(0)
+
+            with mock.patch.object(self.driver, '_abort_multipart') as \
+                    mock_abort_multipart:
+                self.assertRaisesRegex(LibcloudError, 'Error uploading chunk',
+                                       self.driver.upload_object_via_stream,
+                                       container=container,
+                                       object_name='foo_test_stream_data',
+                                       iterator=iterator)
+
+            self.assertEqual(mock_abort_multipart.call_count, 1)
+
+        self.assertEqual(mock_sleep.call_count, 0)
+
     def test_s3_list_multipart_uploads(self):
         if not self.driver.supports_s3_multipart_upload:
             return
@@ -1131,6 +1376,30 @@ class S3Tests(unittest.TestCase):
         result = self.driver.delete_object(obj=obj)
         self.assertTrue(result)
 
+    @mock.patch('libcloud.storage.drivers.s3.MULTI_OBJECT_DELETE_MAX_KEYS', 2)
+    def test_delete_objects(self):
+        if not self.driver.supports_s3_multi_object_delete:
+            return
+
+        self.mock_response_klass.type = 'MULTI_DELETE'
+        self.mock_response_klass.multi_delete_requests = []
+
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        objs = [Object(name=name, size=1234, hash=None, extra=None,
+                       meta_data=None, container=container, driver=self.driver)
+                for name in ['foo1', 'denied_foo2', 'foo3']]
+
+        results = list(self.driver.delete_objects(iter(objs)))
+
+        self.assertEqual(len(self.mock_response_klass.multi_delete_requests),
+                         2)
+        self.assertEqual([result[0] for result in results], objs)
+        self.assertIsNone(results[0][1])
+        self.assertTrue(isinstance(results[1][1], LibcloudError))
+        self.assertTrue('AccessDenied' in str(results[1][1]))
+        self.assertIsNone(results[2][1])
+
     def test_region_keyword_argument(self):
         # Default region
         driver  = S3StorageDriver(*self.driver_args)
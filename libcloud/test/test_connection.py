@@ -14,22 +14,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import os
 import socket
+import asyncio
 import sys
 import ssl
+import concurrent.futures
+from time import sleep
 
 from mock import Mock, patch
 
+import requests
 import requests_mock
 
 from libcloud.test import unittest
+from libcloud.test import MockHttp, AsyncMockHttp, run_async
 from libcloud.common.base import Connection, CertificateConnection
+from libcloud.common.base import AsyncConnection, AsyncPageIterator
+from libcloud.common.base import JsonResponse, Response
+from libcloud.common.base import PollingConnection, PollSchedule
+from libcloud.common.base import ExponentialBackoffPollSchedule
+from libcloud.common.base import JobWaiter
+from libcloud.common.base import ConnectionUserAndKey
+from libcloud.utils.ratelimit import RateLimit, RATE_LIMITER
+from libcloud.utils.retry import RetryPolicy
+from libcloud.common.types import LibcloudError
+from libcloud.common.exceptions import BaseHTTPError
 from libcloud.http import LibcloudBaseConnection
 from libcloud.http import LibcloudConnection
 from libcloud.http import SignedHTTPSAdapter
 from libcloud.utils.misc import retry
 from libcloud.utils.py3 import assertRaisesRegex
+from libcloud.utils.py3 import httplib
 
 
 class BaseConnectionClassTestCase(unittest.TestCase):
@@ -432,5 +449,498 @@ class CertificateConnectionClassTestCase(unittest.TestCase):
         self.assertEqual(adapter.cert_file, 'test.pem')
 
 
+class AsyncConnectionMockHttp(MockHttp):
+    def _items(self, method, url, body, headers):
+        self.assertUrlContainsQueryParams(url, {'api_key': 'secret'})
+        return (httplib.OK, '{"items": [1, 2]}',
+                {'content-type': 'application/json'},
+                httplib.responses[httplib.OK])
+
+    def _error(self, method, url, body, headers):
+        return (httplib.INTERNAL_SERVER_ERROR, '{"message": "error"}',
+                {'content-type': 'application/json'},
+                httplib.responses[httplib.INTERNAL_SERVER_ERROR])
+
+
+class AsyncConnectionTestCase(unittest.TestCase):
+    class JsonConnection(Connection):
+        responseCls = JsonResponse
+
+        def add_default_params(self, params):
+            params['api_key'] = 'secret'
+            return params
+
+    def setUp(self):
+        AsyncConnectionMockHttp.type = None
+        self.connection = self.JsonConnection(host='localhost')
+        self.async_connection = AsyncConnection(self.connection)
+        self.async_connection.conn_class = type(
+            'AsyncMockHttp', (AsyncMockHttp, ),
+            {'mock_cls': AsyncConnectionMockHttp})
+
+    def test_request_uses_connection_hooks_and_response_class(self):
+        async def request():
+            return await asyncio.gather(
+                self.async_connection.request('/items'),
+                self.async_connection.request('/items'))
+
+        responses = run_async(request())
+
+        for response in responses:
+            self.assertTrue(isinstance(response, JsonResponse))
+            self.assertEqual(response.status, httplib.OK)
+            self.assertEqual(response.object, {'items': [1, 2]})
+            self.assertEqual(response.connection, self.connection)
+
+    def test_request_error_response(self):
+        self.connection.set_context({'foo': 'bar'})
+
+        self.assertRaises(BaseHTTPError, run_async,
+                          self.async_connection.request('/error'))
+        self.assertEqual(self.connection.context, {})
+
+    def test_connect_uses_wrapped_connection_settings(self):
+        self.connection.timeout = 10
+        self.async_connection.connect()
+        self.assertEqual(self.async_connection.connection.host,
+                         'https://localhost')
+        self.assertEqual(self.async_connection.connection.mock.session.timeout,
+                         10)
+
+
+class AsyncPageIteratorTestCase(unittest.TestCase):
+    def _collect(self, iterator):
+        async def collect():
+            items = []
+            async for item in iterator:
+                items.append(item)
+            return items
+
+        return run_async(collect())
+
+    def test_pagination(self):
+        pages = {None: ([1, 2], 'b'), 'b': ([], 'c'), 'c': ([3], None)}
+        markers = []
+
+        async def fetch_page(marker):
+            markers.append(marker)
+            return pages[marker]
+
+        self.assertEqual(self._collect(AsyncPageIterator(fetch_page)),
+                         [1, 2, 3])
+        self.assertEqual(markers, [None, 'b', 'c'])
+
+    def test_from_iterator(self):
+        iterator = AsyncPageIterator.from_iterator(lambda: iter(range(7)),
+                                                   page_size=3)
+        self.assertEqual(self._collect(iterator), list(range(7)))
+
+        iterator = AsyncPageIterator.from_iterator(lambda: iter([]))
+        self.assertEqual(self._collect(iterator), [])
+
+
+class RateLimitedConnection(ConnectionUserAndKey):
+    rate_limits = [RateLimit(rate=1, burst=2, scope='account'),
+                   RateLimit(rate=10, burst=1, scope='action')]
+    rate_limiting = True
+
+
+class RateLimitingTestCase(unittest.TestCase):
+    def setUp(self):
+        RATE_LIMITER.clear()
+        # Other tests may leave a mock connection class in place on the base
+        # connection classes, requests in this test case need to go through
+        # requests_mock
+        RateLimitedConnection.conn_class = LibcloudConnection
+
+    def tearDown(self):
+        RATE_LIMITER.clear()
+        del RateLimitedConnection.conn_class
+
+    def test_rate_limiting_is_disabled_by_default(self):
+        conn = RateLimitedConnection('user', 'key', host='mock.com')
+        conn.rate_limiting = None
+        self.assertFalse(conn._use_rate_limiting())
+        self.assertEqual(conn._reserve_rate_limit('/a'), 0)
+
+        with patch.dict(os.environ, {'LIBCLOUD_RATE_LIMITING': '1'}):
+            self.assertTrue(conn._use_rate_limiting())
+
+        conn = Connection(host='mock.com')
+        conn.rate_limiting = True
+        self.assertFalse(conn._use_rate_limiting())
+
+    def test_buckets_are_shared_per_scope(self):
+        conn1 = RateLimitedConnection('user1', 'key', host='mock.com')
+        conn2 = RateLimitedConnection('user1', 'key', host='mock.com')
+        conn3 = RateLimitedConnection('user2', 'key', host='mock.com')
+
+        buckets1 = conn1.get_rate_limit_buckets('/a')
+        self.assertEqual(conn2.get_rate_limit_buckets('/a'), buckets1)
+
+        # Different account
+        buckets3 = conn3.get_rate_limit_buckets('/a')
+        self.assertNotEqual(buckets3[0], buckets1[0])
+
+        # Different action
+        buckets = conn1.get_rate_limit_buckets('/b', method='POST')
+        self.assertEqual(buckets[0], buckets1[0])
+        self.assertNotEqual(buckets[1], buckets1[1])
+
+        # Credentials are not used as bucket keys
+        self.assertFalse('user1' in conn1.get_rate_limit_account())
+
+    @patch('libcloud.common.base.time.sleep')
+    def test_request_waits_for_tokens(self, mock_sleep):
+        conn = RateLimitedConnection('user', 'key', host='mock.com',
+                                     secure=False)
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('GET', 'http://mock.com/a', text='')
+            m.register_uri('GET', 'http://mock.com/b', text='')
+            m.register_uri('GET', 'http://mock.com/c', text='')
+            conn.request('/a')
+            conn.request('/b')
+            self.assertEqual(mock_sleep.call_count, 0)
+
+            # Account bucket is empty
+            conn.request('/c')
+            self.assertEqual(mock_sleep.call_count, 1)
+            self.assertTrue(0.9 < mock_sleep.call_args[0][0] <= 1)
+
+    def test_async_request_waits_for_tokens(self):
+        conn = RateLimitedConnection('user', 'key', host='mock.com')
+        conn.connection = Mock()
+        async_conn = AsyncConnection(conn)
+        async_conn.connection = Mock()
+
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        async def fake_request(**kwargs):
+            return Mock(status=200, headers={}, text='', reason='OK')
+
+        async_conn.connection.request = fake_request
+
+        async def run():
+            with patch('libcloud.common.base.asyncio.sleep', fake_sleep):
+                for _ in range(3):
+                    await async_conn.request('/a')
+
+        conn._create_response = Mock()
+        run_async(run())
+
+        # Action bucket allows a single request at once and account bucket
+        # is empty after two requests
+        self.assertEqual(len(delays), 2)
+        self.assertTrue(0.09 < delays[0] <= 0.1)
+        self.assertTrue(0.9 < delays[1] <= 1)
+
+
+class RetryingConnection(Connection):
+    responseCls = Response
+    retry_policy = RetryPolicy(max_attempts=3)
+
+
+@patch('libcloud.utils.retry.time.sleep')
+class RetryPolicyConnectionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.conn = RetryingConnection(host='mock.com', port=80, secure=False)
+
+    def test_failed_requests_are_retried(self, mock_sleep):
+        with requests_mock.Mocker() as m:
+            m.register_uri('GET', 'http://mock.com/test',
+                           [{'status_code': 503, 'text': 'unavailable'},
+                            {'exc': requests.exceptions.ConnectionError},
+                            {'text': 'ok'}])
+            response = self.conn.request('/test')
+
+        self.assertEqual(response.body, 'ok')
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_non_idempotent_requests_are_not_retried(self, mock_sleep):
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', 'http://mock.com/test',
+                           [{'status_code': 503, 'text': 'unavailable'},
+                            {'text': 'ok'}])
+            self.assertRaises(BaseHTTPError, self.conn.request, '/test',
+                              method='POST')
+
+        self.assertEqual(m.call_count, 1)
+
+        self.conn.is_idempotent_request = Mock(return_value=True)
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', 'http://mock.com/test',
+                           [{'status_code': 503, 'text': 'unavailable'},
+                            {'text': 'ok'}])
+            response = self.conn.request('/test', method='POST')
+
+        self.assertEqual(response.body, 'ok')
+
+    def test_raw_upload_is_rewound(self, mock_sleep):
+        body = io.BytesIO(b'0123456789')
+        uploaded = []
+
+        def callback(request, context):
+            uploaded.append(request.body.read())
+
+            if len(uploaded) == 1:
+                raise requests.exceptions.ConnectionError('reset')
+
+            return ''
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('PUT', 'http://mock.com/upload', text=callback)
+            response = self.conn.request('/upload', method='PUT', data=body,
+                                         raw=True)
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(uploaded, [b'0123456789', b'0123456789'])
+
+
+class FakePollingConnection(PollingConnection):
+    request_method = '_fake_request'
+
+    def __init__(self, statuses, headers=None):
+        super(FakePollingConnection, self).__init__(host='mock.com')
+        self.statuses = list(statuses)
+        self.headers = headers or {}
+        self.requests = []
+
+    def _fake_request(self, **kwargs):
+        self.requests.append(kwargs)
+
+        if kwargs['action'] == '/job':
+            return Mock(object=None, headers={})
+
+        return Mock(object=self.statuses.pop(0), headers=self.headers)
+
+    def get_poll_request_kwargs(self, response, context, request_kwargs):
+        return {'action': '/job/status'}
+
+    def has_completed(self, response):
+        return response.object == 'done'
+
+
+@patch('libcloud.common.base.time.sleep')
+class PollingConnectionTestCase(unittest.TestCase):
+    def test_fixed_poll_interval(self, mock_sleep):
+        conn = FakePollingConnection(['pending', 'pending', 'done'])
+        conn.poll_interval = 3
+
+        response = conn.async_request('/job')
+        self.assertEqual(response.object, 'done')
+        self.assertEqual(len(conn.requests), 4)
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list],
+                         [3, 3])
+
+        stats = conn.last_poll_stats
+        self.assertTrue(stats.completed)
+        self.assertEqual(stats.poll_count, 3)
+        self.assertEqual(stats.sleep_time, 6)
+        self.assertTrue(stats.duration >= 0)
+
+    def test_exponential_backoff(self, mock_sleep):
+        conn = FakePollingConnection(['pending'] * 5 + ['done'])
+        conn.poll_interval = 1
+        conn.poll_backoff = 2
+        conn.poll_max_interval = 10
+
+        conn.async_request('/job')
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list],
+                         [1, 2, 4, 8, 10])
+
+    def test_exponential_backoff_jitter(self, mock_sleep):
+        schedule = ExponentialBackoffPollSchedule(interval=1, multiplier=2,
+                                                  max_interval=None,
+                                                  jitter=0.5)
+
+        for poll_count in range(1, 6):
+            delay = schedule.get_delay(poll_count=poll_count)
+            base = 2 ** (poll_count - 1)
+            self.assertTrue(base * 0.5 <= delay <= base)
+
+    def test_custom_poll_schedule(self, mock_sleep):
+        conn = FakePollingConnection(['pending', 'done'])
+        conn.poll_schedule = PollSchedule(interval=7)
+
+        conn.async_request('/job')
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [7])
+
+    def test_retry_after_hint(self, mock_sleep):
+        conn = FakePollingConnection(['pending', 'pending', 'done'],
+                                     headers={'retry-after': '5'})
+        conn.poll_interval = 1
+
+        conn.async_request('/job')
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list],
+                         [5, 5])
+
+        response = Mock(headers={'retry-after': 'Mon, 01 Jan 2001 00:00:00 '
+                                                'GMT'})
+        self.assertEqual(conn.get_poll_interval_hint(response), 0)
+
+        response = Mock(headers={'retry-after': 'invalid'})
+        self.assertIsNone(conn.get_poll_interval_hint(response))
+
+    def test_max_polls(self, mock_sleep):
+        conn = FakePollingConnection(['pending'] * 10)
+        conn.poll_interval = 0
+        conn.max_polls = 3
+
+        assertRaisesRegex(self, LibcloudError, 'after 3 polls',
+                          conn.async_request, '/job')
+        self.assertEqual(len(conn.requests), 4)
+        self.assertFalse(conn.last_poll_stats.completed)
+        self.assertEqual(conn.last_poll_stats.poll_count, 3)
+
+    def test_sleep_is_bound_by_timeout(self, mock_sleep):
+        conn = FakePollingConnection(['pending'] * 10)
+        conn.poll_interval = 1000
+        conn.timeout = 0.01
+
+        mock_sleep.side_effect = lambda delay: sleep(0.02)
+        assertRaisesRegex(self, LibcloudError, 'did not complete in',
+                          conn.async_request, '/job')
+        self.assertTrue(mock_sleep.call_args[0][0] <= 0.01)
+
+
+class FakeBatchPollingConnection(PollingConnection):
+    request_method = '_fake_request'
+    poll_interval = 0.01
+
+    def __init__(self, statuses):
+        super(FakeBatchPollingConnection, self).__init__(host='mock.com')
+        self.statuses = statuses
+        self.batches = []
+
+    def _fake_request(self, action, **kwargs):
+        if action == '/start':
+            return Mock(object=kwargs['params']['id'], headers={})
+
+        job_id = action.split('/')[-1]
+        status = self.statuses[job_id].pop(0)
+
+        if status == 'error':
+            raise Exception('Failed to poll job %s' % (job_id))
+
+        return Mock(object=status, headers={})
+
+    def poll_jobs(self, jobs):
+        self.batches.append([job.poll_kwargs['action'] for job in jobs])
+        return super(FakeBatchPollingConnection, self).poll_jobs(jobs)
+
+    def get_poll_request_kwargs(self, response, context, request_kwargs):
+        return {'action': '/job/%s' % (response.object)}
+
+    def has_completed(self, response):
+        if response.object == 'failed':
+            raise Exception('Job failed')
+
+        return response.object == 'done'
+
+    def start(self, job_id):
+        return self.start_async_request('/start', params={'id': job_id})
+
+
+class JobWaiterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.waiter = JobWaiter()
+
+    def tearDown(self):
+        self.waiter.shutdown()
+
+    def test_wait_polls_jobs_together(self):
+        conn1 = FakeBatchPollingConnection({
+            '1': ['pending', 'done'],
+            '2': ['pending', 'pending', 'done'],
+            '3': ['done']
+        })
+        conn2 = FakeBatchPollingConnection({'4': ['pending', 'done']})
+
+        jobs = [conn1.start('1'), conn1.start('2'), conn1.start('3'),
+                conn2.start('4')]
+        responses = self.waiter.wait(jobs, timeout=5)
+
+        self.assertEqual([r.object for r in responses], ['done'] * 4)
+        self.assertEqual(conn1.batches[0], ['/job/1', '/job/2', '/job/3'])
+        self.assertEqual(conn1.batches[1], ['/job/1', '/job/2'])
+        self.assertEqual(conn1.batches[2], ['/job/2'])
+        self.assertEqual(conn2.batches, [['/job/4'], ['/job/4']])
+
+        self.assertEqual([job.stats.poll_count for job in jobs], [2, 3, 1, 2])
+        self.assertTrue(all(job.stats.completed for job in jobs))
+
+    def test_errors_only_affect_failed_jobs(self):
+        # Batch is polled again one job at a time if polling it fails
+        conn = FakeBatchPollingConnection({
+            '1': ['pending', 'pending', 'done'],
+            '2': ['error', 'error'],
+            '3': ['failed'],
+        })
+
+        futures = [self.waiter.submit(conn.start(job_id))
+                   for job_id in ['1', '2', '3']]
+        concurrent.futures.wait(futures, timeout=5)
+
+        self.assertEqual(futures[0].result().object, 'done')
+        assertRaisesRegex(self, Exception, 'Failed to poll job 2',
+                          futures[1].result)
+        assertRaisesRegex(self, Exception, 'Job failed', futures[2].result)
+
+    def test_timeout_and_max_polls(self):
+        conn1 = FakeBatchPollingConnection({'1': ['pending'] * 1000})
+        conn1.max_polls = 3
+        conn2 = FakeBatchPollingConnection({'2': ['pending'] * 1000})
+        conn2.timeout = 0.05
+
+        job1 = conn1.start('1')
+        job2 = conn2.start('2')
+        future1 = self.waiter.submit(job1)
+        future2 = self.waiter.submit(job2)
+        concurrent.futures.wait([future1, future2], timeout=5)
+
+        assertRaisesRegex(self, LibcloudError, 'after 3 polls',
+                          future1.result)
+        assertRaisesRegex(self, LibcloudError, 'in 0.05 seconds',
+                          future2.result)
+        self.assertEqual(job1.stats.poll_count, 3)
+        self.assertFalse(job2.stats.completed)
+
+    def test_wait_timeout_cancels_pending_jobs(self):
+        conn = FakeBatchPollingConnection({
+            '1': ['done'],
+            '2': ['pending'] * 1000
+        })
+
+        jobs = [conn.start('1'), conn.start('2')]
+        assertRaisesRegex(self, concurrent.futures.TimeoutError,
+                          '1 \\(of 2\\) jobs did not complete',
+                          self.waiter.wait, jobs, timeout=0.1)
+
+        # Job which hasn't completed is not polled anymore (poll which was
+        # already in progress when the job was cancelled might still finish)
+        sleep(0.05)
+        poll_count = jobs[1].stats.poll_count
+        sleep(0.1)
+        self.assertEqual(jobs[1].stats.poll_count, poll_count)
+        self.assertTrue(jobs[0].stats.completed)
+        self.assertFalse(jobs[1].stats.completed)
+
+    def test_shutdown_cancels_pending_jobs(self):
+        conn = FakeBatchPollingConnection({'1': ['pending'] * 1000})
+        conn.poll_interval = 100
+
+        future = self.waiter.submit(conn.start('1'))
+        self.waiter.shutdown()
+
+        self.assertTrue(future.cancelled())
+        self.assertRaises(RuntimeError, self.waiter.submit, conn.start('1'))
+
+
 if __name__ == '__main__':
     sys.exit(unittest.main())
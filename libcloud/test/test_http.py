@@ -15,14 +15,23 @@
 
 import os
 import sys
+import time
 import os.path
 import warnings
+import threading
+
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+from mock import Mock
 
 import libcloud.security
 
 from libcloud.utils.py3 import reload
 from libcloud.utils.py3 import assertRaisesRegex
 from libcloud.http import LibcloudConnection
+from libcloud.http import ConnectionPoolRegistry
+from libcloud.common.base import Connection
 
 from libcloud.test import unittest
 
@@ -91,5 +100,123 @@ class TestHttpLibSSLTests(unittest.TestCase):
 
         self.assertTrue(self.httplib_object.ca_cert is not None)
 
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'ok'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ConnectionPoolRegistryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.registry = ConnectionPoolRegistry(pool_connections=2,
+                                               pool_maxsize=4,
+                                               idle_timeout=300)
+        self.orig_pool_registry = LibcloudConnection.pool_registry
+        LibcloudConnection.pool_registry = self.registry
+        self.orig_proxy = os.environ.pop('http_proxy', None)
+
+    def tearDown(self):
+        LibcloudConnection.pool_registry = self.orig_pool_registry
+        self.registry.clear()
+
+        if self.orig_proxy:
+            os.environ['http_proxy'] = self.orig_proxy
+
+    def test_get_adapter_is_keyed_by_endpoint_and_settings(self):
+        adapter1 = self.registry.get_adapter('https://foo.bar')
+        adapter2 = self.registry.get_adapter('https://foo.bar')
+        self.assertTrue(adapter1 is adapter2)
+        self.assertEqual(adapter1._pool_maxsize, 4)
+        self.assertEqual(adapter1._pool_connections, 2)
+
+        self.assertFalse(adapter1 is self.registry.get_adapter(
+            'https://foo.bar:8443'))
+        self.assertFalse(adapter1 is self.registry.get_adapter(
+            'https://foo.bar', verify=False))
+        self.assertFalse(adapter1 is self.registry.get_adapter(
+            'https://foo.bar', proxy_url='http://127.0.0.1:3128'))
+        self.assertFalse(adapter1 is self.registry.get_adapter(
+            'https://foo.bar', cert_file='cert.pem', key_file='key.pem'))
+
+        stats = self.registry.get_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 5)
+        self.assertEqual(len(stats['pools']), 5)
+
+    def test_evict_idle(self):
+        adapter = self.registry.get_adapter('https://foo.bar')
+        adapter.close_pools = Mock()
+        self.assertEqual(self.registry.evict_idle(), 0)
+
+        adapter.last_used = time.time() - 301
+        self.assertEqual(self.registry.evict_idle(), 1)
+        adapter.close_pools.assert_called_once_with()
+
+        self.assertFalse(adapter is self.registry.get_adapter(
+            'https://foo.bar'))
+        self.assertEqual(self.registry.get_stats()['evictions'], 1)
+
+    def test_shared_adapter_is_not_closed_with_session(self):
+        conn = LibcloudConnection('foo.bar', port=443, shared_pool=True)
+        adapter = conn.session.get_adapter('https://foo.bar/path')
+        adapter.close_pools = Mock()
+
+        conn.session.close()
+        self.assertEqual(adapter.close_pools.call_count, 0)
+
+    def test_connections_share_keep_alive_sockets(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        try:
+            port = server.server_address[1]
+            conns = [LibcloudConnection('127.0.0.1', port=port,
+                                        shared_pool=True) for _ in range(3)]
+
+            for conn in conns:
+                conn.request('GET', '/')
+                self.assertEqual(conn.read(), b'ok')
+
+            adapter = conns[0].session.get_adapter('http://127.0.0.1:%s/' %
+                                                   (port))
+            for conn in conns[1:]:
+                self.assertTrue(conn.session.get_adapter(
+                    'http://127.0.0.1:%s/' % (port)) is adapter)
+
+            stats = adapter.get_stats()
+            self.assertEqual(stats['requests'], 3)
+            self.assertEqual(stats['connections'], 1)
+        finally:
+            self.registry.clear()
+            server.shutdown()
+            server.server_close()
+
+    def test_connection_class_opt_in(self):
+        conn = Connection(host='foo.bar')
+        conn.connect()
+        self.assertFalse(conn.connection.shared_pool)
+
+        conn = Connection(host='foo.bar')
+        conn.shared_pool = True
+        conn.connect()
+        self.assertTrue(conn.connection.shared_pool)
+        self.assertEqual(len(self.registry.get_stats()['pools']), 1)
+
+
 if __name__ == '__main__':
     sys.exit(unittest.main())
@@ -15,8 +15,16 @@
 
 import os.path
 import sys
+import json
+import time
+import shutil
+import tempfile
 import unittest
 
+import mock
+
+from libcloud.utils.py3 import assertRaisesRegex
+
 import libcloud.pricing
 
 PRICING_FILE_PATH = os.path.join(os.path.dirname(__file__), 'pricing_test.json')
@@ -24,6 +32,9 @@ PRICING_FILE_PATH = os.path.join(os.path.dirname(__file__), 'pricing_test.json')
 
 class PricingTestCase(unittest.TestCase):
 
+    def setUp(self):
+        libcloud.pricing.invalidate_pricing_cache()
+
     def test_get_pricing_success(self):
         self.assertFalse('foo' in libcloud.pricing.PRICING_DATA['compute'])
 
@@ -102,5 +113,306 @@ class PricingTestCase(unittest.TestCase):
                                      pricing={'foo': 1})
         self.assertTrue('foo' in libcloud.pricing.PRICING_DATA['compute'])
 
+    def test_pricing_change_callbacks(self):
+        callback = mock.Mock()
+        libcloud.pricing.register_pricing_change_callback(callback)
+        libcloud.pricing.register_pricing_change_callback(callback)
+        self.addCleanup(libcloud.pricing.PRICING_CHANGE_CALLBACKS.remove,
+                        callback)
+
+        libcloud.pricing.set_pricing(driver_type='compute', driver_name='foo',
+                                     pricing={'foo': 1})
+        self.assertEqual(callback.call_count, 1)
+
+        libcloud.pricing.invalidate_module_pricing_cache(driver_type='compute',
+                                                         driver_name='foo')
+        self.assertEqual(callback.call_count, 2)
+
+        libcloud.pricing.invalidate_pricing_cache()
+        self.assertEqual(callback.call_count, 3)
+
+
+class PricingIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        libcloud.pricing.invalidate_pricing_cache()
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.pricing_file_path = os.path.join(self.tmp_dir, 'pricing.json')
+
+        pricing_data = {
+            'compute': {
+                'foo': {'1': 1.0, '2': '2.5', 'nested': {'a': 1}},
+                'foo_bar': {'1': 3.0},
+                'zzz': {'small': 0.01}
+            },
+            'storage': {
+                'foo': {'1': 4.0}
+            },
+            'updated': 1309019791
+        }
+
+        with open(self.pricing_file_path, 'w') as fp:
+            json.dump(pricing_data, fp)
+
+    def tearDown(self):
+        libcloud.pricing.invalidate_pricing_cache()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_compile_pricing_index(self):
+        index_file_path = libcloud.pricing.compile_pricing_index(
+            pricing_file_path=self.pricing_file_path)
+        self.assertEqual(index_file_path,
+                         os.path.join(self.tmp_dir, 'pricing.idx'))
+
+        index = libcloud.pricing.PricingIndex(index_file_path)
+        self.assertTrue(index.is_up_to_date(self.pricing_file_path))
+        self.assertEqual(index.count, 5)
+
+        self.assertEqual(index.get('compute', 'foo', '1'), 1.0)
+        self.assertEqual(index.get('compute', 'foo', 2), 2.5)
+        self.assertEqual(index.get('compute', 'foo_bar', '1'), 3.0)
+        self.assertEqual(index.get('compute', 'zzz', 'small'), 0.01)
+        self.assertEqual(index.get('storage', 'foo', '1'), 4.0)
+
+        # Unknown size and sizes without a simple price
+        self.assertIsNone(index.get('compute', 'foo', '3'))
+        self.assertIsNone(index.get('compute', 'foo', 'nested'))
+        self.assertIsNone(index.get('compute', 'zzz', 'zzzz'))
+
+        # Unknown driver
+        self.assertRaises(KeyError, index.get, 'compute', 'fo', '1')
+        self.assertRaises(KeyError, index.get, 'compute', 'zzzz', '1')
+        self.assertRaises(KeyError, index.get, 'storage', 'bar', '1')
+
+        self.assertEqual(index.get_pricing('compute', 'foo'),
+                         {'1': 1.0, '2': 2.5})
+        self.assertRaises(KeyError, index.get_pricing, 'compute', 'fo')
+        index.close()
+
+    def test_invalid_pricing_index(self):
+        index_file_path = os.path.join(self.tmp_dir, 'pricing.idx')
+
+        with open(index_file_path, 'wb') as fp:
+            fp.write(b'invalid index file content')
+
+        assertRaisesRegex(self, ValueError, 'not a valid pricing index',
+                          libcloud.pricing.PricingIndex, index_file_path)
+        self.assertIsNone(libcloud.pricing.get_pricing_index(
+            pricing_file_path=self.pricing_file_path))
+
+    def test_get_pricing_uses_index(self):
+        libcloud.pricing.compile_pricing_index(
+            pricing_file_path=self.pricing_file_path)
+
+        pricing = libcloud.pricing.get_pricing(
+            driver_type='compute', driver_name='foo',
+            pricing_file_path=self.pricing_file_path)
+        self.assertEqual(pricing, {'1': 1.0, '2': 2.5})
+
+        # Only the requested driver is cached
+        self.assertEqual(list(libcloud.pricing.PRICING_DATA['compute'].keys()),
+                         ['foo'])
+        self.assertEqual(libcloud.pricing.PRICING_DATA['storage'], {})
+
+        self.assertRaises(KeyError, libcloud.pricing.get_pricing,
+                          driver_type='compute', driver_name='inexistent',
+                          pricing_file_path=self.pricing_file_path)
+
+    def test_get_size_price_uses_index(self):
+        libcloud.pricing.compile_pricing_index(
+            pricing_file_path=self.pricing_file_path)
+
+        with mock.patch('libcloud.pricing.get_pricing_file_path',
+                        return_value=self.pricing_file_path):
+            price = libcloud.pricing.get_size_price(driver_type='compute',
+                                                    driver_name='foo',
+                                                    size_id=2)
+            self.assertEqual(price, 2.5)
+            self.assertIsNone(libcloud.pricing.get_size_price(
+                driver_type='compute', driver_name='foo', size_id='3'))
+
+            # Lookups through the index don't populate the pricing cache
+            self.assertEqual(libcloud.pricing.PRICING_DATA['compute'], {})
+
+            # Cached pricing takes precedence over the index
+            libcloud.pricing.set_pricing(driver_type='compute',
+                                         driver_name='foo',
+                                         pricing={'2': 5.0})
+            price = libcloud.pricing.get_size_price(driver_type='compute',
+                                                    driver_name='foo',
+                                                    size_id='2')
+            self.assertEqual(price, 5.0)
+
+            libcloud.pricing.invalidate_module_pricing_cache(
+                driver_type='compute', driver_name='foo')
+            price = libcloud.pricing.get_size_price(driver_type='compute',
+                                                    driver_name='foo',
+                                                    size_id='2')
+            self.assertEqual(price, 2.5)
+
+    def test_invalidate_pricing_cache_keeps_index_open(self):
+        libcloud.pricing.compile_pricing_index(
+            pricing_file_path=self.pricing_file_path)
+        index = libcloud.pricing.get_pricing_index(
+            pricing_file_path=self.pricing_file_path)
+
+        libcloud.pricing.invalidate_pricing_cache()
+        self.assertEqual(libcloud.pricing.PRICING_INDEXES, {})
+
+        # Index can still be used by the threads which are holding it
+        self.assertEqual(index.get('compute', 'foo', '2'), 2.5)
+
+    def test_stale_pricing_index_is_ignored(self):
+        libcloud.pricing.compile_pricing_index(
+            pricing_file_path=self.pricing_file_path)
+
+        with open(self.pricing_file_path, 'w') as fp:
+            json.dump({'compute': {'foo': {'1': 10.0}}, 'updated': 1}, fp)
+
+        self.assertIsNone(libcloud.pricing.get_pricing_index(
+            pricing_file_path=self.pricing_file_path))
+
+        pricing = libcloud.pricing.get_pricing(
+            driver_type='compute', driver_name='foo',
+            pricing_file_path=self.pricing_file_path)
+        self.assertEqual(pricing, {'1': 10.0})
+
+
+class PricingRefresherTestCase(unittest.TestCase):
+
+    def setUp(self):
+        libcloud.pricing.invalidate_pricing_cache()
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.source_file_path = os.path.join(self.tmp_dir, 'source.json')
+        self.file_path = os.path.join(self.tmp_dir, 'pricing.json')
+        self.file_url = 'file://' + self.source_file_path
+
+        self._write_pricing(self.file_path, updated=100, price=1.0)
+
+        self.refresher = libcloud.pricing.PricingRefresher(
+            file_url=self.file_url, file_path=self.file_path, interval=0.01)
+
+    def tearDown(self):
+        self.refresher.stop()
+        libcloud.pricing.invalidate_pricing_cache()
+        shutil.rmtree(self.tmp_dir)
+
+    def _write_pricing(self, file_path, updated, price):
+        data = {
+            'compute': {'foo': {'1': price}, 'bar': {'1': price}},
+            'storage': {},
+            'updated': updated
+        }
+
+        with open(file_path, 'w') as fp:
+            json.dump(data, fp)
+
+    def _get_pricing(self, driver_name='foo'):
+        return libcloud.pricing.get_pricing(driver_type='compute',
+                                            driver_name=driver_name,
+                                            pricing_file_path=self.file_path)
+
+    def test_download_pricing_file_file_url(self):
+        self._write_pricing(self.source_file_path, updated=200, price=2.0)
+
+        libcloud.pricing.download_pricing_file(file_url=self.file_url,
+                                               file_path=self.file_path)
+        self.assertEqual(self._get_pricing(), {'1': 2.0})
+
+    def test_refresh_is_skipped_if_pricing_is_not_newer(self):
+        self._write_pricing(self.source_file_path, updated=100, price=2.0)
+
+        self.assertFalse(self.refresher.refresh())
+        self.assertEqual(self._get_pricing(), {'1': 1.0})
+
+        metrics = self.refresher.get_metrics()
+        self.assertEqual(metrics['refresh_count'], 1)
+        self.assertEqual(metrics['update_count'], 0)
+        self.assertEqual(metrics['pricing_updated'], 100)
+        self.assertIsNone(metrics['last_update_time'])
+        self.assertTrue(metrics['last_refresh_age'] >= 0)
+
+    def test_refresh_swaps_pricing_data(self):
+        with mock.patch('libcloud.pricing.get_pricing_file_path',
+                        return_value=self.file_path):
+            self.assertEqual(self._get_pricing(), {'1': 1.0})
+            old_table = libcloud.pricing.PRICING_DATA['compute']
+
+            self._write_pricing(self.source_file_path, updated=200, price=2.0)
+            self.assertTrue(self.refresher.refresh())
+
+            # Loaded tables are replaced and not mutated
+            self.assertEqual(old_table['foo'], {'1': 1.0})
+            self.assertEqual(libcloud.pricing.PRICING_DATA['compute'],
+                             {'foo': {'1': 2.0}, 'bar': {'1': 2.0}})
+            self.assertEqual(self._get_pricing('bar'), {'1': 2.0})
+
+        with open(self.file_path) as fp:
+            self.assertEqual(json.load(fp)['updated'], 200)
+
+        # No temporary files are left behind
+        self.assertEqual(sorted(os.listdir(self.tmp_dir)),
+                         ['pricing.json', 'source.json'])
+
+        metrics = self.refresher.get_metrics()
+        self.assertEqual(metrics['update_count'], 1)
+        self.assertEqual(metrics['pricing_updated'], 200)
+        self.assertTrue(metrics['pricing_age'] > 0)
+
+    def test_refresh_recompiles_existing_index(self):
+        libcloud.pricing.compile_pricing_index(pricing_file_path=self.file_path)
+        self.assertEqual(self._get_pricing(), {'1': 1.0})
+
+        libcloud.pricing.invalidate_module_pricing_cache(driver_type='compute',
+                                                         driver_name='foo')
+        self._write_pricing(self.source_file_path, updated=200, price=2.0)
+        self.assertTrue(self.refresher.refresh())
+
+        index = libcloud.pricing.get_pricing_index(
+            pricing_file_path=self.file_path)
+        self.assertEqual(index.get('compute', 'foo', '1'), 2.0)
+        self.assertEqual(self._get_pricing(), {'1': 2.0})
+
+    def test_refresh_invalid_pricing_data(self):
+        with open(self.source_file_path, 'w') as fp:
+            fp.write('{"compute": {}}')
+
+        assertRaisesRegex(self, Exception, 'valid pricing data',
+                          self.refresher.refresh)
+        self.assertEqual(self._get_pricing(), {'1': 1.0})
+
+    def test_background_refresh(self):
+        self._write_pricing(self.source_file_path, updated=200, price=2.0)
+
+        self.refresher.start()
+
+        for _ in range(500):
+            if self.refresher.update_count:
+                break
+            time.sleep(0.01)
+
+        self.refresher.stop()
+        self.assertEqual(self.refresher.update_count, 1)
+        self.assertEqual(self._get_pricing(), {'1': 2.0})
+
+    def test_background_refresh_errors_are_recorded(self):
+        # Source file doesn't exist
+        self.refresher.start()
+
+        for _ in range(500):
+            if self.refresher.error_count:
+                break
+            time.sleep(0.01)
+
+        self.refresher.stop()
+
+        metrics = self.refresher.get_metrics()
+        self.assertTrue(metrics['error_count'] >= 1)
+        self.assertTrue(isinstance(metrics['last_error'], IOError))
+        self.assertIsNone(metrics['last_refresh_time'])
+
+
 if __name__ == '__main__':
     sys.exit(unittest.main())
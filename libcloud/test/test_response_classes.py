@@ -20,7 +20,9 @@ import requests
 import requests_mock
 
 from libcloud.common.base import XmlResponse, JsonResponse, Connection
+from libcloud.common.base import StreamingXmlResponse
 from libcloud.common.types import MalformedResponseError
+from libcloud.common.exceptions import BaseHTTPError
 from libcloud.http import LibcloudConnection
 
 
@@ -62,6 +64,94 @@ class ResponseClassesTests(unittest.TestCase):
         parsed = response.parse_body()
         self.assertEqual(parsed, '')
 
+    def test_XmlResponse_class_iterparse(self):
+        with requests_mock.mock() as m:
+            m.register_uri('GET', 'mock://test.com/',
+                           text='<a><b><c>1</c></b><b><c>2</c></b></a>')
+            response_obj = requests.get('mock://test.com/')
+            response = XmlResponse(response=response_obj,
+                                   connection=self.mock_connection)
+
+        values = [e.findtext('c') for e in response.iterparse('b')]
+        self.assertEqual(values, ['1', '2'])
+
+    def test_StreamingXmlResponse_class_iterparse(self):
+        body = ('<a xmlns="urn:test"><marker>m1</marker>' +
+                '<items>' +
+                ''.join(['<item><id>%s</id><items><item>nested</item>'
+                         '</items></item>' % (i) for i in range(100)]) +
+                '</items><truncated>true</truncated></a>')
+
+        with requests_mock.mock() as m:
+            m.register_uri('GET', 'mock://test.com/', text=body)
+            response_obj = requests.get('mock://test.com/', stream=True)
+            response = StreamingXmlResponse(response=response_obj,
+                                            connection=self.mock_connection)
+            self.assertIsNone(response.object)
+
+            # Make sure elements which span multiple chunks are handled
+            response.chunk_size = 7
+            ids = []
+
+            for element in response.iterparse('items/item',
+                                              namespace='urn:test'):
+                ids.append(element.findtext('{urn:test}id'))
+
+                # Elements which have already been processed are freed
+                items = response.object.find('{urn:test}items')
+                self.assertTrue(len(items) <= 2)
+
+        self.assertEqual(ids, [str(i) for i in range(100)])
+        self.assertEqual(len(response.object.find('{urn:test}items')), 0)
+
+        # Non-matching elements are kept
+        self.assertEqual(response.object.findtext('{urn:test}marker'), 'm1')
+        self.assertEqual(response.object.findtext('{urn:test}truncated'),
+                         'true')
+
+        self.assertRaises(ValueError, list, response.iterparse('items/item'))
+
+    def test_StreamingXmlResponse_class_zero_length_body(self):
+        with requests_mock.mock() as m:
+            m.register_uri('GET', 'mock://test.com/', text='')
+            response_obj = requests.get('mock://test.com/', stream=True)
+            response = StreamingXmlResponse(response=response_obj,
+                                            connection=self.mock_connection)
+            self.assertEqual(list(response.iterparse('b')), [])
+
+        self.assertEqual(response.object, None)
+
+    def test_StreamingXmlResponse_class_malformed_response(self):
+        with requests_mock.mock() as m:
+            m.register_uri('GET', 'mock://test.com/', text='<a><b></b>')
+            response_obj = requests.get('mock://test.com/', stream=True)
+            response = StreamingXmlResponse(response=response_obj,
+                                            connection=self.mock_connection)
+            self.assertRaises(MalformedResponseError, list,
+                              response.iterparse('b'))
+
+    def test_StreamingXmlResponse_class_error_response(self):
+        with requests_mock.mock() as m:
+            m.register_uri('GET', 'mock://test.com/', text='<error/>',
+                           status_code=500)
+            response_obj = requests.get('mock://test.com/', stream=True)
+            self.assertRaises(BaseHTTPError, StreamingXmlResponse,
+                              response=response_obj,
+                              connection=self.mock_connection)
+
+    def test_Connection_request_stream_uses_streamResponseCls(self):
+        conn = Connection(host='mock.com', port=80, secure=False)
+        conn.connect()
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('GET', 'http://mock.com/list', text='<a/>')
+            response = conn.request('/list', stream=True)
+            self.assertFalse(isinstance(response, StreamingXmlResponse))
+
+            conn.streamResponseCls = StreamingXmlResponse
+            response = conn.request('/list', stream=True)
+            self.assertTrue(isinstance(response, StreamingXmlResponse))
+
     def test_JsonResponse_class_success(self):
         with requests_mock.mock() as m:
             m.register_uri('GET', 'mock://test.com/', text='{"foo": "bar"}')
@@ -14,15 +14,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import sys
 import pytest
+import hashlib
 import socket
+import ssl
 import codecs
 import unittest
 import warnings
 import platform
 import os.path
+import requests
 import requests_mock
+import mock
+import pickle
+from mock import Mock
+from io import BytesIO
 from itertools import chain
 
 # In Python > 2.7 DeprecationWarnings are disabled by default
@@ -42,6 +50,11 @@ from libcloud.compute.types import Provider
 from libcloud.compute.providers import DRIVERS
 from libcloud.compute.drivers.dummy import DummyNodeDriver
 from libcloud.utils.misc import get_secure_random_string
+from libcloud.utils.misc import get_object_attributes
+from libcloud.utils.misc import intern_str
+from libcloud.compute.base import Node, NodeSize, NodeImage, StorageVolume
+from libcloud.storage.base import Object, Container
+from libcloud.dns.base import Zone, Record
 from libcloud.utils.networking import is_public_subnet
 from libcloud.utils.networking import is_private_subnet
 from libcloud.utils.networking import is_valid_ip_address
@@ -49,6 +62,9 @@ from libcloud.utils.networking import join_ipv4_segments
 from libcloud.utils.networking import increment_ipv4_segments
 from libcloud.utils.decorators import wrap_non_libcloud_exceptions
 from libcloud.utils.connection import get_response_object
+from libcloud.utils.ratelimit import RateLimit, TokenBucket, RateLimiter
+from libcloud.utils.retry import RetryBudget, RetryPolicy
+from libcloud.common.exceptions import RateLimitReachedError
 from libcloud.utils.publickey import (
     get_pubkey_openssh_fingerprint,
     get_pubkey_ssh2_fingerprint,
@@ -70,6 +86,10 @@ def show_warning(msg, cat, fname, lno, file=None, line=None):
 original_func = warnings.showwarning
 
 
+class CustomNode(Node):
+    pass
+
+
 class TestUtils(unittest.TestCase):
     def setUp(self):
         global WARNINGS_BUFFER
@@ -240,6 +260,87 @@ class TestUtils(unittest.TestCase):
 
         self.assertEqual(index, 548)
 
+    def test_read_in_chunks_fill_size_uneven_pieces(self):
+        data = b('').join([bchr(index % 256) * (index % 7 + 1)
+                           for index in range(0, 500)])
+
+        def iterator():
+            position = 0
+            index = 0
+
+            while position < len(data):
+                size = index % 13 + 1
+                yield data[position:position + size]
+                position += size
+                index += 1
+
+        chunks = list(libcloud.utils.files.read_in_chunks(
+            iterator(), chunk_size=10, fill_size=True))
+
+        self.assertEqual(b('').join(chunks), data)
+
+        for chunk in chunks[:-1]:
+            self.assertEqual(len(chunk), 10)
+            self.assertTrue(isinstance(chunk, bytes))
+
+        self.assertEqual(len(chunks[-1]), len(data) % 10 or 10)
+
+    def test_read_in_chunks_bytearray_and_memoryview_pieces(self):
+        def iterator():
+            yield bytearray(b('aaa'))
+            yield memoryview(b('bbbb'))
+            yield b('cc')
+
+        chunks = list(libcloud.utils.files.read_in_chunks(
+            iterator(), chunk_size=4, fill_size=True))
+        self.assertEqual(chunks, [b('aaab'), b('bbbc'), b('c')])
+
+        chunks = list(libcloud.utils.files.read_in_chunks(
+            iterator(), chunk_size=4, fill_size=False))
+        self.assertEqual(chunks, [b('aaa'), b('bbbb'), b('cc')])
+
+        for chunk in chunks:
+            self.assertTrue(isinstance(chunk, bytes))
+
+    def test_read_in_chunks_readinto(self):
+        class ShortReadStream(io.RawIOBase):
+            def __init__(self, data):
+                self.data = data
+                self.position = 0
+                self.readinto_calls = 0
+
+            def readable(self):
+                return True
+
+            def readinto(self, buf):
+                self.readinto_calls += 1
+                count = min(len(buf), 3, len(self.data) - self.position)
+                buf[:count] = self.data[self.position:self.position + count]
+                self.position += count
+                return count
+
+        data = b('0123456789' * 5)
+
+        # Non-seekable raw stream, data is read into a preallocated buffer
+        stream = ShortReadStream(data)
+        stream.read = Mock(side_effect=Exception('read should not be used'))
+
+        chunks = list(libcloud.utils.files.read_in_chunks(
+            stream, chunk_size=8, fill_size=True))
+        self.assertEqual(b('').join(chunks), data)
+        self.assertEqual([len(chunk) for chunk in chunks],
+                         [8, 8, 8, 8, 8, 8, 2])
+        self.assertEqual(stream.readinto_calls, 20)
+
+        # Buffered file like objects return full chunks from read
+        class FakeBytesIO(BytesIO):
+            def readinto(self, buf):
+                raise Exception('readinto should not be used')
+
+        chunks = list(libcloud.utils.files.read_in_chunks(
+            FakeBytesIO(data), chunk_size=8, fill_size=True))
+        self.assertEqual(b('').join(chunks), data)
+
     def test_exhaust_iterator(self):
         def iterator_func():
             for x in range(0, 1000):
@@ -264,6 +365,45 @@ class TestUtils(unittest.TestCase):
         result = libcloud.utils.files.exhaust_iterator(iterator=iterator)
         self.assertEqual(result, b(data))
 
+    def test_hashing_reader(self):
+        data = b('a' * 1000)
+        expected_hash = hashlib.md5(data).hexdigest()
+
+        stream = BytesIO(data)
+        reader = libcloud.utils.files.HashingReader(stream, hashlib.md5(),
+                                                    chunk_size=100)
+
+        # Length detection doesn't read any data
+        self.assertEqual(requests.utils.super_len(reader), 1000)
+        self.assertEqual(reader.bytes_read, 0)
+
+        chunks = list(reader)
+        self.assertEqual(len(chunks), 10)
+        self.assertEqual(reader.finish(), (expected_hash, 1000))
+
+        # Rewinding the stream resets the hash state
+        reader.seek(0)
+        self.assertEqual(reader.read(500), data[:500])
+        self.assertEqual(reader.finish(), (expected_hash, 1000))
+
+    def test_hashing_reader_finish_consumes_remaining_data(self):
+        data = b('b' * 1000)
+        expected_hash = hashlib.md5(data).hexdigest()
+
+        reader = libcloud.utils.files.HashingReader(BytesIO(data),
+                                                    hashlib.md5())
+        self.assertEqual(reader.read(10), data[:10])
+        self.assertEqual(reader.finish(), (expected_hash, 1000))
+
+    def test_hashing_iterator(self):
+        data = ['a' * 10, 'b' * 10, 'c' * 10]
+        expected_hash = hashlib.md5(b(''.join(data))).hexdigest()
+
+        iterator = libcloud.utils.files.HashingIterator(iter(data),
+                                                        hashlib.md5())
+        self.assertEqual(next(iterator), data[0])
+        self.assertEqual(iterator.finish(), (expected_hash, 30))
+
     def test_unicode_urlquote(self):
         # Regression tests for LIBCLOUD-429
         if PY3:
@@ -288,6 +428,67 @@ class TestUtils(unittest.TestCase):
             value = get_secure_random_string(size=i)
             self.assertEqual(len(value), i)
 
+    def test_get_object_attributes(self):
+        driver = DummyNodeDriver(0)
+        image = driver.list_images()[0]
+        self.assertEqual(get_object_attributes(image),
+                         {'id': image.id, 'name': image.name,
+                          'driver': driver, 'extra': image.extra})
+
+        class CustomObject(object):
+            def __init__(self):
+                self.foo = 'bar'
+
+        self.assertEqual(get_object_attributes(CustomObject()),
+                         {'foo': 'bar'})
+
+    def test_slots_state_mixin_pickle(self):
+        node = CustomNode(id='1', name='node', state=0, public_ips=['1.1.1.1'],
+                          private_ips=[], driver=None, extra={'foo': 'bar'})
+        node.custom = 'value'
+        container = Container(name='container', extra={}, driver=None)
+        zone = Zone(id='1', domain='example.com', type='master', ttl=100,
+                    driver=None)
+        objs = [
+            Node(id='1', name='node', state=0, public_ips=['1.1.1.1'],
+                 private_ips=[], driver=None, extra={'foo': 'bar'}),
+            node,
+            NodeSize(id='1', name='size', ram=512, disk=10, bandwidth=None,
+                     price=0.5, driver=None),
+            NodeImage(id='1', name='image', driver=None),
+            StorageVolume(id='1', name='volume', size=10, driver=None),
+            container,
+            Object(name='object', size=10, hash='abc', extra={},
+                   meta_data={'foo': 'bar'}, container=container, driver=None),
+            zone,
+            Record(id='1', name='www', type='A', data='1.1.1.1', zone=zone,
+                   driver=None, ttl=100)
+        ]
+
+        for obj in objs:
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                result = pickle.loads(pickle.dumps(obj, protocol=protocol))
+                self.assertTrue(type(result) is type(obj))
+                self.assertEqual(self._get_attributes(result),
+                                 self._get_attributes(obj))
+
+        result = pickle.loads(pickle.dumps(node, protocol=0))
+        self.assertEqual(result.custom, 'value')
+
+    def _get_attributes(self, obj):
+        # Container and Zone are compared by value
+        return dict((name, get_object_attributes(value)
+                     if isinstance(value, (Container, Zone)) else value)
+                    for name, value in get_object_attributes(obj).items())
+
+    def test_intern_str(self):
+        value1 = ''.join(['ava', 'ilable'])
+        value2 = ''.join(['avai', 'lable'])
+        self.assertFalse(value1 is value2)
+        self.assertTrue(intern_str(value1) is intern_str(value2))
+        self.assertEqual(intern_str(value1), 'available')
+        self.assertEqual(intern_str(None), None)
+
     def test_hexadigits(self):
         self.assertEqual(hexadigits(b('')), [])
         self.assertEqual(hexadigits(b('a')), ['61'])
@@ -423,6 +624,206 @@ class TestPublicKeyUtils(unittest.TestCase):
         self.assertEqual(fp, '11:ad:5d:4c:5b:99:c9:80:7e:81:03:76:5a:25:9d:8c')
 
 
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RateLimitUtilsTestCase(unittest.TestCase):
+    def test_rate_limit_validation(self):
+        self.assertRaises(ValueError, RateLimit, rate=0)
+        self.assertRaises(ValueError, RateLimit, rate=1, scope='invalid')
+
+        self.assertEqual(RateLimit(rate=10).burst, 10)
+        self.assertEqual(RateLimit(rate=0.5).burst, 1)
+
+    def test_token_bucket_reserve(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+
+        # Burst
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0])
+
+        # Reservations are queued
+        self.assertEqual(bucket.reserve(), 0.5)
+        self.assertEqual(bucket.reserve(), 1.0)
+
+        # Bucket is refilled up to the capacity
+        clock.now = 1.0
+        self.assertEqual(bucket.tokens, 0)
+        clock.now = 100.0
+        self.assertEqual(bucket.tokens, 3)
+
+    def test_token_bucket_try_acquire(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=1, clock=clock)
+
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+        clock.now = 1.0
+        self.assertTrue(bucket.try_acquire())
+
+    def test_rate_limiter_shares_buckets(self):
+        limiter = RateLimiter()
+        rate_limit = RateLimit(rate=1, burst=2)
+
+        bucket1 = limiter.get_bucket(('host', 'a'), rate_limit)
+        self.assertIs(limiter.get_bucket(('host', 'a'), rate_limit), bucket1)
+        self.assertIsNot(limiter.get_bucket(('host', 'b'), rate_limit),
+                         bucket1)
+        self.assertIsNot(limiter.get_bucket(('host', 'a'), RateLimit(rate=2)),
+                         bucket1)
+
+        bucket2 = limiter.get_bucket(('host', 'b'), rate_limit)
+        bucket2.reserve(tokens=2)
+
+        # Caller needs to wait for the most constrained bucket
+        delay = limiter.reserve([bucket1, bucket2])
+        self.assertTrue(0.9 < delay <= 1.0)
+
+        limiter.clear()
+        self.assertIsNot(limiter.get_bucket(('host', 'a'), rate_limit),
+                         bucket1)
+
+
+@mock.patch('libcloud.utils.retry.time.sleep')
+class RetryPolicyTestCase(unittest.TestCase):
+    def _get_failing_func(self, failures, exc=None):
+        calls = []
+
+        def func():
+            calls.append(1)
+
+            if len(calls) <= failures:
+                raise exc or socket.error('connection reset')
+
+            return 'ok'
+
+        return func, calls
+
+    def test_retry_transient_errors(self, mock_sleep):
+        policy = RetryPolicy(max_attempts=3, base_delay=1, max_delay=10)
+        func, calls = self._get_failing_func(failures=2)
+
+        self.assertEqual(policy.call(func, method='GET'), 'ok')
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+        for call in mock_sleep.call_args_list:
+            self.assertTrue(1 <= call[0][0] <= 10)
+
+    def test_max_attempts(self, mock_sleep):
+        policy = RetryPolicy(max_attempts=3)
+        func, calls = self._get_failing_func(failures=5)
+
+        self.assertRaises(socket.error, policy.call, func, method='GET')
+        self.assertEqual(len(calls), 3)
+
+    def test_non_retryable_errors(self, mock_sleep):
+        policy = RetryPolicy()
+        func, calls = self._get_failing_func(failures=1,
+                                             exc=ValueError('invalid'))
+
+        self.assertRaises(ValueError, policy.call, func, method='GET')
+        self.assertEqual(len(calls), 1)
+
+        # Status code based errors
+        exc = Exception('unavailable')
+        exc.http_code = 503
+        self.assertTrue(policy.is_retryable_exception(exc))
+        exc.http_code = 404
+        self.assertFalse(policy.is_retryable_exception(exc))
+
+        self.assertFalse(policy.is_retryable_exception(
+            ssl.SSLError('certificate verify failed')))
+        self.assertTrue(policy.is_retryable_exception(
+            ssl.SSLError('The read operation timed out')))
+
+    def test_non_idempotent_requests_are_not_retried(self, mock_sleep):
+        policy = RetryPolicy()
+        func, calls = self._get_failing_func(failures=1)
+
+        self.assertRaises(socket.error, policy.call, func, method='POST')
+        self.assertEqual(len(calls), 1)
+
+        func, calls = self._get_failing_func(failures=1)
+        self.assertEqual(policy.call(func, method='POST', idempotent=True),
+                         'ok')
+
+        policy = RetryPolicy(idempotent_methods=['GET', 'POST'])
+        func, calls = self._get_failing_func(failures=1)
+        self.assertEqual(policy.call(func, method='post'), 'ok')
+
+    def test_retry_after_is_honored(self, mock_sleep):
+        policy = RetryPolicy(max_delay=1)
+        exc = RateLimitReachedError(headers={'retry-after': '7'})
+        func, calls = self._get_failing_func(failures=1, exc=exc)
+
+        self.assertEqual(policy.call(func), 'ok')
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_timeout(self, mock_sleep):
+        policy = RetryPolicy(max_attempts=10, base_delay=5, timeout=1)
+        func, calls = self._get_failing_func(failures=1)
+
+        self.assertRaises(socket.error, policy.call, func)
+        self.assertEqual(len(calls), 1)
+
+    def test_seekable_body_is_rewound(self, mock_sleep):
+        policy = RetryPolicy()
+        body = BytesIO(b('0123456789'))
+        body.seek(2)
+        reads = []
+
+        def func():
+            reads.append(body.read())
+
+            if len(reads) == 1:
+                raise socket.error('connection reset')
+
+            return 'ok'
+
+        self.assertEqual(policy.call(func, method='PUT', body=body), 'ok')
+        self.assertEqual(reads, [b('23456789'), b('23456789')])
+
+    def test_body_which_cannot_be_rewound_is_not_retried(self, mock_sleep):
+        policy = RetryPolicy()
+        func, calls = self._get_failing_func(failures=1)
+
+        self.assertRaises(socket.error, policy.call, func, method='PUT',
+                          body=iter([b('a'), b('b')]))
+        self.assertEqual(len(calls), 1)
+
+    def test_retry_budget(self, mock_sleep):
+        budget = RetryBudget(ratio=0.5, min_retries=1)
+        policy = RetryPolicy(max_attempts=5, budget=budget)
+
+        # Initial reserve and deposit of the first request allow one retry
+        func, calls = self._get_failing_func(failures=10)
+        self.assertRaises(socket.error, policy.call, func)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(budget.balance, 0.5)
+
+        # Each request deposits "ratio" tokens
+        func, calls = self._get_failing_func(failures=1)
+        self.assertEqual(policy.call(func), 'ok')
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(budget.balance, 0)
+
+    def test_decorrelated_jitter(self, mock_sleep):
+        policy = RetryPolicy(base_delay=1, max_delay=20)
+        delay = None
+
+        for _ in range(50):
+            previous_delay = delay or 1
+            delay = policy.get_delay(previous_delay=delay)
+            self.assertTrue(1 <= delay <= min(20, previous_delay * 3))
+
+
 def test_decorator():
 
     @wrap_non_libcloud_exceptions
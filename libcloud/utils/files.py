@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import os
 import mimetypes
 
@@ -24,7 +25,9 @@ CHUNK_SIZE = 8096
 __all__ = [
     'read_in_chunks',
     'exhaust_iterator',
-    'guess_file_mime_type'
+    'guess_file_mime_type',
+    'HashingReader',
+    'HashingIterator'
 ]
 
 
@@ -33,6 +36,13 @@ def read_in_chunks(iterator, chunk_size=None, fill_size=False,
     """
     Return a generator which yields data in chunks.
 
+    When ``fill_size`` is True and the object is a raw non-seekable stream
+    which implements ``readinto`` method, data is read directly into a
+    preallocated buffer. Otherwise data returned by the iterator is copied
+    into a fixed size buffer which is reused for every chunk so the data
+    doesn't need to be re-allocated and copied each time a new piece of data
+    is received.
+
     :param iterator: An object which implements an iterator interface
                      or a File like object with read method.
     :type iterator: :class:`object` which implements iterator interface.
@@ -47,12 +57,105 @@ def read_in_chunks(iterator, chunk_size=None, fill_size=False,
     :param yield_empty: If true and iterator returned no data, only yield empty
                         bytes object
     :type yield_empty: ``bool``
-
-    TODO: At some point in the future we could use byte arrays here if version
-    >= Python 3. This should speed things up a bit and reduce memory usage.
     """
     chunk_size = chunk_size or CHUNK_SIZE
 
+    readinto = _get_readinto_method(iterator) if fill_size else None
+
+    if readinto is not None:
+        chunks = _read_in_chunks_readinto(readinto=readinto,
+                                          chunk_size=chunk_size)
+    else:
+        chunks = _read_in_chunks_buffered(iterator=iterator,
+                                          chunk_size=chunk_size,
+                                          fill_size=fill_size)
+
+    empty = True
+
+    for chunk in chunks:
+        empty = False
+        yield chunk
+
+    if empty and yield_empty:
+        yield b('')
+
+
+def _get_readinto_method(iterator):
+    """
+    Return ``readinto`` method of the provided file like object or None if
+    the object doesn't implement it or if it's not worth using it.
+
+    Buffered objects (e.g. files opened in "rb" mode and BytesIO) and
+    seekable raw files already return full chunks from ``read`` so reading
+    into a separate buffer would only add another copy. ``readinto`` is only
+    beneficial for non-seekable raw streams (e.g. pipes and sockets) which
+    can return less data than requested.
+
+    ``readinto`` is also only used if it's implemented by the same class
+    which implements ``read`` (or by one of its subclasses). This way classes
+    which inherit from the built-in io classes and only override ``read``
+    method keep working as expected.
+    """
+    if isinstance(iterator, io.BufferedIOBase):
+        return None
+
+    try:
+        if iterator.seekable():
+            return None
+    except Exception:
+        pass
+
+    readinto = getattr(iterator, 'readinto', None)
+
+    if readinto is None or not hasattr(iterator, 'read'):
+        return None
+
+    read_klass = _get_defining_class(iterator, 'read')
+    readinto_klass = _get_defining_class(iterator, 'readinto')
+
+    if read_klass is None or readinto_klass is None:
+        return None
+
+    if not issubclass(readinto_klass, read_klass):
+        return None
+
+    return readinto
+
+
+def _get_defining_class(obj, name):
+    for klass in type(obj).__mro__:
+        if name in klass.__dict__:
+            return klass
+
+    return None
+
+
+def _read_in_chunks_readinto(readinto, chunk_size):
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+
+    while True:
+        position = 0
+
+        while position < chunk_size:
+            count = readinto(view[position:])
+
+            if not count:
+                break
+
+            position += count
+
+        if position == 0:
+            return
+
+        yield bytes(view[:position])
+
+        if position < chunk_size:
+            # readinto returned no data which means we have reached the end
+            return
+
+
+def _read_in_chunks_buffered(iterator, chunk_size, fill_size):
     try:
         get_data = iterator.read
         args = (chunk_size, )
@@ -60,33 +163,51 @@ def read_in_chunks(iterator, chunk_size=None, fill_size=False,
         get_data = next
         args = (iterator, )
 
-    data = b('')
-    empty = False
-
-    while not empty or len(data) > 0:
-        if not empty:
-            try:
-                chunk = b(get_data(*args))
-                if len(chunk) > 0:
-                    data += chunk
-                else:
-                    empty = True
-            except StopIteration:
-                empty = True
-
-        if len(data) == 0:
-            if empty and yield_empty:
-                yield b('')
+    buf = None
+    view = None
+    position = 0
 
-            return
+    while True:
+        try:
+            data = get_data(*args)
+        except StopIteration:
+            break
+
+        if not data:
+            break
+
+        if not isinstance(data, (bytearray, memoryview)):
+            data = b(data)
 
-        if fill_size:
-            if empty or len(data) >= chunk_size:
-                yield data[:chunk_size]
-                data = data[chunk_size:]
-        else:
+        if not fill_size:
+            yield bytes(data)
+            continue
+
+        if position == 0 and len(data) == chunk_size and \
+                isinstance(data, bytes):
+            # Fast path - no need to copy data which is already of the right
+            # size
             yield data
-            data = b('')
+            continue
+
+        if buf is None:
+            buf = bytearray(chunk_size)
+            view = memoryview(buf)
+
+        data = memoryview(data)
+
+        while len(data) > 0:
+            count = min(chunk_size - position, len(data))
+            view[position:position + count] = data[:count]
+            position += count
+            data = data[count:]
+
+            if position == chunk_size:
+                yield bytes(buf)
+                position = 0
+
+    if position > 0:
+        yield bytes(view[:position])
 
 
 def exhaust_iterator(iterator):
@@ -122,3 +243,152 @@ def guess_file_mime_type(file_path):
     filename = os.path.basename(file_path)
     (mimetype, encoding) = mimetypes.guess_type(filename)
     return mimetype, encoding
+
+
+class HashingReader(object):
+    """
+    File like object which wraps another file like object and updates the
+    provided hasher with every chunk which is read from it.
+
+    This allows the hash of the data to be calculated while the data is being
+    sent over the wire, without the need to read the source a second time.
+
+    Methods which are used by the HTTP client to determine the body length
+    (``fileno``, ``tell`` and ``seek``) are proxied to the wrapped object. If
+    the object is rewound to the position it was at when the reader has been
+    created (e.g. when a request is retried), hash state is reset.
+    """
+
+    def __init__(self, stream, hasher, chunk_size=None):
+        """
+        :param stream: File like object with read method.
+        :type stream: :class:`object`
+
+        :param hasher: Hash object (e.g. ``hashlib.md5()``).
+        :type hasher: :class:`object`
+
+        :param chunk_size: Chunk size used when iterating over the reader
+                           (defaults to CHUNK_SIZE)
+        :type chunk_size: ``int``
+        """
+        self._stream = stream
+        self._initial_hasher = hasher.copy()
+        self._chunk_size = chunk_size or CHUNK_SIZE
+
+        self.hasher = hasher
+        self.bytes_read = 0
+
+        try:
+            self._start_position = stream.tell()
+        except Exception:
+            self._start_position = None
+
+    def read(self, size=-1):
+        data = self._stream.read(size)
+
+        if data:
+            chunk = b(data)
+            self.hasher.update(chunk)
+            self.bytes_read += len(chunk)
+
+        return data
+
+    def __iter__(self):
+        while True:
+            data = self.read(self._chunk_size)
+
+            if not data:
+                return
+
+            yield data
+
+    @property
+    def mode(self):
+        return getattr(self._stream, 'mode', 'rb')
+
+    def fileno(self):
+        return self._get_stream_method('fileno')()
+
+    def tell(self):
+        return self._get_stream_method('tell')()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        result = self._get_stream_method('seek')(offset, whence)
+
+        if self._start_position is not None and \
+                self._stream.tell() == self._start_position:
+            # Stream has been rewound, data will be read again
+            self.hasher = self._initial_hasher.copy()
+            self.bytes_read = 0
+
+        return result
+
+    def finish(self):
+        """
+        Consume any data which hasn't been read by the consumer (e.g. if the
+        HTTP client aborted the upload early) and return the final hash and
+        the number of bytes read.
+
+        :return: (hex digest, number of bytes read)
+        :rtype: ``tuple``
+        """
+        for _ in self:
+            pass
+
+        return self.hasher.hexdigest(), self.bytes_read
+
+    def _get_stream_method(self, name):
+        method = getattr(self._stream, name, None)
+
+        if method is None:
+            raise io.UnsupportedOperation(name)
+
+        return method
+
+
+class HashingIterator(object):
+    """
+    Iterator which wraps another iterator and updates the provided hasher with
+    every chunk which is returned by it.
+    """
+
+    def __init__(self, iterator, hasher):
+        """
+        :param iterator: An object which implements an iterator interface.
+        :type iterator: :class:`object`
+
+        :param hasher: Hash object (e.g. ``hashlib.md5()``).
+        :type hasher: :class:`object`
+        """
+        self._iterator = iterator
+
+        self.hasher = hasher
+        self.bytes_read = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        data = next(self._iterator)
+
+        if data:
+            chunk = b(data)
+            self.hasher.update(chunk)
+            self.bytes_read += len(chunk)
+
+        return data
+
+    next = __next__
+
+    def finish(self):
+        """
+        Consume any remaining data and return the final hash and the number
+        of bytes read.
+
+        :return: (hex digest, number of bytes read)
+        :rtype: ``tuple``
+        """
+        for _ in self:
+            pass
+
+        return self.hasher.hexdigest(), self.bytes_read
@@ -14,8 +14,10 @@
 # limitations under the License.
 
 from typing import List
+from typing import Tuple
 
 import os
+import sys
 import binascii
 import socket
 import time
@@ -34,6 +36,8 @@ __all__ = [
     'set_driver',
     'merge_valid_keys',
     'get_new_obj',
+    'get_object_attributes',
+    'intern_str',
     'str2dicts',
     'dict2str',
     'reverse_dict',
@@ -41,7 +45,8 @@ __all__ = [
     'get_secure_random_string',
     'retry',
 
-    'ReprMixin'
+    'ReprMixin',
+    'SlotsStateMixin'
 ]
 
 # Error message which indicates a transient SSL error upon which request
@@ -101,7 +106,7 @@ def get_new_obj(obj, klass, attributes):
     constructor if they are not None.
     """
     kwargs = {}
-    for key, value in list(obj.__dict__.items()):
+    for key, value in list(get_object_attributes(obj).items()):
         if isinstance(value, dict):
             kwargs[key] = value.copy()
         elif isinstance(value, (tuple, list)):
@@ -127,6 +132,53 @@ def get_new_obj(obj, klass, attributes):
     return klass(**kwargs)
 
 
+def get_object_attributes(obj):
+    """
+    Return dictionary with instance attributes of the provided object.
+
+    Unlike ``obj.__dict__`` this also works with objects which store their
+    attributes in slots (e.g. ``Node`` or ``Object``). Private attributes
+    which are stored in slots and slots which have not been set are skipped.
+
+    :rtype: ``dict``
+    """
+    result = {}
+
+    for klass in reversed(type(obj).__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+
+        if isinstance(slots, str):
+            slots = (slots, )
+
+        for name in slots:
+            if name.startswith('_'):
+                continue
+
+            try:
+                result[name] = getattr(obj, name)
+            except AttributeError:
+                pass
+
+    result.update(getattr(obj, '__dict__', {}))
+    return result
+
+
+def intern_str(value):
+    """
+    Return interned version of the provided string.
+
+    It should be used for values which are repeated across a large number of
+    objects (states, regions, storage classes, etc.) so all the objects
+    share a single copy of the string.
+
+    :rtype: ``str``
+    """
+    if value is None:
+        return None
+
+    return sys.intern(str(value))
+
+
 def str2dicts(data):
     """
     Create a list of dictionaries from a whitespace and newline delimited text.
@@ -274,6 +326,43 @@ class ReprMixin(object):
         return str(self.__repr__())
 
 
+class SlotsStateMixin(object):
+    """
+    Mixin class which adds __getstate__ and __setstate__ methods to classes
+    which store their attributes in slots.
+
+    Without them, such objects can't be pickled using pickle protocols 0 and
+    1.
+    """
+
+    __slots__ = ()  # type: Tuple[str, ...]
+
+    def __getstate__(self):
+        state = {}
+
+        for klass in type(self).__mro__:
+            slots = klass.__dict__.get('__slots__', ())
+
+            if isinstance(slots, str):
+                slots = (slots, )
+
+            for name in slots:
+                if name in ('__dict__', '__weakref__'):
+                    continue
+
+                try:
+                    state[name] = getattr(self, name)
+                except AttributeError:
+                    pass
+
+        state.update(getattr(self, '__dict__', {}))
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
 def retry(retry_exceptions=RETRY_EXCEPTIONS, retry_delay=DEFAULT_DELAY,
           timeout=DEFAULT_TIMEOUT, backoff=DEFAULT_BACKOFF):
     """
@@ -0,0 +1,203 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client side rate limiting based on token buckets.
+"""
+
+from typing import Dict
+
+import time
+import threading
+
+__all__ = [
+    'RateLimit',
+    'TokenBucket',
+    'RateLimiter',
+
+    'RATE_LIMITER'
+]
+
+
+class RateLimit(object):
+    """
+    Rate limit definition.
+
+    Scope determines which requests share a bucket:
+
+    - ``host`` - all the requests to the same host
+    - ``account`` - all the requests to the same host which are made using
+      the same account (credentials, project, etc.)
+    - ``action`` - all the requests for the same API action on the same host
+      which are made using the same account
+    """
+
+    SCOPES = ['host', 'account', 'action']
+
+    def __init__(self, rate, burst=None, scope='host'):
+        """
+        :param rate: Number of requests per second which can be sustained.
+        :type rate: ``float``
+
+        :param burst: Maximum number of requests which can be performed at
+                      once (bucket capacity). Defaults to ``rate``.
+        :type burst: ``float``
+
+        :param scope: Rate limit scope (host, account or action).
+        :type scope: ``str``
+        """
+        if rate <= 0:
+            raise ValueError('rate needs to be greater than 0')
+
+        if scope not in self.SCOPES:
+            raise ValueError('Invalid scope: %s' % (scope))
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1)
+        self.scope = scope
+
+    def __repr__(self):
+        return ('<RateLimit rate=%s, burst=%s, scope=%s>' %
+                (self.rate, self.burst, self.scope))
+
+
+class TokenBucket(object):
+    """
+    Thread safe token bucket.
+
+    Tokens are reserved (the number of tokens can go below zero) and the
+    caller is told how long it needs to wait before its reservation can be
+    used so callers are served in the order in which they have arrived.
+    """
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.clock = clock
+
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self, tokens=1):
+        """
+        Reserve tokens and return number of seconds the caller needs to wait
+        before it can proceed.
+
+        :rtype: ``float``
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self.rate
+
+    def try_acquire(self, tokens=1):
+        """
+        Acquire tokens only if they are available right away.
+
+        :rtype: ``bool``
+        """
+        with self._lock:
+            self._refill()
+
+            if self._tokens < tokens:
+                return False
+
+            self._tokens -= tokens
+            return True
+
+    def _refill(self):
+        now = self.clock()
+        elapsed = max(now - self._updated, 0)
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+
+class RateLimiter(object):
+    """
+    Registry of token buckets which are shared by all the connections (and
+    threads) in a process.
+    """
+
+    def __init__(self):
+        self._buckets = {}  # type: Dict[tuple, TokenBucket]
+        self._lock = threading.Lock()
+
+    def get_bucket(self, key, rate_limit):
+        """
+        Return bucket for the provided key, create it if it doesn't exist.
+
+        :rtype: :class:`TokenBucket`
+        """
+        key = (key, rate_limit.rate, rate_limit.burst)
+
+        with self._lock:
+            bucket = self._buckets.get(key, None)
+
+            if bucket is None:
+                bucket = TokenBucket(rate=rate_limit.rate,
+                                     capacity=rate_limit.burst)
+                self._buckets[key] = bucket
+
+            return bucket
+
+    def reserve(self, buckets, tokens=1):
+        """
+        Reserve tokens in all the provided buckets and return number of
+        seconds to wait before the request can be performed.
+
+        :rtype: ``float``
+        """
+        delay = 0.0
+
+        for bucket in buckets:
+            delay = max(delay, bucket.reserve(tokens=tokens))
+
+        return delay
+
+    def acquire(self, buckets, tokens=1):
+        """
+        Block until tokens are available in all the provided buckets.
+
+        :return: Number of seconds which have been spent waiting.
+        :rtype: ``float``
+        """
+        delay = self.reserve(buckets=buckets, tokens=tokens)
+
+        if delay > 0:
+            time.sleep(delay)
+
+        return delay
+
+    def clear(self):
+        """
+        Remove all the buckets.
+        """
+        with self._lock:
+            self._buckets.clear()
+
+
+# Process wide rate limiter which is used by Connection classes
+RATE_LIMITER = RateLimiter()
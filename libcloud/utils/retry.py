@@ -0,0 +1,276 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Retry policies for HTTP requests.
+"""
+
+import ssl
+import time
+import random
+import threading
+
+from libcloud.utils.py3 import basestring, bytes
+from libcloud.utils.misc import RETRY_EXCEPTIONS, TRANSIENT_SSL_ERROR
+from libcloud.utils.misc import TransientSSLError
+from libcloud.common.exceptions import RateLimitReachedError
+
+__all__ = [
+    'RetryBudget',
+    'RetryPolicy'
+]
+
+
+class RetryBudget(object):
+    """
+    Limits the number of retries to a fraction of the number of requests.
+
+    Each request deposits ``ratio`` tokens and each retry withdraws one
+    token. ``min_retries`` tokens are available up front so requests can
+    also be retried when the traffic is low. This way retries can add at most
+    ``ratio`` * 100 % of extra traffic during a provider incident.
+    """
+
+    def __init__(self, ratio=0.1, min_retries=10):
+        """
+        :param ratio: Maximum ratio of retries to requests.
+        :type ratio: ``float``
+
+        :param min_retries: Number of retries which are always allowed.
+        :type min_retries: ``int``
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+
+        # Deposits are capped so the budget can't grow without bound while
+        # everything is healthy
+        self._max_balance = min_retries + ratio * 1000
+        self._balance = float(min_retries)
+        self._lock = threading.Lock()
+
+    @property
+    def balance(self):
+        return self._balance
+
+    def record_request(self):
+        with self._lock:
+            self._balance = min(self._balance + self.ratio,
+                                self._max_balance)
+
+    def try_withdraw(self):
+        """
+        Withdraw a token for a retry.
+
+        :return: True if the retry is allowed.
+        :rtype: ``bool``
+        """
+        with self._lock:
+            if self._balance < 1:
+                return False
+
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy(object):
+    """
+    Policy which determines if and when a failed request is retried.
+
+    - Only requests which use an idempotent HTTP method are retried.
+    - Delay between the attempts uses "decorrelated jitter" backoff so
+      clients which failed at the same time don't retry in lockstep.
+    - ``Retry-After`` delay of :class:`RateLimitReachedError` is honored.
+    - Retries are limited by an (optional) :class:`RetryBudget`.
+    - Request body which is a file like object is rewound (using ``seek``)
+      before the request is retried. Requests with a body which can't be
+      rewound (e.g. an iterator) are not retried.
+    """
+
+    IDEMPOTENT_METHODS = ['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE']
+    RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=30,
+                 timeout=None, retry_exceptions=RETRY_EXCEPTIONS,
+                 retry_status_codes=None, idempotent_methods=None,
+                 budget=None):
+        """
+        :param max_attempts: Maximum number of attempts (including the first
+                             one).
+        :type max_attempts: ``int``
+
+        :param base_delay: Minimum delay between the attempts (in seconds).
+        :type base_delay: ``float``
+
+        :param max_delay: Maximum delay between the attempts (in seconds).
+        :type max_delay: ``float``
+
+        :param timeout: Maximum number of seconds to keep retrying for.
+        :type timeout: ``float``
+
+        :param retry_exceptions: Exception classes which are retried.
+        :type retry_exceptions: ``tuple``
+
+        :param retry_status_codes: HTTP status codes of the exceptions
+                                   (``code`` or ``http_code`` attribute)
+                                   which are retried.
+        :type retry_status_codes: ``list`` of ``int``
+
+        :param idempotent_methods: HTTP methods which are safe to retry.
+        :type idempotent_methods: ``list`` of ``str``
+
+        :param budget: Retry budget which is shared by all the requests
+                       which use this policy.
+        :type budget: :class:`RetryBudget`
+        """
+        if retry_status_codes is None:
+            retry_status_codes = self.RETRY_STATUS_CODES
+
+        if idempotent_methods is None:
+            idempotent_methods = self.IDEMPOTENT_METHODS
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.retry_exceptions = retry_exceptions
+        self.retry_status_codes = retry_status_codes
+        self.idempotent_methods = [m.upper() for m in idempotent_methods]
+        self.budget = budget
+
+    def is_idempotent(self, method):
+        """
+        Return True if requests which use the provided HTTP method can be
+        safely retried.
+
+        :rtype: ``bool``
+        """
+        return method.upper() in self.idempotent_methods
+
+    def is_retryable_exception(self, exc):
+        """
+        Return True if the provided exception indicates a transient error.
+
+        :rtype: ``bool``
+        """
+        if isinstance(exc, ssl.SSLError) and \
+                not isinstance(exc, TransientSSLError):
+            return TRANSIENT_SSL_ERROR in str(exc)
+
+        if isinstance(exc, self.retry_exceptions):
+            return True
+
+        code = getattr(exc, 'code', None) or getattr(exc, 'http_code', None)
+        return code in self.retry_status_codes
+
+    def get_delay(self, previous_delay):
+        """
+        Return delay before the next attempt (decorrelated jitter).
+
+        :param previous_delay: Delay before the previous attempt (None for
+                               the first retry).
+        :type previous_delay: ``float``
+
+        :rtype: ``float``
+        """
+        if previous_delay is None:
+            previous_delay = self.base_delay
+
+        upper = max(previous_delay * 3, self.base_delay)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def call(self, func, method='GET', body=None, idempotent=None):
+        """
+        Call the provided function and retry it according to this policy.
+
+        :param func: Function which performs the request.
+        :type func: ``callable``
+
+        :param method: HTTP method of the request.
+        :type method: ``str``
+
+        :param body: Request body. If it's a file like object, it's rewound
+                     before each retry.
+
+        :param idempotent: True if the request is known to be idempotent
+                           (e.g. it includes an idempotency token) regardless
+                           of the HTTP method.
+        :type idempotent: ``bool``
+
+        :return: Value returned by ``func``.
+        """
+        if idempotent is None:
+            idempotent = self.is_idempotent(method)
+
+        rewind = self._get_body_rewinder(body)
+        retryable = idempotent and rewind is not None
+
+        if self.budget is not None:
+            self.budget.record_request()
+
+        end = time.time() + self.timeout if self.timeout else None
+        delay = None
+        attempt = 1
+
+        while True:
+            try:
+                return func()
+            except Exception as exc:
+                if not retryable or attempt >= self.max_attempts or \
+                        not self.is_retryable_exception(exc):
+                    raise
+
+                if isinstance(exc, RateLimitReachedError) and \
+                        exc.retry_after:
+                    delay = float(exc.retry_after)
+                else:
+                    delay = self.get_delay(previous_delay=delay)
+
+                if end is not None and time.time() + delay > end:
+                    raise
+
+                if self.budget is not None and \
+                        not self.budget.try_withdraw():
+                    raise
+
+                time.sleep(delay)
+
+                try:
+                    rewind()
+                except Exception:
+                    raise exc
+
+                attempt += 1
+
+    def _get_body_rewinder(self, body):
+        """
+        Return function which rewinds the request body to its current
+        position or None if the body can't be rewound.
+        """
+        if body is None or isinstance(body, (basestring, bytes, dict)):
+            return lambda: None
+
+        if not hasattr(body, 'seek') or not hasattr(body, 'tell'):
+            return None
+
+        try:
+            position = body.tell()
+        except Exception:
+            return None
+
+        return lambda: body.seek(position)
+
+    def __repr__(self):
+        return ('<RetryPolicy max_attempts=%s, base_delay=%s, max_delay=%s>' %
+                (self.max_attempts, self.base_delay, self.max_delay))
@@ -177,6 +177,12 @@ INSTALL_REQUIREMENTS = [
     'requests>=2.5.0',
 ]
 
+# Optional dependencies which are only needed by some features
+EXTRAS_REQUIREMENTS = {
+    # asyncio transport (*_async driver methods)
+    'async': ['aiohttp>=3.3.0'],
+}
+
 setuptools_version = tuple(setuptools.__version__.split(".")[0:2])
 setuptools_version = tuple([int(c) for c in setuptools_version])
 
@@ -192,7 +198,7 @@ TEST_REQUIREMENTS = [
     'requests_mock',
     'pytest',
     'pytest-runner'
-] + INSTALL_REQUIREMENTS
+] + INSTALL_REQUIREMENTS + EXTRAS_REQUIREMENTS['async']
 
 if PY_pre_35:
     version = '.'.join([str(x) for x in sys.version_info[:3]])
@@ -271,6 +277,7 @@ setup(
     author='Apache Software Foundation',
     author_email='dev@libcloud.apache.org',
     install_requires=INSTALL_REQUIREMENTS,
+    extras_require=EXTRAS_REQUIREMENTS,
     python_requires=">=3.5.*, <4",
     packages=get_packages('libcloud'),
     package_dir={